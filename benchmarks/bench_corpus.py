@@ -0,0 +1,66 @@
+"""
+Corpus Word Count Benchmark
+
+Measures how CorpusWordCounter scales with the number of worker processes on a local corpus of synthetic policy-like
+pages written to a temporary directory, so no network time is included. On an otherwise idle machine the speedup
+should stay close to the number of workers up to the number of cores.
+
+Usage:
+    python -m benchmarks.bench_corpus --documents 400 --size-kb 100 --workers 1,2,4,8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.fixtures import build_page
+from utilities.corpus_counter import CorpusWordCounter
+
+
+def write_corpus(directory, documents, size_kb):
+    """
+    Writes the synthetic corpus.
+
+    Args:
+        directory (str): The directory receiving the pages.
+        documents (int): The number of pages.
+        size_kb (float): The approximate size of every page in KB.
+    """
+    for number in range(documents):
+        with open(os.path.join(directory, f"policy-{number:05d}.html"), "w") as page:
+            page.write(build_page(size_kb, url_density=0.5, profile="text", seed=number))
+
+
+def parse_workers(value):
+    return [int(workers) for workers in value.split(",") if workers]
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=400, help="number of pages in the corpus")
+    parser.add_argument("--size-kb", type=float, default=100, help="approximate size of every page in KB")
+    parser.add_argument("--workers", type=parse_workers, default=None,
+                        help="comma separated worker counts (defaults to powers of two up to the number of CPUs)")
+    parser.add_argument("--approximate", action="store_true", help="count into fixed-memory approximate counters")
+    args = parser.parse_args(arguments)
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({2 ** power for power in range(cpu_count.bit_length())} | {cpu_count})
+    with tempfile.TemporaryDirectory() as directory:
+        write_corpus(directory, args.documents, args.size_kb)
+        print(f"{'workers':>8} {'seconds':>10} {'docs/s':>10} {'speedup':>8} {'words':>12}")
+        baseline = None
+        for workers in worker_counts:
+            started = time.perf_counter()
+            flag, corpus = CorpusWordCounter([directory], workers=workers, approximate=args.approximate).count()
+            elapsed = time.perf_counter() - started
+            if not flag:
+                raise SystemExit(f"Error counting the corpus due to {corpus}")
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>10.3f} {args.documents / elapsed:>10.1f} {baseline / elapsed:>8.2f} "
+                  f"{corpus['total_words']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+HTML Parser Backend Benchmark
+
+Compares the parse time and peak memory of every installed BeautifulSoup parser backend on a set of saved pages, so
+the default backend can be chosen from numbers rather than folklore.
+
+Save real-world pages (e.g. with "curl -o pages/cfc_index.html https://www.cfcunderwriting.com") into a directory and
+pass it with --pages. Without saved pages, a few synthetic pages of different shapes are generated instead.
+
+Usage:
+    python -m benchmarks.bench_parsers --pages benchmarks/pages --repeat 5 --json parser_results.json
+"""
+
+import argparse
+import glob
+import json
+import os
+import statistics
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+from utilities.parser_backends import ParserBackends
+
+
+def build_synthetic_pages():
+    """
+    Builds synthetic stand-ins for real pages: a text-heavy policy page, a script-heavy landing page and a minified
+    single-line page.
+
+    Returns:
+        dict: Mapping of page name to HTML content.
+    """
+    paragraph = "<p>We collect, use and protect your <a href='/privacy-policy/'>personal data</a> responsibly.</p>\n"
+    script = "<script>window.dataLayer.push({event: 'view', items: [1, 2, 3]});</script>\n"
+    card = ('<div class="card"><img src="https://cdn.example.net/a.png"><a href="https://example.org/x">More</a>'
+            '<span>Cyber insurance</span></div>')
+    return {
+        "synthetic_text_heavy.html": f"<html><body>{paragraph * 4000}</body></html>",
+        "synthetic_script_heavy.html": f"<html><head>{script * 3000}</head><body>{paragraph * 500}</body></html>",
+        "synthetic_minified.html": f"<html><body>{card * 5000}</body></html>",
+    }
+
+
+def load_pages(directory):
+    """
+    Loads every .html file of a directory.
+
+    Args:
+        directory (str): The directory of saved pages.
+
+    Returns:
+        dict: Mapping of page name to HTML content.
+    """
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.html"))):
+        with open(path, encoding="utf-8", errors="replace") as page_file:
+            pages[os.path.basename(path)] = page_file.read()
+    return pages
+
+
+def measure_parser(content, parser, repeat):
+    """
+    Measures the median parse time and the peak traced memory of one backend on one page.
+
+    Args:
+        content (str): The HTML content.
+        parser (str): The parser backend.
+        repeat (int): The number of timed parses.
+
+    Returns:
+        dict: The median seconds and the peak memory in bytes.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        BeautifulSoup(content, parser)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    BeautifulSoup(content, parser)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": statistics.median(timings), "peak_bytes": peak}
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", default=os.path.join(os.path.dirname(__file__), "pages"),
+                        help="directory of saved .html pages")
+    parser.add_argument("--repeat", type=int, default=5, help="timed parses per page and backend")
+    parser.add_argument("--json", dest="json_file", help="also write the results to this JSON file")
+    args = parser.parse_args(arguments)
+
+    pages = load_pages(args.pages) if os.path.isdir(args.pages) else {}
+    if not pages:
+        print(f"No saved pages found in {args.pages}; using synthetic pages.")
+        pages = build_synthetic_pages()
+
+    results = []
+    print(f"{'page':<32} {'parser':<12} {'KB':>8} {'ms':>10} {'peak MB':>9}")
+    for page_name, content in pages.items():
+        for backend in ParserBackends.available_parsers():
+            measurement = measure_parser(content, backend, args.repeat)
+            results.append({"page": page_name, "parser": backend, "bytes": len(content), **measurement})
+            print(f"{page_name:<32} {backend:<12} {len(content) / 1024:>8.0f} "
+                  f"{measurement['seconds'] * 1000:>10.1f} {measurement['peak_bytes'] / 1024 / 1024:>9.1f}")
+
+    if args.json_file:
+        with open(args.json_file, "w") as json_file:
+            json.dump(results, json_file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Startup Benchmark
+
+Measures the start-up cost of cheap main.py commands with "python -X importtime": the wall time of the whole process,
+the total import time and the number of modules imported. Each command is run twice: as main.py runs it now, with the
+controllers imported only by the commands that scrape, and with every controller imported up front, as main.py did
+before it grew subcommands.
+
+Usage:
+    python -m benchmarks.bench_startup --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+EAGER_IMPORTS = (
+    "controllers.batch_controller", "controllers.corpus_controller", "controllers.crawl_controller",
+    "controllers.resource_controller", "controllers.privacy_policy_controller",
+    "controllers.queue_worker_controller", "controllers.service_controller", "controllers.watch_controller",
+)
+
+COMMANDS = (
+    ("--help", ["--help"]),
+    ("cache lookup", ["cache", "https://www.cfcunderwriting.com"]),
+)
+
+
+def build_command(arguments, eager):
+    """
+    Returns the command line running main.py with the given arguments under -X importtime.
+
+    Args:
+        arguments (list): The arguments of main.py.
+        eager (bool): Import every controller before main.py runs.
+
+    Returns:
+        list: The command line.
+    """
+    if not eager:
+        return [sys.executable, "-X", "importtime", "main.py", *arguments]
+    code = (f"import {', '.join(EAGER_IMPORTS)}; import runpy, sys; sys.argv = ['main.py', *{arguments!r}]; "
+            f"runpy.run_path('main.py', run_name='__main__')")
+    return [sys.executable, "-X", "importtime", "-c", code]
+
+
+def parse_importtime(output):
+    """
+    Sums the self times of an -X importtime report.
+
+    Args:
+        output (str): The stderr of the process.
+
+    Returns:
+        tuple: The total import time in seconds (float), the number of imported modules (int) and whether bs4 or
+               requests were imported (bool).
+    """
+    total_us, modules, scraping_stack = 0, 0, False
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        total_us += int(self_us)
+        modules += 1
+        scraping_stack = scraping_stack or name.strip() in ("bs4", "requests")
+    return total_us / 1e6, modules, scraping_stack
+
+
+def time_command(command, repeat):
+    """
+    Runs a command repeatedly and returns its median wall and import time.
+
+    Args:
+        command (list): The command line.
+        repeat (int): The number of runs.
+
+    Returns:
+        tuple: The median wall seconds (float), the median import seconds (float), the number of imported modules
+               (int) and whether bs4 or requests were imported (bool).
+    """
+    wall_timings, import_timings = [], []
+    modules, scraping_stack = 0, False
+    for _ in range(repeat):
+        started = time.perf_counter()
+        completed = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+        wall_timings.append(time.perf_counter() - started)
+        import_seconds, modules, scraping_stack = parse_importtime(completed.stderr)
+        import_timings.append(import_seconds)
+    return statistics.median(wall_timings), statistics.median(import_timings), modules, scraping_stack
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement; the median is reported")
+    args = parser.parse_args(arguments)
+
+    print(f"{'command':>14} {'imports':>8} {'wall (s)':>9} {'import (s)':>11} {'modules':>8} {'bs4/requests':>13} "
+          f"{'speedup':>8}")
+    for name, command_arguments in COMMANDS:
+        eager_wall = None
+        for imports, eager in (("eager", True), ("lazy", False)):
+            wall, import_seconds, modules, scraping_stack = time_command(build_command(command_arguments, eager),
+                                                                         args.repeat)
+            eager_wall = eager_wall or wall
+            print(f"{name:>14} {imports:>8} {wall:>9.3f} {import_seconds:>11.3f} {modules:>8} "
+                  f"{'yes' if scraping_stack else 'no':>13} {eager_wall / wall:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
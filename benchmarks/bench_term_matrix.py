@@ -0,0 +1,155 @@
+"""
+Term Matrix Benchmark
+
+Compares TermFrequencyMatrix with plain dict loops for the comparisons made between many privacy policies: the
+cosine similarity of one policy with every other policy, the top terms of the whole corpus and the term delta between
+two policies or two snapshots of the corpus. Word counts are synthetic, with Zipf-distributed words like natural text.
+
+Usage:
+    python -m benchmarks.bench_term_matrix --documents 2000 --terms 400 --vocabulary 20000
+"""
+
+import argparse
+import math
+import random
+import time
+from collections import Counter
+
+from utilities.change_tracker import ChangeTracker
+from utilities.term_matrix import TermFrequencyMatrix
+
+
+def build_word_counts(documents, terms, vocabulary, seed=0):
+    """
+    Builds synthetic word counts.
+
+    Args:
+        documents (int): The number of documents.
+        terms (int): The number of words drawn per document.
+        vocabulary (int): The number of distinct words.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        dict: Mapping of document label to word count.
+    """
+    generator = random.Random(seed)
+    words = [f"word{rank}" for rank in range(vocabulary)]
+    weights = [1 / (rank + 1) for rank in range(vocabulary)]
+    return {f"https://site{number}.example/privacy": dict(Counter(generator.choices(words, weights, k=terms)))
+            for number in range(documents)}
+
+
+def dict_similarities(word_counts, label):
+    """
+    The cosine similarity of one document with every document, computed over dicts.
+
+    Args:
+        word_counts (dict): Mapping of document label to word count.
+        label (str): The label of the document.
+
+    Returns:
+        list: One similarity per document.
+    """
+    query = word_counts[label]
+    query_norm = math.sqrt(sum(count ** 2 for count in query.values()))
+    similarities = []
+    for word_count in word_counts.values():
+        dot = sum(count * query.get(word, 0) for word, count in word_count.items())
+        norm = math.sqrt(sum(count ** 2 for count in word_count.values())) * query_norm
+        similarities.append(dot / norm if norm else 0.0)
+    return similarities
+
+
+def dict_top_terms(word_counts, n):
+    """
+    The most frequent terms of all documents, computed over dicts.
+
+    Args:
+        word_counts (dict): Mapping of document label to word count.
+        n (int): The number of terms returned.
+
+    Returns:
+        list: (term, count) tuples.
+    """
+    totals = Counter()
+    for word_count in word_counts.values():
+        totals.update(word_count)
+    return totals.most_common(n)
+
+
+def dict_totals_delta(previous_word_counts, word_counts):
+    """
+    The per-term changes of the corpus totals between two snapshots, computed over dicts.
+
+    Args:
+        previous_word_counts (dict): Mapping of document label to word count in the previous snapshot.
+        word_counts (dict): Mapping of document label to word count in the current snapshot.
+
+    Returns:
+        dict: Mapping of term to the change of its total.
+    """
+    previous_totals = Counter()
+    for word_count in previous_word_counts.values():
+        previous_totals.update(word_count)
+    totals = Counter()
+    for word_count in word_counts.values():
+        totals.update(word_count)
+    return ChangeTracker.word_count_delta(previous_totals, totals)
+
+
+def time_call(function, *args):
+    """
+    Times one call.
+
+    Args:
+        function (callable): The function.
+        *args: Its arguments.
+
+    Returns:
+        float: The elapsed seconds.
+    """
+    started = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - started
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=2000, help="number of documents")
+    parser.add_argument("--terms", type=int, default=400, help="number of words drawn per document")
+    parser.add_argument("--vocabulary", type=int, default=20000, help="number of distinct words")
+    args = parser.parse_args(arguments)
+
+    word_counts = build_word_counts(args.documents, args.terms, args.vocabulary)
+    previous_word_counts = build_word_counts(args.documents, args.terms, args.vocabulary, seed=1)
+    labels = list(word_counts)
+    started = time.perf_counter()
+    term_matrix = TermFrequencyMatrix()
+    for label, word_count in word_counts.items():
+        term_matrix.add_document(label, word_count)
+    term_matrix.top_terms(1, labels[0])
+    previous_matrix = TermFrequencyMatrix()
+    for label, word_count in previous_word_counts.items():
+        previous_matrix.add_document(label, word_count)
+    print(f"built a {term_matrix.get_shape()[0]} x {term_matrix.get_shape()[1]} matrix in "
+          f"{(time.perf_counter() - started) * 1000:.1f} ms")
+
+    cases = [
+        ("cosine similarities", (dict_similarities, word_counts, labels[0]),
+         (term_matrix.cosine_similarities, labels[0])),
+        ("top terms", (dict_top_terms, word_counts, 20), (term_matrix.top_terms, 20)),
+        ("term delta", (ChangeTracker.word_count_delta, word_counts[labels[0]], word_counts[labels[1]]),
+         (term_matrix.term_delta, labels[0], labels[1])),
+        ("snapshot delta", (dict_totals_delta, previous_word_counts, word_counts),
+         (term_matrix.term_totals_delta, previous_matrix)),
+    ]
+    print(f"{'operation':>20} {'dicts (ms)':>11} {'matrix (ms)':>12} {'speedup':>8}")
+    for name, dict_case, matrix_case in cases:
+        dict_elapsed = time_call(*dict_case)
+        matrix_elapsed = time_call(*matrix_case)
+        print(f"{name:>20} {dict_elapsed * 1000:>11.2f} {matrix_elapsed * 1000:>12.2f} "
+              f"{dict_elapsed / matrix_elapsed:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Tokenizer Benchmark
+
+Compares WordTokenizer.count() against the previous counting loop of count_soup_words() on the visible text of a
+synthetic policy-like page. The previous loop replaced newlines, split the text, stripped every token, then lowered
+and split every token again and updated the Counter once per token.
+
+Usage:
+    python -m benchmarks.bench_tokenizer --sizes 0.25,1,4 --repeat 5
+"""
+
+import argparse
+import statistics
+import time
+from collections import Counter
+
+from benchmarks.fixtures import build_page
+from utilities.tokenizer import ENGLISH_STOPWORDS, WordTokenizer
+from utilities.visible_text import VisibleTextParser
+
+
+def legacy_count(visible_text):
+    """
+    The previous word counting loop of BeautifulSoupContentScrapper.count_soup_words().
+
+    Args:
+        visible_text (str): The visible text of a page.
+
+    Returns:
+        Counter: The word frequency count.
+    """
+    visible_text = visible_text.replace('\n', ' ')
+    visible_text = visible_text.split()
+    visible_text = [text.strip() for text in visible_text]
+    word_count = Counter()
+    for text in visible_text:
+        words = text.lower().split()
+        word_count.update(words)
+    return word_count
+
+
+def time_count(count, text, repeat):
+    """
+    Returns the median time of counting a text.
+
+    Args:
+        count (callable): The counting function.
+        text (str): The text.
+        repeat (int): The number of runs.
+
+    Returns:
+        tuple: The median elapsed seconds (float) and the number of distinct words (int).
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        word_count = count(text)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), len(word_count)
+
+
+def parse_sizes(value):
+    return [float(size) for size in value.split(",") if size]
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=parse_sizes, default=parse_sizes("0.25,1,4"),
+                        help="comma separated sizes of the visible text in MB")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement; the median is reported")
+    args = parser.parse_args(arguments)
+
+    counters = [
+        ("legacy", legacy_count),
+        ("tokenizer", WordTokenizer().count),
+        ("stopwords", WordTokenizer(stopwords=ENGLISH_STOPWORDS, drop_numbers=True).count),
+    ]
+    print(f"{'size (MB)':>10} {'counter':>10} {'seconds':>10} {'MB/s':>10} {'speedup':>8} {'words':>7}")
+    for size_mb in args.sizes:
+        page = build_page(size_mb * 1024 * 4, url_density=0.1, profile="text", seed=1)
+        flag, text = VisibleTextParser.extract(page)
+        text = text[:int(size_mb * 1024 * 1024)]
+        text_mb = len(text.encode("utf-8")) / 1024 / 1024
+        legacy_elapsed = None
+        for name, count in counters:
+            elapsed, distinct_words = time_count(count, text, args.repeat)
+            legacy_elapsed = legacy_elapsed or elapsed
+            print(f"{size_mb:>10} {name:>10} {elapsed:>10.4f} {text_mb / elapsed:>10.1f} "
+                  f"{legacy_elapsed / elapsed:>8.2f} {distinct_words:>7}")
+
+
+if __name__ == "__main__":
+    main()
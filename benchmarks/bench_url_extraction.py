@@ -0,0 +1,85 @@
+"""
+URL Extraction Benchmark
+
+Compares FetchUrl.fetch_url_list() using the linear-time default pattern against the previous backtracking pattern on
+synthetic minified pages, where the whole document is a single line.
+
+The previous pattern rescans to the end of the line at every candidate URL, so its time grows quadratically with the
+page size. It is therefore only run on the sizes listed in --legacy-sizes.
+
+Usage:
+    python -m benchmarks.bench_url_extraction --sizes 1,5,10,25,50 --legacy-sizes 0.125,0.25,0.5,1
+"""
+
+import argparse
+import time
+
+from utilities.url_scrapper import FetchUrl
+
+LEGACY_PATTERN = r"\b(https?:\/\/(?!.*(?:cfc\.com|cfcunderwriting\.com))[^\s/$.?#]*[^\s\"'><]*)\b"
+
+PAGE_CHUNK = (
+    '<div class="card"><a href="https://cdn.example.net/lib/app.js">Script</a>'
+    '<img src="https://www.cfcunderwriting.com/media/logo.png" alt="CFC">'
+    '<p>Specialist insurance for a changing world.</p></div>'
+)
+
+
+def build_single_line_page(size_mb):
+    """
+    Builds a minified single-line page of roughly the given size.
+
+    Args:
+        size_mb (float): The page size in megabytes.
+
+    Returns:
+        str: The page content.
+    """
+    repeats = max(1, int(size_mb * 1024 * 1024) // len(PAGE_CHUNK))
+    return f"<html><body>{PAGE_CHUNK * repeats}</body></html>"
+
+
+def time_extraction(url_scrapper, content):
+    """
+    Times one fetch_url_list() call.
+
+    Args:
+        url_scrapper (FetchUrl): The FetchUrl instance to benchmark.
+        content (str): The page content.
+
+    Returns:
+        tuple: The elapsed seconds (float) and the number of URLs found (int).
+    """
+    started = time.perf_counter()
+    flag, url_list = url_scrapper.fetch_url_list(content)
+    elapsed = time.perf_counter() - started
+    return elapsed, len(url_list) if flag else 0
+
+
+def parse_sizes(value):
+    return [float(size) for size in value.split(",") if size]
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=parse_sizes, default=parse_sizes("1,5,10,25,50"),
+                        help="comma separated page sizes in MB for the linear-time extractor")
+    parser.add_argument("--legacy-sizes", type=parse_sizes, default=parse_sizes("0.125,0.25,0.5,1"),
+                        help="comma separated page sizes in MB for the previous backtracking pattern")
+    args = parser.parse_args(arguments)
+
+    linear_scrapper = FetchUrl()
+    legacy_scrapper = FetchUrl(pattern=LEGACY_PATTERN)
+    print(f"{'size (MB)':>10} {'extractor':>10} {'seconds':>10} {'MB/s':>10} {'urls':>6}")
+    for size_mb in sorted(set(args.sizes) | set(args.legacy_sizes)):
+        content = build_single_line_page(size_mb)
+        runs = [("linear", linear_scrapper)]
+        if size_mb in args.legacy_sizes:
+            runs.append(("legacy", legacy_scrapper))
+        for name, url_scrapper in runs:
+            elapsed, url_count = time_extraction(url_scrapper, content)
+            print(f"{size_mb:>10} {name:>10} {elapsed:>10.4f} {size_mb / elapsed:>10.1f} {url_count:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Synthetic HTML Fixtures
+
+Generates deterministic synthetic pages for the benchmarks, so results are comparable between runs and machines.
+
+Pages are tuned by:
+    size_kb: the approximate page size.
+    url_density: the number of absolute URLs per KB of page.
+    profile: "text" for policy-like pages dominated by prose, "script" for landing pages dominated by inline scripts.
+    minified: a single-line page when True, a pretty-printed page when False.
+
+Every page links to a privacy policy page, so find_privacy_policy_url() always has a match to find.
+"""
+
+import random
+
+WORDS = (
+    "we collect use share protect your personal data information cookies privacy policy consent rights "
+    "insurance cyber claims services website contact processing purposes lawful basis retention security"
+).split()
+
+RESOURCE_TEMPLATES = (
+    '<script src="https://cdn{n}.example.net/lib/app{n}.js"></script>',
+    '<link rel="stylesheet" href="https://static{n}.example.org/css/site{n}.css">',
+    '<img src="https://images{n}.example.com/media/photo{n}.jpg" alt="photo">',
+    '<link rel="preload" as="font" href="https://fonts.gstatic.com/s/font{n}.woff2">',
+    '<a href="https://www.social{n}.example.com/cfc">Follow us</a>',
+    '<img src="https://www.cfcunderwriting.com/media/logo{n}.png" alt="CFC">',
+)
+
+
+def build_page(size_kb=100, url_density=2.0, profile="text", minified=False, seed=0):
+    """
+    Builds a synthetic HTML page.
+
+    Args:
+        size_kb (float, optional): The approximate page size in KB. Defaults to 100.
+        url_density (float, optional): Absolute URLs per KB of page. Defaults to 2.
+        profile (str, optional): "text" or "script". Defaults to "text".
+        minified (bool, optional): Emit the page on a single line. Defaults to False.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        str: The page content.
+    """
+    generator = random.Random(seed)
+    separator = "" if minified else "\n        "
+    target_size = int(size_kb * 1024)
+    blocks = []
+    size = 0
+    resource_budget = 0.0
+    number = 0
+    while size < target_size:
+        number += 1
+        if profile == "script":
+            block = ("<script>window.dataLayer=window.dataLayer||[];dataLayer.push({event:'view',id:%d,"
+                     "items:[%s]});</script>" % (number, ",".join(str(generator.randint(0, 999)) for _ in range(20))))
+            if number % 4 == 0:
+                block += f"<p>{' '.join(generator.choice(WORDS) for _ in range(12))}</p>"
+        else:
+            block = f"<p>{' '.join(generator.choice(WORDS) for _ in range(40))}.</p>"
+        resource_budget += len(block) / 1024 * url_density
+        while resource_budget >= 1:
+            block += RESOURCE_TEMPLATES[number % len(RESOURCE_TEMPLATES)].format(n=number % 97)
+            resource_budget -= 1
+        blocks.append(block)
+        size += len(block) + len(separator)
+
+    body = separator.join(blocks)
+    return (f"<!DOCTYPE html><html><head><title>Synthetic {profile} page</title></head><body>{separator}"
+            f'<nav><a href="/en-gb/support/privacy-policy/">Privacy Policy</a></nav>{separator}'
+            f"{body}{separator}</body></html>")
+
+
+def build_fixture_matrix(sizes_kb=(100, 1024), url_density=2.0):
+    """
+    Builds one page per combination of size, profile and layout.
+
+    Args:
+        sizes_kb (iterable, optional): The page sizes in KB. Defaults to 100 KB and 1 MB.
+        url_density (float, optional): Absolute URLs per KB of page. Defaults to 2.
+
+    Returns:
+        dict: Mapping of fixture name (e.g. "text-pretty-100kb") to page content.
+    """
+    fixtures = {}
+    for size_kb in sizes_kb:
+        for profile in ("text", "script"):
+            for minified in (False, True):
+                name = f"{profile}-{'minified' if minified else 'pretty'}-{size_kb:g}kb"
+                fixtures[name] = build_page(size_kb, url_density, profile, minified)
+    return fixtures
@@ -0,0 +1,211 @@
+"""
+Benchmark Suite
+
+Times and memory-profiles every hot path of the scraping pipeline on synthetic pages:
+
+    FetchUrl.fetch_url_list, FetchUrl.scrape_using_regex, FetchUrl.scrape_using_tags, FetchUrl.find_privacy_policy_url,
+    PageExtractor.extract (all of the previous ones and the visible text in one pass),
+    BeautifulSoupContentScrapper.count_words_frequency, BeautifulSoupContentScrapper.count_text_words_approximate,
+    FileWriter.write_to_json_file (pretty-printed and compact) and FileWriter.write_ndjson_file.
+
+Each case reports the median wall time over --repeat runs and the peak traced memory of one extra run. Results are
+written as JSON, and --compare checks them against a saved baseline: the run fails with exit code 1 when any case is
+more than --threshold slower (or uses that much more memory) than the baseline, so regressions are caught before
+deploying.
+
+Usage:
+    python -m benchmarks.suite --output bench_results.json
+    python -m benchmarks.suite --output bench_results.json --compare bench_baseline.json --threshold 0.25
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from benchmarks.fixtures import build_fixture_matrix
+from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+from utilities.page_cache import PageArtifactCache
+from utilities.page_extractor import PageExtractor
+from utilities.url_scrapper import FetchUrl
+from utilities.writer import FileWriter
+
+BASE_URL = "https://www.cfcunderwriting.com"
+
+
+def seeded_scrapper(content, parser):
+    """
+    Builds a scrapper whose page cache already holds the page, so count_words_frequency() is measured without network.
+
+    Args:
+        content (str): The page content.
+        parser (str): The parser backend.
+
+    Returns:
+        BeautifulSoupContentScrapper: The scrapper.
+    """
+    page_cache = PageArtifactCache()
+    page_cache.get_artifact(BASE_URL).content = content
+    return BeautifulSoupContentScrapper(BASE_URL, page_cache=page_cache, parser=parser)
+
+
+def build_cases(content, parser, output_directory):
+    """
+    Builds the benchmark cases of one fixture page.
+
+    Args:
+        content (str): The page content.
+        parser (str): The parser backend.
+        output_directory (str): A scratch directory for FileWriter output.
+
+    Returns:
+        dict: Mapping of case name to a zero-argument callable.
+    """
+    url_scrapper = FetchUrl()
+    soup = BeautifulSoup(content, parser)
+    text = soup.get_text()
+    word_count = dict(BeautifulSoupContentScrapper.count_soup_words(soup)[1])
+    output_file = os.path.join(output_directory, "word_count.json")
+    return {
+        "fetch_url_list": lambda: url_scrapper.fetch_url_list(content),
+        "scrape_using_regex": lambda: url_scrapper.scrape_using_regex(content),
+        "scrape_using_tags": lambda: url_scrapper.scrape_using_tags(soup, BASE_URL),
+        "find_privacy_policy_url": lambda: url_scrapper.find_privacy_policy_url(soup, BASE_URL),
+        "extract_page": lambda: PageExtractor.extract(content, BASE_URL),
+        "count_words_frequency": lambda: seeded_scrapper(content, parser).count_words_frequency(BASE_URL),
+        "count_text_words_approximate": lambda: BeautifulSoupContentScrapper.count_text_words_approximate(text),
+        "write_to_json_file": lambda: FileWriter.write_to_json_file(word_count, output_file),
+        "write_to_json_file_compact": lambda: FileWriter.write_to_json_file(word_count, output_file, compact=True),
+        "write_ndjson_file": lambda: FileWriter.write_ndjson_file(
+            ({"word": word, "count": count} for word, count in word_count.items()), output_file
+        ),
+    }
+
+
+def measure(function, repeat):
+    """
+    Measures the median wall time and the peak traced memory of a callable.
+
+    Args:
+        function (callable): The code under test.
+        repeat (int): The number of timed runs.
+
+    Returns:
+        dict: The median "seconds" and the "peak_bytes" of one traced run.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": statistics.median(timings), "peak_bytes": peak}
+
+
+def run_suite(sizes_kb, url_density, repeat, parser):
+    """
+    Runs every case on every fixture page.
+
+    Args:
+        sizes_kb (list): The fixture page sizes in KB.
+        url_density (float): Absolute URLs per KB of page.
+        repeat (int): The number of timed runs per case.
+        parser (str): The parser backend.
+
+    Returns:
+        dict: The run metadata and a mapping of "<case>[<fixture>]" to its measurement.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as output_directory:
+        for fixture_name, content in build_fixture_matrix(sizes_kb, url_density).items():
+            for case_name, function in build_cases(content, parser, output_directory).items():
+                results[f"{case_name}[{fixture_name}]"] = measure(function, repeat)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "parser": parser,
+            "sizes_kb": sizes_kb,
+            "url_density": url_density,
+            "repeat": repeat,
+            "timestamp": time.time(),
+        },
+        "results": results,
+    }
+
+
+def compare_results(current, baseline, threshold):
+    """
+    Compares a run with a baseline run.
+
+    Args:
+        current (dict): The results of this run.
+        baseline (dict): The results of the baseline run.
+        threshold (float): The tolerated relative slowdown or memory growth, e.g. 0.25 for 25%.
+
+    Returns:
+        list: One (case, metric, baseline value, current value, ratio) tuple per regression.
+    """
+    regressions = []
+    for case, measurement in current["results"].items():
+        baseline_measurement = baseline.get("results", {}).get(case)
+        if baseline_measurement is None:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if not baseline_measurement[metric]:
+                continue
+            ratio = measurement[metric] / baseline_measurement[metric]
+            if ratio > 1 + threshold:
+                regressions.append((case, metric, baseline_measurement[metric], measurement[metric], ratio))
+    return regressions
+
+
+def parse_sizes(value):
+    return [float(size) for size in value.split(",") if size]
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=parse_sizes, default=parse_sizes("100,1024"),
+                        help="comma separated fixture page sizes in KB")
+    parser.add_argument("--url-density", type=float, default=2.0, help="absolute URLs per KB of page")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case")
+    parser.add_argument("--parser", default="html.parser", help="HTML parser backend used for parsing")
+    parser.add_argument("--output", default="bench_results.json", help="JSON file receiving the results")
+    parser.add_argument("--compare", metavar="BASELINE", help="baseline JSON file to compare the results with")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="tolerated relative slowdown or memory growth before a case counts as a regression")
+    args = parser.parse_args(arguments)
+
+    results = run_suite(args.sizes, args.url_density, args.repeat, args.parser)
+    with open(args.output, "w") as output_file:
+        json.dump(results, output_file, indent=4)
+
+    print(f"{'case':<60} {'ms':>10} {'peak KB':>10}")
+    for case, measurement in results["results"].items():
+        print(f"{case:<60} {measurement['seconds'] * 1000:>10.2f} {measurement['peak_bytes'] / 1024:>10.0f}")
+    print(f"Results were written to {args.output}")
+
+    if not args.compare:
+        return 0
+    with open(args.compare) as baseline_file:
+        regressions = compare_results(results, json.load(baseline_file), args.threshold)
+    for case, metric, baseline_value, current_value, ratio in regressions:
+        print(f"REGRESSION {case} {metric}: {baseline_value:.6g} -> {current_value:.6g} ({ratio:.2f}x)")
+    if not regressions:
+        print(f"No regressions against {args.compare} above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,7 +8,13 @@ Classes:
 
 """
 
+import asyncio
+import os
+import re
+from urllib.parse import urlparse
+
 from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+from utilities.metrics import MetricsRecorder
 from utilities.writer import FileWriter
 
 
@@ -23,22 +29,62 @@ class BaseController:
         base_scrapper (BeautifulSoupContentScrapper): An instance of the BeautifulSoupContentScrapper class for
                                                      scraping HTML content.
         log_file (str): The name of the error log file.
+        metrics (MetricsRecorder): The shared recorder receiving the per-stage timings of the controller.
+        output_dir (str): The directory receiving per-site results, for controllers handling many sites.
 
     Methods:
-        __init__(file_name=None):
+        __init__(file_name=None, page_cache=None, url=None):
             Initializes an instance of the BaseController.
+        get_site_directory(url):
+            Returns the output sub-directory of a site.
+        run(executor=None):
+            Runs main() without blocking the event loop.
 
     """
 
-    def __init__(self, file_name=None):
+    def __init__(self, file_name=None, page_cache=None, url=None):
         """
         Initializes an instance of the BaseController.
 
         Args:
             file_name (str, optional): The name of the output file. If not provided, the file_name will be None.
+            page_cache (PageArtifactCache, optional): The per-run page cache shared between controllers, so pages
+                                                      requested by several controllers are fetched and parsed once.
+            url (str, optional): The URL of the site to scrape. Defaults to the CFC website.
 
         """
         self.file_writer_obj = FileWriter()
         self.file_name = file_name
-        self.base_scrapper = BeautifulSoupContentScrapper()
+        self.base_scrapper = BeautifulSoupContentScrapper(url, page_cache=page_cache)
         self.log_file = "error.log"
+        self.metrics = MetricsRecorder.get_shared_recorder()
+        self.output_dir = "."
+
+    def get_site_directory(self, url):
+        """
+        Returns the output sub-directory of a site, derived from its host and path.
+
+        Args:
+            url (str): The URL of the index page of the site.
+
+        Returns:
+            str: The path of the site's output sub-directory.
+        """
+        parsed_url = urlparse(url)
+        site_name = re.sub(r"[^A-Za-z0-9._-]+", "_", f"{parsed_url.netloc}{parsed_url.path}").strip("_")
+        return os.path.join(self.output_dir, site_name or "site")
+
+    async def run(self, executor=None):
+        """
+        Runs main() on an executor thread without blocking the event loop, so several controllers can be scheduled
+        concurrently with asyncio.gather(). Controllers sharing a page cache also share its in-flight fetches.
+
+        Args:
+            executor (concurrent.futures.Executor, optional): The executor running main().
+                                                              Defaults to the default thread pool of the loop.
+
+        Returns:
+            str: The message returned by main().
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.main)
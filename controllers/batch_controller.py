@@ -0,0 +1,141 @@
+"""
+BatchScrapeController
+
+A controller class for scraping many sites in one run and writing per-site results into an output directory.
+
+Network waits are overlapped by AsyncContentScrapper, while the CPU-heavy work (BeautifulSoup parsing, regex extraction
+and word counting) is fanned out to a ProcessPoolExecutor so a batch scales across all cores.
+
+Attributes:
+    urls (list): The URLs of the index pages to scrape.
+    output_dir (str): The directory receiving one sub-directory of results per site.
+    workers (int): The number of worker processes used for parsing and counting.
+    results_file_name (str): The NDJSON file receiving one record per site, written as each site finishes.
+
+Methods:
+    __write_site_results(url, site_data):
+        Writes the results of one site into its output sub-directory.
+    __iter_site_records(summary):
+        Scrapes every site and yields one NDJSON record per site as soon as the site finishes.
+    main():
+        Entry point of the controller that orchestrates the scraping and writing process.
+
+Inherits:
+    BaseController
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from controllers.base import BaseController
+from utilities.async_scrapper import AsyncContentScrapper
+
+
+class BatchScrapeController(BaseController):
+    def __init__(self, urls, output_dir=None, workers=None, concurrency=20, per_host_limit=4):
+        """
+        Initialize the BatchScrapeController instance.
+
+        Args:
+            urls (iterable): The URLs of the index pages to scrape.
+            output_dir (str, optional): The output directory. If not provided, a default name is used.
+            workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+            concurrency (int, optional): Maximum number of requests in flight across all hosts. Defaults to 20.
+            per_host_limit (int, optional): Maximum number of requests in flight to a single host. Defaults to 4.
+        """
+        if not output_dir:
+            output_dir = "batch_output"
+        super(BatchScrapeController, self).__init__("batch_summary.json")
+        self.urls = list(urls)
+        self.output_dir = output_dir
+        self.workers = workers or os.cpu_count() or 1
+        self.concurrency = concurrency
+        self.per_host_limit = per_host_limit
+        self.results_file_name = "batch_results.ndjson"
+
+    def __write_site_results(self, url, site_data):
+        """
+        Writes the external resources and the privacy policy word count of one site into its output sub-directory.
+
+        Args:
+            url (str): The URL of the index page of the site.
+            site_data (dict): The result returned by AsyncContentScrapper.scrape_site().
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the error message if writing fails.
+        """
+        site_directory = self.get_site_directory(url)
+        os.makedirs(site_directory, exist_ok=True)
+        flag, errors = self.file_writer_obj.write_to_json_file(
+            site_data["external_resources"],
+            os.path.join(site_directory, "external_resources.json")
+        )
+        if not flag:
+            return flag, errors
+        return self.file_writer_obj.write_to_json_file(
+            site_data["word_count"],
+            os.path.join(site_directory, "privacy_policy_word_count.json")
+        )
+
+    def __iter_site_records(self, summary):
+        """
+        Scrapes every site, running parsing and counting in a process pool, and yields one record per site in order
+        of completion. Each site is written into its output sub-directory and its NDJSON record reaches the results
+        file as soon as the site finishes, so only the sites still in flight are held in memory.
+
+        Args:
+            summary (dict): Receives the outcome ("ok" or "error: ...") of every site.
+
+        Yields:
+            dict: The URL, the outcome and, for successful sites, the scraped data of one site.
+        """
+        with ProcessPoolExecutor(max_workers=self.workers) as cpu_executor:
+            async_scrapper = AsyncContentScrapper(
+                concurrency=self.concurrency,
+                per_host_limit=self.per_host_limit,
+                cpu_executor=cpu_executor,
+            )
+            for url, (flag, site_data) in async_scrapper.iter_sites(self.urls):
+                if flag:
+                    flag, errors = self.__write_site_results(url, site_data)
+                else:
+                    errors = site_data
+                summary[url] = "ok" if flag else f"error: {errors}"
+                record = {"url": url, "status": summary[url]}
+                if flag:
+                    record.update(site_data)
+                yield record
+
+    def main(self):
+        """
+        Entry point of the controller that orchestrates the scraping and writing process.
+
+        Returns:
+            str: Message indicating the success of the operation or an error message if an exception occurs.
+        """
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            summary = {}
+            results_file = os.path.join(self.output_dir, self.results_file_name)
+            with self.metrics.stage(f"controller.{type(self).__name__}"):
+                flag, errors = self.file_writer_obj.write_ndjson_file(
+                    self.__iter_site_records(summary),
+                    results_file
+                )
+            if not flag:
+                return f"Error Writing file to {results_file} due to {errors}"
+
+            summary_file = os.path.join(self.output_dir, self.file_name)
+            flag, errors = self.file_writer_obj.write_to_json_file(summary, summary_file)
+            if not flag:
+                return f"Error Writing file to {summary_file} due to {errors}"
+            succeeded = len([status for status in summary.values() if status == "ok"])
+            return f"Batch results for {succeeded} of {len(summary)} sites were written to {self.output_dir}"
+        except Exception as e:
+            flag, error = self.file_writer_obj.write_logs(
+                e.args[0],
+                self.log_file
+            )
+            if not flag:
+                return error
+            return f"Error Writing {self.output_dir} Batch Results"
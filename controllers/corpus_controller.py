@@ -0,0 +1,98 @@
+"""
+CorpusWordCountController
+
+A controller class for counting the words of many privacy policy pages at once, e.g. to build per-industry aggregates,
+and writing the merged word count and the totals of every document.
+
+Attributes:
+    file_name (str): The name of the output JSON file receiving the merged word count.
+    documents_file_name (str): The name of the NDJSON file receiving one record of totals per document.
+    term_matrix_file (str): The .npz file receiving the term frequencies of every document, or None.
+    corpus_counter (CorpusWordCounter): The map-reduce counter of the corpus.
+
+Methods:
+    __write_corpus_word_count():
+        Counts the words of the corpus and writes the merged count and the per-document totals.
+    main():
+        Entry point of the controller that orchestrates the counting and writing process.
+
+Inherits:
+    BaseController
+"""
+
+import os
+
+from controllers.base import BaseController
+from utilities.corpus_counter import CorpusWordCounter
+
+
+class CorpusWordCountController(BaseController):
+    def __init__(self, sources, file_name=None, workers=None, approximate=False, top_k=100, term_matrix_file=None):
+        """
+        Initialize the CorpusWordCountController instance.
+
+        Args:
+            sources (iterable): Privacy policy URLs, saved HTML files or directories of saved HTML files.
+            file_name (str, optional): The name of the output JSON file. If not provided, a default name is used.
+            workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+            approximate (bool, optional): Count in fixed memory and keep only the top_k words. Defaults to False.
+            top_k (int, optional): The number of words kept in approximate mode. Defaults to 100.
+            term_matrix_file (str, optional): Also write a TermFrequencyMatrix with one row per document to this
+                                              .npz file. Defaults to None.
+        """
+        if not file_name:
+            file_name = "corpus_word_count.json"
+        super(CorpusWordCountController, self).__init__(file_name)
+        self.documents_file_name = os.path.join(os.path.dirname(file_name), "corpus_documents.ndjson")
+        self.term_matrix_file = term_matrix_file
+        self.corpus_counter = CorpusWordCounter(sources, workers=workers, approximate=approximate, top_k=top_k,
+                                                term_matrix=bool(term_matrix_file))
+
+    def __write_corpus_word_count(self):
+        """
+        Counts the words of the corpus and writes the merged count and the per-document totals.
+
+        Returns:
+            str: Message indicating the success of the write operation or an error message if writing fails.
+        """
+        try:
+            flag, corpus = self.corpus_counter.count()
+            if not flag:
+                return f"Error Writing file to {self.file_name} due to {corpus}"
+            flag, errors = self.file_writer_obj.write_ndjson_file(corpus["documents"], self.documents_file_name)
+            if not flag:
+                return f"Error Writing file to {self.documents_file_name} due to {errors}"
+            if self.term_matrix_file:
+                flag, errors = corpus["term_matrix"].save(self.term_matrix_file)
+                if not flag:
+                    return f"Error Writing file to {self.term_matrix_file} due to {errors}"
+            counted = sum(document["status"] == "ok" for document in corpus["documents"])
+            flag, errors = self.file_writer_obj.write_to_json_file(
+                {"documents": counted, "total_words": corpus["total_words"], "word_count": corpus["word_count"]},
+                self.file_name
+            )
+            if not flag:
+                return f"Error Writing file to {self.file_name} due to {errors}"
+            return (f"Word counts of {counted} of {len(corpus['documents'])} documents were written to "
+                    f"{self.file_name}")
+        except Exception as e:
+            return f"Error Writing file to {self.file_name} due to {e.args}"
+
+    def main(self):
+        """
+        Entry point of the controller that orchestrates the counting and writing process.
+
+        Returns:
+            str: Message indicating the success of the operation or an error message if an exception occurs.
+        """
+        try:
+            with self.metrics.stage(f"controller.{type(self).__name__}"):
+                return self.__write_corpus_word_count()
+        except Exception as e:
+            flag, error = self.file_writer_obj.write_logs(
+                e.args[0],
+                self.log_file
+            )
+            if not flag:
+                return error
+            return f"Error Writing {self.file_name} File"
@@ -0,0 +1,96 @@
+"""
+SiteCrawlController
+
+A controller class for crawling a whole site and writing the external resources loaded on any of its pages, with the
+pages each resource appears on, to a JSON file.
+
+Attributes:
+    file_name (str): The name of the output JSON file.
+    crawler (SiteCrawler): The crawler of the site.
+
+Methods:
+    __write_site_resources():
+        Crawls the site and writes the aggregated external resources to a JSON file.
+    execute():
+        Runs the controller and returns a flag indicating success and its message.
+    main():
+        Entry point of the controller that orchestrates the crawling and writing process.
+
+Inherits:
+    BaseController
+"""
+
+from controllers.base import BaseController
+from utilities.site_crawler import SiteCrawler
+
+
+class SiteCrawlController(BaseController):
+    def __init__(self, file_name=None, url=None, max_depth=2, max_pages=100, requests_per_second=2.0):
+        """
+        Initialize the SiteCrawlController instance.
+
+        Args:
+            file_name (str, optional): The name of the output JSON file. If not provided, a default name is used.
+            url (str, optional): The URL the crawl starts from. Defaults to the CFC website.
+            max_depth (int, optional): The number of link hops followed from the start URL. Defaults to 2.
+            max_pages (int, optional): The maximum number of pages fetched. Defaults to 100.
+            requests_per_second (float, optional): Maximum request rate per host. Defaults to 2.
+        """
+        if not file_name:
+            file_name = "site_external_resources.json"
+        super(SiteCrawlController, self).__init__(file_name, url=url)
+        self.crawler = SiteCrawler(
+            self.base_scrapper.get_url(),
+            max_depth=max_depth,
+            max_pages=max_pages,
+            requests_per_second=requests_per_second,
+        )
+
+    def __write_site_resources(self):
+        """
+        Crawls the site and writes the aggregated external resources to a JSON file.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a message (str) confirming the write or the
+                   error message.
+        """
+        try:
+            flag, crawl_result = self.crawler.run()
+            if not flag:
+                return False, f"Error Writing file to {self.file_name} due to {crawl_result}"
+            flag, errors = self.file_writer_obj.write_to_json_file(crawl_result, self.file_name)
+            if not flag:
+                return False, f"Error Writing file to {self.file_name} due to {errors}"
+            return True, (f"External resources of {len(crawl_result['pages'])} pages were written to "
+                          f"{self.file_name}")
+        except Exception as e:
+            return False, f"Error Writing file to {self.file_name} due to {e.args}"
+
+    def execute(self):
+        """
+        Runs the controller and returns a flag indicating success and its message.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the message (str) of the operation.
+        """
+        try:
+            with self.metrics.stage(f"controller.{type(self).__name__}"):
+                return self.__write_site_resources()
+        except Exception as e:
+            flag, error = self.file_writer_obj.write_logs(
+                e.args[0],
+                self.log_file
+            )
+            if not flag:
+                return False, error
+            return False, f"Error Writing {self.file_name} File"
+
+    def main(self):
+        """
+        Entry point of the controller that orchestrates the crawling and writing process.
+
+        Returns:
+            str: Message indicating the success of the operation or an error message if an exception occurs.
+        """
+        _, message = self.execute()
+        return message
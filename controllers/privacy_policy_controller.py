@@ -3,14 +3,28 @@ PrivacyPolicyWordCountController
 
 A controller class for counting the word frequency in a privacy policy and writing the count to a JSON file.
 
+Runs are incremental: a state file next to the output keeps the hash of the raw privacy policy page, of its visible
+text and of the tokenizer options. When the tokenizer options are unchanged and either page hash matches the previous
+run, parsing, counting and writing are skipped. When the text changed, the per-word count changes are also written to a
+delta file.
+
 Attributes:
     file_name (str): The name of the output JSON file.
+    state_file_name (str): The name of the JSON file keeping the hashes of the last counted page.
+    delta_file_name (str): The name of the JSON file receiving the count changes of the last run.
+    incremental (bool): Whether unchanged pages skip counting and writing.
 
 Methods:
+    __get_privacy_policy_content():
+        Retrieves the content of the privacy policy page and returns a flag indicating success and the content.
     __get_privacy_policy_word_count():
         Retrieves the word frequency count of the privacy policy and returns a flag indicating success and a dictionary of the count.
+    __load_json_file(file_name):
+        Loads a JSON file written by a previous run.
     __write_privacy_policy_word_count():
-        Writes the privacy policy word frequency count to a JSON file and returns a message indicating the success of the write operation.
+        Writes the privacy policy word frequency count to a JSON file and returns a flag and a message indicating the success of the write operation.
+    execute():
+        Runs the controller and returns a flag indicating success and its message.
     main():
         Entry point of the controller that orchestrates the word counting and writing process.
 
@@ -18,20 +32,45 @@ Inherits:
     BaseController
 """
 
+import json
+import os
+
 from controllers.base import BaseController
+from utilities.change_tracker import ChangeTracker
+from utilities.tokenizer import WordTokenizer
 
 
 class PrivacyPolicyWordCountController(BaseController):
-    def __init__(self, file_name=None):
+    def __init__(self, file_name=None, page_cache=None, url=None, incremental=True):
         """
         Initialize the PrivacyPolicyWordCountController instance.
 
         Args:
             file_name (str, optional): The name of the output JSON file. If not provided, a default name is used.
+            page_cache (PageArtifactCache, optional): The per-run page cache shared with other controllers.
+            url (str, optional): The URL of the site to scrape. Defaults to the CFC website.
+            incremental (bool, optional): Skip counting and writing when the privacy policy text is unchanged since
+                                          the last run. Defaults to True.
         """
         if not file_name:
             file_name = "privacy_policy_word_count.json"
-        super(PrivacyPolicyWordCountController, self).__init__(file_name)
+        super(PrivacyPolicyWordCountController, self).__init__(file_name, page_cache, url)
+        base_name = file_name[:-len(".json")] if file_name.lower().endswith(".json") else file_name
+        self.state_file_name = f"{base_name}.state.json"
+        self.delta_file_name = f"{base_name}.delta.json"
+        self.incremental = incremental
+
+    def __get_privacy_policy_content(self):
+        """
+        Retrieves the content of the privacy policy page and returns a flag indicating success and the content.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the content (str) of the privacy policy page.
+        """
+        try:
+            return self.base_scrapper.get_privacy_policy_content()
+        except Exception as e:
+            return False, f"Error Writing file to {self.file_name} due to {e.args}"
 
     def __get_privacy_policy_word_count(self):
         """
@@ -41,44 +80,111 @@ class PrivacyPolicyWordCountController(BaseController):
             tuple: A tuple containing a flag indicating success (bool) and a dictionary (dict) containing the word frequency count of the privacy policy.
         """
         try:
-            flag, privacy_policy_word_count = self.base_scrapper.privacy_policy_word_frequency_counter()
-            return flag, privacy_policy_word_count
+            return self.base_scrapper.count_privacy_policy_words()
         except Exception as e:
             return False, f"Error Writing file to {self.file_name} due to {e.args}"
 
+    @staticmethod
+    def __load_json_file(file_name):
+        """
+        Loads a JSON file written by a previous run.
+
+        Args:
+            file_name (str): The path of the JSON file.
+
+        Returns:
+            dict: The loaded data, or an empty dict if the file is missing or unreadable.
+        """
+        try:
+            with open(file_name) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
     def __write_privacy_policy_word_count(self):
         """
-        Writes the privacy policy word frequency count to a JSON file and returns a message indicating the success of the write operation.
+        Writes the privacy policy word frequency count to a JSON file and returns a flag and a message indicating the success of the write operation.
+
+        Unchanged pages are detected by the hash of the raw page first and the hash of its visible text second, and
+        skip parsing, counting and writing unless the tokenizer options changed since the last run.
 
         Returns:
-            str: Message indicating the success of the write operation or an error message if writing fails.
+            tuple: A tuple containing a flag indicating success (bool) and a message (str) confirming the write or the error message.
         """
         try:
-            flag, privacy_policy_word_count = self.__get_privacy_policy_word_count()
+            flag, content = self.__get_privacy_policy_content()
             if not flag:
-                return f"Error Writing file to {self.file_name} due to {privacy_policy_word_count}"
+                return False, f"Error Writing file to {self.file_name} due to {content}"
+
+            tokenizer = WordTokenizer.get_shared_tokenizer().get_fingerprint()
+            incremental = self.incremental and os.path.exists(self.file_name)
+            state = self.__load_json_file(self.state_file_name) if incremental else {}
+            incremental = incremental and state.get("tokenizer") == tokenizer
+            unchanged_message = f"Privacy Policy Count is unchanged, {self.file_name} was not rewritten"
+            content_hash = ChangeTracker.hash_content(content)
+            if incremental and state.get("content_sha256") == content_hash:
+                return True, unchanged_message
+
+            flag, visible_text = self.base_scrapper.extract_visible_text(content)
+            if not flag:
+                return False, f"Error Writing file to {self.file_name} due to {visible_text}"
+            text_hash = ChangeTracker.hash_text(visible_text)
+            new_state = {"content_sha256": content_hash, "text_sha256": text_hash, "tokenizer": tokenizer}
+            if incremental and state.get("text_sha256") == text_hash:
+                flag, errors = self.file_writer_obj.write_to_json_file(new_state, self.state_file_name)
+                if not flag:
+                    return False, f"Error Writing file to {self.state_file_name} due to {errors}"
+                return True, unchanged_message
+
+            flag, privacy_policy_word_count = self.base_scrapper.count_text_words(visible_text)
+            if not flag:
+                return False, f"Error Writing file to {self.file_name} due to {privacy_policy_word_count}"
+            previous_word_count = self.__load_json_file(self.file_name) if incremental else None
+
             flag, errors = self.file_writer_obj.write_to_json_file(
                 privacy_policy_word_count, self.file_name)
             if not flag:
-                return f"Error Writing file to {self.file_name} due to {errors}"
-            return f"Privacy Policy Count was written to {self.file_name}"
+                return False, f"Error Writing file to {self.file_name} due to {errors}"
+            if previous_word_count is not None:
+                flag, errors = self.file_writer_obj.write_to_json_file({
+                    "previous_text_sha256": state.get("text_sha256"),
+                    "text_sha256": text_hash,
+                    "changes": ChangeTracker.word_count_delta(previous_word_count, privacy_policy_word_count),
+                }, self.delta_file_name)
+                if not flag:
+                    return False, f"Error Writing file to {self.delta_file_name} due to {errors}"
+            flag, errors = self.file_writer_obj.write_to_json_file(new_state, self.state_file_name)
+            if not flag:
+                return False, f"Error Writing file to {self.state_file_name} due to {errors}"
+            return True, f"Privacy Policy Count was written to {self.file_name}"
         except Exception as e:
-            return f"Error Writing file to {self.file_name} due to {e.args}"
+            return False, f"Error Writing file to {self.file_name} due to {e.args}"
 
-    def main(self):
+    def execute(self):
         """
-        Entry point of the controller that orchestrates the word counting and writing process.
+        Runs the controller and returns a flag indicating success and its message.
 
         Returns:
-            str: Message indicating the success of the operation or an error message if an exception occurs.
+            tuple: A tuple containing a flag indicating success (bool) and the message (str) of the operation.
         """
         try:
-            return self.__write_privacy_policy_word_count()
+            with self.metrics.stage(f"controller.{type(self).__name__}"):
+                return self.__write_privacy_policy_word_count()
         except Exception as e:
             flag, error = self.file_writer_obj.write_logs(
                 e.args[0],
                 self.log_file
             )
             if not flag:
-                return error
-            return f"Error Writing {self.file_name} File"
+                return False, error
+            return False, f"Error Writing {self.file_name} File"
+
+    def main(self):
+        """
+        Entry point of the controller that orchestrates the word counting and writing process.
+
+        Returns:
+            str: Message indicating the success of the operation or an error message if an exception occurs.
+        """
+        _, message = self.execute()
+        return message
@@ -0,0 +1,258 @@
+"""
+QueueWorkerController
+
+A controller class for a worker process of the durable work queue. The worker leases tasks one at a time and runs the
+existing controller logic for each of them: "resources" tasks run ResourceScrapeController, "wordcount" tasks run
+PrivacyPolicyWordCountController and "crawl" tasks run SiteCrawlController. Any number of workers, on this or other
+machines, can share one queue to scale a job horizontally.
+
+While a task runs, a heartbeat thread extends its lease every third of the lease duration, so only tasks whose worker
+died are picked up again by other workers.
+
+Each attempt writes into its own directory next to the output file. The output, together with the state and delta
+files of a word count, is moved to its final path only once the queue accepted the result, so a worker finishing
+after its lease expired cannot overwrite the result of the worker that completed the task first. The output and state
+of an earlier word count are copied into the attempt directory first, so word count tasks stay incremental.
+
+Attributes:
+    TASK_KINDS (tuple): The task kinds a worker can run.
+    queue (WorkQueue): The queue tasks are leased from.
+    worker_id (str): The identity of the worker, recorded as the lease owner.
+    output_dir (str): The directory receiving per-site results of enqueued tasks.
+
+Methods:
+    enqueue_sites(urls, kinds=("resources", "wordcount")):
+        Adds one task per site and kind to the queue.
+    run_task(task):
+        Runs the controller of a task, writing its output into the directory of the attempt.
+    finish_task(task, flag, message):
+        Records the result of a task and promotes or discards the output of the attempt.
+    main(max_tasks=None, wait_seconds=0.0, poll_interval=1.0):
+        Entry point of the controller that leases and runs tasks until the queue is drained.
+
+Inherits:
+    BaseController
+"""
+
+import os
+import shutil
+import socket
+import threading
+import time
+
+from controllers.base import BaseController
+from controllers.crawl_controller import SiteCrawlController
+from controllers.privacy_policy_controller import PrivacyPolicyWordCountController
+from controllers.resource_controller import ResourceScrapeController
+from utilities.page_cache import PageArtifactCache
+
+TASK_FILE_NAMES = {
+    "resources": "external_resources.json",
+    "wordcount": "privacy_policy_word_count.json",
+    "crawl": "site_external_resources.json",
+}
+
+
+class QueueWorkerController(BaseController):
+    TASK_KINDS = tuple(TASK_FILE_NAMES)
+
+    def __init__(self, queue, worker_id=None, output_dir=None):
+        """
+        Initialize the QueueWorkerController instance.
+
+        Args:
+            queue (WorkQueue): The queue tasks are leased from.
+            worker_id (str, optional): The identity of the worker. Defaults to the host name and process id.
+            output_dir (str, optional): The directory receiving per-site results of enqueued tasks.
+                                        Defaults to "queue_output".
+        """
+        super(QueueWorkerController, self).__init__()
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.output_dir = output_dir or "queue_output"
+
+    def enqueue_sites(self, urls, kinds=("resources", "wordcount")):
+        """
+        Adds one task per site and kind to the queue. Sites already queued with the same kind are not added again.
+
+        Args:
+            urls (iterable): The URLs of the index pages to scrape.
+            kinds (tuple, optional): The task kinds to add per site. Defaults to ("resources", "wordcount").
+
+        Returns:
+            int: The number of tasks added.
+        """
+        added_count = 0
+        for url in urls:
+            site_directory = self.get_site_directory(url)
+            for kind in kinds:
+                if kind not in TASK_FILE_NAMES:
+                    raise ValueError(f"Unknown task kind {kind}")
+                payload = {"url": url, "file_name": os.path.join(site_directory, TASK_FILE_NAMES[kind])}
+                added, _ = self.queue.enqueue(kind, payload)
+                added_count += added
+        return added_count
+
+    @staticmethod
+    def __get_controller(task, file_name):
+        """
+        Builds the controller running a task. Every task gets its own page cache, so a long-running worker does not
+        keep the pages of every site it scraped.
+
+        Args:
+            task (dict): The leased task.
+            file_name (str): The output file of the controller.
+
+        Returns:
+            BaseController: The controller of the task.
+        """
+        payload = task["payload"]
+        if task["kind"] == "resources":
+            return ResourceScrapeController(file_name, page_cache=PageArtifactCache(), url=payload["url"])
+        if task["kind"] == "wordcount":
+            return PrivacyPolicyWordCountController(file_name, page_cache=PageArtifactCache(),
+                                                    url=payload["url"])
+        if task["kind"] == "crawl":
+            return SiteCrawlController(file_name, url=payload["url"],
+                                       max_depth=payload.get("max_depth", 2), max_pages=payload.get("max_pages", 100))
+        raise ValueError(f"Unknown task kind {task['kind']}")
+
+    @staticmethod
+    def __get_attempt_file_name(task):
+        """
+        Returns the path the controller of a task writes to during the current attempt.
+
+        Args:
+            task (dict): The leased task.
+
+        Returns:
+            str: The output file inside the directory of the attempt.
+        """
+        file_name = task["payload"]["file_name"]
+        attempt_directory = os.path.join(os.path.dirname(file_name), f".attempt-{task['id']}-{task['attempts']}")
+        return os.path.join(attempt_directory, os.path.basename(file_name))
+
+    @staticmethod
+    def __copy_previous_files(task, attempt_file_names):
+        """
+        Copies the files written by an earlier run of a task into the directory of the attempt, so the controller
+        finds them as if it wrote to the final location.
+
+        Args:
+            task (dict): The leased task.
+            attempt_file_names (tuple): The paths inside the directory of the attempt.
+        """
+        directory = os.path.dirname(task["payload"]["file_name"])
+        for attempt_file_name in attempt_file_names:
+            previous_file_name = os.path.join(directory, os.path.basename(attempt_file_name))
+            if os.path.exists(previous_file_name):
+                shutil.copy2(previous_file_name, attempt_file_name)
+
+    def run_task(self, task):
+        """
+        Runs the controller of a task, writing its output into the directory of the attempt. finish_task() moves it
+        to the output file of the task.
+
+        Args:
+            task (dict): The leased task.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the message of the controller, naming the
+                   output file of the task.
+        """
+        try:
+            attempt_file_name = self.__get_attempt_file_name(task)
+            os.makedirs(os.path.dirname(attempt_file_name), exist_ok=True)
+            controller = self.__get_controller(task, attempt_file_name)
+            if isinstance(controller, PrivacyPolicyWordCountController):
+                self.__copy_previous_files(task, (controller.file_name, controller.state_file_name))
+            flag, message = controller.execute()
+            return flag, message.replace(attempt_file_name, task["payload"]["file_name"])
+        except Exception as e:
+            return False, f"Error running task {task['id']} due to {e.args}"
+
+    def finish_task(self, task, flag, message):
+        """
+        Records the result of a task and moves the files of the attempt (the output and any state or delta file) next
+        to the output file of the task, but only if the queue accepted the result. The directory of the attempt is
+        removed either way.
+
+        Args:
+            task (dict): The leased task.
+            flag (bool): Whether run_task() succeeded.
+            message (str): The message returned by run_task().
+
+        Returns:
+            bool: True if the output of the attempt became the output of the task.
+        """
+        attempt_file_name = self.__get_attempt_file_name(task)
+        file_name = task["payload"]["file_name"]
+        try:
+            if not flag:
+                self.queue.fail(task["id"], self.worker_id, message)
+                return False
+            if not self.queue.complete(task["id"], self.worker_id, {"message": message, "file_name": file_name}):
+                return False
+            attempt_directory = os.path.dirname(attempt_file_name)
+            # State files go last: a crash part way leaves the old state, so the next run recounts instead of trusting
+            # a state that does not match the output.
+            for name in sorted(os.listdir(attempt_directory), key=lambda name: (name.endswith(".state.json"), name)):
+                os.replace(os.path.join(attempt_directory, name), os.path.join(os.path.dirname(file_name), name))
+            return True
+        finally:
+            shutil.rmtree(os.path.dirname(attempt_file_name), ignore_errors=True)
+
+    def __keep_leased(self, task_id, stopped):
+        """
+        Extends the lease of a task until it is finished. Runs on the heartbeat thread.
+
+        Args:
+            task_id (int): The task id.
+            stopped (threading.Event): Set when the task is finished.
+        """
+        interval = self.queue.get_lease_seconds() / 3
+        while not stopped.wait(interval):
+            if not self.queue.heartbeat(task_id, self.worker_id):
+                return
+
+    def main(self, max_tasks=None, wait_seconds=0.0, poll_interval=1.0):
+        """
+        Entry point of the controller that leases and runs tasks until the queue is drained.
+
+        Args:
+            max_tasks (int, optional): Stop after running this many tasks. Defaults to no limit.
+            wait_seconds (float, optional): Keep polling an empty queue this long before stopping, so tasks still
+                                            leased by other workers can be picked up if those workers die.
+                                            Defaults to 0.
+            poll_interval (float, optional): Seconds between two polls of an empty queue. Defaults to 1.
+
+        Returns:
+            str: Message summarizing the tasks run by the worker.
+        """
+        completed = failed = 0
+        idle_since = None
+        with self.metrics.stage(f"controller.{type(self).__name__}"):
+            while max_tasks is None or completed + failed < max_tasks:
+                task = self.queue.lease(self.worker_id)
+                if task is None:
+                    idle_since = idle_since if idle_since is not None else time.monotonic()
+                    if time.monotonic() - idle_since >= wait_seconds:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+                idle_since = None
+                stopped = threading.Event()
+                heartbeat = threading.Thread(target=self.__keep_leased, args=(task["id"], stopped), daemon=True)
+                heartbeat.start()
+                try:
+                    flag, message = self.run_task(task)
+                finally:
+                    stopped.set()
+                    heartbeat.join()
+                self.finish_task(task, flag, message)
+                if flag:
+                    completed += 1
+                else:
+                    failed += 1
+                self.metrics.increment("queue_tasks_completed" if flag else "queue_tasks_failed")
+        return f"Worker {self.worker_id} completed {completed} tasks, {failed} failed"
@@ -10,7 +10,9 @@ Methods:
     __scrape_resources():
         Scrapes external resources from a webpage and returns a dictionary of the scraped resources.
     __write_resources():
-        Writes the scraped external resources to a JSON file and returns a message indicating the success of the write operation.
+        Writes the scraped external resources to a JSON file and returns a flag and a message indicating the success of the write operation.
+    execute():
+        Runs the controller and returns a flag indicating success and its message.
     main():
         Entry point of the controller that orchestrates the scraping and writing process.
 
@@ -22,16 +24,18 @@ from controllers.base import BaseController
 
 
 class ResourceScrapeController(BaseController):
-    def __init__(self, file_name=None):
+    def __init__(self, file_name=None, page_cache=None, url=None):
         """
         Initialize the ResourceScrapeController instance.
 
         Args:
             file_name (str, optional): The name of the output JSON file. If not provided, a default name is used.
+            page_cache (PageArtifactCache, optional): The per-run page cache shared with other controllers.
+            url (str, optional): The URL of the site to scrape. Defaults to the CFC website.
         """
         if not file_name:
             file_name = "external_resources.json"
-        super(ResourceScrapeController, self).__init__(file_name)
+        super(ResourceScrapeController, self).__init__(file_name, page_cache, url)
 
     def __scrape_resources(self):
         """
@@ -48,39 +52,50 @@ class ResourceScrapeController(BaseController):
 
     def __write_resources(self):
         """
-        Writes the scraped external resources to a JSON file and returns a message indicating the success of the write operation.
+        Writes the scraped external resources to a JSON file and returns a flag and a message indicating the success of the write operation.
 
         Returns:
-            str: Message indicating the success of the write operation or an error message if writing fails.
+            tuple: A tuple containing a flag indicating success (bool) and a message (str) confirming the write or the error message.
         """
         try:
             flag, external_resources = self.__scrape_resources()
             if not flag:
-                return f"Error Writing file to {self.file_name} due to {external_resources}"
+                return False, f"Error Writing file to {self.file_name} due to {external_resources}"
             flag, errors = self.file_writer_obj.write_to_json_file(
                 external_resources,
                 self.file_name
             )
             if not flag:
-                return f"Error Writing file to {self.file_name} due to {errors}"
-            return f"External resources were written to {self.file_name}"
+                return False, f"Error Writing file to {self.file_name} due to {errors}"
+            return True, f"External resources were written to {self.file_name}"
         except Exception as e:
-            return f"Error Writing file to {self.file_name} due to {e.args}"
+            return False, f"Error Writing file to {self.file_name} due to {e.args}"
 
-    def main(self):
+    def execute(self):
         """
-        Entry point of the controller that orchestrates the scraping and writing process.
+        Runs the controller and returns a flag indicating success and its message.
 
         Returns:
-            str: Message indicating the success of the operation or an error message if an exception occurs.
+            tuple: A tuple containing a flag indicating success (bool) and the message (str) of the operation.
         """
         try:
-            return self.__write_resources()
+            with self.metrics.stage(f"controller.{type(self).__name__}"):
+                return self.__write_resources()
         except Exception as e:
             flag, error = self.file_writer_obj.write_logs(
                 e.args[0],
                 self.log_file
             )
             if not flag:
-                return error
-            return f"Error Writing {self.file_name} File"
+                return False, error
+            return False, f"Error Writing {self.file_name} File"
+
+    def main(self):
+        """
+        Entry point of the controller that orchestrates the scraping and writing process.
+
+        Returns:
+            str: Message indicating the success of the operation or an error message if an exception occurs.
+        """
+        _, message = self.execute()
+        return message
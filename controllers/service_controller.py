@@ -0,0 +1,81 @@
+"""
+ScrapeServiceController
+
+A controller class running the local scrape service: a long-running HTTP/JSON API answering resources and word count
+requests for any site from an in-memory result cache.
+
+Attributes:
+    server (ScrapeServer): The HTTP server, bound when the controller is created.
+
+Methods:
+    get_server_url():
+        Returns the base URL the service listens on.
+    shutdown():
+        Stops a running service.
+    main():
+        Entry point of the controller that serves requests until the service is stopped.
+
+Inherits:
+    BaseController
+"""
+
+from controllers.base import BaseController
+from utilities.result_cache import ResultCache
+from utilities.scrape_service import ScrapeServer, ScrapeService
+
+
+class ScrapeServiceController(BaseController):
+    def __init__(self, host="127.0.0.1", port=8080, cache_size=256, cache_ttl=300.0):
+        """
+        Initialize the ScrapeServiceController instance and bind the server to its address.
+
+        Args:
+            host (str, optional): The interface to listen on. Defaults to localhost only.
+            port (int, optional): The port to listen on; 0 picks a free port. Defaults to 8080.
+            cache_size (int, optional): The number of results kept in memory. Defaults to 256.
+            cache_ttl (float, optional): Seconds a result is served before the site is scraped again.
+                                         Defaults to 300.
+        """
+        super(ScrapeServiceController, self).__init__()
+        service = ScrapeService(ResultCache(max_entries=cache_size, ttl=cache_ttl))
+        self.server = ScrapeServer((host, port), service)
+
+    def get_server_url(self):
+        """
+        Get the base URL the service listens on.
+
+        Returns:
+            str: The base URL, e.g. "http://127.0.0.1:8080".
+        """
+        return self.server.get_url()
+
+    def shutdown(self):
+        """
+        Stops a running service; main() returns once the request loop has exited.
+        """
+        self.server.shutdown()
+
+    def main(self):
+        """
+        Entry point of the controller that serves requests until shutdown() is called or the process is interrupted.
+
+        Returns:
+            str: Message indicating that the service stopped or an error message if an exception occurs.
+        """
+        try:
+            with self.metrics.stage(f"controller.{type(self).__name__}"):
+                try:
+                    self.server.serve_forever()
+                except KeyboardInterrupt:
+                    pass
+                finally:
+                    self.server.server_close()
+                return f"Scrape service on {self.get_server_url()} stopped"
+        except Exception as e:
+            flag, error = self.file_writer_obj.write_logs(
+                e.args[0],
+                self.log_file
+            )
+            if not flag:
+                return error
+            return "Error Running Scrape Service"
@@ -0,0 +1,147 @@
+"""
+WatchController
+
+A controller class re-checking a site on a schedule and appending only what changed, the added and removed external
+resources and the changed privacy policy word counts, to an append-only NDJSON change log.
+
+The state of the last check is saved after every check, so a restarted watcher carries on from where it stopped
+instead of reporting the whole site again.
+
+Attributes:
+    file_name (str): The NDJSON change log receiving one record per check that found changes.
+    state_file_name (str): The JSON file holding the state of the last check.
+    interval (float): The seconds between two checks.
+    jitter (float): The fraction of the interval by which each wait is randomly lengthened or shortened.
+    site_watcher (SiteWatcher): The watcher of the site.
+
+Methods:
+    get_next_wait():
+        Returns the seconds to wait before the next check.
+    stop():
+        Stops a running watch after the current check.
+    main(iterations=None):
+        Entry point of the controller that checks the site until stopped.
+
+Inherits:
+    BaseController
+"""
+
+import json
+import random
+import threading
+
+from controllers.base import BaseController
+from utilities.site_watcher import SiteWatcher
+
+
+class WatchController(BaseController):
+    def __init__(self, url=None, file_name=None, state_file_name=None, interval=3600.0, jitter=0.1):
+        """
+        Initialize the WatchController instance, loading the state of an earlier watch of the same site.
+
+        Args:
+            url (str, optional): The URL of the site to watch. Defaults to the CFC website.
+            file_name (str, optional): The NDJSON change log. Defaults to "change_log.ndjson".
+            state_file_name (str, optional): The JSON state file. Defaults to "watch_state.json".
+            interval (float, optional): The seconds between two checks. Defaults to one hour.
+            jitter (float, optional): The fraction of the interval by which each wait varies, so many watchers
+                                      started together do not hit a site in lockstep. Defaults to 0.1.
+        """
+        super(WatchController, self).__init__(file_name or "change_log.ndjson", url=url)
+        self.state_file_name = state_file_name or "watch_state.json"
+        self.interval = interval
+        self.jitter = jitter
+        self.site_watcher = SiteWatcher(url, self.__load_state())
+        self.__stopped = threading.Event()
+
+    def __load_state(self):
+        """
+        Loads the state saved by an earlier watch.
+
+        Returns:
+            dict: The saved state, or None if the file is missing or unreadable.
+        """
+        try:
+            with open(self.state_file_name) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def get_next_wait(self):
+        """
+        Returns the seconds to wait before the next check: the interval, randomly lengthened or shortened by up to
+        the jitter fraction.
+
+        Returns:
+            float: The wait in seconds.
+        """
+        return max(0.0, self.interval * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    def stop(self):
+        """
+        Stops a running watch; main() returns after the current check instead of waiting for the next one.
+        """
+        self.__stopped.set()
+
+    def __check_once(self):
+        """
+        Checks the site once, appends the changes to the change log and saves the state.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and whether changes were found (bool), or the
+                   error message.
+        """
+        flag, changes = self.site_watcher.check()
+        if not flag:
+            return False, changes
+        changed = len(changes) > 2
+        if changed:
+            flag, errors = self.file_writer_obj.append_ndjson_records([changes], self.file_name)
+            if not flag:
+                return False, f"Error Writing file to {self.file_name} due to {errors}"
+        flag, errors = self.file_writer_obj.write_to_json_file(self.site_watcher.get_state(), self.state_file_name)
+        if not flag:
+            return False, f"Error Writing file to {self.state_file_name} due to {errors}"
+        return True, changed
+
+    def main(self, iterations=None):
+        """
+        Entry point of the controller that checks the site, then waits and checks again until iterations checks ran,
+        stop() is called or the process is interrupted. The error of a failed check is written to the error log and the
+        check is retried at the next interval.
+
+        Args:
+            iterations (int, optional): The number of checks to run. Defaults to checking until stopped.
+
+        Returns:
+            str: A message summarizing the checks or an error message if an exception occurs.
+        """
+        try:
+            with self.metrics.stage(f"controller.{type(self).__name__}"):
+                checks, changed_checks, failed_checks = 0, 0, 0
+                try:
+                    while iterations is None or checks < iterations:
+                        flag, changed = self.__check_once()
+                        checks += 1
+                        if not flag:
+                            failed_checks += 1
+                            self.metrics.increment("watch_errors")
+                            self.file_writer_obj.write_logs(changed, self.log_file)
+                        elif changed:
+                            changed_checks += 1
+                        if iterations is not None and checks >= iterations:
+                            break
+                        if self.__stopped.wait(self.get_next_wait()):
+                            break
+                except KeyboardInterrupt:
+                    pass
+                return (f"Watched {self.site_watcher.get_url()} {checks} times, {changed_checks} changes were "
+                        f"appended to {self.file_name}, {failed_checks} checks failed")
+        except Exception as e:
+            flag, error = self.file_writer_obj.write_logs(
+                e.args[0],
+                self.log_file
+            )
+            if not flag:
+                return error
+            return f"Error Writing {self.file_name} File"
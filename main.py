@@ -1,62 +1,617 @@
 """
 CFC Web Scraper
 
-This module contains the CFCWebScrapper class that serves as the entry point for the web scraping process.
+This module contains the CFCWebScrapper class that serves as the entry point for the web scraping process, and its
+command line interface.
 
 Classes:
 - CFCWebScrapper
 
+Usage:
+    python3 main.py
+    python3 main.py all --url https://www.example.com --output-dir results
+        Scrapes the default (or given) site and writes external_resources.json and privacy_policy_word_count.json.
+    python3 main.py resources --url https://www.example.com --output resources.json
+        Only writes the external resources of the site.
+    python3 main.py wordcount --url https://www.example.com --output word_count.json --parser lxml
+        Only writes the privacy policy word count of the site.
+    python3 main.py batch urls.txt --output-dir results
+        Scrapes every URL listed in urls.txt ("-" reads the list from stdin) and writes per-site results into results/.
+    python3 main.py crawl --max-depth 3 --max-pages 500
+        Crawls the default site and writes the external resources of all its pages into site_external_resources.json.
+    python3 main.py corpus policies.txt --workers 8
+        Counts the words of every privacy policy URL, saved HTML file or directory listed in policies.txt and writes
+        the merged count into corpus_word_count.json and per-document totals into corpus_documents.ndjson.
+    python3 main.py queue jobs.sqlite3 --enqueue urls.txt --output-dir results
+        Adds a resources and a word count task per listed site to the durable work queue in jobs.sqlite3.
+    python3 main.py queue jobs.sqlite3 --work
+        Runs a worker leasing tasks from the queue until it is drained; start any number of workers on any host.
+    python3 main.py watch --interval 3600 --change-log change_log.ndjson
+        Re-checks the default site every hour and appends only the added and removed resources and the changed
+        privacy policy word counts to change_log.ndjson.
+    python3 main.py serve --port 8080
+        Runs the local scrape service answering GET /resources?url=URL and GET /wordcount?url=URL from a warm process
+        and an in-memory result cache.
+    python3 main.py cache https://www.example.com --http-cache .http_cache --policy-cache policies.json
+        Prints what the caches hold for a URL, without network access.
+    python3 main.py all --metrics-json metrics.json --metrics-prom metrics.prom
+        Also writes the per-stage timings and counters of the run as a JSON report and in Prometheus text format.
+
+Only argparse and the lightweight cache and configuration utilities are imported before a command runs; bs4, requests
+and the controllers are imported by the commands that scrape, so "--help" and cache lookups start quickly. See
+benchmarks/bench_startup.py.
+
 """
 
-from controllers.resource_controller import ResourceScrapeController
-from controllers.privacy_policy_controller import PrivacyPolicyWordCountController
+import argparse
+import json
+import os
+import sys
+
+from utilities.parser_backends import ParserBackends
+
+COMMANDS = ("all", "resources", "wordcount", "batch", "crawl", "corpus", "queue", "watch", "serve", "cache")
 
 
 class CFCWebScrapper:
     """
     CFCWebScrapper serves as the entry point for the web scraping process.
 
+    Attributes:
+        page_cache (PageArtifactCache): The per-run page cache shared by both controllers, so the index page is
+                                        downloaded and parsed only once per run.
+        url (str): The URL of the site scraped by both controllers, or None for the CFC website.
+        output_dir (str): The directory receiving the output files of both controllers.
+
+    Controllers and utilities are imported by the entry points that use them, so the interpreter only loads bs4,
+    requests and the rest of the scraping stack for commands that scrape.
+
     Methods:
-        resource_scraper_entry_point():
+        run():
+            Executes the resource scraping and privacy policy word counting processes concurrently.
+        run_controllers():
+            Schedules both controllers concurrently on the running event loop.
+        resource_scraper_entry_point(file_name=None):
             Executes the resource scraping process.
-        privacy_policy_word_counter_entry_point():
+        privacy_policy_word_counter_entry_point(file_name=None):
             Executes the privacy policy word counting process.
+        batch_entry_point(urls, output_dir=None, workers=None):
+            Executes the resource scraping and word counting processes for many sites.
+        crawl_entry_point(url=None, max_depth=2, max_pages=100, requests_per_second=2.0):
+            Executes the site-wide resource crawling process.
+        corpus_entry_point(sources, workers=None, approximate=False, top_k=100, term_matrix_file=None):
+            Executes the word counting process for a corpus of privacy policy pages.
+        enqueue_entry_point(queue_path, urls, output_dir=None):
+            Adds the resource scraping and word counting tasks of many sites to a work queue.
+        queue_worker_entry_point(queue_path, worker_id=None, wait_seconds=0.0):
+            Runs a worker leasing tasks from a work queue.
+        watch_entry_point(url=None, change_log=None, interval=3600.0, jitter=0.1, iterations=None):
+            Re-checks a site on a schedule and appends its changes to a change log.
+        serve_entry_point(host="127.0.0.1", port=8080, cache_size=256, cache_ttl=300.0):
+            Runs the local scrape service until it is interrupted.
+        cache_lookup_entry_point(url):
+            Returns the HTTP cache and privacy policy cache entries of a URL.
+        read_url_file(file_name):
+            Reads a list of URLs from a file or stdin.
+        read_url_list(source):
+            Reads a list of URLs from a file or a stream.
 
     """
 
-    @staticmethod
-    def resource_scraper_entry_point():
+    def __init__(self, page_cache=None, url=None, output_dir=None):
+        """
+        Initializes an instance of the CFCWebScrapper.
+
+        Args:
+            page_cache (PageArtifactCache, optional): The page cache to share between controllers.
+                                                      If not provided, a new cache is created for this run.
+            url (str, optional): The URL of the site to scrape. Defaults to the CFC website.
+            output_dir (str, optional): The directory receiving the output files. Defaults to the current directory.
+
+        """
+        if page_cache is None:
+            from utilities.page_cache import PageArtifactCache
+            page_cache = PageArtifactCache()
+        self.page_cache = page_cache
+        self.url = url
+        self.output_dir = output_dir
+
+    def __get_output_file(self, file_name, default_name):
+        """
+        Returns the path of an output file: the given file name, or the default name inside the output directory,
+        which is created if needed.
+
+        Args:
+            file_name (str): The requested file name, or None.
+            default_name (str): The default file name.
+
+        Returns:
+            str: The path of the output file.
+
+        """
+        if file_name:
+            return file_name
+        if not self.output_dir:
+            return default_name
+        os.makedirs(self.output_dir, exist_ok=True)
+        return os.path.join(self.output_dir, default_name)
+
+    async def run_controllers(self):
+        """
+        Schedules the resource scraper and the privacy policy word counter concurrently on the running event loop.
+
+        Both controllers share the page cache, whose in-flight fetches are single-flight: the index page is
+        downloaded and parsed once, by whichever controller asks first, while the other waits for it instead of
+        fetching it again. A privacy policy URL known from the policy cache is fetched while the index page is
+        still in flight, so the run takes about as long as the slower controller instead of both in turn.
+
+        Returns:
+            list: The messages of the resource scraper and of the privacy policy word counter, in that order.
+
+        """
+        import asyncio
+
+        from controllers.privacy_policy_controller import PrivacyPolicyWordCountController
+        from controllers.resource_controller import ResourceScrapeController
+
+        controllers = [
+            ResourceScrapeController(self.__get_output_file(None, "external_resources.json"),
+                                     page_cache=self.page_cache, url=self.url),
+            PrivacyPolicyWordCountController(self.__get_output_file(None, "privacy_policy_word_count.json"),
+                                             page_cache=self.page_cache, url=self.url),
+        ]
+        return await asyncio.gather(*(controller.run() for controller in controllers))
+
+    def run(self):
+        """
+        Executes the resource scraping and privacy policy word counting processes concurrently.
+
+        Returns:
+            list: The messages of the resource scraper and of the privacy policy word counter, in that order.
+
+        """
+        import asyncio
+
+        return asyncio.run(self.run_controllers())
+
+    def resource_scraper_entry_point(self, file_name=None):
         """
         Executes the resource scraping process.
 
+        Args:
+            file_name (str, optional): The output JSON file. Defaults to external_resources.json in the output
+                                       directory.
+
         Returns:
             str: A message indicating the success of the resource scraping process.
 
         """
-        resource_scraper = ResourceScrapeController()
+        from controllers.resource_controller import ResourceScrapeController
+
+        resource_scraper = ResourceScrapeController(self.__get_output_file(file_name, "external_resources.json"),
+                                                    page_cache=self.page_cache, url=self.url)
         return resource_scraper.main()
 
-    @staticmethod
-    def privacy_policy_word_counter_entry_point():
+    def privacy_policy_word_counter_entry_point(self, file_name=None):
         """
         Executes the privacy policy word counting process.
 
+        Args:
+            file_name (str, optional): The output JSON file. Defaults to privacy_policy_word_count.json in the output
+                                       directory.
+
         Returns:
             str: A message indicating the success of the privacy policy word counting process.
 
         """
-        privacy_policy_word_counter = PrivacyPolicyWordCountController()
+        from controllers.privacy_policy_controller import PrivacyPolicyWordCountController
+
+        privacy_policy_word_counter = PrivacyPolicyWordCountController(
+            self.__get_output_file(file_name, "privacy_policy_word_count.json"), page_cache=self.page_cache,
+            url=self.url)
         return privacy_policy_word_counter.main()
 
+    @staticmethod
+    def batch_entry_point(urls, output_dir=None, workers=None):
+        """
+        Executes the resource scraping and privacy policy word counting processes for many sites, fanning parsing and
+        counting out to a process pool.
+
+        Args:
+            urls (iterable): The URLs of the index pages to scrape.
+            output_dir (str, optional): The directory receiving per-site results.
+            workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+
+        Returns:
+            str: A message indicating the success of the batch process.
+
+        """
+        from controllers.batch_controller import BatchScrapeController
+
+        batch_scraper = BatchScrapeController(urls, output_dir=output_dir, workers=workers)
+        return batch_scraper.main()
+
+    @staticmethod
+    def crawl_entry_point(url=None, max_depth=2, max_pages=100, requests_per_second=2.0):
+        """
+        Executes the site-wide resource crawling process.
+
+        Args:
+            url (str, optional): The URL the crawl starts from. Defaults to the CFC website.
+            max_depth (int, optional): The number of link hops followed from the start URL. Defaults to 2.
+            max_pages (int, optional): The maximum number of pages fetched. Defaults to 100.
+            requests_per_second (float, optional): Maximum request rate per host. Defaults to 2.
+
+        Returns:
+            str: A message indicating the success of the crawling process.
+
+        """
+        from controllers.crawl_controller import SiteCrawlController
+
+        site_crawler = SiteCrawlController(url=url, max_depth=max_depth, max_pages=max_pages,
+                                           requests_per_second=requests_per_second)
+        return site_crawler.main()
+
+    @staticmethod
+    def corpus_entry_point(sources, workers=None, approximate=False, top_k=100, term_matrix_file=None):
+        """
+        Executes the word counting process for a corpus of privacy policy pages, counting in a process pool and
+        merging the partial counts in a tree.
+
+        Args:
+            sources (iterable): Privacy policy URLs, saved HTML files or directories of saved HTML files.
+            workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+            approximate (bool, optional): Count in fixed memory and keep only the top_k words. Defaults to False.
+            top_k (int, optional): The number of words kept in approximate mode. Defaults to 100.
+            term_matrix_file (str, optional): Also write the term frequencies of every document to this .npz file.
+
+        Returns:
+            str: A message indicating the success of the corpus word counting process.
+
+        """
+        from controllers.corpus_controller import CorpusWordCountController
+
+        corpus_word_counter = CorpusWordCountController(sources, workers=workers, approximate=approximate,
+                                                        top_k=top_k, term_matrix_file=term_matrix_file)
+        return corpus_word_counter.main()
+
+    @staticmethod
+    def enqueue_entry_point(queue_path, urls, output_dir=None):
+        """
+        Adds the resource scraping and privacy policy word counting tasks of many sites to a durable work queue.
+
+        Args:
+            queue_path (str): The SQLite database file of the queue.
+            urls (iterable): The URLs of the index pages to scrape.
+            output_dir (str, optional): The directory receiving per-site results.
+
+        Returns:
+            str: A message indicating the number of tasks added.
+
+        """
+        from controllers.queue_worker_controller import QueueWorkerController
+        from utilities.work_queue import WorkQueue
+
+        queue_worker = QueueWorkerController(WorkQueue(queue_path), output_dir=output_dir)
+        return f"{queue_worker.enqueue_sites(urls)} tasks were added to {queue_path}"
+
+    @staticmethod
+    def queue_worker_entry_point(queue_path, worker_id=None, wait_seconds=0.0):
+        """
+        Runs a worker leasing tasks from a durable work queue until it is drained.
+
+        Args:
+            queue_path (str): The SQLite database file of the queue.
+            worker_id (str, optional): The identity of the worker. Defaults to the host name and process id.
+            wait_seconds (float, optional): Keep polling an empty queue this long before stopping. Defaults to 0.
+
+        Returns:
+            str: A message summarizing the tasks run by the worker.
+
+        """
+        from controllers.queue_worker_controller import QueueWorkerController
+        from utilities.work_queue import WorkQueue
+
+        queue_worker = QueueWorkerController(WorkQueue(queue_path), worker_id=worker_id)
+        return queue_worker.main(wait_seconds=wait_seconds)
+
+    @staticmethod
+    def watch_entry_point(url=None, change_log=None, interval=3600.0, jitter=0.1, iterations=None):
+        """
+        Re-checks a site on a schedule and appends the added and removed resources and the changed privacy policy
+        word counts to an append-only change log.
+
+        Args:
+            url (str, optional): The URL of the site to watch. Defaults to the CFC website.
+            change_log (str, optional): The NDJSON change log. Defaults to "change_log.ndjson".
+            interval (float, optional): The seconds between two checks. Defaults to one hour.
+            jitter (float, optional): The fraction of the interval by which each wait varies. Defaults to 0.1.
+            iterations (int, optional): The number of checks to run. Defaults to checking until interrupted.
+
+        Returns:
+            str: A message summarizing the checks.
+
+        """
+        from controllers.watch_controller import WatchController
+
+        watcher = WatchController(url, change_log, interval=interval, jitter=jitter)
+        return watcher.main(iterations)
+
+    @staticmethod
+    def serve_entry_point(host="127.0.0.1", port=8080, cache_size=256, cache_ttl=300.0):
+        """
+        Runs the local scrape service until it is interrupted.
+
+        Args:
+            host (str, optional): The interface to listen on. Defaults to localhost only.
+            port (int, optional): The port to listen on. Defaults to 8080.
+            cache_size (int, optional): The number of results kept in memory. Defaults to 256.
+            cache_ttl (float, optional): Seconds a result is served before the site is scraped again.
+                                         Defaults to 300.
+
+        Returns:
+            str: A message indicating that the service stopped.
+
+        """
+        from controllers.service_controller import ScrapeServiceController
+
+        service = ScrapeServiceController(host, port, cache_size=cache_size, cache_ttl=cache_ttl)
+        print(f"Scrape service listening on {service.get_server_url()}")
+        return service.main()
+
+    @staticmethod
+    def cache_lookup_entry_point(url):
+        """
+        Returns what the configured HTTP cache and privacy policy cache hold for a URL, without any network access.
+
+        Args:
+            url (str): The URL of a page, or of the index page of a site for the privacy policy cache.
+
+        Returns:
+            str: The JSON of the "http_cache" and "policy_cache" entries, each null when missing or not configured.
+
+        """
+        from utilities.http_cache import DiskHttpCache
+        from utilities.privacy_policy_cache import PrivacyPolicyCache
+
+        http_cache = DiskHttpCache.get_shared_cache()
+        policy_cache = PrivacyPolicyCache.get_shared_cache()
+        return json.dumps({
+            "http_cache": http_cache.lookup(url) if http_cache is not None else None,
+            "policy_cache": policy_cache.lookup(url) if policy_cache is not None else None,
+        }, indent=4)
+
+    @staticmethod
+    def read_url_file(file_name):
+        """
+        Reads a list of URLs from a file, or from stdin when file_name is "-".
+
+        Args:
+            file_name (str): The path of the file, or "-".
+
+        Returns:
+            list: The URLs in the order they appear.
+
+        """
+        if file_name == "-":
+            return CFCWebScrapper.read_url_list(sys.stdin)
+        with open(file_name) as url_file:
+            return CFCWebScrapper.read_url_list(url_file)
+
+    @staticmethod
+    def read_url_list(source):
+        """
+        Reads a list of URLs, one per line, skipping blank lines and "#" comments.
+
+        Args:
+            source (file object): An open text file or stdin.
+
+        Returns:
+            list: The URLs in the order they appear.
+
+        """
+        urls = []
+        for line in source:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                urls.append(line)
+        return urls
+
+
+def parse_arguments(arguments=None):
+    """
+    Parses the command line arguments. Without a command, the "all" command is run, so "python3 main.py" keeps
+    scraping the default site.
+
+    Args:
+        arguments (list, optional): The arguments to parse. Defaults to sys.argv[1:].
+
+    Returns:
+        argparse.Namespace: The parsed arguments, with the name of the command in "command".
+
+    """
+    arguments = list(sys.argv[1:] if arguments is None else arguments)
+    if not arguments or (arguments[0] not in COMMANDS and arguments[0] not in ("-h", "--help")):
+        arguments.insert(0, "all")
+
+    options = argparse.ArgumentParser(add_help=False)
+    options.add_argument("--parser", choices=ParserBackends.available_parsers(), default=None,
+                         help="installed HTML parser backend (defaults to the fastest installed one)")
+    options.add_argument("--http-cache", metavar="DIR", default=None,
+                         help="keep fetched pages in DIR and revalidate them with conditional requests")
+    options.add_argument("--cache-ttl", type=float, default=None,
+                         help="serve cached pages younger than this many seconds without revalidation")
+    options.add_argument("--cache-max-mb", type=float, default=50,
+                         help="size cap of the HTTP cache in MB; least recently used pages are evicted first")
+    options.add_argument("--policy-cache", metavar="FILE", default=None,
+                         help="remember discovered privacy policy URLs per domain in FILE, so later runs skip the index page")
+    options.add_argument("--policy-cache-ttl", type=float, default=7 * 24 * 3600,
+                         help="seconds before a remembered privacy policy URL is revalidated with a HEAD request")
+    options.add_argument("--drop-stopwords", action="store_true",
+                         help="leave common English words such as \"the\" and \"and\" out of word counts")
+    options.add_argument("--drop-numbers", action="store_true", help="leave numbers out of word counts")
+    options.add_argument("--metrics-json", metavar="FILE", default=None,
+                         help="write the per-stage timings and counters of the run to FILE as JSON")
+    options.add_argument("--metrics-prom", metavar="FILE", default=None,
+                         help="write the per-stage timings and counters of the run to FILE in Prometheus text format")
+
+    parser = argparse.ArgumentParser(description="Scrape external resources and privacy policy word counts.")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    command = commands.add_parser("all", parents=[options],
+                                  help="write the external resources and the privacy policy word count of a site")
+    command.add_argument("--url", default=None, help="the site to scrape (defaults to the CFC website)")
+    command.add_argument("--output-dir", default=None,
+                         help="directory receiving both output files (defaults to the current directory)")
+
+    command = commands.add_parser("resources", parents=[options], help="write the external resources of a site")
+    command.add_argument("--url", default=None, help="the site to scrape (defaults to the CFC website)")
+    command.add_argument("--output", metavar="FILE", default="external_resources.json", help="the output JSON file")
+
+    command = commands.add_parser("wordcount", parents=[options],
+                                  help="write the privacy policy word count of a site")
+    command.add_argument("--url", default=None, help="the site to scrape (defaults to the CFC website)")
+    command.add_argument("--output", metavar="FILE", default="privacy_policy_word_count.json",
+                         help="the output JSON file")
+
+    command = commands.add_parser("batch", parents=[options], help="scrape every site listed in a file")
+    command.add_argument("urls", metavar="FILE", help='file with one URL per line ("-" reads the list from stdin)')
+    command.add_argument("--output-dir", default="batch_output", help="directory receiving per-site results")
+    command.add_argument("--workers", type=int, default=None,
+                         help="number of worker processes (defaults to the number of CPUs)")
+
+    command = commands.add_parser("crawl", parents=[options],
+                                  help="crawl a site and write the external resources of all its pages")
+    command.add_argument("--url", default=None, help="the site to crawl (defaults to the CFC website)")
+    command.add_argument("--max-depth", type=int, default=2, help="number of link hops followed")
+    command.add_argument("--max-pages", type=int, default=100, help="maximum number of pages fetched")
+    command.add_argument("--rate-limit", type=float, default=2.0, help="maximum requests per second to the site")
+
+    command = commands.add_parser("corpus", parents=[options],
+                                  help="count the words of many privacy policy pages into one merged count")
+    command.add_argument("sources", metavar="FILE",
+                         help='file listing policy URLs, saved HTML files or directories ("-" reads from stdin)')
+    command.add_argument("--workers", type=int, default=None,
+                         help="number of worker processes (defaults to the number of CPUs)")
+    command.add_argument("--approximate", action="store_true",
+                         help="count in fixed memory with a Count-Min sketch and keep only the top-k words")
+    command.add_argument("--top-k", type=int, default=100, help="number of most frequent words kept with --approximate")
+    command.add_argument("--term-matrix", metavar="FILE", default=None,
+                         help="also write the term frequencies of every document as a sparse matrix to FILE (.npz)")
+
+    command = commands.add_parser("queue", parents=[options], help="fill or work a durable SQLite work queue")
+    command.add_argument("queue", metavar="QUEUE", help="the SQLite database of the work queue")
+    action = command.add_mutually_exclusive_group(required=True)
+    action.add_argument("--enqueue", metavar="FILE",
+                        help='add a task per site listed in FILE to the queue ("-" reads from stdin)')
+    action.add_argument("--work", action="store_true", help="run a worker leasing tasks from the queue")
+    command.add_argument("--output-dir", default="batch_output", help="directory receiving per-site results")
+    command.add_argument("--worker-id", default=None,
+                         help="identity of the worker (defaults to the host name and process id)")
+    command.add_argument("--wait", type=float, default=0.0,
+                         help="seconds a worker keeps polling an empty queue before stopping")
+
+    command = commands.add_parser("watch", parents=[options],
+                                  help="re-check a site on a schedule and append only its changes to a change log")
+    command.add_argument("--url", default=None, help="the site to watch (defaults to the CFC website)")
+    command.add_argument("--change-log", metavar="FILE", default=None,
+                         help="the NDJSON change log (defaults to change_log.ndjson)")
+    command.add_argument("--interval", type=float, default=3600.0, help="seconds between two checks")
+    command.add_argument("--jitter", type=float, default=0.1,
+                         help="fraction of the interval by which each wait randomly varies")
+    command.add_argument("--iterations", type=int, default=None,
+                         help="number of checks (defaults to checking until interrupted)")
+
+    command = commands.add_parser("serve", parents=[options],
+                                  help="run the local scrape service answering /resources and /wordcount requests")
+    command.add_argument("--host", default="127.0.0.1", help="interface the service listens on")
+    command.add_argument("--port", type=int, default=8080, help="port the service listens on")
+    command.add_argument("--result-cache-size", type=int, default=256,
+                         help="number of scrape results the service keeps in memory")
+    command.add_argument("--result-ttl", type=float, default=300.0,
+                         help="seconds the service serves a result before scraping the site again")
+
+    command = commands.add_parser("cache", parents=[options],
+                                  help="print the HTTP cache and privacy policy cache entries of a URL")
+    command.add_argument("url", help="the URL to look up")
+
+    return parser.parse_args(arguments)
+
+
+def configure_run(args):
+    """
+    Configures the process-wide parser, caches and tokenizer from the parsed arguments.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+
+    """
+    from utilities.http_cache import DiskHttpCache
+    from utilities.privacy_policy_cache import PrivacyPolicyCache
+    from utilities.tokenizer import ENGLISH_STOPWORDS, WordTokenizer
+
+    ParserBackends.set_default_parser(args.parser)
+    DiskHttpCache.configure_shared_cache(args.http_cache, max_bytes=int(args.cache_max_mb * 1024 * 1024),
+                                         ttl=args.cache_ttl)
+    PrivacyPolicyCache.configure_shared_cache(args.policy_cache, ttl=args.policy_cache_ttl)
+    WordTokenizer.configure_shared_tokenizer(stopwords=ENGLISH_STOPWORDS if args.drop_stopwords else None,
+                                             drop_numbers=args.drop_numbers)
+
+
+def run_command(args):
+    """
+    Runs the command of the parsed arguments.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+
+    Returns:
+        list: The messages of the command, one per line of output.
+
+    """
+    if args.command == "all":
+        return CFCWebScrapper(url=args.url, output_dir=args.output_dir).run()
+    if args.command == "resources":
+        return [CFCWebScrapper(url=args.url).resource_scraper_entry_point(args.output)]
+    if args.command == "wordcount":
+        return [CFCWebScrapper(url=args.url).privacy_policy_word_counter_entry_point(args.output)]
+    if args.command == "batch":
+        return [CFCWebScrapper.batch_entry_point(CFCWebScrapper.read_url_file(args.urls), args.output_dir,
+                                                 args.workers)]
+    if args.command == "crawl":
+        return [CFCWebScrapper.crawl_entry_point(args.url, args.max_depth, args.max_pages, args.rate_limit)]
+    if args.command == "corpus":
+        return [CFCWebScrapper.corpus_entry_point(CFCWebScrapper.read_url_file(args.sources), args.workers,
+                                                  args.approximate, args.top_k, args.term_matrix)]
+    if args.command == "queue" and args.enqueue:
+        return [CFCWebScrapper.enqueue_entry_point(args.queue, CFCWebScrapper.read_url_file(args.enqueue),
+                                                   args.output_dir)]
+    if args.command == "queue":
+        return [CFCWebScrapper.queue_worker_entry_point(args.queue, args.worker_id, args.wait)]
+    if args.command == "watch":
+        return [CFCWebScrapper.watch_entry_point(args.url, args.change_log, args.interval, args.jitter,
+                                                 args.iterations)]
+    if args.command == "serve":
+        return [CFCWebScrapper.serve_entry_point(args.host, args.port, args.result_cache_size, args.result_ttl)]
+    return [CFCWebScrapper.cache_lookup_entry_point(args.url)]
+
 
 if __name__ == "__main__":
     """
     Entry point of the CFC Web Scraper.
 
-    Create an instance of CFCWebScrapper and execute the resource scraper and privacy policy word counter.
-    Print the results of both processes.
+    Parse the command line, configure the shared parser, caches and tokenizer, run the command and print its
+    messages. Without a command, execute the resource scraper and privacy policy word counter concurrently. Write
+    the metrics report of the run when requested.
 
     """
-    scraper_instance = CFCWebScrapper()
-    print(scraper_instance.resource_scraper_entry_point())
-    print(scraper_instance.privacy_policy_word_counter_entry_point())
+    args = parse_arguments()
+    configure_run(args)
+    for message in run_command(args):
+        print(message)
+    if args.metrics_json or args.metrics_prom:
+        from utilities.metrics import MetricsRecorder
+
+        flag, error = MetricsRecorder.get_shared_recorder().write_report(args.metrics_json, args.metrics_prom)
+        if not flag:
+            print(f"Error Writing metrics report due to {error}")
@@ -0,0 +1,35 @@
+from benchmarks.fixtures import build_page
+from benchmarks.suite import compare_results, run_suite
+
+
+class TestBenchmarkSuite:
+    def test_build_page(self):
+        """
+        Test case for the build_page function of the benchmark fixtures.
+
+        Tests that minified pages are single-line and pages reach the requested size.
+        """
+        minified_page = build_page(size_kb=8, profile="script", minified=True)
+        pretty_page = build_page(size_kb=8, profile="text", minified=False)
+        assert "\n" not in minified_page
+        assert pretty_page.count("\n") > 10
+        assert len(pretty_page) >= 8 * 1024
+        assert "privacy-policy" in minified_page
+
+    def test_run_suite(self):
+        """
+        Test case for the run_suite function of the benchmark suite on a tiny fixture matrix.
+        """
+        results = run_suite([2], url_density=2.0, repeat=1, parser="html.parser")
+        assert "fetch_url_list[text-pretty-2kb]" in results["results"]
+        assert "write_to_json_file[script-minified-2kb]" in results["results"]
+        assert all(measurement["seconds"] >= 0 for measurement in results["results"].values())
+
+    def test_compare_results(self):
+        """
+        Test case for the compare_results function of the benchmark suite.
+        """
+        baseline = {"results": {"case": {"seconds": 1.0, "peak_bytes": 1000}}}
+        current = {"results": {"case": {"seconds": 1.5, "peak_bytes": 1100}, "new_case": {"seconds": 9, "peak_bytes": 9}}}
+        regressions = compare_results(current, baseline, threshold=0.25)
+        assert [(case, metric) for case, metric, *_ in regressions] == [("case", "seconds")]
@@ -0,0 +1,210 @@
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class LocalSite:
+    """
+    A local stand-in HTTP site serving in-memory pages, so tests can exercise the scrappers without network access.
+
+    Attributes:
+        pages (dict): Mapping of request path to the HTML body served for it.
+        requests (list): The (path, client port) pairs of every request received, in arrival order.
+        statuses (list): The status code of every response sent, in order.
+        delay (float): Seconds each response is delayed by, used to simulate network latency.
+        last_headers (dict): The headers of the most recent request.
+        max_in_flight (int): The highest number of requests served concurrently.
+    """
+
+    def __init__(self):
+        self.pages = {}
+        self.requests = []
+        self.statuses = []
+        self.delay = 0
+        self.last_headers = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.base_url = None
+        self.__lock = threading.Lock()
+
+    def add_page(self, path, body):
+        """
+        Serve the given body at the given path.
+
+        Args:
+            path (str): The request path, e.g. "/en-gb/support/privacy-policy/".
+            body (str): The HTML body.
+        """
+        self.pages[path] = body
+
+    def add_synthetic_sites(self, count):
+        """
+        Serve many synthetic sites under "/site-<n>/", each with external resources and a privacy policy page.
+
+        Args:
+            count (int): The number of sites to serve.
+
+        Returns:
+            list: The index URLs of the synthetic sites.
+        """
+        urls = []
+        for number in range(count):
+            prefix = f"/site-{number}"
+            self.add_page(f"{prefix}/", f"""
+                <html>
+                    <head>
+                        <script src="https://cdn{number}.example.net/app.js"></script>
+                        <link rel="stylesheet" href="https://cdn{number}.example.net/site.css">
+                    </head>
+                    <body>
+                        <img src="https://img.example.org/{number}.png">
+                        <a href="{prefix}/about/">About</a>
+                        <a href="{prefix}/privacy-policy/">Privacy Policy</a>
+                    </body>
+                </html>
+            """)
+            self.add_page(f"{prefix}/privacy-policy/", f"""
+                <html>
+                    <body>
+                        <h1>Privacy Policy of site {number}</h1>
+                        <p>Site {number} collects data. Data is protected.</p>
+                    </body>
+                </html>
+            """)
+            urls.append(self.url(f"{prefix}/"))
+        return urls
+
+    def url(self, path="/"):
+        """
+        Build the absolute URL of a path on this site.
+
+        Args:
+            path (str, optional): The request path. Defaults to "/".
+
+        Returns:
+            str: The absolute URL.
+        """
+        return f"{self.base_url}{path}"
+
+    def record(self, path, port):
+        with self.__lock:
+            self.requests.append((path, port))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def release(self):
+        with self.__lock:
+            self.in_flight -= 1
+
+    def request_count(self, path):
+        """
+        Count the requests received for a path.
+
+        Args:
+            path (str): The request path.
+
+        Returns:
+            int: The number of requests received for the path.
+        """
+        return len([request for request in self.requests if request[0] == path])
+
+
+class LocalSiteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        site = self.server.site
+        site.record(self.path, self.client_address[1])
+        try:
+            self.serve_page(site)
+        finally:
+            site.release()
+
+    def do_HEAD(self):
+        site = self.server.site
+        site.record(self.path, self.client_address[1])
+        try:
+            self.serve_page(site, head_only=True)
+        finally:
+            site.release()
+
+    def serve_page(self, site, head_only=False):
+        site.last_headers = dict(self.headers)
+        if site.delay:
+            time.sleep(site.delay)
+        body = site.pages.get(self.path)
+        if body is None:
+            self.send_empty_response(site, 404)
+            return
+        payload = body.encode("utf-8")
+        etag = f'"{hashlib.sha1(payload).hexdigest()[:16]}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_empty_response(site, 304)
+            return
+        site.statuses.append(200)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(payload)
+
+    def send_empty_response(self, site, status):
+        site.statuses.append(status)
+        self.send_response(status)
+        if status != 304:
+            self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+@pytest.fixture
+def local_site():
+    """
+    Fixture for a LocalSite served on an ephemeral localhost port for the duration of a test.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LocalSiteHandler)
+    server.daemon_threads = True
+    server.site = LocalSite()
+    server.site.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.site
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cfc_site(local_site):
+    """
+    Fixture for a LocalSite mirroring the structure of the CFC index and privacy policy pages.
+    """
+    local_site.add_page("/", """
+        <html>
+            <head>
+                <title>CFC UnderWriting</title>
+                <link rel="stylesheet" href="https://cdn.example.net/styles.css">
+                <script src="https://cdn.example.net/app.js"></script>
+            </head>
+            <body>
+                <img src="https://images.example.org/logo.png">
+                <a href="/en-gb/support/privacy-policy/">Privacy Policy</a>
+                <a href="/en-gb/support/terms">Terms of Service</a>
+            </body>
+        </html>
+    """)
+    local_site.add_page("/en-gb/support/privacy-policy/", """
+        <html>
+            <body>
+                <h1>Privacy Policy</h1>
+                <p>We respect your privacy. Privacy matters to us.</p>
+            </body>
+        </html>
+    """)
+    return local_site
@@ -0,0 +1,80 @@
+import asyncio
+import json
+import time
+
+import pytest
+from controllers.resource_controller import ResourceScrapeController
+from main import CFCWebScrapper
+from utilities.page_cache import PageArtifactCache
+from utilities.privacy_policy_cache import PrivacyPolicyCache
+
+
+class TestBaseControllerRun:
+    @pytest.fixture
+    def policy_cache(self, tmp_path):
+        """
+        Fixture enabling the shared privacy policy cache for the duration of a test.
+        """
+        policy_cache = PrivacyPolicyCache.configure_shared_cache(str(tmp_path / "policy_cache.json"))
+        yield policy_cache
+        PrivacyPolicyCache.configure_shared_cache(None)
+
+    def test_run(self, cfc_site, tmp_path):
+        """
+        Test case for the run method of BaseController.
+
+        Tests that awaiting run() returns the message of main().
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+            tmp_path (Path): Temporary directory of the test.
+        """
+        controller = ResourceScrapeController(file_name=str(tmp_path / "external_resources.json"),
+                                              url=cfc_site.url("/"))
+        message = asyncio.run(controller.run())
+        assert message == f"External resources were written to {controller.file_name}"
+
+    def test_scrapper_run_shares_index_page(self, cfc_site, tmp_path, monkeypatch):
+        """
+        Test case for the run method of CFCWebScrapper.
+
+        Tests that both controllers run concurrently, write their files and download the index page only once.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+            tmp_path (Path): Temporary directory of the test.
+            monkeypatch (MonkeyPatch): Pytest fixture used to run in the temporary directory.
+        """
+        monkeypatch.chdir(tmp_path)
+        cfc_site.delay = 0.2
+        messages = CFCWebScrapper(url=cfc_site.url("/")).run()
+
+        assert messages == ["External resources were written to external_resources.json",
+                            "Privacy Policy Count was written to privacy_policy_word_count.json"]
+        assert cfc_site.request_count("/") == 1
+        with open(tmp_path / "privacy_policy_word_count.json") as file:
+            assert json.load(file)["privacy"] == 3
+
+    def test_scrapper_run_overlaps_fetches(self, cfc_site, tmp_path, monkeypatch, policy_cache):
+        """
+        Test case for the latency of the run method of CFCWebScrapper.
+
+        Tests that, with the privacy policy URL known from the policy cache, the index page and the privacy policy
+        page are fetched at the same time, so the run takes about one round trip instead of two.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+            tmp_path (Path): Temporary directory of the test.
+            monkeypatch (MonkeyPatch): Pytest fixture used to run in the temporary directory.
+            policy_cache (PrivacyPolicyCache): The shared privacy policy cache.
+        """
+        monkeypatch.chdir(tmp_path)
+        policy_cache.store(cfc_site.url("/"), cfc_site.url("/en-gb/support/privacy-policy/"))
+        cfc_site.delay = 0.5
+
+        started = time.perf_counter()
+        CFCWebScrapper(page_cache=PageArtifactCache(), url=cfc_site.url("/")).run()
+        elapsed = time.perf_counter() - started
+
+        assert cfc_site.max_in_flight == 2
+        assert elapsed < 2 * cfc_site.delay
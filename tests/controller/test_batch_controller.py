@@ -0,0 +1,65 @@
+import io
+import json
+import os
+
+import pytest
+from controllers.batch_controller import BatchScrapeController
+from main import CFCWebScrapper
+
+
+class TestBatchScrapeController:
+    @pytest.fixture
+    def batch_scrape_controller(self, local_site, tmp_path):
+        """
+        Fixture for creating an instance of BatchScrapeController over synthetic local sites for testing.
+        """
+        urls = local_site.add_synthetic_sites(6) + ["http://127.0.0.1:9/"]
+        return BatchScrapeController(urls, output_dir=str(tmp_path / "results"), workers=2)
+
+    def test_get_site_directory(self, batch_scrape_controller):
+        """
+        Test case for the get_site_directory method of BatchScrapeController.
+
+        Args:
+            batch_scrape_controller (BatchScrapeController): Instance of BatchScrapeController.
+        """
+        site_directory = batch_scrape_controller.get_site_directory("https://www.cfcunderwriting.com/en-gb/")
+        assert os.path.basename(site_directory) == "www.cfcunderwriting.com_en-gb"
+
+    def test_main(self, batch_scrape_controller):
+        """
+        Test case for the main method of BatchScrapeController.
+
+        Tests that every reachable site gets its own result files and the unreachable one is reported in the summary.
+
+        Args:
+            batch_scrape_controller (BatchScrapeController): Instance of BatchScrapeController.
+        """
+        message = batch_scrape_controller.main()
+        assert message == f"Batch results for 6 of 7 sites were written to {batch_scrape_controller.output_dir}"
+
+        site_directory = batch_scrape_controller.get_site_directory(batch_scrape_controller.urls[0])
+        with open(os.path.join(site_directory, "external_resources.json")) as file:
+            assert json.load(file)["scripts"] == ["https://cdn0.example.net/app.js"]
+        with open(os.path.join(site_directory, "privacy_policy_word_count.json")) as file:
+            assert json.load(file)["site"] == 2
+
+        with open(os.path.join(batch_scrape_controller.output_dir, "batch_summary.json")) as file:
+            summary = json.load(file)
+        assert summary["http://127.0.0.1:9/"].startswith("error")
+
+        with open(os.path.join(batch_scrape_controller.output_dir, "batch_results.ndjson")) as file:
+            records = [json.loads(line) for line in file]
+        # records are written in order of completion, not in the order of the URL list
+        assert sorted(record["url"] for record in records) == sorted(batch_scrape_controller.urls)
+        records = {record["url"]: record for record in records}
+        assert records[batch_scrape_controller.urls[0]]["status"] == "ok"
+        assert records[batch_scrape_controller.urls[0]]["word_count"]["site"] == 2
+        assert records["http://127.0.0.1:9/"]["status"].startswith("error")
+
+    def test_read_url_list(self):
+        """
+        Test case for the read_url_list method of CFCWebScrapper.
+        """
+        source = io.StringIO("https://a.example\n\n# comment\n  https://b.example  \n")
+        assert CFCWebScrapper.read_url_list(source) == ["https://a.example", "https://b.example"]
@@ -0,0 +1,33 @@
+import json
+
+from controllers.corpus_controller import CorpusWordCountController
+from tests.utilities.test_corpus_counter import write_policies
+from utilities.term_matrix import TermFrequencyMatrix
+
+
+class TestCorpusWordCountController:
+    def test_main(self, tmp_path):
+        """
+        Test case for the main method of CorpusWordCountController.
+
+        Args:
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        corpus_directory = tmp_path / "corpus"
+        corpus_directory.mkdir()
+        paths = write_policies(corpus_directory, ["privacy data", "data"])
+        output_file = str(tmp_path / "corpus_word_count.json")
+        controller = CorpusWordCountController(paths + [str(tmp_path / "missing.html")], output_file, workers=2,
+                                               term_matrix_file=str(tmp_path / "policies.npz"))
+
+        message = controller.main()
+
+        assert message == f"Word counts of 2 of 3 documents were written to {output_file}"
+        with open(output_file) as file:
+            assert json.load(file) == {"documents": 2, "total_words": 3, "word_count": {"data": 2, "privacy": 1}}
+        with open(tmp_path / "corpus_documents.ndjson") as file:
+            records = [json.loads(line) for line in file]
+        assert [record["words"] for record in records] == [2, 1, 0]
+        flag, term_matrix = TermFrequencyMatrix.load(str(tmp_path / "policies.npz"))
+        assert flag
+        assert term_matrix.get_labels() == paths
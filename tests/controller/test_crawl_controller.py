@@ -0,0 +1,27 @@
+import json
+
+from controllers.crawl_controller import SiteCrawlController
+from tests.utilities.test_site_crawler import add_crawl_site
+
+
+class TestSiteCrawlController:
+    def test_main(self, local_site, tmp_path):
+        """
+        Test case for the main method of SiteCrawlController.
+
+        Args:
+            local_site (LocalSite): Local HTTP server.
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        add_crawl_site(local_site)
+        output_file = str(tmp_path / "site_external_resources.json")
+        controller = SiteCrawlController(output_file, url=local_site.url("/"), requests_per_second=0)
+
+        message = controller.main()
+
+        assert message == f"External resources of 4 pages were written to {output_file}"
+        with open(output_file) as file:
+            result = json.load(file)
+        assert result["external_resources"]["https://tags.example.com/tag.js"]["pages"] == [
+            local_site.url("/b/?x=1&y=2")
+        ]
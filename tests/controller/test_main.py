@@ -0,0 +1,112 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from main import configure_run, parse_arguments, run_command
+from utilities.parser_backends import ParserBackends
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestCommandLine:
+    @pytest.fixture(autouse=True)
+    def reset_configuration(self):
+        """
+        Fixture restoring the default shared configuration after commands that configured it.
+        """
+        yield
+        configure_run(parse_arguments([]))
+
+    def test_parse_arguments_defaults_to_all(self):
+        """
+        Test case that running without a command, or with only options, runs the "all" command.
+        """
+        assert parse_arguments([]).command == "all"
+        args = parse_arguments(["--parser", "html.parser"])
+        assert args.command == "all"
+        assert args.parser == "html.parser"
+
+    def test_parser_must_be_installed(self, monkeypatch):
+        """
+        Test case that --parser only accepts installed backends, rejecting others with a usage error.
+        """
+        monkeypatch.setattr(ParserBackends, "available_parsers", classmethod(lambda cls: ["html.parser"]))
+        with pytest.raises(SystemExit):
+            parse_arguments(["--parser", "lxml"])
+
+    def test_queue_requires_an_action(self):
+        """
+        Test case that the queue command needs either --enqueue or --work.
+        """
+        with pytest.raises(SystemExit):
+            parse_arguments(["queue", "jobs.sqlite3"])
+        assert parse_arguments(["queue", "jobs.sqlite3", "--work"]).work is True
+
+    def test_resources_and_wordcount_commands(self, cfc_site, tmp_path):
+        """
+        Test case for the resources and wordcount commands with the URL and output options.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+            tmp_path (Path): Temporary directory of the test.
+        """
+        resources_file = str(tmp_path / "resources.json")
+        args = parse_arguments(["resources", "--url", cfc_site.url("/"), "--output", resources_file])
+        configure_run(args)
+        assert run_command(args) == [f"External resources were written to {resources_file}"]
+        with open(resources_file) as file:
+            assert "https://cdn.example.net/app.js" in str(json.load(file))
+
+        word_count_file = str(tmp_path / "word_count.json")
+        args = parse_arguments(["wordcount", "--url", cfc_site.url("/"), "--output", word_count_file,
+                                "--drop-stopwords"])
+        configure_run(args)
+        assert run_command(args) == [f"Privacy Policy Count was written to {word_count_file}"]
+        with open(word_count_file) as file:
+            word_count = json.load(file)
+        assert word_count["privacy"] == 3
+        assert "we" not in word_count
+
+    def test_all_command(self, cfc_site, tmp_path):
+        """
+        Test case for the all command writing both files into a new output directory.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+            tmp_path (Path): Temporary directory of the test.
+        """
+        args = parse_arguments(["all", "--url", cfc_site.url("/"), "--output-dir", str(tmp_path / "results")])
+        configure_run(args)
+        run_command(args)
+        assert os.path.exists(tmp_path / "results" / "external_resources.json")
+        assert os.path.exists(tmp_path / "results" / "privacy_policy_word_count.json")
+
+    def test_cache_command(self, tmp_path):
+        """
+        Test case for the cache command looking up the privacy policy cache.
+
+        Args:
+            tmp_path (Path): Temporary directory of the test.
+        """
+        policy_cache_file = tmp_path / "policies.json"
+        policy_cache_file.write_text(json.dumps({"www.example.com": {
+            "url": "https://www.example.com/privacy/", "discovered_at": 1, "validated_at": 1}}))
+        args = parse_arguments(["cache", "https://www.example.com/", "--policy-cache", str(policy_cache_file)])
+        configure_run(args)
+
+        entries = json.loads(run_command(args)[0])
+
+        assert entries["http_cache"] is None
+        assert entries["policy_cache"]["url"] == "https://www.example.com/privacy/"
+
+    def test_cheap_commands_do_not_import_the_scraping_stack(self):
+        """
+        Test case that parsing arguments and looking up caches does not import bs4, requests or the controllers.
+        """
+        code = ("import sys, main; args = main.parse_arguments(['cache', 'https://www.example.com']); "
+                "main.configure_run(args); main.run_command(args); "
+                "print(sorted(name for name in ('bs4', 'requests', 'controllers.base') if name in sys.modules))")
+        completed = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+        assert completed.stdout.strip() == "[]"
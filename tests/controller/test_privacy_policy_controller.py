@@ -1,5 +1,9 @@
+import json
+import os
+
 import pytest
 from controllers.privacy_policy_controller import PrivacyPolicyWordCountController
+from utilities.tokenizer import ENGLISH_STOPWORDS, WordTokenizer
 
 
 class TestPrivacyPolicyWordCountController:
@@ -27,12 +31,13 @@ class TestPrivacyPolicyWordCountController:
         """
         Test case for the __write_privacy_policy_word_count method of PrivacyPolicyWordCountController.
 
-        Tests the behavior of writing the privacy policy word frequency count to a JSON file and returning a message.
+        Tests the behavior of writing the privacy policy word frequency count to a JSON file and returning a flag and a message.
 
         Args:
             privacy_policy_word_count_controller (PrivacyPolicyWordCountController): Instance of PrivacyPolicyWordCountController.
         """
-        message = privacy_policy_word_count_controller._PrivacyPolicyWordCountController__write_privacy_policy_word_count()
+        flag, message = privacy_policy_word_count_controller._PrivacyPolicyWordCountController__write_privacy_policy_word_count()
+        assert isinstance(flag, bool)
         assert isinstance(message, str)
 
     def test_main(self, privacy_policy_word_count_controller):
@@ -46,3 +51,96 @@ class TestPrivacyPolicyWordCountController:
         """
         message = privacy_policy_word_count_controller.main()
         assert isinstance(message, str)
+
+    @pytest.fixture
+    def local_word_count_controller(self, cfc_site, tmp_path):
+        """
+        Fixture for creating an instance of PrivacyPolicyWordCountController against the local stand-in site.
+        """
+        return PrivacyPolicyWordCountController(
+            file_name=str(tmp_path / "privacy_policy_word_count.json"),
+            url=cfc_site.url("/"),
+        )
+
+    def test_main_incremental(self, local_word_count_controller, cfc_site):
+        """
+        Test case for the incremental behaviour of the main method of PrivacyPolicyWordCountController.
+
+        Tests that an unchanged page and a page whose markup changed but whose visible text did not are not
+        rewritten, and that a text change rewrites the count and writes a delta.
+
+        Args:
+            local_word_count_controller (PrivacyPolicyWordCountController): Instance of PrivacyPolicyWordCountController.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        controller = local_word_count_controller
+        assert controller.main() == f"Privacy Policy Count was written to {controller.file_name}"
+        with open(controller.file_name) as file:
+            # "privacy." in "We respect your privacy." is counted as "privacy" since punctuation is not part of a word
+            assert json.load(file)["privacy"] == 3
+        assert not os.path.exists(controller.delta_file_name)
+        written_at = os.path.getmtime(controller.file_name)
+
+        unchanged_message = f"Privacy Policy Count is unchanged, {controller.file_name} was not rewritten"
+        assert PrivacyPolicyWordCountController(controller.file_name, url=controller.base_scrapper.get_url()).main() \
+            == unchanged_message
+
+        policy_path = "/en-gb/support/privacy-policy/"
+        cfc_site.add_page(policy_path, cfc_site.pages[policy_path].replace("<body>", "<body><script>x()</script>"))
+        assert PrivacyPolicyWordCountController(controller.file_name, url=controller.base_scrapper.get_url()).main() \
+            == unchanged_message
+        assert os.path.getmtime(controller.file_name) == written_at
+
+        cfc_site.add_page(policy_path, cfc_site.pages[policy_path].replace("Privacy matters", "Security matters"))
+        assert PrivacyPolicyWordCountController(controller.file_name, url=controller.base_scrapper.get_url()).main() \
+            == f"Privacy Policy Count was written to {controller.file_name}"
+        with open(controller.delta_file_name) as file:
+            assert json.load(file)["changes"] == {"privacy": -1, "security": 1}
+
+    def test_main_not_incremental(self, cfc_site, tmp_path):
+        """
+        Test case for the main method of PrivacyPolicyWordCountController with incremental runs disabled.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        file_name = str(tmp_path / "privacy_policy_word_count.json")
+        for _ in range(2):
+            controller = PrivacyPolicyWordCountController(file_name, url=cfc_site.url("/"), incremental=False)
+            assert controller.main() == f"Privacy Policy Count was written to {file_name}"
+
+    def test_main_state_write_error(self, local_word_count_controller, tmp_path):
+        """
+        Test case that a failed write of the state file is reported instead of a successful count, so the next run
+        does not silently compare against a stale state.
+
+        Args:
+            local_word_count_controller (PrivacyPolicyWordCountController): Instance of PrivacyPolicyWordCountController.
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        controller = local_word_count_controller
+        controller.state_file_name = str(tmp_path / "missing" / "privacy_policy_word_count.state.json")
+
+        assert controller.main().startswith(f"Error Writing file to {controller.state_file_name} due to ")
+
+    def test_main_tokenizer_change(self, local_word_count_controller):
+        """
+        Test case that a run with other tokenizer options recounts an unchanged page instead of keeping the counts of
+        the previous options.
+
+        Args:
+            local_word_count_controller (PrivacyPolicyWordCountController): Instance of PrivacyPolicyWordCountController.
+        """
+        controller = local_word_count_controller
+        assert controller.main() == f"Privacy Policy Count was written to {controller.file_name}"
+        with open(controller.file_name) as file:
+            assert "we" in json.load(file)
+
+        WordTokenizer.configure_shared_tokenizer(stopwords=ENGLISH_STOPWORDS)
+        try:
+            assert PrivacyPolicyWordCountController(controller.file_name, url=controller.base_scrapper.get_url()) \
+                .main() == f"Privacy Policy Count was written to {controller.file_name}"
+        finally:
+            WordTokenizer.configure_shared_tokenizer()
+        with open(controller.file_name) as file:
+            assert "we" not in json.load(file)
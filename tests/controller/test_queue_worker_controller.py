@@ -0,0 +1,116 @@
+import json
+import os
+import time
+
+from controllers.queue_worker_controller import QueueWorkerController
+from utilities.work_queue import WorkQueue
+
+
+class TestQueueWorkerController:
+    def test_main(self, local_site, tmp_path):
+        """
+        Test case for the main method of QueueWorkerController: every enqueued task is run once and its output file
+        written, and a second worker finds the queue drained.
+
+        Args:
+            local_site (LocalSite): Local HTTP server.
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        urls = local_site.add_synthetic_sites(2)
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"))
+        worker = QueueWorkerController(queue, worker_id="worker-1", output_dir=str(tmp_path / "output"))
+
+        assert worker.enqueue_sites(urls) == 4
+        assert worker.enqueue_sites(urls) == 0
+        message = worker.main()
+
+        assert message == "Worker worker-1 completed 4 tasks, 0 failed"
+        assert queue.get_counts()[WorkQueue.DONE] == 4
+        site_directory = worker.get_site_directory(urls[1])
+        with open(os.path.join(site_directory, "privacy_policy_word_count.json")) as file:
+            assert json.load(file)["site"] == 2
+        with open(os.path.join(site_directory, "external_resources.json")) as file:
+            assert "https://cdn1.example.net/app.js" in json.dumps(json.load(file))
+        other_worker = QueueWorkerController(queue, worker_id="worker-2")
+        assert other_worker.main() == "Worker worker-2 completed 0 tasks, 0 failed"
+
+    def test_main_failed_task(self, local_site, tmp_path):
+        """
+        Test case that a task whose controller reports an error is retried and failed for good after max_attempts.
+
+        Args:
+            local_site (LocalSite): Local HTTP server.
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"), max_attempts=2)
+        worker = QueueWorkerController(queue, worker_id="worker-1", output_dir=str(tmp_path / "output"))
+        worker.enqueue_sites([local_site.url("/missing/")], kinds=("wordcount",))
+
+        message = worker.main()
+
+        assert message == "Worker worker-1 completed 0 tasks, 2 failed"
+        task = queue.get_task(1)
+        assert task["status"] == WorkQueue.FAILED
+        assert task["attempts"] == 2
+        assert task["error"].startswith("Error")
+
+    def test_late_worker_does_not_overwrite_result(self, local_site, tmp_path):
+        """
+        Test case that a worker finishing a task after its lease expired, and after another worker completed the
+        task, leaves the output of the first completion in place.
+
+        Args:
+            local_site (LocalSite): Local HTTP server.
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"), lease_seconds=0.05)
+        late_worker = QueueWorkerController(queue, worker_id="worker-1", output_dir=str(tmp_path / "output"))
+        late_worker.enqueue_sites(local_site.add_synthetic_sites(1), kinds=("resources",))
+        late_task = queue.lease("worker-1")
+        time.sleep(0.1)
+
+        worker = QueueWorkerController(queue, worker_id="worker-2", output_dir=str(tmp_path / "output"))
+        assert worker.main() == "Worker worker-2 completed 1 tasks, 0 failed"
+        file_name = late_task["payload"]["file_name"]
+        completed_inode = os.stat(file_name).st_ino
+
+        flag, message = late_worker.run_task(late_task)
+        assert flag
+        assert not late_worker.finish_task(late_task, flag, message)
+        assert os.stat(file_name).st_ino == completed_inode
+        assert queue.get_task(late_task["id"])["result"]["message"] == f"External resources were written to {file_name}"
+        assert os.listdir(os.path.dirname(file_name)) == ["external_resources.json"]
+
+    def test_wordcount_stays_incremental(self, local_site, tmp_path):
+        """
+        Test case that word count tasks see the state of earlier runs: an unchanged page is not recounted and a
+        changed page writes a delta next to the output.
+
+        Args:
+            local_site (LocalSite): Local HTTP server.
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        urls = local_site.add_synthetic_sites(1)
+        output_dir = str(tmp_path / "output")
+
+        def run_worker(name):
+            queue = WorkQueue(str(tmp_path / f"{name}.sqlite3"))
+            worker = QueueWorkerController(queue, worker_id=name, output_dir=output_dir)
+            worker.enqueue_sites(urls, kinds=("wordcount",))
+            assert worker.main() == f"Worker {name} completed 1 tasks, 0 failed"
+            return queue.get_task(1)["result"]["message"]
+
+        file_name = os.path.join(QueueWorkerController(None, output_dir=output_dir).get_site_directory(urls[0]),
+                                 "privacy_policy_word_count.json")
+        assert run_worker("first") == f"Privacy Policy Count was written to {file_name}"
+        assert os.path.exists(file_name.replace(".json", ".state.json"))
+        assert run_worker("second") == f"Privacy Policy Count is unchanged, {file_name} was not rewritten"
+
+        policy_path = "/site-0/privacy-policy/"
+        local_site.add_page(policy_path, local_site.pages[policy_path].replace("collects data", "collects cookies"))
+        assert run_worker("third") == f"Privacy Policy Count was written to {file_name}"
+        with open(file_name.replace(".json", ".delta.json")) as file:
+            assert json.load(file)["changes"] == {"cookies": 1, "data": -1}
+        assert sorted(os.listdir(os.path.dirname(file_name))) == [
+            "privacy_policy_word_count.delta.json", "privacy_policy_word_count.json",
+            "privacy_policy_word_count.state.json"]
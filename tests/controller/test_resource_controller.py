@@ -27,12 +27,13 @@ class TestResourceScrapeController:
         """
         Test case for the __write_resources method of ResourceScrapeController.
 
-        Tests the behavior of writing the scraped external resources to a JSON file and returning a message.
+        Tests the behavior of writing the scraped external resources to a JSON file and returning a flag and a message.
 
         Args:
             resource_scrape_controller (ResourceScrapeController): Instance of ResourceScrapeController.
         """
-        message = resource_scrape_controller._ResourceScrapeController__write_resources()
+        flag, message = resource_scrape_controller._ResourceScrapeController__write_resources()
+        assert isinstance(flag, bool)
         assert isinstance(message, str)
 
     def test_main(self, resource_scrape_controller):
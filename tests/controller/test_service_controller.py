@@ -0,0 +1,91 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from controllers.service_controller import ScrapeServiceController
+
+
+class TestScrapeServiceController:
+    @pytest.fixture
+    def service(self):
+        """
+        Fixture running a ScrapeServiceController on a free port for the duration of a test.
+        """
+        controller = ScrapeServiceController(port=0, cache_ttl=60)
+        messages = []
+        thread = threading.Thread(target=lambda: messages.append(controller.main()), daemon=True)
+        thread.start()
+        yield controller
+        controller.shutdown()
+        thread.join(timeout=5)
+        assert messages == [f"Scrape service on {controller.get_server_url()} stopped"]
+
+    def test_resources_and_word_count(self, service, cfc_site):
+        """
+        Test case for the /resources and /wordcount endpoints.
+
+        Tests that both endpoints answer with the scraped results, that /wordcount reuses the index page fetched by
+        /resources, and that a repeated request is served from the result cache without contacting the site.
+
+        Args:
+            service (ScrapeServiceController): The running service.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        site_url = cfc_site.url("/")
+        response = requests.get(f"{service.get_server_url()}/resources", params={"url": site_url}, timeout=10)
+        assert response.status_code == 200
+        assert response.headers["X-Cache"] == "miss"
+        assert response.json()["url"] == site_url
+        assert "https://cdn.example.net/app.js" in str(response.json()["resources"])
+
+        response = requests.get(f"{service.get_server_url()}/wordcount", params={"url": site_url}, timeout=10)
+        assert response.status_code == 200
+        assert response.json()["word_count"]["privacy"] == 3
+        assert cfc_site.request_count("/") == 1
+
+        requests_before = len(cfc_site.requests)
+        for endpoint in ("resources", "wordcount"):
+            response = requests.get(f"{service.get_server_url()}/{endpoint}", params={"url": site_url}, timeout=10)
+            assert response.headers["X-Cache"] == "hit"
+        assert len(cfc_site.requests) == requests_before
+
+        stats = requests.get(f"{service.get_server_url()}/stats", timeout=10).json()["result_cache"]
+        assert stats == {"entries": 2, "hits": 2, "misses": 2, "shared": 0}
+
+    def test_identical_concurrent_requests_share_one_scrape(self, service, cfc_site):
+        """
+        Test case for the single-flight deduplication of the service.
+
+        Tests that identical requests arriving while the site is being scraped wait for that scrape.
+
+        Args:
+            service (ScrapeServiceController): The running service.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        cfc_site.delay = 0.3
+        endpoint = f"{service.get_server_url()}/resources"
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            responses = list(executor.map(
+                lambda _: requests.get(endpoint, params={"url": cfc_site.url("/")}, timeout=10), range(4)))
+
+        assert all(response.status_code == 200 for response in responses)
+        assert sorted(response.headers["X-Cache"] for response in responses) == ["miss"] + ["shared"] * 3
+        assert cfc_site.request_count("/") == 1
+
+    def test_errors(self, service, cfc_site):
+        """
+        Test case for the error responses of the service.
+
+        Args:
+            service (ScrapeServiceController): The running service.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        base_url = service.get_server_url()
+        assert requests.get(f"{base_url}/resources", timeout=10).status_code == 400
+        assert requests.get(f"{base_url}/resources", params={"url": "file:///etc/passwd"}, timeout=10).status_code == 400
+        assert requests.get(f"{base_url}/unknown", timeout=10).status_code == 404
+
+        response = requests.get(f"{base_url}/wordcount", params={"url": cfc_site.url("/missing/")}, timeout=10)
+        assert response.status_code == 502
+        assert "error" in response.json()
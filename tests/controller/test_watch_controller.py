@@ -0,0 +1,86 @@
+import json
+
+from controllers.watch_controller import WatchController
+
+
+class TestWatchController:
+    @staticmethod
+    def read_change_log(file_name):
+        """
+        Reads the records of an NDJSON change log.
+        """
+        with open(file_name) as file:
+            return [json.loads(line) for line in file]
+
+    def test_main_appends_only_changes(self, cfc_site, tmp_path):
+        """
+        Test case for the main method of WatchController.
+
+        Tests that checks without changes append nothing, that a restarted watcher resumes from the saved state and
+        that a later change is appended to the existing change log.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+            tmp_path (Path): Temporary directory of the test.
+        """
+        change_log = str(tmp_path / "change_log.ndjson")
+        state_file = str(tmp_path / "watch_state.json")
+        controller = WatchController(cfc_site.url("/"), change_log, state_file, interval=0)
+
+        message = controller.main(iterations=2)
+
+        assert message == f"Watched {cfc_site.url('/')} 2 times, 1 changes were appended to {change_log}, 0 checks failed"
+        assert len(self.read_change_log(change_log)) == 1
+
+        cfc_site.pages["/"] += "<img src='https://images.example.org/banner.png'>"
+        restarted = WatchController(cfc_site.url("/"), change_log, state_file, interval=0)
+        restarted.main(iterations=1)
+
+        records = self.read_change_log(change_log)
+        assert len(records) == 2
+        assert records[-1]["added_resources"] == {"images": ["https://images.example.org/banner.png"]}
+        assert "word_count_changes" not in records[-1]
+
+    def test_failed_checks_are_counted(self, local_site, tmp_path):
+        """
+        Test case for the main method of WatchController against a site without pages, whose errors are logged.
+
+        Args:
+            local_site (LocalSite): Local stand-in site.
+            tmp_path (Path): Temporary directory of the test.
+        """
+        change_log = str(tmp_path / "change_log.ndjson")
+        controller = WatchController(local_site.url("/"), change_log, str(tmp_path / "watch_state.json"),
+                                     interval=0)
+        controller.log_file = str(tmp_path / "error.log")
+
+        message = controller.main(iterations=2)
+
+        assert message.endswith("2 checks failed")
+        assert not (tmp_path / "change_log.ndjson").exists()
+        with open(controller.log_file) as file:
+            assert "404" in json.load(file)
+
+    def test_get_next_wait(self):
+        """
+        Test case for the jitter of get_next_wait.
+        """
+        controller = WatchController(interval=100, jitter=0.2)
+        waits = [controller.get_next_wait() for _ in range(200)]
+        assert all(80 <= wait <= 120 for wait in waits)
+        assert len(set(waits)) > 1
+
+    def test_stop(self, cfc_site, tmp_path):
+        """
+        Test case for the stop method of WatchController.
+
+        Tests that a stopped watcher returns after its current check instead of waiting for the next one.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+            tmp_path (Path): Temporary directory of the test.
+        """
+        controller = WatchController(cfc_site.url("/"), str(tmp_path / "change_log.ndjson"),
+                                     str(tmp_path / "watch_state.json"), interval=3600)
+        controller.stop()
+        assert controller.main().startswith(f"Watched {cfc_site.url('/')} 1 times")
@@ -0,0 +1,146 @@
+import json
+import random
+from collections import Counter
+
+import pytest
+
+from utilities.approximate_counter import ApproximateWordCounter, CountMinSketch, SpaceSavingSummary
+from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+
+
+def zipf_corpus(documents=20, words_per_document=2000, vocabulary=5000, seed=7):
+    """
+    Builds a synthetic corpus whose word frequencies follow a Zipf distribution, like natural language.
+
+    Args:
+        documents (int, optional): The number of documents. Defaults to 20.
+        words_per_document (int, optional): The number of words per document. Defaults to 2000.
+        vocabulary (int, optional): The number of distinct words. Defaults to 5000.
+        seed (int, optional): The random seed. Defaults to 7.
+
+    Returns:
+        list: The documents, each a list of words.
+    """
+    generator = random.Random(seed)
+    words = [f"word{rank}" for rank in range(vocabulary)]
+    weights = [1 / (rank + 1) for rank in range(vocabulary)]
+    return [generator.choices(words, weights, k=words_per_document) for _ in range(documents)]
+
+
+class TestCountMinSketch:
+    def test_estimate_within_bounds(self):
+        """
+        Test case that estimates never undercount and overcount by at most epsilon * total, cross-checked against an
+        exact Counter.
+        """
+        corpus = [word for document in zipf_corpus() for word in document]
+        exact = Counter(corpus)
+        sketch = CountMinSketch(epsilon=0.001, delta=0.01)
+        for word in corpus:
+            sketch.add(word)
+
+        bound = 0.001 * sketch.get_total()
+        overcounts = [sketch.estimate(word) - count for word, count in exact.items()]
+        assert sketch.get_total() == len(corpus)
+        assert min(overcounts) >= 0
+        assert sum(overcount > bound for overcount in overcounts) <= 0.01 * len(exact)
+        assert sketch.get_shape() == (5, 2719)
+
+    def test_merge_and_serialize(self):
+        """
+        Test case that merging two sketches equals counting both streams in one sketch, also after a JSON round trip.
+        """
+        first, second, combined = CountMinSketch(), CountMinSketch(), CountMinSketch()
+        for word in ["a", "b", "a", "c"]:
+            first.add(word)
+            combined.add(word)
+        for word in ["a", "d"]:
+            second.add(word)
+            combined.add(word)
+
+        restored = CountMinSketch.from_dict(json.loads(json.dumps(second.to_dict())))
+        first.merge(restored)
+
+        assert first.to_dict() == combined.to_dict()
+        with pytest.raises(ValueError):
+            first.merge(CountMinSketch(seed=1))
+
+
+class TestSpaceSavingSummary:
+    def test_capacity_and_error(self):
+        """
+        Test case that the summary keeps capacity items and every count overcounts by at most its error.
+        """
+        corpus = [word for document in zipf_corpus() for word in document]
+        exact = Counter(corpus)
+        summary = SpaceSavingSummary(50)
+        for word in corpus:
+            summary.add(word)
+
+        tracked = summary.most_common()
+        assert len(tracked) == 50
+        for word, count, error in tracked:
+            assert count - error <= exact[word] <= count
+        assert {word for word, _, _ in tracked[:5]} == {word for word, _ in exact.most_common(5)}
+
+
+class TestApproximateWordCounter:
+    def test_heavy_hitters_match_exact_count(self):
+        """
+        Test case that the top words and their estimates match the exact count within the error bound.
+        """
+        corpus = zipf_corpus()
+        exact = Counter(word for document in corpus for word in document)
+        counter = ApproximateWordCounter(top_k=100)
+        for document in corpus:
+            counter.update(document)
+
+        top_words = counter.most_common(10)
+        assert [word for word, _ in top_words] == [word for word, _ in exact.most_common(10)]
+        for word, estimate in top_words:
+            assert exact[word] <= estimate <= exact[word] + counter.get_error_bound()
+        assert counter.estimate("missing") <= counter.get_error_bound()
+
+    def test_merged_workers_match_single_counter(self):
+        """
+        Test case that counters of separate workers, merged after a JSON round trip, find the same heavy hitters as a
+        single counter.
+        """
+        corpus = zipf_corpus()
+        single = ApproximateWordCounter(top_k=100)
+        workers = [ApproximateWordCounter(top_k=100) for _ in range(4)]
+        for number, document in enumerate(corpus):
+            single.update(document)
+            workers[number % 4].update(document)
+
+        merged = ApproximateWordCounter.from_dict(json.loads(json.dumps(workers[0].to_dict())))
+        for worker in workers[1:]:
+            merged.merge(worker)
+
+        assert merged.get_total() == single.get_total()
+        assert merged.get_sketch().to_dict() == single.get_sketch().to_dict()
+        assert [word for word, _ in merged.most_common(10)] == [word for word, _ in single.most_common(10)]
+
+    def test_memory_is_fixed(self):
+        """
+        Test case that the size of the state does not grow with the vocabulary.
+        """
+        counter = ApproximateWordCounter(top_k=10, epsilon=0.01)
+        counter.update(f"word{number}" for number in range(100))
+        small = len(json.dumps(counter.to_dict()))
+        counter.update(f"word{number}" for number in range(100, 100000))
+
+        assert len(counter.get_heavy_hitters().most_common()) == 10
+        assert len(json.dumps(counter.to_dict())) < 2 * small
+
+    def test_count_text_words_approximate(self):
+        """
+        Test case for the count_text_words_approximate method of BeautifulSoupContentScrapper.
+        """
+        flag, counter = BeautifulSoupContentScrapper.count_text_words_approximate("Data is DATA and data")
+        assert flag
+        flag, counter = BeautifulSoupContentScrapper.count_text_words_approximate("more data", counter)
+
+        assert flag
+        assert counter.get_total() == 7
+        assert counter.most_common(1) == [("data", 4)]
@@ -0,0 +1,136 @@
+import asyncio
+import time
+
+import pytest
+from utilities.async_scrapper import AsyncContentScrapper, count_content_words, parse_index_content
+from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+
+
+class TestAsyncContentScrapper:
+    @pytest.fixture
+    def async_content_scrapper(self):
+        """
+        Fixture for creating an instance of AsyncContentScrapper for testing.
+        """
+        return AsyncContentScrapper(concurrency=16, per_host_limit=8)
+
+    def test_parse_index_content(self):
+        """
+        Test case for the parse_index_content function.
+
+        Tests that resources and the privacy policy URL are extracted from an index page.
+        """
+        content = """
+        <html>
+            <body>
+                <script src="https://test.com/script.js"></script>
+                <a href="/en-gb/support/privacy-policy/">Privacy Policy</a>
+            </body>
+        </html>
+        """
+        flag, index_data = parse_index_content(content, "https://cfc.com")
+        assert flag is True
+        assert index_data["external_resources"]["scripts"] == ["https://test.com/script.js"]
+        assert index_data["privacy_policy_url"] == "https://cfc.com/en-gb/support/privacy-policy/"
+
+    def test_count_content_words(self):
+        """
+        Test case for the count_content_words function.
+        """
+        flag, word_count = count_content_words("<html><body><p>Data is data</p></body></html>")
+        assert flag is True
+        assert word_count == {"data": 2, "is": 1}
+
+        content = ("<html><head><title>T</title></head><body><p>Hello world</p><noscript>enable js</noscript>"
+                   "<div hidden>hidden text</div></body></html>")
+        flag, word_count = count_content_words(content)
+        assert flag is True
+        assert word_count == dict(BeautifulSoupContentScrapper.count_content_words(content)[1])
+        assert word_count == {"t": 1, "hello": 1, "world": 1}
+
+    def test_scrape_site(self, async_content_scrapper, local_site):
+        """
+        Test case for the scrape_site method of AsyncContentScrapper.
+
+        Args:
+            async_content_scrapper (AsyncContentScrapper): Instance of AsyncContentScrapper.
+            local_site (LocalSite): Local stand-in HTTP site.
+        """
+        url = local_site.add_synthetic_sites(1)[0]
+        results = async_content_scrapper.run([url])
+        flag, site_data = results[url]
+        assert flag is True
+        assert site_data["external_resources"]["scripts"] == ["https://cdn0.example.net/app.js"]
+        assert site_data["privacy_policy_url"] == local_site.url("/site-0/privacy-policy/")
+        assert site_data["word_count"]["site"] == 2
+
+    def test_scrape_site_unreachable(self, async_content_scrapper):
+        """
+        Test case for the scrape_site method of AsyncContentScrapper when the site cannot be reached.
+
+        Args:
+            async_content_scrapper (AsyncContentScrapper): Instance of AsyncContentScrapper.
+        """
+        results = async_content_scrapper.run(["http://127.0.0.1:9/"])
+        flag, _ = results["http://127.0.0.1:9/"]
+        assert flag is False
+
+    def test_scrape_sites_per_host_limit(self, local_site):
+        """
+        Test case for the per-host limit of AsyncContentScrapper.
+
+        Tests that no more than per_host_limit requests reach the same host at once.
+
+        Args:
+            local_site (LocalSite): Local stand-in HTTP site.
+        """
+        local_site.delay = 0.02
+        urls = local_site.add_synthetic_sites(12)
+        results = AsyncContentScrapper(concurrency=16, per_host_limit=3).run(urls)
+        assert all(flag is True for flag, _ in results.values())
+        assert 1 < local_site.max_in_flight <= 3
+
+    def test_scrape_sites_throughput(self, async_content_scrapper, local_site):
+        """
+        Test case for the throughput of the scrape_sites method of AsyncContentScrapper.
+
+        Tests that many synthetic sites served with simulated latency are scraped concurrently, well under the time a
+        serial run would need.
+
+        Args:
+            async_content_scrapper (AsyncContentScrapper): Instance of AsyncContentScrapper.
+            local_site (LocalSite): Local stand-in HTTP site.
+        """
+        local_site.delay = 0.05
+        urls = local_site.add_synthetic_sites(40)
+        started = time.perf_counter()
+        results = asyncio.run(async_content_scrapper.scrape_sites(urls))
+        elapsed = time.perf_counter() - started
+
+        serial_estimate = len(urls) * 2 * local_site.delay
+        assert all(flag is True for flag, _ in results.values())
+        assert len(local_site.requests) == len(urls) * 2
+        assert elapsed < serial_estimate / 2
+
+    def test_iter_sites(self, async_content_scrapper, local_site):
+        """
+        Test case for the iter_sites method of AsyncContentScrapper.
+
+        Tests that each site is yielded as soon as it finishes, before slower sites are done.
+
+        Args:
+            async_content_scrapper (AsyncContentScrapper): Instance of AsyncContentScrapper.
+            local_site (LocalSite): Local stand-in HTTP site.
+        """
+        local_site.delay = 0.3
+        urls = local_site.add_synthetic_sites(2) + ["http://127.0.0.1:9/"]
+        started = time.perf_counter()
+        sites = async_content_scrapper.iter_sites(urls)
+
+        url, (flag, _) = next(sites)
+        assert url == "http://127.0.0.1:9/" and flag is False
+        assert time.perf_counter() - started < 2 * local_site.delay
+
+        remaining = dict(sites)
+        assert sorted(remaining) == sorted(urls[:2])
+        assert all(flag is True for flag, _ in remaining.values())
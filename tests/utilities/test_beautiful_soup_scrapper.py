@@ -1,6 +1,8 @@
 import pytest
 from bs4 import BeautifulSoup
 from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+from utilities.metrics import MetricsRecorder
+from utilities.page_cache import PageArtifactCache
 
 
 class TestBeautifulSoupContentScrapper:
@@ -66,3 +68,26 @@ class TestBeautifulSoupContentScrapper:
         flag, word_count = beautifulsoup_content_scrapper.privacy_policy_word_frequency_counter()
         assert flag is True
         assert isinstance(word_count, dict)
+
+    def test_scrape_index_page_single_pass(self, cfc_site):
+        """
+        Test case that scraping the resources and finding the privacy policy URL share one extraction of the index
+        page instead of scanning it with a regex and tokenizing it again.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        page_cache = PageArtifactCache()
+        scrapper = BeautifulSoupContentScrapper(cfc_site.url("/"), page_cache=page_cache)
+        metrics = MetricsRecorder.get_shared_recorder()
+        extractions_before = (metrics.get_stage("extract_page") or {}).get("calls", 0)
+
+        flag, external_resources = scrapper.scrape_index_page()
+        assert flag is True
+        assert "https://cdn.example.net/app.js" in external_resources["scripts"]
+        flag, _ = scrapper.get_privacy_policy_url()
+        assert flag is True
+
+        assert metrics.get_stage("extract_page")["calls"] == extractions_before + 1
+        assert page_cache.get_parse_count() == 0
+        assert cfc_site.request_count("/") == 1
@@ -0,0 +1,130 @@
+import re
+from collections import Counter
+
+from utilities.corpus_counter import CorpusWordCounter, count_documents, merge_partial_counts
+
+
+def write_policies(directory, texts):
+    """
+    Writes one saved privacy policy page per text.
+
+    Args:
+        directory (Path): The directory receiving the pages.
+        texts (list): The visible text of every page.
+
+    Returns:
+        list: The paths of the pages.
+    """
+    paths = []
+    for number, text in enumerate(texts):
+        path = directory / f"policy-{number}.html"
+        path.write_text(f"<html><head><script>var hidden = 1;</script></head><body><p>{text}</p></body></html>")
+        paths.append(str(path))
+    return paths
+
+
+class TestCorpusWordCounter:
+    def test_count_matches_exact_count(self, tmp_path, local_site):
+        """
+        Test case that the merged count of files and URLs equals the exact count of every document together, and that
+        per-document totals are reported in input order.
+
+        Args:
+            tmp_path (Path): Temporary directory provided by pytest.
+            local_site (LocalSite): Local HTTP server.
+        """
+        texts = [f"We protect your data. Policy {number} data" for number in range(9)]
+        paths = write_policies(tmp_path, texts)
+        local_site.add_page("/privacy/", "<html><body><p>Data controller DATA</p></body></html>")
+        sources = paths + [local_site.url("/privacy/")]
+
+        flag, corpus = CorpusWordCounter(sources, workers=2, chunks_per_worker=2).count()
+
+        expected = Counter(re.findall(r"\w+", " ".join(texts + ["Data controller DATA"]).lower()))
+        assert flag
+        assert corpus["word_count"] == dict(expected)
+        assert list(corpus["word_count"])[0] == "data"
+        assert corpus["total_words"] == sum(expected.values())
+        assert [document["source"] for document in corpus["documents"]] == sources
+        assert corpus["documents"][-1] == {"source": local_site.url("/privacy/"), "status": "ok", "words": 3,
+                                           "distinct_words": 2}
+
+    def test_count_reports_unreadable_documents(self, tmp_path):
+        """
+        Test case that an unreadable document is reported in the per-document totals without failing the corpus.
+
+        Args:
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        paths = write_policies(tmp_path, ["privacy matters"]) + [str(tmp_path / "missing.html")]
+
+        flag, corpus = CorpusWordCounter(paths, workers=1).count()
+
+        assert flag
+        assert corpus["word_count"] == {"privacy": 1, "matters": 1}
+        assert corpus["documents"][1]["status"].startswith("error")
+
+    def test_count_approximate(self, tmp_path):
+        """
+        Test case that approximate mode keeps the top words of the corpus.
+
+        Args:
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        texts = ["data data data policy", "data policy cookies", "data rights"]
+        paths = write_policies(tmp_path, texts)
+
+        flag, corpus = CorpusWordCounter([str(tmp_path)], workers=2, approximate=True, top_k=2).count()
+
+        assert flag
+        assert list(corpus["word_count"].items())[0] == ("data", 5)
+        assert len(corpus["word_count"]) == 2
+        assert corpus["total_words"] == 9
+
+    def test_count_term_matrix(self, tmp_path):
+        """
+        Test case that the corpus term matrix holds one row per counted document, in input order.
+
+        Args:
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        paths = write_policies(tmp_path, ["data privacy data", "cookies", "data rights", "privacy"])
+
+        flag, corpus = CorpusWordCounter(paths, workers=2, chunks_per_worker=2, term_matrix=True).count()
+
+        assert flag
+        term_matrix = corpus["term_matrix"]
+        assert term_matrix.get_labels() == paths
+        assert term_matrix.get_row(paths[0]) == {"data": 2, "privacy": 1}
+        assert term_matrix.top_terms(1) == [("data", 3)]
+
+    def test_expand_sources(self, tmp_path):
+        """
+        Test case that directories are expanded into their HTML files in sorted order.
+
+        Args:
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        (tmp_path / "b.html").write_text("b")
+        (tmp_path / "a.htm").write_text("a")
+        (tmp_path / "notes.txt").write_text("skipped")
+
+        sources = CorpusWordCounter.expand_sources([str(tmp_path), "https://example.com/privacy"])
+
+        assert sources == [str(tmp_path / "a.htm"), str(tmp_path / "b.html"), "https://example.com/privacy"]
+
+    def test_map_and_reduce_steps(self, tmp_path):
+        """
+        Test case for the count_documents and merge_partial_counts functions.
+
+        Args:
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        paths = write_policies(tmp_path, ["a b b", "b c"])
+
+        left, documents, rows = count_documents(paths[:1])
+        right, _, _ = count_documents(paths[1:])
+
+        assert rows is None
+        assert documents == [{"source": paths[0], "status": "ok", "words": 3, "distinct_words": 2}]
+        assert merge_partial_counts(left, right) == {"a": 1, "b": 3, "c": 1}
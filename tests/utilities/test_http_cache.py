@@ -0,0 +1,132 @@
+import os
+
+import pytest
+from utilities.http_cache import DiskHttpCache
+from utilities.page_info import GetPageInfo
+
+
+class TestDiskHttpCache:
+    @pytest.fixture
+    def http_cache(self, tmp_path):
+        """
+        Fixture for creating an instance of DiskHttpCache in a temporary directory for testing.
+        """
+        return DiskHttpCache(str(tmp_path / "http_cache"))
+
+    def test_store_and_lookup(self, http_cache):
+        """
+        Test case for the store, lookup and read_body methods of DiskHttpCache.
+
+        Args:
+            http_cache (DiskHttpCache): Instance of DiskHttpCache.
+        """
+        assert http_cache.lookup("https://cfc.com/") is None
+        flag, _ = http_cache.store("https://cfc.com/", "<html>CFC</html>", '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT")
+        assert flag is True
+
+        entry = http_cache.lookup("https://cfc.com/")
+        assert http_cache.read_body(entry) == "<html>CFC</html>"
+        assert http_cache.get_conditional_headers(entry) == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        assert not [name for name in os.listdir(http_cache.get_directory()) if name.endswith(".tmp")]
+
+    def test_is_fresh(self, tmp_path):
+        """
+        Test case for the is_fresh method of DiskHttpCache.
+        """
+        http_cache = DiskHttpCache(str(tmp_path / "http_cache"))
+        _, entry = http_cache.store("https://cfc.com/", "body")
+        assert http_cache.is_fresh(entry) is False
+
+        ttl_cache = DiskHttpCache(str(tmp_path / "http_cache"), ttl=60)
+        assert ttl_cache.is_fresh(ttl_cache.lookup("https://cfc.com/")) is True
+
+    def test_evict(self, tmp_path):
+        """
+        Test case for the evict method of DiskHttpCache.
+
+        Tests that the least recently used entries are evicted when the cache exceeds its size cap.
+        """
+        http_cache = DiskHttpCache(str(tmp_path / "http_cache"), max_bytes=25)
+        http_cache.store("https://a.example/", "a" * 10)
+        http_cache.store("https://b.example/", "b" * 10)
+        http_cache.read_body(http_cache.lookup("https://a.example/"))
+        http_cache.store("https://c.example/", "c" * 10)
+
+        assert http_cache.lookup("https://a.example/") is not None
+        assert http_cache.lookup("https://b.example/") is None
+        assert http_cache.lookup("https://c.example/") is not None
+
+    def test_evict_index_loaded_once(self, tmp_path, monkeypatch):
+        """
+        Test case that the size index is loaded from the metadata files once and kept up to date in memory.
+
+        Tests that a cache reopened on an existing directory evicts the entries stored before, without rescanning the
+        directory on every store.
+        """
+        DiskHttpCache(str(tmp_path / "http_cache")).store("https://a.example/", "a" * 10)
+        http_cache = DiskHttpCache(str(tmp_path / "http_cache"), max_bytes=25)
+        scans = []
+        get_entries = http_cache.get_entries
+        monkeypatch.setattr(http_cache, "get_entries", lambda: scans.append(1) or get_entries())
+        for name in "bcd":
+            http_cache.store(f"https://{name}.example/", name * 10)
+
+        assert len(scans) == 1
+        assert http_cache.lookup("https://a.example/") is None
+        assert http_cache.lookup("https://b.example/") is None
+        assert http_cache.lookup("https://d.example/") is not None
+
+    def test_get_content_revalidation(self, http_cache, cfc_site):
+        """
+        Test case for the get_content method of GetPageInfo with a DiskHttpCache.
+
+        Tests that an unchanged page is revalidated with a conditional request and served from disk on 304, and a
+        changed page is downloaded again.
+
+        Args:
+            http_cache (DiskHttpCache): Instance of DiskHttpCache.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        url = cfc_site.url("/")
+        flag, first_content = GetPageInfo(url, cache=http_cache).get_content()
+        assert flag is True
+        flag, second_content = GetPageInfo(url, cache=http_cache).get_content()
+        assert flag is True
+        assert second_content == first_content
+        assert cfc_site.statuses == [200, 304]
+        assert cfc_site.last_headers["If-None-Match"]
+
+        cfc_site.add_page("/", "<html><body>Changed</body></html>")
+        flag, third_content = GetPageInfo(url, cache=http_cache).get_content()
+        assert third_content == "<html><body>Changed</body></html>"
+        assert cfc_site.statuses == [200, 304, 200]
+
+    def test_get_content_ttl(self, tmp_path, cfc_site):
+        """
+        Test case for the TTL override of GetPageInfo with a DiskHttpCache.
+
+        Tests that an entry younger than the TTL is served without contacting the server.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        http_cache = DiskHttpCache(str(tmp_path / "http_cache"), ttl=60)
+        for _ in range(3):
+            flag, _ = GetPageInfo(cfc_site.url("/"), cache=http_cache).get_content()
+            assert flag is True
+        assert cfc_site.request_count("/") == 1
+
+    def test_configure_shared_cache(self, tmp_path):
+        """
+        Test case for the configure_shared_cache and get_shared_cache methods of DiskHttpCache.
+        """
+        shared_cache = DiskHttpCache.configure_shared_cache(str(tmp_path / "shared"))
+        try:
+            assert DiskHttpCache.get_shared_cache() is shared_cache
+            assert GetPageInfo("https://www.cfcunderwriting.com").get_cache() is shared_cache
+        finally:
+            DiskHttpCache.configure_shared_cache(None)
+        assert DiskHttpCache.get_shared_cache() is None
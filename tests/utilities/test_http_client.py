@@ -0,0 +1,77 @@
+import pytest
+import requests
+from utilities.http_client import HttpClient
+from utilities.page_info import GetPageInfo
+
+
+class TestHttpClient:
+    @pytest.fixture
+    def http_client(self):
+        """
+        Fixture for creating an instance of HttpClient with short timeouts for testing.
+        """
+        client = HttpClient(connect_timeout=1, read_timeout=1, headers={"X-Test": "cfc"})
+        yield client
+        client.close()
+
+    def test_get_timeout(self, http_client):
+        """
+        Test case for the get_timeout method of HttpClient.
+
+        Args:
+            http_client (HttpClient): Instance of HttpClient.
+        """
+        assert http_client.get_timeout() == (1, 1)
+
+    def test_get_keep_alive(self, http_client, cfc_site):
+        """
+        Test case for the get method of HttpClient.
+
+        Tests that repeated requests to the same host reuse one pooled connection.
+
+        Args:
+            http_client (HttpClient): Instance of HttpClient.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        for path in ("/", "/en-gb/support/privacy-policy/", "/"):
+            response = http_client.get(cfc_site.url(path))
+            assert response.status_code == 200
+
+        client_ports = {port for _, port in cfc_site.requests}
+        assert len(client_ports) == 1
+
+    def test_get_default_headers(self, http_client, cfc_site):
+        """
+        Test case for the default headers sent by HttpClient.
+
+        Args:
+            http_client (HttpClient): Instance of HttpClient.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        http_client.get(cfc_site.url("/"))
+        assert cfc_site.last_headers["X-Test"] == "cfc"
+        assert "CFCWebScrapper" in cfc_site.last_headers["User-Agent"]
+
+    def test_get_read_timeout(self, http_client, cfc_site):
+        """
+        Test case for the read timeout of HttpClient.
+
+        Tests that a stalled server raises a timeout instead of hanging the run.
+
+        Args:
+            http_client (HttpClient): Instance of HttpClient.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        cfc_site.delay = 2
+        with pytest.raises(requests.Timeout):
+            http_client.get(cfc_site.url("/"))
+
+    def test_get_shared_client(self):
+        """
+        Test case for the get_shared_client and configure_shared_client methods of HttpClient.
+        """
+        shared_client = HttpClient.configure_shared_client(read_timeout=12)
+        assert HttpClient.get_shared_client() is shared_client
+        assert shared_client.get_timeout() == (5.0, 12)
+        assert GetPageInfo("https://www.cfcunderwriting.com").get_client() is shared_client
+        HttpClient.configure_shared_client()
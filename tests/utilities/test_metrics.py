@@ -0,0 +1,122 @@
+import json
+
+import pytest
+from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+from utilities.metrics import MetricsRecorder
+from utilities.page_cache import PageArtifactCache
+from utilities.url_scrapper import FetchUrl
+
+
+class TestMetricsRecorder:
+    @pytest.fixture
+    def recorder(self):
+        """
+        Fixture for creating an instance of MetricsRecorder for testing.
+        """
+        return MetricsRecorder()
+
+    @pytest.fixture
+    def shared_recorder(self):
+        """
+        Fixture returning the shared MetricsRecorder, cleared before the test.
+        """
+        recorder = MetricsRecorder.get_shared_recorder()
+        recorder.reset()
+        return recorder
+
+    def test_stage(self, recorder):
+        """
+        Test case for the stage method of MetricsRecorder.
+
+        Args:
+            recorder (MetricsRecorder): Instance of MetricsRecorder.
+        """
+        for _ in range(2):
+            with recorder.stage("parse"):
+                sum(range(10000))
+        with pytest.raises(ValueError):
+            with recorder.stage("parse"):
+                raise ValueError("boom")
+
+        stage = recorder.get_stage("parse")
+        assert stage["calls"] == 3
+        assert stage["wall_seconds"] > 0
+        assert stage["cpu_seconds"] >= 0
+        assert recorder.get_stage("download") is None
+
+    def test_increment(self, recorder):
+        """
+        Test case for the increment and reset methods of MetricsRecorder.
+
+        Args:
+            recorder (MetricsRecorder): Instance of MetricsRecorder.
+        """
+        recorder.increment("bytes_downloaded", 100)
+        recorder.increment("bytes_downloaded", 50)
+        recorder.increment("page_cache_hits")
+        assert recorder.get_counter("bytes_downloaded") == 150
+        assert recorder.get_counter("page_cache_hits") == 1
+        assert recorder.get_counter("unknown") == 0
+
+        recorder.reset()
+        assert recorder.to_dict()["counters"] == {}
+
+    def test_to_prometheus(self, recorder):
+        """
+        Test case for the to_prometheus method of MetricsRecorder.
+
+        Args:
+            recorder (MetricsRecorder): Instance of MetricsRecorder.
+        """
+        recorder.add_stage_time("http.wait", 0.25, 0.0)
+        recorder.increment("bytes_downloaded", 2048)
+        text = recorder.to_prometheus()
+
+        assert "# TYPE cfc_scraper_stage_wall_seconds_total counter" in text
+        assert 'cfc_scraper_stage_wall_seconds_total{stage="http.wait"} 0.25' in text
+        assert 'cfc_scraper_stage_calls_total{stage="http.wait"} 1' in text
+        assert "cfc_scraper_bytes_downloaded_total 2048" in text
+        assert text.endswith("\n")
+
+    def test_write_report(self, recorder, tmp_path):
+        """
+        Test case for the write_report method of MetricsRecorder.
+
+        Args:
+            recorder (MetricsRecorder): Instance of MetricsRecorder.
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        recorder.increment("tokens_counted", 7)
+        json_file = tmp_path / "metrics.json"
+        prometheus_file = tmp_path / "metrics.prom"
+        flag, error = recorder.write_report(str(json_file), str(prometheus_file))
+
+        assert flag is True
+        assert error is None
+        assert json.loads(json_file.read_text())["counters"] == {"tokens_counted": 7}
+        assert "cfc_scraper_tokens_counted_total 7" in prometheus_file.read_text()
+
+        flag, _ = recorder.write_report(str(tmp_path / "missing" / "metrics.json"))
+        assert flag is False
+
+    def test_pipeline_instrumentation(self, shared_recorder, cfc_site):
+        """
+        Test case for the instrumentation of the fetch, parse, extraction and counting stages.
+
+        Args:
+            shared_recorder (MetricsRecorder): The shared MetricsRecorder.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        scrapper = BeautifulSoupContentScrapper(cfc_site.url("/"), page_cache=PageArtifactCache())
+        flag, _ = scrapper.privacy_policy_word_frequency_counter()
+        assert flag is True
+        flag, _ = FetchUrl().fetch_url_list(scrapper.get_page_cache().get_content(cfc_site.url("/"))[1])
+        assert flag is True
+
+        for stage in ("http.request", "http.wait", "http.download", "parse", "count_words", "regex_extraction"):
+            assert shared_recorder.get_stage(stage) is not None, stage
+        assert shared_recorder.get_counter("http_requests") == 2
+        assert shared_recorder.get_counter("bytes_downloaded") > 0
+        assert shared_recorder.get_counter("tokens_counted") > 0
+        assert shared_recorder.get_counter("page_cache_hits") >= 1
+        assert shared_recorder.get_counter("urls_extracted") == 3
@@ -0,0 +1,133 @@
+import threading
+
+import pytest
+from bs4 import BeautifulSoup
+from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+from utilities.page_cache import PageArtifactCache
+
+
+class TestPageArtifactCache:
+    @pytest.fixture
+    def page_cache(self):
+        """
+        Fixture for creating an instance of PageArtifactCache for testing.
+        """
+        return PageArtifactCache()
+
+    def test_get_content(self, page_cache, cfc_site):
+        """
+        Test case for the get_content method of PageArtifactCache.
+
+        Tests that repeated calls for the same URL download the page only once.
+
+        Args:
+            page_cache (PageArtifactCache): Instance of PageArtifactCache.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        for _ in range(3):
+            flag, content = page_cache.get_content(cfc_site.url("/"))
+            assert flag is True
+            assert "CFC UnderWriting" in content
+
+        assert cfc_site.request_count("/") == 1
+        assert page_cache.get_fetch_count() == 1
+
+    def test_get_content_concurrent(self, page_cache, cfc_site):
+        """
+        Test case for the get_content method of PageArtifactCache under concurrency.
+
+        Tests that concurrent callers of the same URL share one in-flight download.
+
+        Args:
+            page_cache (PageArtifactCache): Instance of PageArtifactCache.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        cfc_site.delay = 0.2
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(page_cache.get_content(cfc_site.url("/"))))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 8
+        assert all(flag is True for flag, _ in results)
+        assert cfc_site.request_count("/") == 1
+
+    def test_get_content_failure_not_cached(self, page_cache):
+        """
+        Test case for the get_content method of PageArtifactCache when the download fails.
+
+        Args:
+            page_cache (PageArtifactCache): Instance of PageArtifactCache.
+        """
+        flag, _ = page_cache.get_content("http://127.0.0.1:9/unreachable")
+        assert flag is False
+        assert page_cache.get_artifact("http://127.0.0.1:9/unreachable").content is None
+
+    def test_get_soup(self, page_cache, cfc_site):
+        """
+        Test case for the get_soup method of PageArtifactCache.
+
+        Tests that the page is parsed only once and the same BeautifulSoup instance is shared.
+
+        Args:
+            page_cache (PageArtifactCache): Instance of PageArtifactCache.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        flag, first_soup = page_cache.get_soup(cfc_site.url("/"))
+        assert flag is True
+        assert isinstance(first_soup, BeautifulSoup)
+        flag, second_soup = page_cache.get_soup(cfc_site.url("/"))
+        assert second_soup is first_soup
+        assert page_cache.get_parse_count() == 1
+
+    def test_put_content_drops_stale_artifacts(self, page_cache):
+        """
+        Test case for the put_content method of PageArtifactCache.
+
+        Tests that seeding new content drops the soup and extraction of the previous content, while seeding the same
+        content again keeps them.
+
+        Args:
+            page_cache (PageArtifactCache): Instance of PageArtifactCache.
+        """
+        url = "https://cfc.example/"
+        page_cache.put_content(url, "<html><body><p>old</p></body></html>")
+        _, old_soup = page_cache.get_soup(url)
+        _, old_extraction = page_cache.get_extraction(url)
+        page_cache.put_content(url, "<html><body><p>old</p></body></html>")
+        assert page_cache.get_soup(url)[1] is old_soup
+
+        page_cache.put_content(url, "<html><body><p>new</p></body></html>")
+        _, new_soup = page_cache.get_soup(url)
+        _, new_extraction = page_cache.get_extraction(url)
+        assert new_soup.p.text == "new"
+        assert new_extraction is not old_extraction
+
+    def test_shared_between_scrappers(self, page_cache, cfc_site):
+        """
+        Tests that a resource scrape and a privacy policy count sharing a cache download the index page once.
+
+        Args:
+            page_cache (PageArtifactCache): Instance of PageArtifactCache.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        resource_scrapper = BeautifulSoupContentScrapper(cfc_site.url("/"), page_cache=page_cache)
+        word_count_scrapper = BeautifulSoupContentScrapper(cfc_site.url("/"), page_cache=page_cache)
+
+        flag, external_resources = resource_scrapper.scrape_index_page()
+        assert flag is True
+        assert external_resources["scripts"] == ["https://cdn.example.net/app.js"]
+
+        flag, word_count = word_count_scrapper.privacy_policy_word_frequency_counter()
+        assert flag is True
+        # "privacy." in "We respect your privacy." is counted as "privacy" since punctuation is not part of a word
+        assert word_count["privacy"] == 3
+
+        assert cfc_site.request_count("/") == 1
+        # The index page is only extracted in one pass to find the policy link, so only the policy page is parsed
+        assert page_cache.get_parse_count() == 1
@@ -0,0 +1,110 @@
+import pytest
+from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+from utilities.page_cache import PageArtifactCache
+from utilities.page_extractor import PageExtractor
+
+PAGE = """
+<html>
+    <head>
+        <base href="https://www.cfcunderwriting.com/en-gb/">
+        <link rel="stylesheet" href="https://cdn.example.net/styles.css">
+        <link rel="preload" as="font" href="https://fonts.gstatic.com/s/font.woff2">
+        <link rel="canonical" href="https://www.cfcunderwriting.com/en-gb/">
+        <link rel="stylesheet" href="/local.css">
+        <script src="//cdn.example.net/app.js"></script>
+        <script>var markup = "<img src='https://ignored.example.com/x.png'>";</script>
+    </head>
+    <body>
+        <img src="https://images.example.org/logo.png"
+             srcset="https://images.example.org/logo-2x.png 2x, https://images.example.org/logo-3x.png 3x"/>
+        <video poster="https://video.example.com/poster.jpg"><source src="https://video.example.com/intro.mp4"></video>
+        <iframe src="https://www.youtube.com/embed/cfc"></iframe>
+        <noscript><img src="https://tracker.example.net/pixel.gif"></noscript>
+        <img src="https://www.cfcunderwriting.com/media/logo.png">
+        <p>We respect your <b>privacy</b>.</p>
+        <a href="support/terms">Terms</a>
+        <footer><a href="/legal/" rel="nofollow">Our <b>Privacy</b> notice</a></footer>
+    </body>
+</html>
+"""
+
+
+class TestPageExtractor:
+    @pytest.fixture
+    def extraction(self):
+        """
+        Fixture for the PageExtraction of PAGE.
+        """
+        flag, extraction = PageExtractor.extract(PAGE, "https://www.cfcunderwriting.com/")
+        assert flag is True
+        return extraction
+
+    def test_resources(self, extraction):
+        """
+        Test case for the external resources of a PageExtraction.
+
+        Tests that resources are classified by tag and attribute, resolved against <base href> and that inline
+        scripts and first-party URLs are left out.
+
+        Args:
+            extraction (PageExtraction): The extraction of PAGE.
+        """
+        assert extraction.resources == {
+            "scripts": ["https://cdn.example.net/app.js"],
+            "stylesheets": ["https://cdn.example.net/styles.css"],
+            "fonts": ["https://fonts.gstatic.com/s/font.woff2"],
+            "images": [
+                "https://images.example.org/logo.png",
+                "https://images.example.org/logo-2x.png",
+                "https://images.example.org/logo-3x.png",
+                "https://video.example.com/poster.jpg",
+                "https://tracker.example.net/pixel.gif",
+            ],
+            "media": ["https://video.example.com/intro.mp4"],
+            "frames": ["https://www.youtube.com/embed/cfc"],
+            "links": [],
+        }
+
+    def test_anchors_and_privacy_policy_url(self, extraction):
+        """
+        Test case for the anchors and the privacy policy candidate of a PageExtraction.
+
+        Args:
+            extraction (PageExtraction): The extraction of PAGE.
+        """
+        assert extraction.anchors == [
+            {"href": "https://www.cfcunderwriting.com/en-gb/support/terms", "text": "Terms", "rel": [],
+             "in_footer": False, "position": 0},
+            {"href": "https://www.cfcunderwriting.com/legal/", "text": "Our Privacy notice", "rel": ["nofollow"],
+             "in_footer": True, "position": 1},
+        ]
+        assert extraction.privacy_policy_url == "https://www.cfcunderwriting.com/legal/"
+
+    def test_text(self, extraction):
+        """
+        Test case for the visible text of a PageExtraction.
+
+        Args:
+            extraction (PageExtraction): The extraction of PAGE.
+        """
+        assert extraction.text.split() == ["We", "respect", "your", "privacy.", "Terms", "Our", "Privacy", "notice"]
+
+    def test_extract_page(self, cfc_site):
+        """
+        Test case for the extract_page method of BeautifulSoupContentScrapper.
+
+        Tests that the extraction is computed once and shared through the page cache.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        page_cache = PageArtifactCache()
+        scrapper = BeautifulSoupContentScrapper(cfc_site.url("/"), page_cache=page_cache)
+        flag, extraction = scrapper.extract_page()
+        assert flag is True
+        assert extraction.privacy_policy_url == cfc_site.url("/en-gb/support/privacy-policy/")
+        assert extraction.resources["scripts"] == ["https://cdn.example.net/app.js"]
+        assert extraction.resources["images"] == ["https://images.example.org/logo.png"]
+
+        assert scrapper.extract_page(cfc_site.url("/"))[1] is extraction
+        assert cfc_site.request_count("/") == 1
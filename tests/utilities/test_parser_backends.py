@@ -0,0 +1,66 @@
+import pytest
+from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+from utilities.parser_backends import ParserBackends
+
+
+class TestParserBackends:
+    @pytest.fixture(autouse=True)
+    def reset_default_parser(self):
+        """
+        Fixture restoring automatic parser selection after each test.
+        """
+        yield
+        ParserBackends.set_default_parser(None)
+
+    def test_is_available(self):
+        """
+        Test case for the is_available method of ParserBackends.
+        """
+        assert ParserBackends.is_available("html.parser") is True
+        assert ParserBackends.is_available("no-such-parser") is False
+
+    def test_available_parsers(self):
+        """
+        Test case for the available_parsers method of ParserBackends.
+
+        Tests that the built-in parser is always available and backends are ordered fastest first.
+        """
+        available_parsers = ParserBackends.available_parsers()
+        backend_order = [name for name, _ in ParserBackends.BACKENDS]
+        assert "html.parser" in available_parsers
+        assert available_parsers == sorted(available_parsers, key=backend_order.index)
+
+    def test_select_parser(self):
+        """
+        Test case for the select_parser method of ParserBackends.
+
+        Tests that the fastest available backend is the default and overrides take precedence.
+        """
+        assert ParserBackends.select_parser() == ParserBackends.available_parsers()[0]
+        assert ParserBackends.select_parser("html.parser") == "html.parser"
+        with pytest.raises(ValueError):
+            ParserBackends.select_parser("no-such-parser")
+
+    def test_set_default_parser(self):
+        """
+        Test case for the set_default_parser method of ParserBackends.
+
+        Tests that a per-run override is used by new scrappers unless they request a parser themselves.
+        """
+        ParserBackends.set_default_parser("html.parser")
+        assert BeautifulSoupContentScrapper().get_parser() == "html.parser"
+        with pytest.raises(ValueError):
+            ParserBackends.set_default_parser("no-such-parser")
+
+    @pytest.mark.parametrize("parser", ParserBackends.available_parsers())
+    def test_fetch_bs_page(self, parser):
+        """
+        Test case for parsing a page with every available backend.
+
+        Args:
+            parser (str): The parser backend.
+        """
+        scrapper = BeautifulSoupContentScrapper(parser=parser)
+        flag, soup = scrapper.fetch_bs_page("<html><body><a href='/privacy-policy/'>Privacy</a></body></html>")
+        assert flag is True
+        assert soup.find("a")["href"] == "/privacy-policy/"
@@ -0,0 +1,100 @@
+import time
+
+import pytest
+from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+from utilities.page_cache import PageArtifactCache
+from utilities.privacy_policy_cache import PrivacyPolicyCache
+
+
+class TestPrivacyPolicyCache:
+    @pytest.fixture
+    def policy_cache_file(self, tmp_path):
+        """
+        Fixture providing the path of a policy cache file in a temporary directory.
+        """
+        return str(tmp_path / "policy_cache.json")
+
+    def test_store_and_get(self, policy_cache_file):
+        """
+        Test case for the store, lookup and get methods of PrivacyPolicyCache.
+
+        Tests that entries are kept per domain and survive a new cache instance.
+
+        Args:
+            policy_cache_file (str): Path of the policy cache file.
+        """
+        policy_cache = PrivacyPolicyCache(policy_cache_file)
+        assert policy_cache.get("https://cfc.com/") == (False, None)
+        flag, _ = policy_cache.store("https://cfc.com/en-gb/", "https://cfc.com/privacy-policy/")
+        assert flag is True
+
+        reloaded_cache = PrivacyPolicyCache(policy_cache_file)
+        assert reloaded_cache.lookup("https://CFC.com/")["url"] == "https://cfc.com/privacy-policy/"
+        assert reloaded_cache.get("https://cfc.com/") == (True, "https://cfc.com/privacy-policy/")
+        assert reloaded_cache.get("https://other.example/") == (False, None)
+
+    def test_revalidate(self, policy_cache_file, cfc_site):
+        """
+        Test case for the revalidation of stale entries of PrivacyPolicyCache.
+
+        Tests that a stale entry is kept after a successful HEAD request and dropped when the page is gone.
+
+        Args:
+            policy_cache_file (str): Path of the policy cache file.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        policy_cache = PrivacyPolicyCache(policy_cache_file, ttl=0)
+        policy_url = cfc_site.url("/en-gb/support/privacy-policy/")
+        policy_cache.store(cfc_site.url("/"), policy_url)
+
+        assert policy_cache.get(cfc_site.url("/")) == (True, policy_url)
+        assert cfc_site.request_count("/en-gb/support/privacy-policy/") == 1
+        assert policy_cache.lookup(cfc_site.url("/"))["validated_at"] <= time.time()
+
+        policy_cache.store(cfc_site.url("/"), cfc_site.url("/gone/"))
+        assert policy_cache.get(cfc_site.url("/")) == (False, None)
+        assert policy_cache.lookup(cfc_site.url("/")) is None
+
+    def test_scrapper_skips_index_page(self, policy_cache_file, cfc_site):
+        """
+        Test case for get_privacy_policy_url of BeautifulSoupContentScrapper with a policy cache.
+
+        Tests that a later run goes straight to the policy page without fetching the index page.
+
+        Args:
+            policy_cache_file (str): Path of the policy cache file.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        policy_cache = PrivacyPolicyCache(policy_cache_file)
+        first_run = BeautifulSoupContentScrapper(cfc_site.url("/"), page_cache=PageArtifactCache(),
+                                                 policy_cache=policy_cache)
+        assert first_run.get_privacy_policy_url() == (True, cfc_site.url("/en-gb/support/privacy-policy/"))
+        assert cfc_site.request_count("/") == 1
+
+        second_run = BeautifulSoupContentScrapper(cfc_site.url("/"), page_cache=PageArtifactCache(),
+                                                  policy_cache=PrivacyPolicyCache(policy_cache_file))
+        flag, content = second_run.get_privacy_policy_content()
+        assert flag is True
+        assert "We respect your privacy" in content
+        assert cfc_site.request_count("/") == 1
+
+    def test_scrapper_rediscovers_broken_url(self, policy_cache_file, cfc_site):
+        """
+        Test case for get_privacy_policy_content of BeautifulSoupContentScrapper with a stale cached URL.
+
+        Tests that a cached URL that stopped working is dropped and rediscovered from the index page.
+
+        Args:
+            policy_cache_file (str): Path of the policy cache file.
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        policy_cache = PrivacyPolicyCache(policy_cache_file)
+        policy_cache.store(cfc_site.url("/"), cfc_site.url("/old-privacy-policy/"))
+        scrapper = BeautifulSoupContentScrapper(cfc_site.url("/"), page_cache=PageArtifactCache(),
+                                                policy_cache=policy_cache)
+
+        flag, content = scrapper.get_privacy_policy_content()
+
+        assert flag is True
+        assert "We respect your privacy" in content
+        assert policy_cache.lookup(cfc_site.url("/"))["url"] == cfc_site.url("/en-gb/support/privacy-policy/")
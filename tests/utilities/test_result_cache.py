@@ -0,0 +1,121 @@
+import threading
+import time
+
+from utilities.result_cache import ResultCache
+
+
+class FakeClock:
+    """
+    A manually advanced clock for testing expiry without sleeping.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResultCache:
+    def test_ttl_expiry(self):
+        """
+        Test case that a result is served until its TTL runs out and computed again afterwards.
+        """
+        clock = FakeClock()
+        cache = ResultCache(ttl=10, clock=clock)
+        calls = []
+
+        def compute():
+            calls.append(clock.now)
+            return True, len(calls)
+
+        assert cache.get_or_compute("site", compute) == (True, 1, "miss")
+        clock.now = 9.5
+        assert cache.get_or_compute("site", compute) == (True, 1, "hit")
+        clock.now = 10
+        assert cache.get_or_compute("site", compute) == (True, 2, "miss")
+        assert cache.get_stats() == {"entries": 1, "hits": 1, "misses": 2, "shared": 0}
+
+    def test_lru_eviction(self):
+        """
+        Test case that the least recently used result is evicted once the cache is full.
+        """
+        cache = ResultCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == (True, 1)
+        cache.put("c", 3)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.get("c") == (True, 3)
+
+    def test_failures_are_not_cached(self):
+        """
+        Test case that failed results and exceptions are returned but computed again by the next caller.
+        """
+        cache = ResultCache()
+
+        def fail():
+            raise ValueError("unreachable")
+
+        assert cache.get_or_compute("site", lambda: (False, "timeout")) == (False, "timeout", "miss")
+        assert cache.get_or_compute("site", fail) == (False, "unreachable", "miss")
+        assert cache.get_or_compute("site", lambda: (True, "ok")) == (True, "ok", "miss")
+
+    def test_concurrent_callers_share_one_computation(self):
+        """
+        Test case that concurrent callers of the same missing key wait for a single computation.
+        """
+        cache = ResultCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return True, "result"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("site", compute)))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert sorted(status for _, _, status in results) == ["miss"] + ["shared"] * 4
+        assert all(value == "result" for _, value, _ in results)
+
+    def test_interrupted_computation_releases_waiters(self):
+        """
+        Test case that callers waiting for a computation interrupted by a BaseException get a failed result instead
+        of waiting forever, and the next caller computes the result again.
+        """
+        cache = ResultCache()
+        started = threading.Event()
+
+        def interrupted():
+            started.set()
+            time.sleep(0.2)
+            raise KeyboardInterrupt
+
+        def compute_interrupted():
+            try:
+                cache.get_or_compute("site", interrupted)
+            except KeyboardInterrupt:
+                pass
+
+        computing = threading.Thread(target=compute_interrupted)
+        computing.start()
+        started.wait()
+        results = []
+        waiting = threading.Thread(target=lambda: results.append(cache.get_or_compute("site", lambda: (True, "ok"))))
+        waiting.start()
+        computing.join()
+        waiting.join(timeout=5)
+
+        assert not waiting.is_alive()
+        assert results[0][0] is False
+        assert results[0][2] == "shared"
+        assert cache.get_or_compute("site", lambda: (True, "ok")) == (True, "ok", "miss")
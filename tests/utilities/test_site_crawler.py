@@ -0,0 +1,119 @@
+import time
+
+import pytest
+from utilities.site_crawler import SiteCrawler
+
+
+def add_crawl_site(local_site, crawl_delay=None):
+    """
+    Serves a small site: an index linking to two sections, a deep page, a page disallowed by robots.txt, an external
+    link and duplicate links differing only by fragment, tracking parameters or parameter order.
+    """
+    robots = "User-agent: *\nDisallow: /private/\n"
+    if crawl_delay is not None:
+        robots += f"Crawl-delay: {crawl_delay}\n"
+    local_site.add_page("/robots.txt", robots)
+    local_site.add_page("/", """
+        <html><head><script src="https://cdn.example.net/app.js"></script></head><body>
+            <a href="/a/">A</a> <a href="/b/?y=2&x=1">B</a> <a href="/b/?x=1&y=2#top">B again</a>
+            <a href="/a/?utm_source=mail">A tracked</a> <a href="/private/">Private</a>
+            <a href="https://elsewhere.example.org/">Elsewhere</a> <a href="/brochure.pdf">Brochure</a>
+        </body></html>
+    """)
+    local_site.add_page("/a/", """
+        <html><body><script src="https://cdn.example.net/app.js"></script>
+            <img src="https://images.example.org/a.png"><a href="/a/deep/">Deep</a><a href="/">Home</a>
+        </body></html>
+    """)
+    local_site.add_page("/b/?x=1&y=2", """
+        <html><body><script src="https://tags.example.com/tag.js"></script></body></html>
+    """)
+    local_site.add_page("/a/deep/", """
+        <html><body><script src="https://deep.example.com/deep.js"></script></body></html>
+    """)
+    local_site.add_page("/private/", "<html><body>secret</body></html>")
+
+
+class TestSiteCrawler:
+    @pytest.fixture
+    def crawl_site(self, local_site):
+        """
+        Fixture serving the crawl test site.
+        """
+        add_crawl_site(local_site)
+        return local_site
+
+    def test_canonicalize_url(self):
+        """
+        Test case for the canonicalize_url method of SiteCrawler.
+        """
+        assert SiteCrawler.canonicalize_url("HTTPS://WWW.CFC.com:443/a?b=2&a=1&utm_source=x#frag") == \
+            "https://www.cfc.com/a?a=1&b=2"
+        assert SiteCrawler.canonicalize_url("http://cfc.com") == "http://cfc.com/"
+        assert SiteCrawler.canonicalize_url("http://cfc.com:8080/x") == "http://cfc.com:8080/x"
+        assert SiteCrawler.canonicalize_url("mailto:privacy@cfc.com") is None
+
+    def test_crawl(self, crawl_site):
+        """
+        Test case for the crawl method of SiteCrawler.
+
+        Tests that same-site links are followed once, robots.txt is honoured and resources are aggregated per page.
+
+        Args:
+            crawl_site (LocalSite): The local crawl test site.
+        """
+        flag, result = SiteCrawler(crawl_site.url("/"), max_depth=2, requests_per_second=0).run()
+        assert flag is True
+
+        assert [(page["url"], page["depth"]) for page in result["pages"]] == [
+            (crawl_site.url("/"), 0),
+            (crawl_site.url("/a/"), 1),
+            (crawl_site.url("/b/?x=1&y=2"), 1),
+            (crawl_site.url("/a/deep/"), 2),
+        ]
+        assert all(page["status"] == "ok" for page in result["pages"])
+        assert crawl_site.request_count("/private/") == 0
+        assert crawl_site.request_count("/brochure.pdf") == 0
+
+        resources = result["external_resources"]
+        assert resources["https://cdn.example.net/app.js"] == {
+            "category": "scripts", "page_count": 2, "pages": [crawl_site.url("/"), crawl_site.url("/a/")],
+        }
+        assert resources["https://deep.example.com/deep.js"]["pages"] == [crawl_site.url("/a/deep/")]
+        assert resources["https://images.example.org/a.png"]["category"] == "images"
+
+    def test_crawl_budget(self, crawl_site):
+        """
+        Test case for the depth and page budget of SiteCrawler.
+
+        Args:
+            crawl_site (LocalSite): The local crawl test site.
+        """
+        flag, result = SiteCrawler(crawl_site.url("/"), max_depth=1, requests_per_second=0).run()
+        assert flag is True
+        assert crawl_site.url("/a/deep/") not in [page["url"] for page in result["pages"]]
+
+        flag, result = SiteCrawler(crawl_site.url("/"), max_depth=5, max_pages=2, requests_per_second=0).run()
+        assert flag is True
+        assert len(result["pages"]) == 2
+
+    def test_crawl_delay(self, local_site):
+        """
+        Test case for the per-host politeness of SiteCrawler.
+
+        Tests that the robots.txt Crawl-delay spaces requests even with free concurrency.
+
+        Args:
+            local_site (LocalSite): Local HTTP server.
+        """
+        add_crawl_site(local_site, crawl_delay=1)
+        crawler = SiteCrawler(local_site.url("/"), max_depth=1, max_pages=2, concurrency=8, requests_per_second=0)
+
+        started = time.perf_counter()
+        flag, result = crawler.run()
+
+        assert flag is True
+        assert len(result["pages"]) == 2
+        assert crawler.get_interval() == 1
+        assert time.perf_counter() - started >= 1
+        assert local_site.max_in_flight == 1
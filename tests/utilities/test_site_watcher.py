@@ -0,0 +1,115 @@
+from utilities.site_watcher import SiteWatcher
+from utilities.tokenizer import ENGLISH_STOPWORDS, WordTokenizer
+
+POLICY_PATH = "/en-gb/support/privacy-policy/"
+
+
+class TestSiteWatcher:
+    def test_first_check_reports_everything(self, cfc_site):
+        """
+        Test case for the first check of SiteWatcher, which has no previous state to compare with.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        flag, changes = SiteWatcher(cfc_site.url("/")).check()
+
+        assert flag is True
+        assert "https://cdn.example.net/app.js" in changes["added_resources"]["scripts"]
+        assert "removed_resources" not in changes
+        assert changes["word_count_changes"]["privacy"] == 3
+
+    def test_unchanged_site_is_not_parsed_again(self, cfc_site):
+        """
+        Test case for a check of an unchanged site.
+
+        Tests that both pages are revalidated with their ETags, answered with 304 and reported as unchanged.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        watcher = SiteWatcher(cfc_site.url("/"))
+        watcher.check()
+
+        flag, changes = watcher.check()
+
+        assert flag is True
+        assert set(changes) == {"url", "checked_at"}
+        assert cfc_site.statuses[-2:] == [304, 304]
+        assert "If-None-Match" in cfc_site.last_headers
+
+    def test_changes_are_reported(self, cfc_site):
+        """
+        Test case for checks after the site changed.
+
+        Tests that added and removed resources and changed word counts are reported, that a markup-only change of
+        the privacy policy is not, and that a watcher resumed from the saved state carries on.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        watcher = SiteWatcher(cfc_site.url("/"))
+        watcher.check()
+
+        cfc_site.pages["/"] = cfc_site.pages["/"].replace("https://cdn.example.net/app.js",
+                                                          "https://tracker.example.com/pixel.js")
+        cfc_site.pages[POLICY_PATH] = cfc_site.pages[POLICY_PATH].replace("<p>", "<p class='lead'>")
+        flag, changes = watcher.check()
+        assert flag is True
+        assert changes["added_resources"] == {"scripts": ["https://tracker.example.com/pixel.js"]}
+        assert changes["removed_resources"] == {"scripts": ["https://cdn.example.net/app.js"]}
+        assert "word_count_changes" not in changes
+
+        cfc_site.pages[POLICY_PATH] = cfc_site.pages[POLICY_PATH].replace("Privacy matters", "Security matters")
+        resumed_watcher = SiteWatcher(cfc_site.url("/"), watcher.get_state())
+        flag, changes = resumed_watcher.check()
+        assert flag is True
+        assert changes["word_count_changes"] == {"privacy": -1, "security": 1}
+        assert "added_resources" not in changes
+
+    def test_failed_check_keeps_state(self, cfc_site):
+        """
+        Test case for a check whose privacy policy page cannot be fetched.
+
+        Tests that the check fails without updating the state, so its resource changes are reported by the next
+        successful check.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        watcher = SiteWatcher(cfc_site.url("/"))
+        watcher.check()
+        policy_page = cfc_site.pages.pop(POLICY_PATH)
+        cfc_site.pages["/"] += "<script src='https://tracker.example.com/new.js'></script>"
+
+        flag, error = watcher.check()
+        assert flag is False
+        assert "404" in error
+
+        cfc_site.pages[POLICY_PATH] = policy_page
+        flag, changes = watcher.check()
+        assert flag is True
+        assert changes["added_resources"] == {"scripts": ["https://tracker.example.com/new.js"]}
+
+    def test_tokenizer_change_recounts(self, cfc_site):
+        """
+        Test case for a check of an unchanged site after the tokenizer options changed.
+
+        Tests that the privacy policy is counted again instead of keeping the counts of the previous options.
+
+        Args:
+            cfc_site (LocalSite): Local stand-in for the CFC website.
+        """
+        watcher = SiteWatcher(cfc_site.url("/"))
+        watcher.check()
+        assert "tokenizer" in watcher.get_state()
+
+        WordTokenizer.configure_shared_tokenizer(stopwords=ENGLISH_STOPWORDS)
+        try:
+            flag, changes = SiteWatcher(cfc_site.url("/"), watcher.get_state()).check()
+        finally:
+            WordTokenizer.configure_shared_tokenizer()
+
+        assert flag is True
+        assert changes["word_count_changes"]
+        assert all(count < 0 for count in changes["word_count_changes"].values())
@@ -0,0 +1,105 @@
+import tracemalloc
+
+import pytest
+from bs4 import BeautifulSoup
+from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+from utilities.streaming_counter import StreamingWordCounter
+
+PAGE = """<!DOCTYPE html>
+<html>
+    <head>
+        <title>CFC Privacy Policy</title>
+        <style>body { font-family: Montserrat; }</style>
+        <script>var tracking = "not words";</script>
+    </head>
+    <body>
+        <!-- a comment that is not visible -->
+        <h1>Privacy&nbsp;Policy</h1>
+        <p>We <b>respect</b> your pri<i>vacy</i>. Cookies &amp; data, policy,
+        policy &#8212; POLICY!</p>
+        <template><p>template text</p></template>
+        <ul><li>one</li><li>two</li></ul>
+        <textarea>typed text</textarea>
+        <![CDATA[cdata text]]>
+    </body>
+</html>
+"""
+
+
+class TestStreamingWordCounter:
+    @pytest.fixture
+    def expected_word_count(self):
+        """
+        Fixture for the word count BeautifulSoupContentScrapper produces for PAGE when parsing it whole.
+        """
+        flag, word_count = BeautifulSoupContentScrapper.count_soup_words(BeautifulSoup(PAGE, "html.parser"))
+        assert flag is True
+        return word_count
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, len(PAGE)])
+    def test_count_chunks(self, expected_word_count, chunk_size):
+        """
+        Test case for the count_chunks method of StreamingWordCounter.
+
+        Tests that the streamed count matches the count of the whole parsed page for any chunk size.
+
+        Args:
+            expected_word_count (Counter): The word count of the whole parsed page.
+            chunk_size (int): The number of characters per chunk.
+        """
+        chunks = (PAGE[index:index + chunk_size] for index in range(0, len(PAGE), chunk_size))
+        flag, word_count = StreamingWordCounter.count_chunks(chunks)
+        assert flag is True
+        assert word_count == expected_word_count
+        assert "tracking" not in word_count
+        assert "template" not in word_count
+
+    def test_count_chunks_bounded_memory(self):
+        """
+        Test case for the memory use of the count_chunks method of StreamingWordCounter.
+
+        Tests that counting a 2 MB page streamed in 16 KB chunks keeps peak memory far below the page size.
+        """
+        paragraph = "<p>Our privacy policy explains how we collect, use and protect your data.</p>\n"
+        chunk = paragraph * (16384 // len(paragraph))
+        chunk_count = 2 * 1024 * 1024 // len(chunk)
+
+        tracemalloc.start()
+        flag, word_count = StreamingWordCounter.count_chunks(chunk for _ in range(chunk_count))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert flag is True
+        assert word_count["privacy"] == chunk_count * (16384 // len(paragraph))
+        assert peak < 256 * 1024
+
+    def test_stream_words_frequency(self, local_site):
+        """
+        Test case for the stream_words_frequency method of BeautifulSoupContentScrapper.
+
+        Args:
+            local_site (LocalSite): Local stand-in HTTP site.
+        """
+        local_site.add_page("/privacy-policy/", PAGE)
+        scrapper = BeautifulSoupContentScrapper()
+
+        flag, streamed_word_count = scrapper.stream_words_frequency(local_site.url("/privacy-policy/"), chunk_size=16)
+        assert flag is True
+        flag, word_count = scrapper.count_words_frequency(local_site.url("/privacy-policy/"))
+        assert flag is True
+        assert streamed_word_count == word_count
+
+    def test_stream_words_frequency_error_status(self, local_site):
+        """
+        Test case for stream_words_frequency on a page answered with an error status.
+
+        Tests that a 404 is reported as a failure instead of counting the words of the error body.
+
+        Args:
+            local_site (LocalSite): Local stand-in HTTP site.
+        """
+        url = local_site.url("/missing/")
+        flag, error = BeautifulSoupContentScrapper.stream_words_frequency(url)
+
+        assert flag is False
+        assert error == f"HTTP 404 fetching {url}"
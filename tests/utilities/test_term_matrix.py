@@ -0,0 +1,167 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from utilities.change_tracker import ChangeTracker
+from utilities.term_matrix import TermFrequencyMatrix
+
+
+def cosine(first, second):
+    """
+    Exact cosine similarity of two word counts, used to cross-check the vectorized one.
+
+    Args:
+        first (dict): A word count.
+        second (dict): Another word count.
+
+    Returns:
+        float: The cosine similarity.
+    """
+    dot = sum(count * second.get(word, 0) for word, count in first.items())
+    norms = math.sqrt(sum(count ** 2 for count in first.values())) * math.sqrt(sum(count ** 2 for count in second.values()))
+    return dot / norms if norms else 0.0
+
+
+class TestTermFrequencyMatrix:
+    @pytest.fixture
+    def word_counts(self):
+        """
+        Fixture for the word counts of a few policies, including an empty one.
+        """
+        return {
+            "a.example": {"privacy": 3, "data": 2, "cookies": 1},
+            "b.example": {"data": 4, "privacy": 1, "rights": 2},
+            "c.example": {"insurance": 5},
+            "empty.example": {},
+        }
+
+    @pytest.fixture
+    def term_matrix(self, word_counts):
+        """
+        Fixture for a matrix holding word_counts.
+        """
+        term_matrix = TermFrequencyMatrix()
+        for label, word_count in word_counts.items():
+            term_matrix.add_document(label, word_count)
+        return term_matrix
+
+    def test_rows(self, term_matrix, word_counts):
+        """
+        Test case that every row reads back as its word count and duplicate labels are rejected.
+
+        Args:
+            term_matrix (TermFrequencyMatrix): The matrix.
+            word_counts (dict): The word counts of the matrix.
+        """
+        assert term_matrix.get_shape() == (4, 5)
+        for label, word_count in word_counts.items():
+            assert term_matrix.get_row(label) == word_count
+        with pytest.raises(ValueError):
+            term_matrix.add_document("a.example", {})
+        with pytest.raises(KeyError):
+            term_matrix.get_row("missing.example")
+
+    def test_top_terms(self, term_matrix):
+        """
+        Test case for the top_terms method of TermFrequencyMatrix.
+
+        Args:
+            term_matrix (TermFrequencyMatrix): The matrix.
+        """
+        assert term_matrix.top_terms(2, "a.example") == [("privacy", 3), ("data", 2)]
+        assert term_matrix.top_terms(3) == [("data", 6), ("insurance", 5), ("privacy", 4)]
+        assert term_matrix.top_terms(10, "empty.example") == []
+
+    def test_cosine_similarities(self, term_matrix, word_counts):
+        """
+        Test case that vectorized similarities match the exact dict computation, with 0 for empty documents.
+
+        Args:
+            term_matrix (TermFrequencyMatrix): The matrix.
+            word_counts (dict): The word counts of the matrix.
+        """
+        similarities = term_matrix.cosine_similarities("a.example")
+
+        expected = [cosine(word_counts["a.example"], word_count) for word_count in word_counts.values()]
+        assert np.allclose(similarities, expected)
+        assert similarities[0] == pytest.approx(1.0)
+        assert term_matrix.most_similar("a.example", n=2) == [("b.example", pytest.approx(expected[1])),
+                                                              ("c.example", 0.0)]
+
+    def test_cosine_similarities_random_corpus(self):
+        """
+        Test case that similarities over a larger random corpus, with rows added in several batches, match the exact
+        dict computation.
+        """
+        generator = random.Random(3)
+        word_counts = {
+            f"site-{number}": {f"word{generator.randrange(300)}": generator.randrange(1, 9) for _ in range(40)}
+            for number in range(60)
+        }
+        term_matrix = TermFrequencyMatrix()
+        for number, (label, word_count) in enumerate(word_counts.items()):
+            term_matrix.add_document(label, word_count)
+            if number % 25 == 0:
+                term_matrix.cosine_similarities("site-0")
+
+        similarities = term_matrix.cosine_similarities("site-7")
+
+        expected = [cosine(word_counts["site-7"], word_count) for word_count in word_counts.values()]
+        assert np.allclose(similarities, expected)
+
+    def test_term_delta(self, term_matrix, word_counts):
+        """
+        Test case that term deltas between rows and between snapshots match ChangeTracker.word_count_delta().
+
+        Args:
+            term_matrix (TermFrequencyMatrix): The matrix.
+            word_counts (dict): The word counts of the matrix.
+        """
+        delta = term_matrix.term_delta("a.example", "b.example")
+        assert delta == ChangeTracker.word_count_delta(word_counts["a.example"], word_counts["b.example"])
+        assert list(delta)[0] in ("data", "privacy")
+
+        current = TermFrequencyMatrix()
+        current.add_document("a.example", {"privacy": 3, "consent": 2})
+        assert current.term_delta("a.example", "a.example", previous=term_matrix) == {
+            "consent": 2, "data": -2, "cookies": -1
+        }
+
+    def test_term_totals_delta(self, term_matrix):
+        """
+        Test case for the term_totals_delta method of TermFrequencyMatrix.
+
+        Args:
+            term_matrix (TermFrequencyMatrix): The matrix, used as the previous snapshot.
+        """
+        current = TermFrequencyMatrix()
+        current.add_document("a.example", {"privacy": 3, "data": 2, "consent": 4})
+        current.add_document("b.example", {"data": 4, "privacy": 1, "rights": 2})
+
+        assert current.term_totals_delta(term_matrix) == {"insurance": -5, "consent": 4, "cookies": -1}
+        assert term_matrix.term_totals_delta(term_matrix) == {}
+
+    def test_concatenate_and_save(self, term_matrix, word_counts, tmp_path):
+        """
+        Test case that concatenated matrices and a save/load round trip keep every row.
+
+        Args:
+            term_matrix (TermFrequencyMatrix): The matrix.
+            word_counts (dict): The word counts of the matrix.
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        combined = TermFrequencyMatrix()
+        combined.add_document("d.example", {"cookies": 7, "banner": 1})
+        combined.concatenate(term_matrix)
+
+        flag, error = combined.save(str(tmp_path / "policies"))
+        assert flag, error
+        flag, loaded = TermFrequencyMatrix.load(str(tmp_path / "policies.npz"))
+
+        assert flag
+        assert loaded.get_labels() == ["d.example"] + list(word_counts)
+        for label, word_count in word_counts.items():
+            assert loaded.get_row(label) == word_count
+        assert loaded.top_terms(1) == [("cookies", 8)]
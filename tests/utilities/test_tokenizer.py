@@ -0,0 +1,66 @@
+import pytest
+
+from utilities.tokenizer import ENGLISH_STOPWORDS, WordTokenizer
+
+
+class TestWordTokenizer:
+    def test_tokenize(self):
+        """
+        Test case that punctuation is split off, case is folded and joined words are kept whole.
+        """
+        words = WordTokenizer().tokenize("Our Privacy Policy, policy; POLICY! Don't share third-party e-mail_data.")
+
+        assert words == ["our", "privacy", "policy", "policy", "policy", "don't", "share", "third-party", "e-mail",
+                         "data"]
+
+    def test_tokenize_unicode(self):
+        """
+        Test case that non-ASCII letters are word characters and case folding applies to them.
+        """
+        words = WordTokenizer().tokenize("Datenschutzerklärung — STRASSE Straße «Données» 個人情報")
+
+        assert words == ["datenschutzerklärung", "strasse", "strasse", "données", "個人情報"]
+
+    @pytest.mark.parametrize("options, expected_words", [
+        ({}, ["we", "keep", "data", "for", "30", "days", "since", "2018"]),
+        ({"drop_numbers": True}, ["we", "keep", "data", "for", "days", "since"]),
+        ({"stopwords": ENGLISH_STOPWORDS}, ["keep", "data", "30", "days", "since", "2018"]),
+        ({"stopwords": ["Keep", "DAYS"], "drop_numbers": True}, ["we", "data", "for", "since"]),
+    ])
+    def test_filters(self, options, expected_words):
+        """
+        Test case for the stopword and number filters.
+
+        Args:
+            options (dict): The tokenizer options.
+            expected_words (list): The expected words.
+        """
+        assert WordTokenizer(**options).tokenize("We keep data for 30 days since 2018.") == expected_words
+
+    def test_count(self):
+        """
+        Test case for the count method of WordTokenizer.
+        """
+        assert WordTokenizer().count("Data, data and DATA.") == {"data": 3, "and": 1}
+
+    def test_configure_shared_tokenizer(self):
+        """
+        Test case that the shared tokenizer can be replaced and restored.
+        """
+        try:
+            tokenizer = WordTokenizer.configure_shared_tokenizer(drop_numbers=True)
+            assert WordTokenizer.get_shared_tokenizer() is tokenizer
+            assert tokenizer.is_filtering()
+        finally:
+            WordTokenizer.configure_shared_tokenizer()
+        assert not WordTokenizer.get_shared_tokenizer().is_filtering()
+
+    def test_get_fingerprint(self):
+        """
+        Test case that the fingerprint only changes with the options that change the counts.
+        """
+        fingerprint = WordTokenizer().get_fingerprint()
+        assert WordTokenizer().get_fingerprint() == fingerprint
+        assert WordTokenizer(stopwords=["The"]).get_fingerprint() == WordTokenizer(stopwords=["the"]).get_fingerprint()
+        assert WordTokenizer(stopwords=["the"]).get_fingerprint() != fingerprint
+        assert WordTokenizer(drop_numbers=True).get_fingerprint() != fingerprint
@@ -55,6 +55,55 @@ class TestFetchUrl:
         assert "https://1234.com/page" in url_list
         assert "https://test.com/page" in url_list
 
+    def test_fetch_url_list_single_line(self, fetch_url):
+        """
+        Test case for the fetch_url_list method of FetchUrl on minified single-line content.
+
+        Tests that third-party URLs appearing before a first-party URL on the same line are kept and that
+        first-party sub-domains are dropped.
+
+        Args:
+            fetch_url (FetchUrl): Instance of FetchUrl.
+        """
+        content = ('<script src="https://test.com/app.js"></script><a href="https://test.com/page/">Test</a>'
+                   '<img src="https://www.cfcunderwriting.com/logo.png"><a href="https://cfc.com.example.net/x">X</a>')
+
+        flag, url_list = fetch_url.fetch_url_list(content)
+
+        assert flag is True
+        assert sorted(url_list) == [
+            "https://cfc.com.example.net/x",
+            "https://test.com/app.js",
+            "https://test.com/page",
+        ]
+
+    def test_is_first_party_url(self, fetch_url):
+        """
+        Test case for the is_first_party_url method of FetchUrl.
+
+        Args:
+            fetch_url (FetchUrl): Instance of FetchUrl.
+        """
+        assert fetch_url.is_first_party_url("https://cfc.com/page") is True
+        assert fetch_url.is_first_party_url("https://www.CFCUnderwriting.com/") is True
+        assert fetch_url.is_first_party_url("https://notcfc.com/") is False
+        assert fetch_url.is_first_party_url("https://test.com/?ref=cfc.com") is False
+
+    def test_get_site_domains(self):
+        """
+        Test case for the get_site_domains method of FetchUrl.
+
+        Tests that another site's own URLs are first-party for that site, while the CFC domains stay together.
+        """
+        assert FetchUrl.get_site_domains("https://www.cfcunderwriting.com/en-gb/") == ("cfc.com", "cfcunderwriting.com")
+        assert FetchUrl.get_site_domains("https://www.example.org/") == ("example.org",)
+        site_scrapper = FetchUrl(first_party_domains=FetchUrl.get_site_domains("https://www.example.org/"))
+        flag, resources = site_scrapper.scrape_using_regex(
+            '<script src="https://static.example.org/app.js"></script><script src="https://cdn.net/lib.js"></script>')
+        assert flag is True
+        assert "https://static.example.org/app.js" not in str(resources)
+        assert "https://cdn.net/lib.js" in str(resources)
+
     def test_get_unique_url_list(self, fetch_url):
         """
         Test case for the get_unique_url_list method of FetchUrl.
@@ -143,3 +192,50 @@ class TestFetchUrl:
         assert flag is True
         print("--privacy_policy_url--" + privacy_policy_url)
         assert privacy_policy_url == "https://cfc.com/en-gb/support/privacy-policy/"
+
+    def test_find_privacy_policy_url_ranked(self, fetch_url):
+        """
+        Test case for the ranking of Privacy Policy candidates by find_privacy_policy_url.
+
+        Tests that anchor text, footer position and absolute or query-string hrefs are taken into account.
+
+        Args:
+            fetch_url (FetchUrl): Instance of FetchUrl.
+        """
+        content = """
+        <html>
+            <body>
+                <a href="/cookie-policy/">Cookie Policy</a>
+                <a href="https://www.google.com/policies/privacy/">Google Privacy</a>
+                <footer>
+                    <a href="https://cfc.com/legal?page=privacy-notice">Privacy notice</a>
+                    <a href="/en-gb/support/terms">Terms of Service</a>
+                </footer>
+            </body>
+        </html>
+        """
+        soup = BeautifulSoup(content, "html.parser")
+
+        flag, privacy_policy_url = fetch_url.find_privacy_policy_url(soup, "https://cfc.com/en-gb/")
+
+        assert flag is True
+        assert privacy_policy_url == "https://cfc.com/legal?page=privacy-notice"
+
+    def test_rank_privacy_policy_candidates(self, fetch_url):
+        """
+        Test case for the rank_privacy_policy_candidates method of FetchUrl.
+
+        Args:
+            fetch_url (FetchUrl): Instance of FetchUrl.
+        """
+        anchors = [
+            {"href": "https://cfc.com/about/", "text": "About", "rel": [], "in_footer": False},
+            {"href": "https://cfc.com/privacy/", "text": "Privacy", "rel": [], "in_footer": False},
+            {"href": "https://cfc.com/data-protection/", "text": "Data protection", "rel": ["privacy-policy"],
+             "in_footer": False},
+        ]
+
+        candidates = fetch_url.rank_privacy_policy_candidates(anchors, "https://cfc.com/")
+
+        assert [href for _, href in candidates] == ["https://cfc.com/data-protection/", "https://cfc.com/privacy/"]
+        assert fetch_url.rank_privacy_policy_candidates(anchors[:1], "https://cfc.com/") == []
@@ -0,0 +1,80 @@
+import pytest
+from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+from utilities.visible_text import VisibleTextParser
+
+PAGE = """
+<html>
+    <head>
+        <title>Privacy</title>
+        <style>.banner { display: none; }</style>
+        <script>window.dataLayer = [];</script>
+        <script type="application/ld+json">{"@type": "Organization", "name": "CFC"}</script>
+    </head>
+    <body>
+        <noscript><img src="https://tracker.example.net/pixel.gif">Enable JavaScript</noscript>
+        <template><p>Template copy</p></template>
+        <div hidden><p>Hidden copy</p><div>nested hidden</div></div>
+        <span aria-hidden="true">icon</span>
+        <span style="display:none">collapsed</span>
+        <ul><li>Cookies</li><li>Data</li></ul>
+        <p>We respect your <b>privacy</b>.<br>Read on.</p>
+    </body>
+</html>
+"""
+
+
+class TestVisibleTextParser:
+    @pytest.fixture
+    def visible_text(self):
+        """
+        Fixture for the visible text extracted from PAGE.
+        """
+        flag, visible_text = VisibleTextParser.extract(PAGE)
+        assert flag is True
+        return visible_text
+
+    def test_extract(self, visible_text):
+        """
+        Test case for the extract method of VisibleTextParser.
+
+        Tests that only rendered text is kept and block boundaries separate words.
+
+        Args:
+            visible_text (str): The visible text of PAGE.
+        """
+        assert visible_text.split() == ["Privacy", "Cookies", "Data", "We", "respect", "your", "privacy.", "Read", "on."]
+
+    @pytest.mark.parametrize("content, expected_words", [
+        ('<div aria-hidden="false">shown</div>', ["shown"]),
+        ("<ul><li hidden>gone</ul><p>kept</p>", ["kept"]),
+        ("<input hidden>after", ["after"]),
+        ("<div hidden><div>inner</div>still hidden</div>shown", ["shown"]),
+    ])
+    def test_extract_hidden_subtrees(self, content, expected_words):
+        """
+        Test case for the pruning of hidden subtrees by VisibleTextParser.
+
+        Args:
+            content (str): The HTML content.
+            expected_words (list): The expected visible words.
+        """
+        flag, visible_text = VisibleTextParser.extract(content)
+        assert flag is True
+        assert visible_text.split() == expected_words
+
+    def test_count_visible_words_frequency(self, local_site):
+        """
+        Test case for the count_visible_words_frequency method of BeautifulSoupContentScrapper.
+
+        Args:
+            local_site (LocalSite): Local stand-in HTTP site.
+        """
+        local_site.add_page("/privacy-policy/", PAGE)
+        flag, word_count = BeautifulSoupContentScrapper().count_visible_words_frequency(
+            local_site.url("/privacy-policy/"))
+        assert flag is True
+        # The title "Privacy" and "privacy." are the same word since punctuation is not part of a word
+        assert word_count["privacy"] == 2
+        assert word_count["cookies"] == 1
+        assert "window.datalayer" not in word_count
+        assert "icon" not in word_count
@@ -0,0 +1,151 @@
+import threading
+import time
+
+from utilities.work_queue import WorkQueue
+
+
+class TestWorkQueue:
+    def test_enqueue_is_idempotent(self, tmp_path):
+        """
+        Test case that a task with the same kind and payload is only added once.
+
+        Args:
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"))
+
+        first = queue.enqueue("resources", {"url": "https://a.example", "file_name": "a.json"})
+        second = queue.enqueue("resources", {"file_name": "a.json", "url": "https://a.example"})
+        other_kind = queue.enqueue("wordcount", {"url": "https://a.example", "file_name": "a.json"})
+
+        assert first[0] and not second[0]
+        assert first[1] == second[1]
+        assert other_kind[0]
+        assert queue.get_counts()[WorkQueue.PENDING] == 2
+
+    def test_lease_is_exclusive(self, tmp_path):
+        """
+        Test case that a leased task is not handed out again while its lease runs, and that tasks are leased oldest
+        first.
+
+        Args:
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"))
+        queue.enqueue("resources", {"url": "https://a.example"})
+        queue.enqueue("resources", {"url": "https://b.example"})
+
+        first = queue.lease("worker-1")
+        second = queue.lease("worker-2")
+
+        assert first["payload"] == {"url": "https://a.example"}
+        assert first["attempts"] == 1 and first["lease_owner"] == "worker-1"
+        assert second["payload"] == {"url": "https://b.example"}
+        assert queue.lease("worker-3") is None
+
+    def test_expired_lease_is_leased_again(self, tmp_path):
+        """
+        Test case that a task whose worker stopped sending heartbeats is picked up by another worker, and that the
+        first worker can no longer extend or fail it.
+
+        Args:
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"), lease_seconds=0.05)
+        queue.enqueue("resources", {"url": "https://a.example"})
+        task = queue.lease("worker-1")
+        assert queue.heartbeat(task["id"], "worker-1")
+
+        time.sleep(0.1)
+        retried = queue.lease("worker-2")
+
+        assert retried["id"] == task["id"]
+        assert retried["attempts"] == 2 and retried["lease_owner"] == "worker-2"
+        assert not queue.heartbeat(task["id"], "worker-1")
+        assert not queue.fail(task["id"], "worker-1", "too late")
+
+    def test_fail_retries_until_max_attempts(self, tmp_path):
+        """
+        Test case that a failed task is retried until it used up its attempts, then failed for good.
+
+        Args:
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"), max_attempts=2)
+        _, task_id = queue.enqueue("resources", {"url": "https://a.example"})
+
+        assert queue.fail(queue.lease("worker-1")["id"], "worker-1", "timeout")
+        assert queue.get_task(task_id)["status"] == WorkQueue.PENDING
+        assert queue.fail(queue.lease("worker-1")["id"], "worker-1", "timeout again")
+
+        task = queue.get_task(task_id)
+        assert task["status"] == WorkQueue.FAILED
+        assert task["error"] == "timeout again"
+        assert queue.lease("worker-1") is None
+
+    def test_expired_lease_without_attempts_left_fails(self, tmp_path):
+        """
+        Test case that a task whose last attempt timed out is failed instead of leased again.
+
+        Args:
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"), lease_seconds=0.05, max_attempts=1)
+        _, task_id = queue.enqueue("resources", {"url": "https://a.example"})
+        queue.lease("worker-1")
+
+        time.sleep(0.1)
+
+        assert queue.lease("worker-2") is None
+        assert queue.get_task(task_id)["status"] == WorkQueue.FAILED
+        assert queue.get_task(task_id)["error"] == "lease expired"
+
+    def test_complete_keeps_first_result(self, tmp_path):
+        """
+        Test case that only the first completion of a task is recorded.
+
+        Args:
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"), lease_seconds=0.05)
+        _, task_id = queue.enqueue("resources", {"url": "https://a.example"})
+        queue.lease("worker-1")
+        time.sleep(0.1)
+        queue.lease("worker-2")
+
+        assert queue.complete(task_id, "worker-2", {"message": "second worker"})
+        assert not queue.complete(task_id, "worker-1", {"message": "first worker"})
+
+        task = queue.get_task(task_id)
+        assert task["status"] == WorkQueue.DONE
+        assert task["result"] == {"message": "second worker"}
+        assert queue.get_counts() == {"pending": 0, "leased": 0, "done": 1, "failed": 0}
+
+    def test_concurrent_workers_lease_each_task_once(self, tmp_path):
+        """
+        Test case that workers leasing from several threads at once never receive the same task.
+
+        Args:
+            tmp_path (Path): Temporary directory provided by pytest.
+        """
+        queue = WorkQueue(str(tmp_path / "queue.sqlite3"))
+        for number in range(40):
+            queue.enqueue("resources", {"url": f"https://{number}.example"})
+        leased = []
+        lock = threading.Lock()
+
+        def work(worker_id):
+            worker_queue = WorkQueue(queue.get_path())
+            while (task := worker_queue.lease(worker_id)) is not None:
+                with lock:
+                    leased.append(task["id"])
+                worker_queue.complete(task["id"], worker_id, {"worker": worker_id})
+
+        threads = [threading.Thread(target=work, args=(f"worker-{number}",)) for number in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(leased) == list(range(1, 41))
+        assert queue.get_counts()[WorkQueue.DONE] == 40
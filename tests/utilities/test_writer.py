@@ -0,0 +1,104 @@
+import json
+import os
+
+import pytest
+from utilities.writer import FileWriter
+
+
+class TestFileWriter:
+    @pytest.fixture
+    def output_directory(self, tmp_path):
+        """
+        Fixture providing an empty output directory for testing.
+        """
+        return tmp_path
+
+    def test_write_to_json_file(self, output_directory):
+        """
+        Test case for the write_to_json_file method of FileWriter in the pretty-printed and compact modes.
+
+        Args:
+            output_directory (Path): Temporary output directory.
+        """
+        data = {"privacy": 2, "policy": 1}
+        flag, _ = FileWriter.write_to_json_file(data, str(output_directory / "pretty"))
+        assert flag is True
+        flag, _ = FileWriter.write_to_json_file(data, str(output_directory / "compact.json"), compact=True)
+        assert flag is True
+
+        pretty = (output_directory / "pretty.json").read_text()
+        compact = (output_directory / "compact.json").read_text()
+        assert json.loads(pretty) == json.loads(compact) == data
+        assert compact == '{"privacy":2,"policy":1}'
+        assert len(compact) < len(pretty)
+        assert sorted(os.listdir(output_directory)) == ["compact.json", "pretty.json"]
+
+    def test_write_ndjson_file(self, output_directory):
+        """
+        Test case for the write_ndjson_file method of FileWriter.
+
+        Tests that records are consumed from a generator and written one per line.
+
+        Args:
+            output_directory (Path): Temporary output directory.
+        """
+        records = ({"url": f"https://site{number}.example", "status": "ok"} for number in range(3))
+        flag, written = FileWriter.write_ndjson_file(records, str(output_directory / "results"))
+
+        assert flag is True
+        assert written == 3
+        lines = (output_directory / "results.ndjson").read_text().splitlines()
+        assert [json.loads(line)["url"] for line in lines] == [f"https://site{number}.example" for number in range(3)]
+
+    def test_write_is_atomic(self, output_directory):
+        """
+        Test case for the atomicity of FileWriter writes.
+
+        Tests that a write failing midway keeps the previous file intact and leaves no temporary file behind.
+
+        Args:
+            output_directory (Path): Temporary output directory.
+        """
+        output_file = str(output_directory / "results.ndjson")
+        FileWriter.write_ndjson_file([{"run": 1}], output_file)
+
+        def failing_records():
+            yield {"run": 2}
+            raise RuntimeError("scrape failed")
+
+        flag, error = FileWriter.write_ndjson_file(failing_records(), output_file)
+        assert flag is False
+        assert error == "scrape failed"
+        assert (output_directory / "results.ndjson").read_text() == '{"run":1}\n'
+        assert os.listdir(output_directory) == ["results.ndjson"]
+
+        flag, _ = FileWriter.write_to_json_file({"a": {1, 2}}, output_file.replace(".ndjson", ".json"))
+        assert flag is False
+        assert os.listdir(output_directory) == ["results.ndjson"]
+
+    def test_write_logs(self, output_directory):
+        """
+        Test case for the write_logs method of FileWriter.
+
+        Args:
+            output_directory (Path): Temporary output directory.
+        """
+        flag, _ = FileWriter.write_logs("Connection refused", str(output_directory / "error"))
+        assert flag is True
+        assert json.loads((output_directory / "error.log").read_text()) == "Connection refused"
+        with open(output_directory / "reference.log", "w"):
+            pass
+        assert os.stat(output_directory / "error.log").st_mode & 0o777 == \
+            os.stat(output_directory / "reference.log").st_mode & 0o777
+
+    def test_write_text_file(self, output_directory):
+        """
+        Test case for the write_text_file method of FileWriter.
+
+        Args:
+            output_directory (Path): Temporary output directory.
+        """
+        flag, _ = FileWriter.write_text_file("scrape_requests_total 3\n", str(output_directory / "metrics.prom"))
+        assert flag is True
+        assert (output_directory / "metrics.prom").read_text() == "scrape_requests_total 3\n"
+        assert os.listdir(output_directory) == ["metrics.prom"]
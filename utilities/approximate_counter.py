@@ -0,0 +1,481 @@
+"""
+ApproximateWordCounter
+
+Fixed-memory word frequency counting for corpora too large for an exact Counter of every distinct word, e.g. the
+aggregated privacy policies of thousands of sites.
+
+Counts are kept in a Count-Min sketch, whose size depends only on the requested error bounds: with a width of
+ceil(e / epsilon) and a depth of ceil(ln(1 / delta)), an estimate never undercounts and overcounts by more than
+epsilon times the total number of counted words with probability at most delta. The most frequent words are tracked
+by a Space-Saving summary of top_k entries, whose counts overcount by at most the recorded error of each entry.
+
+Both structures are mergeable: sketches built with the same parameters by different workers, threads or processes can
+be combined, and to_dict() / from_dict() carry their state across process boundaries as JSON-serializable data.
+Words are hashed with BLAKE2b rather than hash(), so the same word maps to the same cells in every process.
+
+Methods:
+    CountMinSketch.add(item, count=1), estimate(item), merge(other)
+    SpaceSavingSummary.add(item, count=1), most_common(n=None), merge(other)
+    ApproximateWordCounter.update(words):
+        Counts an iterable of words.
+    ApproximateWordCounter.estimate(word):
+        Returns the estimated count of a word.
+    ApproximateWordCounter.most_common(n=None):
+        Returns the estimated heavy hitters, most frequent first.
+    ApproximateWordCounter.get_error_bound():
+        Returns the maximum overcount of an estimate, with probability 1 - delta.
+    ApproximateWordCounter.merge(other):
+        Adds the counts of another counter built with the same parameters.
+    ApproximateWordCounter.to_dict() / from_dict(state):
+        Serializes and restores the counter state.
+"""
+
+import hashlib
+import heapq
+import math
+from array import array
+from collections import Counter
+
+
+class CountMinSketch:
+    def __init__(self, epsilon=0.0005, delta=0.01, seed=0):
+        """
+        Initialize an empty CountMinSketch instance.
+
+        Args:
+            epsilon (float, optional): Maximum overcount as a fraction of the total count. Defaults to 0.0005.
+            delta (float, optional): Probability of exceeding the overcount bound. Defaults to 0.01.
+            seed (int, optional): Hash seed; only sketches with the same seed can be merged. Defaults to 0.
+        """
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon and delta must be between 0 and 1")
+        self.__epsilon = epsilon
+        self.__delta = delta
+        self.__seed = seed
+        self.__width = math.ceil(math.e / epsilon)
+        self.__depth = math.ceil(math.log(1 / delta))
+        self.__salt = seed.to_bytes(8, "little")
+        self.__table = array("q", bytes(8 * self.__width * self.__depth))
+        self.__total = 0
+
+    def get_parameters(self):
+        """
+        Get the parameters a sketch must share with this one to be merged.
+
+        Returns:
+            dict: The "epsilon", "delta" and "seed" of the sketch.
+        """
+        return {"epsilon": self.__epsilon, "delta": self.__delta, "seed": self.__seed}
+
+    def get_shape(self):
+        """
+        Get the dimensions of the counter table.
+
+        Returns:
+            tuple: The depth (number of rows) and width (counters per row).
+        """
+        return self.__depth, self.__width
+
+    def get_total(self):
+        """
+        Get the sum of all counts added.
+
+        Returns:
+            int: The total count.
+        """
+        return self.__total
+
+    def __get_cells(self, item):
+        """
+        Returns the table index of an item in every row, using double hashing of one 128-bit BLAKE2b digest.
+
+        Args:
+            item (str): The item.
+
+        Returns:
+            list: One flat table index per row.
+        """
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16, salt=self.__salt).digest()
+        first_hash = int.from_bytes(digest[:8], "little")
+        second_hash = int.from_bytes(digest[8:], "little") | 1
+        width = self.__width
+        return [row * width + (first_hash + row * second_hash) % width for row in range(self.__depth)]
+
+    def add(self, item, count=1):
+        """
+        Adds a count to an item.
+
+        Args:
+            item (str): The item.
+            count (int, optional): The non-negative count to add. Defaults to 1.
+
+        Returns:
+            int: The new estimate of the item.
+        """
+        table = self.__table
+        estimate = None
+        for cell in self.__get_cells(item):
+            table[cell] += count
+            estimate = table[cell] if estimate is None else min(estimate, table[cell])
+        self.__total += count
+        return estimate
+
+    def estimate(self, item):
+        """
+        Returns the estimated count of an item: never lower than its true count, and higher by at most
+        epsilon * get_total() with probability 1 - delta.
+
+        Args:
+            item (str): The item.
+
+        Returns:
+            int: The estimated count.
+        """
+        table = self.__table
+        return min(table[cell] for cell in self.__get_cells(item))
+
+    def merge(self, other):
+        """
+        Adds the counts of another sketch built with the same parameters.
+
+        Args:
+            other (CountMinSketch): The sketch to merge into this one.
+
+        Returns:
+            CountMinSketch: This sketch.
+        """
+        if other.get_parameters() != self.get_parameters():
+            raise ValueError("Only sketches with the same epsilon, delta and seed can be merged")
+        table = self.__table
+        for cell, count in enumerate(other.__table):
+            if count:
+                table[cell] += count
+        self.__total += other.get_total()
+        return self
+
+    def to_dict(self):
+        """
+        Serializes the sketch.
+
+        Returns:
+            dict: The JSON-serializable state of the sketch.
+        """
+        return dict(self.get_parameters(), total=self.__total, table=self.__table.tolist())
+
+    @classmethod
+    def from_dict(cls, state):
+        """
+        Restores a sketch serialized by to_dict().
+
+        Args:
+            state (dict): The serialized state.
+
+        Returns:
+            CountMinSketch: The restored sketch.
+        """
+        sketch = cls(state["epsilon"], state["delta"], state["seed"])
+        if len(state["table"]) != len(sketch.__table):
+            raise ValueError("The serialized table does not match the sketch parameters")
+        sketch.__table = array("q", state["table"])
+        sketch.__total = state["total"]
+        return sketch
+
+
+class SpaceSavingSummary:
+    def __init__(self, capacity=100):
+        """
+        Initialize an empty SpaceSavingSummary instance.
+
+        Args:
+            capacity (int, optional): The number of tracked items. Defaults to 100.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.__capacity = capacity
+        self.__counts = {}
+        self.__errors = {}
+        self.__heap = []
+
+    def get_capacity(self):
+        """
+        Get the number of tracked items.
+
+        Returns:
+            int: The capacity.
+        """
+        return self.__capacity
+
+    def get_min_count(self):
+        """
+        Get the count an untracked item may have at most: the smallest tracked count once the summary is full.
+
+        Returns:
+            int: The minimum tracked count, or 0 while the summary is not full.
+        """
+        if len(self.__counts) < self.__capacity:
+            return 0
+        return self.__peek_min()[0]
+
+    def __peek_min(self):
+        """
+        Returns the (count, item) of the least frequent tracked item. Heap entries are pushed on every update and
+        outdated ones are discarded lazily here, so an update costs O(log capacity).
+
+        Returns:
+            tuple: The smallest count and its item.
+        """
+        heap = self.__heap
+        while heap[0][0] != self.__counts.get(heap[0][1]):
+            heapq.heappop(heap)
+        return heap[0]
+
+    def add(self, item, count=1):
+        """
+        Adds a count to an item. When the summary is full, an untracked item replaces the least frequent one and
+        inherits its count as error.
+
+        Args:
+            item (str): The item.
+            count (int, optional): The count to add. Defaults to 1.
+        """
+        counts = self.__counts
+        if item not in counts and len(counts) >= self.__capacity:
+            min_count, min_item = self.__peek_min()
+            del counts[min_item]
+            del self.__errors[min_item]
+            counts[item] = min_count
+            self.__errors[item] = min_count
+        counts[item] = counts.get(item, 0) + count
+        self.__errors.setdefault(item, 0)
+        heapq.heappush(self.__heap, (counts[item], item))
+        if len(self.__heap) > 4 * self.__capacity:
+            self.__heap = [(item_count, tracked) for tracked, item_count in counts.items()]
+            heapq.heapify(self.__heap)
+
+    def get(self, item):
+        """
+        Returns the tracked count and error of an item.
+
+        Args:
+            item (str): The item.
+
+        Returns:
+            tuple: The count and error of the item, or None if the item is not tracked.
+        """
+        if item not in self.__counts:
+            return None
+        return self.__counts[item], self.__errors[item]
+
+    def most_common(self, n=None):
+        """
+        Returns the tracked items, most frequent first.
+
+        Args:
+            n (int, optional): The number of items returned. Defaults to all tracked items.
+
+        Returns:
+            list: (item, count, error) tuples; the true count of an item lies between count - error and count.
+        """
+        ranked = sorted(self.__counts.items(), key=lambda entry: (-entry[1], entry[0]))
+        return [(item, count, self.__errors[item]) for item, count in ranked[:n]]
+
+    def merge(self, other):
+        """
+        Adds the counts of another summary. An item tracked by only one summary is charged the minimum count of the
+        other, so counts keep overcounting, and the capacity most frequent items are kept.
+
+        Args:
+            other (SpaceSavingSummary): The summary to merge into this one.
+
+        Returns:
+            SpaceSavingSummary: This summary.
+        """
+        own_min, other_min = self.get_min_count(), other.get_min_count()
+        merged = {}
+        for item in set(self.__counts) | set(other.__counts):
+            own = self.get(item) or (own_min, own_min)
+            theirs = other.get(item) or (other_min, other_min)
+            merged[item] = (own[0] + theirs[0], own[1] + theirs[1])
+        kept = heapq.nsmallest(self.__capacity, merged.items(), key=lambda entry: (-entry[1][0], entry[0]))
+        self.__counts = {item: count for item, (count, _) in kept}
+        self.__errors = {item: error for item, (_, error) in kept}
+        self.__heap = [(count, item) for item, count in self.__counts.items()]
+        heapq.heapify(self.__heap)
+        return self
+
+    def to_dict(self):
+        """
+        Serializes the summary.
+
+        Returns:
+            dict: The JSON-serializable state of the summary.
+        """
+        return {"capacity": self.__capacity,
+                "items": [[item, count, self.__errors[item]] for item, count in self.__counts.items()]}
+
+    @classmethod
+    def from_dict(cls, state):
+        """
+        Restores a summary serialized by to_dict().
+
+        Args:
+            state (dict): The serialized state.
+
+        Returns:
+            SpaceSavingSummary: The restored summary.
+        """
+        summary = cls(state["capacity"])
+        summary.__counts = {item: count for item, count, _ in state["items"]}
+        summary.__errors = {item: error for item, _, error in state["items"]}
+        summary.__heap = [(count, item) for item, count in summary.__counts.items()]
+        heapq.heapify(summary.__heap)
+        return summary
+
+
+class ApproximateWordCounter:
+    def __init__(self, top_k=100, epsilon=0.0005, delta=0.01, seed=0):
+        """
+        Initialize an empty ApproximateWordCounter instance. Its memory footprint is fixed by the parameters: a
+        ceil(ln(1 / delta)) x ceil(e / epsilon) table of 64-bit counters plus top_k tracked words.
+
+        Args:
+            top_k (int, optional): The number of heavy hitters tracked. Defaults to 100.
+            epsilon (float, optional): Maximum overcount as a fraction of the total count. Defaults to 0.0005.
+            delta (float, optional): Probability of exceeding the overcount bound. Defaults to 0.01.
+            seed (int, optional): Hash seed; only counters with the same seed can be merged. Defaults to 0.
+        """
+        self.__sketch = CountMinSketch(epsilon, delta, seed)
+        self.__heavy_hitters = SpaceSavingSummary(top_k)
+
+    def get_sketch(self):
+        """
+        Get the Count-Min sketch holding the counts of every word.
+
+        Returns:
+            CountMinSketch: The sketch.
+        """
+        return self.__sketch
+
+    def get_heavy_hitters(self):
+        """
+        Get the Space-Saving summary tracking the most frequent words.
+
+        Returns:
+            SpaceSavingSummary: The summary.
+        """
+        return self.__heavy_hitters
+
+    def get_total(self):
+        """
+        Get the number of words counted.
+
+        Returns:
+            int: The total count.
+        """
+        return self.__sketch.get_total()
+
+    def get_error_bound(self):
+        """
+        Returns the maximum overcount of an estimate, which holds with probability 1 - delta.
+
+        Returns:
+            float: epsilon times the number of words counted.
+        """
+        return self.__sketch.get_parameters()["epsilon"] * self.get_total()
+
+    def add(self, word, count=1):
+        """
+        Adds a count to a word.
+
+        Args:
+            word (str): The word, already case-folded by the caller.
+            count (int, optional): The count to add. Defaults to 1.
+        """
+        self.__sketch.add(word, count)
+        self.__heavy_hitters.add(word, count)
+
+    def update(self, words):
+        """
+        Counts an iterable of words, e.g. the words of one document. Repeated words are collapsed first, so each
+        distinct word of the batch is hashed once.
+
+        Args:
+            words (iterable): The words, or a mapping of word to count.
+
+        Returns:
+            ApproximateWordCounter: This counter.
+        """
+        word_count = words if isinstance(words, dict) else Counter(words)
+        for word, count in word_count.items():
+            self.add(word, count)
+        return self
+
+    def estimate(self, word):
+        """
+        Returns the estimated count of a word: never lower than its true count, and higher by at most
+        get_error_bound() with probability 1 - delta.
+
+        Args:
+            word (str): The word.
+
+        Returns:
+            int: The estimated count.
+        """
+        estimate = self.__sketch.estimate(word)
+        tracked = self.__heavy_hitters.get(word)
+        return min(estimate, tracked[0]) if tracked is not None else estimate
+
+    def most_common(self, n=None):
+        """
+        Returns the estimated heavy hitters, most frequent first. Every word occurring more than
+        get_total() / top_k times is included.
+
+        Args:
+            n (int, optional): The number of words returned. Defaults to top_k.
+
+        Returns:
+            list: (word, estimated count) tuples.
+        """
+        estimates = [(word, min(count, self.__sketch.estimate(word)))
+                     for word, count, _ in self.__heavy_hitters.most_common()]
+        estimates.sort(key=lambda entry: (-entry[1], entry[0]))
+        return estimates[:n]
+
+    def merge(self, other):
+        """
+        Adds the counts of another counter built with the same parameters, e.g. by another worker.
+
+        Args:
+            other (ApproximateWordCounter): The counter to merge into this one.
+
+        Returns:
+            ApproximateWordCounter: This counter.
+        """
+        self.__sketch.merge(other.get_sketch())
+        self.__heavy_hitters.merge(other.get_heavy_hitters())
+        return self
+
+    def to_dict(self):
+        """
+        Serializes the counter, e.g. to send it from a worker process or to store it between runs.
+
+        Returns:
+            dict: The JSON-serializable state of the counter.
+        """
+        return {"sketch": self.__sketch.to_dict(), "heavy_hitters": self.__heavy_hitters.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state):
+        """
+        Restores a counter serialized by to_dict().
+
+        Args:
+            state (dict): The serialized state.
+
+        Returns:
+            ApproximateWordCounter: The restored counter.
+        """
+        counter = cls()
+        counter.__sketch = CountMinSketch.from_dict(state["sketch"])
+        counter.__heavy_hitters = SpaceSavingSummary.from_dict(state["heavy_hitters"])
+        return counter
@@ -0,0 +1,264 @@
+"""
+AsyncContentScrapper
+
+An asyncio variant of the scraping pipeline that audits many sites concurrently. For every site it fetches the index
+page, extracts its external resources and privacy policy URL with one PageExtractor pass, fetches the privacy policy
+page and counts its words with BeautifulSoupContentScrapper.count_content_words, like the single-site commands.
+
+Network waits run on a thread pool through the pooled HttpClient, bounded by a global concurrency limit and a per-host
+limit. CPU-bound parsing and counting run on a separate executor, which can be a ProcessPoolExecutor, so the event loop
+is never blocked.
+
+Functions:
+    parse_index_content(content, url):
+        Extracts the external resources and the privacy policy URL of an index page.
+    count_content_words(content):
+        Counts the words of the visible text of a page.
+
+Methods:
+    scrape_site(url):
+        Runs the whole pipeline for one site.
+    scrape_sites(urls):
+        Runs the whole pipeline for many sites concurrently.
+    scrape_sites_as_completed(urls):
+        Runs the whole pipeline for many sites concurrently, yielding each site as it finishes.
+    iter_sites(urls):
+        Synchronous wrapper around scrape_sites_as_completed() for callers without an event loop.
+    run(urls):
+        Synchronous wrapper around scrape_sites() for callers without an event loop.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+from utilities.http_client import HttpClient
+from utilities.page_extractor import PageExtractor
+from utilities.page_info import GetPageInfo
+
+
+def parse_index_content(content, url):
+    """
+    Extracts the external resources and the privacy policy URL of an index page with a single PageExtractor pass.
+
+    Defined at module level so it can be shipped to a ProcessPoolExecutor.
+
+    Args:
+        content (str): The HTML content of the index page.
+        url (str): The URL of the index page.
+
+    Returns:
+        tuple: A tuple containing a flag indicating success (bool) and a dict with the "external_resources" and
+               "privacy_policy_url" of the page.
+    """
+    flag, extraction = PageExtractor.extract(content, url)
+    if not flag:
+        return flag, extraction
+    return True, {
+        "external_resources": extraction.resources,
+        "privacy_policy_url": extraction.privacy_policy_url,
+    }
+
+
+def count_content_words(content):
+    """
+    Counts the words of the visible text of a page, as extracted by BeautifulSoupContentScrapper.extract_visible_text(),
+    so batch runs count the same words as the wordcount command.
+
+    Defined at module level so it can be shipped to a ProcessPoolExecutor.
+
+    Args:
+        content (str): The HTML content of the page.
+
+    Returns:
+        tuple: A tuple containing a flag indicating success (bool) and a dict containing word frequency count.
+    """
+    try:
+        flag, word_count = BeautifulSoupContentScrapper.count_content_words(content)
+        if not flag:
+            return flag, word_count
+        return True, dict(word_count)
+    except Exception as e:
+        return False, e.args[0]
+
+
+class AsyncContentScrapper:
+    def __init__(self, concurrency=20, per_host_limit=4, client=None, cpu_executor=None):
+        """
+        Initialize the AsyncContentScrapper instance.
+
+        Args:
+            concurrency (int, optional): Maximum number of requests in flight across all hosts. Defaults to 20.
+            per_host_limit (int, optional): Maximum number of requests in flight to a single host. Defaults to 4.
+            client (HttpClient, optional): The HTTP client used to send requests. If not provided, a client whose
+                                           per-host pool matches per_host_limit is created.
+            cpu_executor (concurrent.futures.Executor, optional): The executor running parsing and counting.
+                                                                  If not provided, a thread pool is used.
+        """
+        self.__concurrency = concurrency
+        self.__per_host_limit = per_host_limit
+        self.__client = client if client is not None else HttpClient(pool_maxsize=per_host_limit)
+        self.__cpu_executor = cpu_executor
+        self.__io_executor = None
+        self.__global_semaphore = None
+        self.__host_semaphores = {}
+
+    def get_concurrency(self):
+        """
+        Get the maximum number of requests in flight across all hosts.
+
+        Returns:
+            int: The global concurrency limit.
+        """
+        return self.__concurrency
+
+    def get_per_host_limit(self):
+        """
+        Get the maximum number of requests in flight to a single host.
+
+        Returns:
+            int: The per-host concurrency limit.
+        """
+        return self.__per_host_limit
+
+    def __get_host_semaphore(self, url):
+        host = urlparse(url).netloc.lower()
+        semaphore = self.__host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.__per_host_limit)
+            self.__host_semaphores[host] = semaphore
+        return semaphore
+
+    async def fetch(self, url):
+        """
+        Fetch the content of a webpage without blocking the event loop.
+
+        Args:
+            url (str): The URL of the webpage.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a str: The content of the webpage.
+        """
+        loop = asyncio.get_running_loop()
+        async with self.__global_semaphore, self.__get_host_semaphore(url):
+            return await loop.run_in_executor(
+                self.__io_executor, GetPageInfo(url, self.__client).get_content)
+
+    async def __run_cpu(self, function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__cpu_executor, function, *args)
+
+    async def scrape_site(self, url):
+        """
+        Runs the whole pipeline for one site: fetch, resource extraction, privacy policy discovery and word count.
+
+        Args:
+            url (str): The URL of the index page of the site.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a dict with the "external_resources",
+                   "privacy_policy_url" and "word_count" of the site.
+        """
+        try:
+            flag, content = await self.fetch(url)
+            if not flag:
+                return flag, content
+            flag, index_data = await self.__run_cpu(parse_index_content, content, url)
+            if not flag:
+                return flag, index_data
+            privacy_policy_url = index_data["privacy_policy_url"]
+            if not privacy_policy_url:
+                return False, "Error Finding Privacy Policy Url"
+            flag, content = await self.fetch(privacy_policy_url)
+            if not flag:
+                return flag, content
+            flag, word_count = await self.__run_cpu(count_content_words, content)
+            if not flag:
+                return flag, word_count
+            return True, {
+                "external_resources": index_data["external_resources"],
+                "privacy_policy_url": privacy_policy_url,
+                "word_count": word_count,
+            }
+        except Exception as e:
+            return False, e.args[0]
+
+    async def __scrape_site_with_url(self, url):
+        return url, await self.scrape_site(url)
+
+    async def scrape_sites_as_completed(self, urls):
+        """
+        Runs the whole pipeline for many sites concurrently, yielding each site as soon as it finishes, so callers
+        can write its results without waiting for the slowest site.
+
+        Args:
+            urls (iterable): The URLs of the index pages of the sites.
+
+        Yields:
+            tuple: The URL and the (flag, result) tuple returned by scrape_site(), in order of completion.
+        """
+        urls = list(dict.fromkeys(urls))
+        self.__global_semaphore = asyncio.Semaphore(self.__concurrency)
+        self.__host_semaphores = {}
+        with ThreadPoolExecutor(max_workers=self.__concurrency) as io_executor:
+            self.__io_executor = io_executor
+            tasks = [asyncio.ensure_future(self.__scrape_site_with_url(url)) for url in urls]
+            try:
+                for finished in asyncio.as_completed(tasks):
+                    yield await finished
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                self.__io_executor = None
+
+    async def scrape_sites(self, urls):
+        """
+        Runs the whole pipeline for many sites concurrently.
+
+        Args:
+            urls (iterable): The URLs of the index pages of the sites.
+
+        Returns:
+            dict: Mapping of each URL to the (flag, result) tuple returned by scrape_site(), in the order of urls.
+        """
+        urls = list(dict.fromkeys(urls))
+        results = {url: result async for url, result in self.scrape_sites_as_completed(urls)}
+        return {url: results[url] for url in urls}
+
+    def iter_sites(self, urls):
+        """
+        Synchronous wrapper around scrape_sites_as_completed() for callers without an event loop. The sites are
+        scraped on a private event loop that runs while the caller waits for the next site.
+
+        Args:
+            urls (iterable): The URLs of the index pages of the sites.
+
+        Yields:
+            tuple: The URL and the (flag, result) tuple returned by scrape_site(), in order of completion.
+        """
+        loop = asyncio.new_event_loop()
+        sites = self.scrape_sites_as_completed(urls)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(sites.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.run_until_complete(sites.aclose())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def run(self, urls):
+        """
+        Synchronous wrapper around scrape_sites() for callers without an event loop.
+
+        Args:
+            urls (iterable): The URLs of the index pages of the sites.
+
+        Returns:
+            dict: Mapping of each URL to the (flag, result) tuple returned by scrape_site().
+        """
+        return asyncio.run(self.scrape_sites(urls))
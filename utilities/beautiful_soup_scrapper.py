@@ -5,7 +5,9 @@ A class for scraping and extracting externally loaded resources from HTML conten
 
 Attributes:
     __url (str): The default URL to be used across the system.
-    __default_parser (str): The default parser to be used by BeautifulSoup.
+    __default_parser (str): The parser backend to be used by BeautifulSoup, see ParserBackends.
+    __page_cache (PageArtifactCache): The per-run cache of fetched and parsed pages.
+    __policy_cache (PrivacyPolicyCache): The per-domain cache of discovered Privacy Policy URLs, or None.
 
 Methods:
     fetch_bs_page(content):
@@ -15,30 +17,69 @@ Methods:
     count_words_frequency(url):
         Scrapes the webpage at the given URL, performs case-insensitive word frequency count on the visible text,
         and returns the frequency count as a dictionary.
+    count_soup_words(soup):
+        Performs case-insensitive word frequency count on the visible text of an already parsed page.
+    stream_words_frequency(url, chunk_size):
+        Streams the webpage at the given URL and counts its words without holding the whole page in memory.
+    extract_visible_text(content):
+        Extracts the visible text of a page, pruning script, style, noscript, template and hidden subtrees.
+    count_visible_words_frequency(url):
+        Performs case-insensitive word frequency count on the text extracted by extract_visible_text().
+    count_text_words(text):
+        Performs case-insensitive word frequency count on already extracted text.
+    count_content_words(content):
+        Performs case-insensitive word frequency count on the visible text of already fetched HTML content.
+    count_text_words_approximate(text, counter=None):
+        Counts the words of already extracted text into a fixed-memory approximate counter.
+    extract_page(url):
+        Extracts the external resources, anchors, privacy policy candidate and visible text of a page in one pass.
+    get_privacy_policy_url():
+        Finds the URL of the privacy policy page linked from the index page, or takes it from the policy cache.
+    get_privacy_policy_content():
+        Returns the content of the privacy policy page, rediscovering its URL if a cached one stopped working.
+    count_privacy_policy_words():
+        Performs case-insensitive word frequency count on the visible text of the privacy policy page.
     privacy_policy_word_frequency_counter():
         Scrapes the privacy policy page from the given URL, performs case-insensitive word frequency count on the
         visible text, and returns the frequency count as a dictionary.
+
+Parsing, visible text extraction and counting are recorded in the shared MetricsRecorder as the "parse",
+"extract_visible_text" and "count_words" stages, together with the "tokens_counted" counter.
 """
-from collections import Counter
 
 from bs4 import BeautifulSoup
+from utilities.approximate_counter import ApproximateWordCounter
+from utilities.metrics import MetricsRecorder
+from utilities.page_cache import PageArtifactCache
 from utilities.page_info import GetPageInfo
-from utilities.url_scrapper import FetchUrl
+from utilities.parser_backends import ParserBackends
+from utilities.privacy_policy_cache import PrivacyPolicyCache
+from utilities.streaming_counter import StreamingWordCounter
+from utilities.tokenizer import WordTokenizer
+from utilities.visible_text import VisibleTextParser
 
 
 class BeautifulSoupContentScrapper:
-    def __init__(self, url=None):
+    def __init__(self, url=None, page_cache=None, parser=None, policy_cache=None):
         """
         Initialize the BeautifulSoupContentScrapper instance.
 
         Args:
             url (str, optional): The default URL to be used across the system. Defaults to "https://www.cfcunderwriting.com".
+            page_cache (PageArtifactCache, optional): The per-run page cache shared with other scrappers.
+                                                      If not provided, a private cache is used.
+            parser (str, optional): The parser backend to be used by BeautifulSoup ("lxml", "html.parser" or
+                                    "html5lib"). If not provided, the fastest installed backend is used.
+            policy_cache (PrivacyPolicyCache, optional): The per-domain cache of Privacy Policy URLs.
+                                                         If not provided, the process-wide shared cache is used, if any.
         """
         if url:
             self.__url = url
         else:
             self.__url = "https://www.cfcunderwriting.com"
-        self.__default_parser = "html.parser"
+        self.__default_parser = ParserBackends.select_parser(parser)
+        self.__page_cache = page_cache if page_cache is not None else PageArtifactCache()
+        self.__policy_cache = policy_cache if policy_cache is not None else PrivacyPolicyCache.get_shared_cache()
 
     def get_url(self):
         """
@@ -58,6 +99,24 @@ class BeautifulSoupContentScrapper:
         """
         return self.__default_parser
 
+    def get_page_cache(self):
+        """
+        Get the page cache used to fetch and parse pages.
+
+        Returns:
+            PageArtifactCache: The page cache.
+        """
+        return self.__page_cache
+
+    def get_policy_cache(self):
+        """
+        Get the per-domain cache of Privacy Policy URLs.
+
+        Returns:
+            PrivacyPolicyCache: The policy cache, or None when policy caching is disabled.
+        """
+        return self.__policy_cache
+
     def fetch_bs_page(self, content):
         """
         Fetches and returns a BeautifulSoup instance for the given HTML content.
@@ -69,38 +128,34 @@ class BeautifulSoupContentScrapper:
             tuple: A tuple containing a flag indicating success (bool) and a BeautifulSoup instance representing the parsed HTML content.
         """
         try:
-            soup_instance = BeautifulSoup(content, self.get_parser())
+            metrics = MetricsRecorder.get_shared_recorder()
+            with metrics.stage("parse"):
+                soup_instance = BeautifulSoup(content, self.get_parser())
             return True, soup_instance
         except Exception as e:
             return False, e.args[0]
 
     def scrape_index_page(self):
         """
-        Scrapes the index page from the given URL and extracts externally loaded resources.
+        Scrapes the index page from the given URL and extracts externally loaded resources from the single-pass
+        extraction of the page, which privacy policy discovery reuses from the page cache.
 
         Returns:
             tuple: A tuple containing a flag indicating success (bool) and a dict of externally loaded resources.
         """
         try:
-            url = self.get_url()
-            get_page = GetPageInfo(url)
-            flag, content = get_page.get_content()
+            flag, extraction = self.extract_page()
             if not flag:
-                return flag, content
-            bs_scrapper = FetchUrl()
-            flag, external_resources = bs_scrapper.scrape_using_regex(content)
-
-            if not flag:
-                return flag, external_resources
-
-            return True, external_resources
+                return flag, extraction
+            return True, extraction.resources
         except Exception as e:
             return False, e.args[0]
 
     def count_words_frequency(self, url):
         """
         Scrapes the webpage at the given URL, performs case-insensitive word frequency count on the visible text,
-        and returns the frequency count as a dictionary.
+        and returns the frequency count as a dictionary. The page is parsed with StreamingWordCounter.TREE_PARSER
+        whatever the parser of the scrapper, so the count matches stream_words_frequency().
 
         Args:
             url (str): The URL of the webpage.
@@ -109,68 +164,265 @@ class BeautifulSoupContentScrapper:
             tuple: A tuple containing a flag indicating success (bool) and a Dictionary containing word frequency count.
         """
         try:
-            get_page = GetPageInfo(url)
-            flag, content = get_page.get_content()
+            flag, soup = self.get_page_cache().get_soup(url, StreamingWordCounter.TREE_PARSER)
 
             if not flag:
-                return flag, content
+                return flag, soup
+
+            return self.count_soup_words(soup)
+        except Exception as e:
+            return False, e.args[0]
+
+    @staticmethod
+    def count_soup_words(soup):
+        """
+        Performs case-insensitive word frequency count on the visible text of an already parsed page, splitting it
+        into words with the shared WordTokenizer.
+
+        Args:
+            soup (BeautifulSoup): The BeautifulSoup instance representing the parsed HTML content.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a Dictionary containing word frequency count.
+        """
+        try:
+            metrics = MetricsRecorder.get_shared_recorder()
+            with metrics.stage("count_words"):
+                word_count = WordTokenizer.get_shared_tokenizer().count(soup.get_text())
+            metrics.increment("tokens_counted", sum(word_count.values()))
+
+            return True, word_count
+        except Exception as e:
+            return False, e.args[0]
 
-            flag, soup = self.fetch_bs_page(content)
+    @staticmethod
+    def stream_words_frequency(url, chunk_size=65536):
+        """
+        Streams the webpage at the given URL through an incremental parser and counts words as text nodes arrive.
+        Peak memory is bounded by the chunk size plus the vocabulary size, and the result matches
+        count_words_frequency().
 
+        Args:
+            url (str): The URL of the webpage.
+            chunk_size (int, optional): The number of bytes read from the connection per chunk. Defaults to 65536.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a Dictionary containing word frequency count.
+        """
+        try:
+            flag, chunks = GetPageInfo(url).iter_content_chunks(chunk_size)
             if not flag:
-                return flag, soup
+                return flag, chunks
+            with MetricsRecorder.get_shared_recorder().stage("stream_count_words"):
+                return StreamingWordCounter.count_chunks(chunks)
+        except Exception as e:
+            return False, e.args[0]
+
+    @staticmethod
+    def extract_visible_text(content):
+        """
+        Extracts the text a visitor can see. <script> (including JSON-LD), <style>, <noscript> and <template>
+        elements, and elements marked hidden or aria-hidden, are pruned while parsing instead of being parsed
+        into a tree and filtered afterwards.
+
+        Args:
+            content (str): The HTML content of a webpage.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a str: The visible text.
+        """
+        with MetricsRecorder.get_shared_recorder().stage("extract_visible_text"):
+            return VisibleTextParser.extract(content)
+
+    def count_visible_words_frequency(self, url):
+        """
+        Scrapes the webpage at the given URL and performs case-insensitive word frequency count on the text
+        returned by extract_visible_text().
 
-            visible_text = soup.get_text()
-            visible_text = visible_text.replace('\n', ' ')
-            visible_text = visible_text.split()
-            visible_text = [text.strip() for text in visible_text]
+        Args:
+            url (str): The URL of the webpage.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a Dictionary containing word frequency count.
+        """
+        try:
+            flag, content = self.get_page_cache().get_content(url)
+            if not flag:
+                return flag, content
+            return self.count_content_words(content)
+        except Exception as e:
+            return False, e.args[0]
 
-            # word_count = dict()
-            # for text in visible_text:
-            #     words = text.lower().split()
-            #     for word in words:
-            #         word_count[word] = word_count.get(word, 0) + 1
+    @staticmethod
+    def count_text_words(text):
+        """
+        Performs case-insensitive word frequency count on already extracted text with the shared WordTokenizer.
 
-            word_count = Counter()
-            for text in visible_text:
-                words = text.lower().split()
-                word_count.update(words)
+        Args:
+            text (str): The text, e.g. the result of extract_visible_text().
 
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a Dictionary containing word frequency count.
+        """
+        try:
+            metrics = MetricsRecorder.get_shared_recorder()
+            with metrics.stage("count_words"):
+                word_count = WordTokenizer.get_shared_tokenizer().count(text)
+            metrics.increment("tokens_counted", sum(word_count.values()))
             return True, word_count
         except Exception as e:
             return False, e.args[0]
 
-    def privacy_policy_word_frequency_counter(self):
+    @staticmethod
+    def count_content_words(content):
         """
-        Scrapes the privacy policy page from the given URL, performs case-insensitive word frequency count on the
-        visible text, and returns the frequency count as a dictionary.
+        Performs case-insensitive word frequency count on the text returned by extract_visible_text() for already
+        fetched HTML content.
+
+        Args:
+            content (str): The HTML content of a webpage.
 
         Returns:
-            tuple[
-                bool: Determine whether this function raised any bug
-                dict: Dictionary containing word frequency count of the privacy policy page
-            ]
+            tuple: A tuple containing a flag indicating success (bool) and a Dictionary containing word frequency count.
+        """
+        flag, visible_text = BeautifulSoupContentScrapper.extract_visible_text(content)
+        if not flag:
+            return flag, visible_text
+        return BeautifulSoupContentScrapper.count_text_words(visible_text)
+
+    @staticmethod
+    def count_text_words_approximate(text, counter=None):
+        """
+        Performs case-insensitive word frequency count on already extracted text into a fixed-memory
+        ApproximateWordCounter, for aggregating word counts over more pages than an exact count fits in memory.
+
+        Args:
+            text (str): The text, e.g. the result of extract_visible_text().
+            counter (ApproximateWordCounter, optional): The counter to add the words to, e.g. one per worker that is
+                                                        merged with the others afterwards. Defaults to a new counter.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the ApproximateWordCounter.
+        """
+        try:
+            metrics = MetricsRecorder.get_shared_recorder()
+            with metrics.stage("count_words_approximate"):
+                word_count = WordTokenizer.get_shared_tokenizer().count(text)
+                counter = counter if counter is not None else ApproximateWordCounter()
+                counter.update(word_count)
+            metrics.increment("tokens_counted", sum(word_count.values()))
+            return True, counter
+        except Exception as e:
+            return False, e.args[0]
+
+    def extract_page(self, url=None):
+        """
+        Extracts the external resources, anchors, privacy policy candidate and visible text of a page with a single
+        tokenization of its content, see PageExtractor. The extraction is kept in the page cache.
+
+        Args:
+            url (str, optional): The URL of the webpage. Defaults to the default URL.
 
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a PageExtraction instance.
+        """
+        return self.get_page_cache().get_extraction(url or self.get_url())
+
+    def get_privacy_policy_url(self):
+        """
+        Finds the URL of the privacy policy page linked from the index page, as the best ranked candidate of the
+        single-pass extraction of the index page. With a policy cache, a URL discovered by an earlier run for the same
+        domain is used without touching the index page.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the URL of the Privacy Policy page.
         """
         try:
             url = self.get_url()
-            get_page = GetPageInfo(url)
-            flag, content = get_page.get_content()
+            policy_cache = self.get_policy_cache()
+            if policy_cache is not None:
+                flag, privacy_policy_url = policy_cache.get(url)
+                if flag:
+                    return True, privacy_policy_url
 
+            flag, extraction = self.extract_page(url)
             if not flag:
+                return flag, extraction
+            if extraction.privacy_policy_url is None:
+                return False, "Error Finding Privacy Policy Url"
+            if policy_cache is not None:
+                policy_cache.store(url, extraction.privacy_policy_url)
+            return True, extraction.privacy_policy_url
+        except Exception as e:
+            return False, e.args[0]
+
+    def get_privacy_policy_content(self):
+        """
+        Returns the content of the privacy policy page. If a URL taken from the policy cache cannot be fetched any
+        more, the entry is dropped and the URL is rediscovered from the index page.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a str: The content of the privacy policy page.
+        """
+        try:
+            flag, privacy_policy_url = self.get_privacy_policy_url()
+            if not flag:
+                return flag, privacy_policy_url
+            flag, content = self.get_page_cache().get_content(privacy_policy_url)
+            policy_cache = self.get_policy_cache()
+            if flag or policy_cache is None or policy_cache.lookup(self.get_url()) is None:
                 return flag, content
-            flag, soup = self.fetch_bs_page(content)
 
+            policy_cache.invalidate(self.get_url())
+            flag, rediscovered_url = self.get_privacy_policy_url()
+            if not flag or rediscovered_url == privacy_policy_url:
+                return False, content
+            return self.get_page_cache().get_content(rediscovered_url)
+        except Exception as e:
+            return False, e.args[0]
+
+    def count_privacy_policy_words(self):
+        """
+        Performs case-insensitive word frequency count on the text returned by extract_visible_text() for the privacy
+        policy page.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a Dictionary containing word frequency count.
+        """
+        try:
+            flag, content = self.get_privacy_policy_content()
             if not flag:
-                return flag, soup
+                return flag, content
+            return self.count_content_words(content)
+        except Exception as e:
+            return False, e.args[0]
 
-            bs_scrapper = FetchUrl()
-            flag, privacy_policy_url = bs_scrapper.find_privacy_policy_url(soup, url)
+    def privacy_policy_word_frequency_counter(self, streaming=False):
+        """
+        Scrapes the privacy policy page from the given URL, performs case-insensitive word frequency count on the
+        visible text, and returns the frequency count as a dictionary.
+
+        Args:
+            streaming (bool, optional): Count the privacy policy page with stream_words_frequency() instead of
+                                        parsing it whole. Defaults to False.
+
+        Returns:
+            tuple[
+                bool: Determine whether this function raised any bug
+                dict: Dictionary containing word frequency count of the privacy policy page
+            ]
+
+        """
+        try:
+            flag, privacy_policy_url = self.get_privacy_policy_url()
 
             if not flag:
-                return False, "Error Finding Privacy Policy Url"
+                return flag, privacy_policy_url
 
-            flag, word_count = self.count_words_frequency(privacy_policy_url)
+            if streaming:
+                flag, word_count = self.stream_words_frequency(privacy_policy_url)
+            else:
+                flag, word_count = self.count_words_frequency(privacy_policy_url)
             if not flag:
                 return flag, word_count
             return True, word_count
@@ -0,0 +1,68 @@
+"""
+ChangeTracker
+
+Helpers for detecting whether a page changed since the last run and describing what changed, so unchanged pages can
+skip parsing, counting and writing.
+
+Methods:
+    hash_content(content):
+        Returns the SHA-256 of raw page content.
+    hash_text(text):
+        Returns the SHA-256 of text with its whitespace normalised.
+    word_count_delta(previous, current):
+        Returns the per-word count changes between two word counts.
+"""
+
+import hashlib
+
+
+class ChangeTracker:
+    @staticmethod
+    def hash_content(content):
+        """
+        Returns the SHA-256 of raw page content.
+
+        Args:
+            content (str): The page content.
+
+        Returns:
+            str: The hex digest.
+        """
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def hash_text(text):
+        """
+        Returns the SHA-256 of text with runs of whitespace collapsed, so re-indenting a page does not count as a
+        change of its text.
+
+        Args:
+            text (str): The extracted text.
+
+        Returns:
+            str: The hex digest.
+        """
+        return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def word_count_delta(previous, current):
+        """
+        Returns the per-word count changes between two word counts. Words whose count did not change are left out,
+        and a word that disappeared has a change equal to minus its previous count.
+
+        Args:
+            previous (dict): The previous word count.
+            current (dict): The current word count.
+
+        Returns:
+            dict: Mapping of word to the change of its count.
+        """
+        delta = {}
+        for word, count in current.items():
+            change = count - previous.get(word, 0)
+            if change:
+                delta[word] = change
+        for word, count in previous.items():
+            if word not in current:
+                delta[word] = -count
+        return delta
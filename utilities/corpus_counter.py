@@ -0,0 +1,263 @@
+"""
+CorpusWordCounter
+
+Map-reduce word frequency counting over a corpus of pages, e.g. the privacy policies of every site of an industry.
+
+Documents are URLs or saved HTML files. The map step runs in worker processes: each worker reads a chunk of documents,
+extracts their visible text, counts their words and returns one compact partial count for the whole chunk together
+with the totals of every document. Exact partial counts are merged in the parent process as they arrive, since
+shipping whole counts to another process for a merge costs more than the merge itself. Approximate partial counts
+have a fixed size and are merged pairwise in a tree instead, each level of merges running in parallel on the same pool.
+
+In approximate mode, partial counts are ApproximateWordCounter states instead of exact counts, so the memory of every
+partial count and of the merged result stays fixed however large the corpus is.
+
+With term_matrix enabled, every worker also keeps the count of each of its documents as a row of a
+TermFrequencyMatrix, and the chunk matrices are concatenated into one matrix of the whole corpus for vectorized
+comparisons between documents.
+
+Functions:
+    read_document(source):
+        Returns the HTML content of a URL or a saved file.
+    count_documents(sources, approximate_options=None, keep_rows=False):
+        Counts the words of a chunk of documents (map step).
+    merge_partial_counts(left, right):
+        Merges two partial counts (reduce step).
+
+Methods:
+    expand_sources(sources):
+        Expands directories into the HTML files they contain.
+    count():
+        Counts the words of the whole corpus.
+"""
+
+import math
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from utilities.approximate_counter import ApproximateWordCounter
+from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+from utilities.page_info import GetPageInfo
+from utilities.term_matrix import TermFrequencyMatrix
+
+HTML_EXTENSIONS = (".html", ".htm")
+
+
+def read_document(source):
+    """
+    Returns the HTML content of a URL or a saved file.
+
+    Args:
+        source (str): An http(s) URL or the path of a saved HTML file.
+
+    Returns:
+        tuple: A tuple containing a flag indicating success (bool) and the content or the error message.
+    """
+    if source.startswith(("http://", "https://")):
+        return GetPageInfo(source).get_content()
+    try:
+        with open(source, encoding="utf-8", errors="replace") as document:
+            return True, document.read()
+    except OSError as e:
+        return False, str(e)
+
+
+def count_documents(sources, approximate_options=None, keep_rows=False):
+    """
+    Counts the words of the visible text of a chunk of documents (map step).
+
+    Defined at module level so it can be shipped to a ProcessPoolExecutor.
+
+    Args:
+        sources (list): The URLs or file paths of the documents.
+        approximate_options (dict, optional): Keyword arguments of ApproximateWordCounter; when given, the partial
+                                              count is an approximate counter state instead of an exact count.
+        keep_rows (bool, optional): Also return the count of every document as TermFrequencyMatrix arrays.
+                                    Defaults to False.
+
+    Returns:
+        tuple: The partial count (dict) of the chunk, the list of per-document totals ("source", "status", "words"
+               and "distinct_words") and the TermFrequencyMatrix arrays of the chunk, or None without keep_rows.
+    """
+    if approximate_options is not None:
+        partial_count = ApproximateWordCounter(**approximate_options)
+    else:
+        partial_count = Counter()
+    documents = []
+    term_matrix = TermFrequencyMatrix() if keep_rows else None
+    for source in sources:
+        flag, result = read_document(source)
+        if flag:
+            flag, result = BeautifulSoupContentScrapper.count_content_words(result)
+        if not flag:
+            documents.append({"source": source, "status": f"error: {result}", "words": 0, "distinct_words": 0})
+            continue
+        word_count = result
+        partial_count.update(word_count)
+        if term_matrix is not None:
+            term_matrix.add_document(source, word_count)
+        documents.append({"source": source, "status": "ok", "words": sum(word_count.values()),
+                          "distinct_words": len(word_count)})
+    rows = term_matrix.to_arrays() if term_matrix is not None else None
+    if approximate_options is not None:
+        return partial_count.to_dict(), documents, rows
+    return dict(partial_count), documents, rows
+
+
+def merge_partial_counts(left, right):
+    """
+    Merges two partial counts (reduce step). The larger exact count is updated in place, so each merge costs the size
+    of the smaller one.
+
+    Defined at module level so it can be shipped to a ProcessPoolExecutor.
+
+    Args:
+        left (dict): A partial count returned by count_documents() or by a previous merge.
+        right (dict): Another partial count of the same mode.
+
+    Returns:
+        dict: The merged partial count.
+    """
+    if "sketch" in left:
+        return ApproximateWordCounter.from_dict(left).merge(ApproximateWordCounter.from_dict(right)).to_dict()
+    if len(left) < len(right):
+        left, right = right, left
+    for word, count in right.items():
+        left[word] = left.get(word, 0) + count
+    return left
+
+
+class CorpusWordCounter:
+    def __init__(self, sources, workers=None, chunks_per_worker=4, approximate=False, top_k=100, epsilon=0.0005,
+                 delta=0.01, term_matrix=False):
+        """
+        Initialize the CorpusWordCounter instance.
+
+        Args:
+            sources (iterable): URLs, HTML file paths or directories of saved HTML files.
+            workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+            chunks_per_worker (int, optional): The number of chunks the documents are split into per worker, so
+                                               faster workers pick up more chunks. Defaults to 4.
+            approximate (bool, optional): Count into fixed-memory ApproximateWordCounter states. Defaults to False.
+            top_k (int, optional): The heavy hitters tracked in approximate mode. Defaults to 100.
+            epsilon (float, optional): The overcount bound in approximate mode. Defaults to 0.0005.
+            delta (float, optional): The probability of exceeding the bound in approximate mode. Defaults to 0.01.
+            term_matrix (bool, optional): Also build a TermFrequencyMatrix with one row per document.
+                                          Defaults to False.
+        """
+        self.__sources = self.expand_sources(sources)
+        self.__workers = workers or os.cpu_count() or 1
+        self.__chunks_per_worker = chunks_per_worker
+        self.__approximate_options = {"top_k": top_k, "epsilon": epsilon, "delta": delta} if approximate else None
+        self.__term_matrix = term_matrix
+
+    def get_sources(self):
+        """
+        Get the documents of the corpus.
+
+        Returns:
+            list: The URLs and file paths of the documents.
+        """
+        return self.__sources
+
+    def get_workers(self):
+        """
+        Get the number of worker processes.
+
+        Returns:
+            int: The number of workers.
+        """
+        return self.__workers
+
+    @staticmethod
+    def expand_sources(sources):
+        """
+        Expands directories into the HTML files they contain, in sorted order. URLs and files are kept as they are.
+
+        Args:
+            sources (iterable): URLs, HTML file paths or directories.
+
+        Returns:
+            list: The URLs and file paths of the documents.
+        """
+        documents = []
+        for source in sources:
+            if os.path.isdir(source):
+                for directory, _, file_names in sorted(os.walk(source)):
+                    documents.extend(os.path.join(directory, file_name) for file_name in sorted(file_names)
+                                     if file_name.lower().endswith(HTML_EXTENSIONS))
+            else:
+                documents.append(source)
+        return documents
+
+    def __get_chunks(self):
+        """
+        Splits the documents into contiguous chunks, one map task each.
+
+        Returns:
+            list: The chunks, each a list of sources.
+        """
+        chunk_size = max(1, math.ceil(len(self.__sources) / (self.__workers * self.__chunks_per_worker)))
+        return [self.__sources[start:start + chunk_size] for start in range(0, len(self.__sources), chunk_size)]
+
+    @staticmethod
+    def __reduce(executor, partial_counts):
+        """
+        Merges approximate partial counts pairwise, level by level, running the merges of a level in parallel.
+
+        Args:
+            executor (concurrent.futures.Executor): The pool running the merges.
+            partial_counts (list): The approximate partial counts of every chunk.
+
+        Returns:
+            dict: The merged count, or None when there is nothing to merge.
+        """
+        while len(partial_counts) > 1:
+            pairs = [executor.submit(merge_partial_counts, partial_counts[index], partial_counts[index + 1])
+                     for index in range(0, len(partial_counts) - 1, 2)]
+            leftover = partial_counts[-1:] if len(partial_counts) % 2 else []
+            partial_counts = [pair.result() for pair in pairs] + leftover
+        return partial_counts[0] if partial_counts else None
+
+    def count(self):
+        """
+        Counts the words of the whole corpus.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a dict with the "word_count" (the merged
+                   count, most frequent words first; the heavy hitters in approximate mode), the corpus "total_words"
+                   and the per-document totals in "documents", plus the "term_matrix" of the corpus when enabled, or
+                   the error message.
+        """
+        try:
+            chunks = self.__get_chunks()
+            documents = []
+            with ProcessPoolExecutor(max_workers=min(self.__workers, max(1, len(chunks)))) as executor:
+                mapped = executor.map(count_documents, chunks, [self.__approximate_options] * len(chunks),
+                                      [self.__term_matrix] * len(chunks))
+                partial_counts = []
+                merged = None
+                term_matrix = TermFrequencyMatrix() if self.__term_matrix else None
+                for partial_count, chunk_documents, rows in mapped:
+                    if self.__approximate_options is not None:
+                        partial_counts.append(partial_count)
+                    else:
+                        merged = merge_partial_counts(merged, partial_count) if merged else partial_count
+                    documents.extend(chunk_documents)
+                    if term_matrix is not None:
+                        term_matrix.concatenate(TermFrequencyMatrix.from_arrays(rows))
+                if self.__approximate_options is not None:
+                    merged = self.__reduce(executor, partial_counts)
+            total_words = sum(document["words"] for document in documents)
+            if self.__approximate_options is not None:
+                counter = ApproximateWordCounter.from_dict(merged) if merged else ApproximateWordCounter()
+                word_count = dict(counter.most_common())
+            else:
+                word_count = dict(Counter(merged or {}).most_common())
+            corpus = {"word_count": word_count, "total_words": total_words, "documents": documents}
+            if term_matrix is not None:
+                corpus["term_matrix"] = term_matrix
+            return True, corpus
+        except Exception as e:
+            return False, e.args[0]
@@ -0,0 +1,337 @@
+"""
+DiskHttpCache
+
+A persistent HTTP response cache keyed by URL. Each entry stores the response body together with its ETag and
+Last-Modified validators, so the next fetch can be a conditional request and a "304 Not Modified" answer is served from
+disk instead of downloading the page again.
+
+The cache is capped in size: when the stored bodies exceed max_bytes, the least recently used entries are evicted.
+An optional TTL override serves entries younger than ttl seconds without contacting the server at all.
+
+Every entry is two files named after the SHA-256 of the URL: "<key>.body" with the body and "<key>.json" with the
+metadata. Both are written to a temporary file and renamed into place, so a crash never leaves a torn entry.
+
+The size and last access of every entry are kept in an in-memory index, loaded from the metadata files the first time
+it is needed and updated by store(), read_body(), touch() and evict(), so a store does not rescan the directory.
+
+Attributes:
+    __shared_cache (DiskHttpCache): The process-wide cache returned by get_shared_cache(), None when disabled.
+
+Methods:
+    lookup(url):
+        Returns the metadata of a cached URL.
+    read_body(entry, revalidated=False):
+        Returns the cached body of an entry.
+    is_fresh(entry):
+        Determines whether an entry can be served without revalidation.
+    get_conditional_headers(entry):
+        Returns the If-None-Match / If-Modified-Since headers revalidating an entry.
+    store(url, body, etag, last_modified):
+        Stores a response body and its validators.
+    touch(url):
+        Marks an entry as revalidated and recently used.
+    evict():
+        Removes least recently used entries until the cache fits in max_bytes.
+    get_shared_cache():
+        Returns the process-wide cache, or None when disk caching is disabled.
+    configure_shared_cache(directory, **options):
+        Enables disk caching for every GetPageInfo instance of the process.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+
+class DiskHttpCache:
+    __shared_cache = None
+
+    def __init__(self, directory=".http_cache", max_bytes=50 * 1024 * 1024, ttl=None):
+        """
+        Initialize the DiskHttpCache instance.
+
+        Args:
+            directory (str, optional): The directory holding the cache entries. Defaults to ".http_cache".
+            max_bytes (int, optional): The maximum total size of the cached bodies. Defaults to 50 MB.
+            ttl (float, optional): Seconds during which an entry is served without revalidation.
+                                   If not provided, every hit is revalidated with a conditional request.
+        """
+        self.__directory = directory
+        self.__max_bytes = max_bytes
+        self.__ttl = ttl
+        self.__lock = threading.Lock()
+        self.__index = None
+        self.__total_size = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def get_directory(self):
+        """
+        Get the directory holding the cache entries.
+
+        Returns:
+            str: The cache directory.
+        """
+        return self.__directory
+
+    def get_ttl(self):
+        """
+        Get the TTL override.
+
+        Returns:
+            float: Seconds during which an entry is served without revalidation, or None.
+        """
+        return self.__ttl
+
+    @staticmethod
+    def get_key(url):
+        """
+        Get the cache key of a URL.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            str: The SHA-256 hex digest of the URL.
+        """
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def __get_path(self, key, extension):
+        return os.path.join(self.__directory, f"{key}.{extension}")
+
+    def __write_atomic(self, path, data):
+        """
+        Writes bytes to a temporary file in the cache directory and renames it over the destination.
+
+        Args:
+            path (str): The destination path.
+            data (bytes): The data to write.
+        """
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.__directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                temporary_file.write(data)
+            os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+    def __write_metadata(self, entry):
+        self.__write_atomic(self.__get_path(entry["key"], "json"), json.dumps(entry).encode("utf-8"))
+
+    def __get_index(self):
+        """
+        Returns the in-memory index of the entries, loading it from the metadata files on the first call. The caller
+        must hold the lock.
+
+        Returns:
+            dict: Mapping of entry key to its "size" and "last_access".
+        """
+        if self.__index is None:
+            self.__index = {entry["key"]: {"size": entry["size"], "last_access": entry["last_access"]}
+                            for entry in self.get_entries()}
+            self.__total_size = sum(indexed["size"] for indexed in self.__index.values())
+        return self.__index
+
+    def __index_entry(self, entry):
+        """
+        Adds or updates an entry in the in-memory index. The caller must hold the lock.
+
+        Args:
+            entry (dict): The entry metadata.
+        """
+        index = self.__get_index()
+        previous = index.get(entry["key"])
+        self.__total_size += entry["size"] - (previous["size"] if previous else 0)
+        index[entry["key"]] = {"size": entry["size"], "last_access": entry["last_access"]}
+
+    def lookup(self, url):
+        """
+        Returns the metadata of a cached URL.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            dict: The entry metadata ("url", "key", "etag", "last_modified", "stored_at", "last_access", "size"),
+                  or None if the URL is not cached.
+        """
+        try:
+            with open(self.__get_path(self.get_key(url), "json")) as metadata_file:
+                entry = json.load(metadata_file)
+            if entry.get("url") != url or not os.path.exists(self.__get_path(entry["key"], "body")):
+                return None
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def read_body(self, entry, revalidated=False):
+        """
+        Returns the cached body of an entry and marks the entry as recently used, writing its metadata once.
+
+        Args:
+            entry (dict): The entry metadata returned by lookup().
+            revalidated (bool, optional): The server just confirmed the entry with a 304, so its TTL restarts too,
+                                          as with touch(). Defaults to False.
+
+        Returns:
+            str: The cached body.
+        """
+        with open(self.__get_path(entry["key"], "body"), "rb") as body_file:
+            body = body_file.read().decode("utf-8")
+        with self.__lock:
+            entry["last_access"] = time.time()
+            if revalidated:
+                entry["stored_at"] = entry["last_access"]
+            self.__write_metadata(entry)
+            self.__index_entry(entry)
+        return body
+
+    def is_fresh(self, entry):
+        """
+        Determines whether an entry is younger than the TTL override and can be served without revalidation.
+
+        Args:
+            entry (dict): The entry metadata returned by lookup().
+
+        Returns:
+            bool: True if the entry can be served as is.
+        """
+        return self.__ttl is not None and time.time() - entry["stored_at"] < self.__ttl
+
+    @staticmethod
+    def get_conditional_headers(entry):
+        """
+        Returns the headers revalidating an entry with the server.
+
+        Args:
+            entry (dict): The entry metadata returned by lookup().
+
+        Returns:
+            dict: The If-None-Match and/or If-Modified-Since headers.
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url, body, etag=None, last_modified=None):
+        """
+        Stores a response body and its validators, then evicts entries if the cache is over its size cap.
+
+        Args:
+            url (str): The URL.
+            body (str): The response body.
+            etag (str, optional): The ETag response header.
+            last_modified (str, optional): The Last-Modified response header.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the stored entry metadata (dict).
+        """
+        try:
+            key = self.get_key(url)
+            data = body.encode("utf-8")
+            now = time.time()
+            entry = {
+                "url": url,
+                "key": key,
+                "etag": etag,
+                "last_modified": last_modified,
+                "stored_at": now,
+                "last_access": now,
+                "size": len(data),
+            }
+            with self.__lock:
+                self.__write_atomic(self.__get_path(key, "body"), data)
+                self.__write_metadata(entry)
+                self.__index_entry(entry)
+            self.evict()
+            return True, entry
+        except Exception as e:
+            return False, e.args[0]
+
+    def touch(self, url):
+        """
+        Marks an entry as revalidated by the server and recently used, restarting its TTL.
+
+        Args:
+            url (str): The URL.
+        """
+        with self.__lock:
+            entry = self.lookup(url)
+            if entry is not None:
+                entry["stored_at"] = entry["last_access"] = time.time()
+                self.__write_metadata(entry)
+                self.__index_entry(entry)
+
+    def get_entries(self):
+        """
+        Returns the metadata of every cached entry.
+
+        Returns:
+            list: The entry metadata dicts.
+        """
+        entries = []
+        for file_name in os.listdir(self.__directory):
+            if not file_name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.__directory, file_name)) as metadata_file:
+                    entries.append(json.load(metadata_file))
+            except (OSError, ValueError):
+                continue
+        return entries
+
+    def evict(self):
+        """
+        Removes least recently used entries until the total size of the cached bodies fits in max_bytes.
+
+        Returns:
+            int: The number of evicted entries.
+        """
+        with self.__lock:
+            index = self.__get_index()
+            if self.__total_size <= self.__max_bytes:
+                return 0
+            evicted = 0
+            for key, indexed in sorted(index.items(), key=lambda item: item[1]["last_access"]):
+                if self.__total_size <= self.__max_bytes:
+                    break
+                for extension in ("json", "body"):
+                    path = self.__get_path(key, extension)
+                    if os.path.exists(path):
+                        os.remove(path)
+                del index[key]
+                self.__total_size -= indexed["size"]
+                evicted += 1
+            return evicted
+
+    @classmethod
+    def get_shared_cache(cls):
+        """
+        Get the process-wide cache used by GetPageInfo instances created without an explicit cache.
+
+        Returns:
+            DiskHttpCache: The shared cache, or None when disk caching is disabled.
+        """
+        return cls.__shared_cache
+
+    @classmethod
+    def configure_shared_cache(cls, directory=None, **options):
+        """
+        Enables disk caching for every GetPageInfo instance of the process, or disables it when directory is None.
+
+        Args:
+            directory (str, optional): The cache directory.
+            **options: Other keyword arguments accepted by DiskHttpCache.__init__().
+
+        Returns:
+            DiskHttpCache: The new shared cache, or None.
+        """
+        cls.__shared_cache = cls(directory, **options) if directory else None
+        return cls.__shared_cache
@@ -0,0 +1,149 @@
+"""
+HttpClient
+
+A pooled, keep-alive HTTP client shared by all GetPageInfo instances, so repeated fetches to the same host reuse warm
+connections and a stalled server cannot hang the run.
+
+Attributes:
+    DEFAULT_HEADERS (dict): The headers sent with every request unless overridden.
+    __shared_client (HttpClient): The process-wide client returned by get_shared_client().
+
+Methods:
+    get_timeout():
+        Returns the (connect, read) timeout tuple applied to every request.
+    get(url, **kwargs):
+        Sends a GET request through the pooled session.
+    head(url, **kwargs):
+        Sends a HEAD request through the pooled session, following redirects.
+    close():
+        Closes every pooled connection.
+    get_shared_client():
+        Returns the process-wide client, creating it with the default options on first use.
+    configure_shared_client(**options):
+        Replaces the process-wide client with one built from the given options.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HttpClient:
+    DEFAULT_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (compatible; CFCWebScrapper/1.0)",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+
+    __shared_client = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, connect_timeout=5.0, read_timeout=30.0, pool_connections=10, pool_maxsize=10,
+                 max_retries=0, headers=None):
+        """
+        Initialize the HttpClient instance.
+
+        Args:
+            connect_timeout (float, optional): Seconds to wait for the TCP/TLS connection. Defaults to 5.
+            read_timeout (float, optional): Seconds to wait between bytes of the response. Defaults to 30.
+            pool_connections (int, optional): Number of per-host connection pools to keep. Defaults to 10.
+            pool_maxsize (int, optional): Maximum number of keep-alive connections per host. Defaults to 10.
+            max_retries (int, optional): Number of retries on connection errors. Defaults to 0.
+            headers (dict, optional): Headers merged over DEFAULT_HEADERS and sent with every request.
+        """
+        self.__timeout = (connect_timeout, read_timeout)
+        self.__session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                              max_retries=max_retries)
+        self.__session.mount("http://", adapter)
+        self.__session.mount("https://", adapter)
+        self.__session.headers.update(self.DEFAULT_HEADERS)
+        if headers:
+            self.__session.headers.update(headers)
+
+    def get_timeout(self):
+        """
+        Get the (connect, read) timeout applied to every request.
+
+        Returns:
+            tuple: The connect and read timeouts in seconds.
+        """
+        return self.__timeout
+
+    def get_headers(self):
+        """
+        Get the default headers sent with every request.
+
+        Returns:
+            dict: The default headers.
+        """
+        return dict(self.__session.headers)
+
+    def get(self, url, **kwargs):
+        """
+        Send a GET request through the pooled session.
+
+        Args:
+            url (str): The URL to request.
+            **kwargs: Extra arguments passed to requests.Session.get(). The client timeout is used unless a
+                      timeout is given explicitly.
+
+        Returns:
+            requests.Response: The response object returned by the GET request.
+        """
+        kwargs.setdefault("timeout", self.get_timeout())
+        return self.__session.get(url, **kwargs)
+
+    def head(self, url, **kwargs):
+        """
+        Send a HEAD request through the pooled session, e.g. to check that a URL still exists without downloading it.
+
+        Args:
+            url (str): The URL to request.
+            **kwargs: Extra arguments passed to requests.Session.head(). The client timeout is used unless a
+                      timeout is given explicitly, and redirects are followed unless allow_redirects is given.
+
+        Returns:
+            requests.Response: The response object returned by the HEAD request.
+        """
+        kwargs.setdefault("timeout", self.get_timeout())
+        kwargs.setdefault("allow_redirects", True)
+        return self.__session.head(url, **kwargs)
+
+    def close(self):
+        """
+        Close every pooled connection of this client.
+        """
+        self.__session.close()
+
+    @classmethod
+    def get_shared_client(cls):
+        """
+        Get the process-wide client, creating it with the default options on first use.
+
+        Returns:
+            HttpClient: The shared client.
+        """
+        with cls.__shared_lock:
+            if cls.__shared_client is None:
+                cls.__shared_client = cls()
+            return cls.__shared_client
+
+    @classmethod
+    def configure_shared_client(cls, **options):
+        """
+        Replace the process-wide client with one built from the given options, closing the previous one.
+
+        Args:
+            **options: Keyword arguments accepted by HttpClient.__init__().
+
+        Returns:
+            HttpClient: The new shared client.
+        """
+        with cls.__shared_lock:
+            if cls.__shared_client is not None:
+                cls.__shared_client.close()
+            cls.__shared_client = cls(**options)
+            return cls.__shared_client
@@ -0,0 +1,212 @@
+"""
+MetricsRecorder
+
+Per-stage timing and counter instrumentation for the scraping pipeline. Stages record their call count, wall time and
+CPU time of the calling thread; counters record totals such as bytes downloaded, counted tokens and
+cache hits. At the end of a run the recorded metrics are exported as a JSON report and in the Prometheus text
+exposition format.
+
+GetPageInfo, PageArtifactCache, BeautifulSoupContentScrapper, FetchUrl, FileWriter and the controllers all record into
+the process-wide recorder returned by get_shared_recorder(). Work done inside ProcessPoolExecutor workers is recorded in
+those worker processes and is not part of the parent report.
+
+Stages:
+    http.request, http.wait (DNS, connect and time to first byte), http.download, parse, extract_visible_text,
+    count_words, extract_page, regex_extraction, write_output, controller.<name>
+
+Methods:
+    stage(name):
+        Context manager timing a block of code as one call of a stage.
+    add_stage_time(name, wall_seconds, cpu_seconds):
+        Records one call of a stage measured elsewhere.
+    increment(name, value):
+        Adds to a counter.
+    to_dict():
+        Returns the recorded metrics.
+    to_prometheus(prefix):
+        Returns the recorded metrics in the Prometheus text exposition format.
+    write_report(json_file, prometheus_file):
+        Writes the JSON report and/or the Prometheus text file.
+    reset():
+        Clears every stage and counter.
+    get_shared_recorder():
+        Returns the process-wide recorder.
+"""
+
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+
+class MetricsRecorder:
+    __shared_recorder = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self):
+        """
+        Initialize the MetricsRecorder instance with no stages and no counters.
+        """
+        self.__lock = threading.Lock()
+        self.__stages = {}
+        self.__counters = {}
+        self.__started_at = time.time()
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Times a block of code as one call of a stage, using wall time and the CPU time of the calling thread.
+
+        Args:
+            name (str): The stage name, e.g. "parse".
+        """
+        wall_started = time.perf_counter()
+        cpu_started = time.thread_time()
+        try:
+            yield
+        finally:
+            self.add_stage_time(name, time.perf_counter() - wall_started, time.thread_time() - cpu_started)
+
+    def add_stage_time(self, name, wall_seconds, cpu_seconds=0.0):
+        """
+        Records one call of a stage measured elsewhere.
+
+        Args:
+            name (str): The stage name.
+            wall_seconds (float): The wall time of the call.
+            cpu_seconds (float, optional): The CPU time of the call. Defaults to 0.
+        """
+        with self.__lock:
+            stage = self.__stages.setdefault(name, {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0})
+            stage["calls"] += 1
+            stage["wall_seconds"] += wall_seconds
+            stage["cpu_seconds"] += cpu_seconds
+
+    def increment(self, name, value=1):
+        """
+        Adds to a counter.
+
+        Args:
+            name (str): The counter name, e.g. "bytes_downloaded".
+            value (int, optional): The amount to add. Defaults to 1.
+        """
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + value
+
+    def get_stage(self, name):
+        """
+        Get the totals of a stage.
+
+        Args:
+            name (str): The stage name.
+
+        Returns:
+            dict: The "calls", "wall_seconds" and "cpu_seconds" of the stage, or None if it never ran.
+        """
+        with self.__lock:
+            stage = self.__stages.get(name)
+            return dict(stage) if stage is not None else None
+
+    def get_counter(self, name):
+        """
+        Get the value of a counter.
+
+        Args:
+            name (str): The counter name.
+
+        Returns:
+            int: The counter value, 0 if it was never incremented.
+        """
+        with self.__lock:
+            return self.__counters.get(name, 0)
+
+    def reset(self):
+        """
+        Clears every stage and counter.
+        """
+        with self.__lock:
+            self.__stages = {}
+            self.__counters = {}
+            self.__started_at = time.time()
+
+    def to_dict(self):
+        """
+        Returns the recorded metrics.
+
+        Returns:
+            dict: The "started_at" and "finished_at" timestamps, the "stages" totals and the "counters".
+        """
+        with self.__lock:
+            return {
+                "started_at": self.__started_at,
+                "finished_at": time.time(),
+                "stages": {name: dict(stage) for name, stage in sorted(self.__stages.items())},
+                "counters": dict(sorted(self.__counters.items())),
+            }
+
+    def to_prometheus(self, prefix="cfc_scraper"):
+        """
+        Returns the recorded metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str, optional): The metric name prefix. Defaults to "cfc_scraper".
+
+        Returns:
+            str: The exposition text.
+        """
+        metrics = self.to_dict()
+        lines = []
+        stage_metrics = (
+            ("stage_calls_total", "calls", "Number of calls per pipeline stage."),
+            ("stage_wall_seconds_total", "wall_seconds", "Wall-clock time spent per pipeline stage."),
+            ("stage_cpu_seconds_total", "cpu_seconds", "CPU time spent per pipeline stage."),
+        )
+        for metric_name, field, description in stage_metrics:
+            lines.append(f"# HELP {prefix}_{metric_name} {description}")
+            lines.append(f"# TYPE {prefix}_{metric_name} counter")
+            for stage_name, stage in metrics["stages"].items():
+                lines.append(f'{prefix}_{metric_name}{{stage="{stage_name}"}} {stage[field]:.6g}')
+        for counter_name, value in metrics["counters"].items():
+            metric_name = f"{prefix}_{re.sub(r'[^a-zA-Z0-9_]', '_', counter_name)}_total"
+            lines.append(f"# TYPE {metric_name} counter")
+            lines.append(f"{metric_name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, json_file=None, prometheus_file=None):
+        """
+        Writes the JSON report and/or the Prometheus text file, each through FileWriter's atomic replace.
+
+        Args:
+            json_file (str, optional): The path of the JSON report.
+            prometheus_file (str, optional): The path of the Prometheus text file.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the error message if writing fails.
+        """
+        # utilities.writer imports this module, so FileWriter is imported here rather than at module level
+        from utilities.writer import FileWriter
+
+        reports = []
+        if json_file:
+            reports.append((json.dumps(self.to_dict(), indent=4), json_file))
+        if prometheus_file:
+            reports.append((self.to_prometheus(), prometheus_file))
+        for text, output_file in reports:
+            flag, error = FileWriter.write_text_file(text, output_file)
+            if not flag:
+                return False, error
+        return True, None
+
+    @classmethod
+    def get_shared_recorder(cls):
+        """
+        Get the process-wide recorder used by the pipeline.
+
+        Returns:
+            MetricsRecorder: The shared recorder.
+        """
+        with cls.__shared_lock:
+            if cls.__shared_recorder is None:
+                cls.__shared_recorder = cls()
+            return cls.__shared_recorder
@@ -0,0 +1,200 @@
+"""
+PageArtifactCache
+
+A per-run cache of fetched pages shared between controllers, so a URL is downloaded and parsed at most once per run.
+
+Classes:
+    PageArtifact:
+        Holds the raw content, the parsed BeautifulSoup instances and the single-pass extraction of a single URL.
+    PageArtifactCache:
+        Maps URLs to PageArtifact instances and lets concurrent callers of the same URL share one in-flight fetch.
+
+Methods:
+    get_content(url):
+        Returns the raw content of the URL, fetching it with GetPageInfo on first use.
+    put_content(url, content):
+        Seeds the content of a URL fetched elsewhere.
+    get_soup(url, parser):
+        Returns the parsed BeautifulSoup instance of the URL, parsing it on first use.
+    get_extraction(url):
+        Returns the PageExtraction of the URL, extracting it on first use.
+
+Hits and misses are recorded in the shared MetricsRecorder as "page_cache_hits", "page_cache_misses" and
+"soup_cache_hits"; parses are recorded as the "parse" stage and extractions as the "extract_page" stage.
+"""
+
+import threading
+
+from bs4 import BeautifulSoup
+from utilities.metrics import MetricsRecorder
+from utilities.page_extractor import PageExtractor
+from utilities.page_info import GetPageInfo
+from utilities.parser_backends import ParserBackends
+
+
+class PageArtifact:
+    def __init__(self, url):
+        """
+        Initialize the PageArtifact instance.
+
+        Args:
+            url (str): The URL of the webpage this artifact belongs to.
+        """
+        self.url = url
+        self.content = None
+        self.soups = {}
+        self.extraction = None
+        self.lock = threading.Lock()
+
+
+class PageArtifactCache:
+    def __init__(self):
+        """
+        Initialize the PageArtifactCache instance with an empty artifact table.
+        """
+        self.__artifacts = {}
+        self.__lock = threading.Lock()
+        self.__fetch_count = 0
+        self.__parse_count = 0
+
+    def get_artifact(self, url):
+        """
+        Get the artifact of the given URL, creating an empty one if the URL was never requested.
+
+        Args:
+            url (str): The URL of the webpage.
+
+        Returns:
+            PageArtifact: The artifact of the URL.
+        """
+        with self.__lock:
+            artifact = self.__artifacts.get(url)
+            if artifact is None:
+                artifact = PageArtifact(url)
+                self.__artifacts[url] = artifact
+            return artifact
+
+    def get_fetch_count(self):
+        """
+        Get the number of downloads performed by this cache.
+
+        Returns:
+            int: The number of downloads.
+        """
+        return self.__fetch_count
+
+    def get_parse_count(self):
+        """
+        Get the number of BeautifulSoup parses performed by this cache.
+
+        Returns:
+            int: The number of parses.
+        """
+        return self.__parse_count
+
+    def get_content(self, url):
+        """
+        Get the content of the webpage, downloading it only if no other caller has done so already.
+
+        Concurrent callers of the same URL block on the artifact lock, so they share the in-flight download.
+        Failed downloads are not cached and will be retried by the next caller.
+
+        Args:
+            url (str): The URL of the webpage.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a str: The content of the webpage.
+        """
+        try:
+            artifact = self.get_artifact(url)
+            metrics = MetricsRecorder.get_shared_recorder()
+            with artifact.lock:
+                if artifact.content is not None:
+                    metrics.increment("page_cache_hits")
+                else:
+                    metrics.increment("page_cache_misses")
+                    flag, content = GetPageInfo(url).get_content()
+                    with self.__lock:
+                        self.__fetch_count += 1
+                    if not flag:
+                        return flag, content
+                    artifact.content = content
+                return True, artifact.content
+        except Exception as e:
+            return False, e.args[0]
+
+    def put_content(self, url, content):
+        """
+        Seeds the content of a URL fetched elsewhere, e.g. with a conditional request, so later calls parse and
+        extract it without downloading it again. Soups and extractions of different earlier content are dropped.
+
+        Args:
+            url (str): The URL of the webpage.
+            content (str): The content of the webpage.
+        """
+        artifact = self.get_artifact(url)
+        with artifact.lock:
+            if artifact.content != content:
+                artifact.soups = {}
+                artifact.extraction = None
+            artifact.content = content
+
+    def get_soup(self, url, parser=None):
+        """
+        Get the BeautifulSoup instance of the webpage, parsing the cached content only once per parser.
+
+        Args:
+            url (str): The URL of the webpage.
+            parser (str, optional): The parser backend to be used by BeautifulSoup.
+                                    If not provided, the fastest installed backend is used.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a BeautifulSoup instance representing the parsed HTML content.
+        """
+        try:
+            parser = ParserBackends.select_parser(parser)
+            flag, content = self.get_content(url)
+            if not flag:
+                return flag, content
+            artifact = self.get_artifact(url)
+            metrics = MetricsRecorder.get_shared_recorder()
+            with artifact.lock:
+                soup = artifact.soups.get(parser)
+                if soup is not None:
+                    metrics.increment("soup_cache_hits")
+                else:
+                    with metrics.stage("parse"):
+                        soup = BeautifulSoup(content, parser)
+                    with self.__lock:
+                        self.__parse_count += 1
+                    artifact.soups[parser] = soup
+                return True, soup
+        except Exception as e:
+            return False, e.args[0]
+
+    def get_extraction(self, url):
+        """
+        Get the single-pass extraction of the webpage (resources, anchors, privacy policy candidate and visible text),
+        extracting the cached content only once.
+
+        Args:
+            url (str): The URL of the webpage.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a PageExtraction instance.
+        """
+        try:
+            flag, content = self.get_content(url)
+            if not flag:
+                return flag, content
+            artifact = self.get_artifact(url)
+            with artifact.lock:
+                if artifact.extraction is None:
+                    with MetricsRecorder.get_shared_recorder().stage("extract_page"):
+                        flag, extraction = PageExtractor.extract(content, url)
+                    if not flag:
+                        return flag, extraction
+                    artifact.extraction = extraction
+                return True, artifact.extraction
+        except Exception as e:
+            return False, e.args[0]
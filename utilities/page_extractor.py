@@ -0,0 +1,229 @@
+"""
+PageExtractor
+
+A single-pass extraction engine. One tokenization of the page emits everything the pipeline needs, instead of a regex
+over the raw HTML, a find_all() per question and a get_text() walk over the parsed tree:
+
+- external resources, by tag and attribute: <script src>, <link rel="stylesheet" href>, <link rel="preload" as="font"
+  href>, other <link href>s, <img src/srcset>, <source src/srcset>, <video poster/src>, <audio src>, <iframe src>,
+  <embed src> and <object data>,
+- every anchor, with its text, rel and whether it sits inside a <footer>,
+- the privacy policy candidates, ranked by FetchUrl.rank_privacy_policy_candidates(),
+- the visible text, with the pruning rules of VisibleTextParser.
+
+Resources inside pruned subtrees (e.g. a tracking pixel in <noscript>) are still reported, since browsers load them.
+URLs are resolved against the page URL, or its <base href>, and a resource is external when it is an http(s) URL whose
+host is neither the page host nor a first-party domain of FetchUrl.
+
+Classes:
+    PageExtraction:
+        The structured result of one extraction.
+    PageExtractor:
+        The extraction parser.
+
+Methods:
+    extract(content, url, first_party_domains):
+        Returns the PageExtraction of an HTML document.
+"""
+
+from urllib.parse import urljoin, urlsplit
+
+from utilities.url_scrapper import FetchUrl
+from utilities.visible_text import VisibleTextParser
+
+RESOURCE_CATEGORIES = ("scripts", "stylesheets", "fonts", "images", "media", "frames", "links")
+
+
+class PageExtraction:
+    def __init__(self, url):
+        """
+        Initialize the PageExtraction instance.
+
+        Args:
+            url (str): The URL of the extracted page.
+        """
+        self.url = url
+        self.resources = {category: [] for category in RESOURCE_CATEGORIES}
+        self.anchors = []
+        self.privacy_policy_candidates = []
+        self.privacy_policy_url = None
+        self.text = ""
+
+    def to_dict(self):
+        """
+        Returns the extraction as plain data.
+
+        Returns:
+            dict: The "url", "resources", "anchors", "privacy_policy_candidates", "privacy_policy_url" and "text" of
+                  the extraction.
+        """
+        return {
+            "url": self.url,
+            "resources": self.resources,
+            "anchors": self.anchors,
+            "privacy_policy_candidates": self.privacy_policy_candidates,
+            "privacy_policy_url": self.privacy_policy_url,
+            "text": self.text,
+        }
+
+
+class PageExtractor(VisibleTextParser):
+    def __init__(self, url, first_party_domains=None):
+        """
+        Initialize the PageExtractor instance.
+
+        Args:
+            url (str): The URL of the page, used to resolve relative URLs and to tell external resources apart.
+            first_party_domains (iterable, optional): Domains whose URLs are not external resources.
+                                                      If not provided, the domains of the site of the URL are used.
+        """
+        super(PageExtractor, self).__init__()
+        self.__result = PageExtraction(url)
+        self.__base_url = url
+        self.__page_host = urlsplit(url).hostname
+        self.__url_scrapper = FetchUrl(first_party_domains=first_party_domains or FetchUrl.get_site_domains(url))
+        self.__seen_resources = set()
+        self.__anchor = None
+        self.__anchor_text = []
+        self.__footer_depth = 0
+
+    def __resolve(self, value):
+        if not value:
+            return None
+        value = value.strip()
+        if not value or value.startswith(("#", "data:", "javascript:", "mailto:", "tel:")):
+            return None
+        return urljoin(self.__base_url, value)
+
+    def __add_resource(self, category, value):
+        resource_url = self.__resolve(value)
+        if resource_url is None or resource_url in self.__seen_resources:
+            return
+        split_url = urlsplit(resource_url)
+        if split_url.scheme not in ("http", "https") or split_url.hostname == self.__page_host:
+            return
+        if self.__url_scrapper.is_first_party_url(resource_url):
+            return
+        self.__seen_resources.add(resource_url)
+        self.__result.resources[category].append(resource_url)
+
+    def __add_srcset(self, category, value):
+        for candidate in (value or "").split(","):
+            candidate = candidate.split()
+            if candidate:
+                self.__add_resource(category, candidate[0])
+
+    def __collect(self, tag, attrs):
+        """
+        Collects the resources and the anchor started by a tag.
+
+        Args:
+            tag (str): The lower-cased tag name.
+            attrs (list): The (name, value) attribute pairs of the element.
+        """
+        attributes = dict(attrs)
+        if tag == "a":
+            href = self.__resolve(attributes.get("href"))
+            if href is not None:
+                self.__anchor = {
+                    "href": href,
+                    "text": "",
+                    "rel": (attributes.get("rel") or "").lower().split(),
+                    "in_footer": self.__footer_depth > 0,
+                    "position": len(self.__result.anchors),
+                }
+                self.__anchor_text = []
+        elif tag == "script":
+            self.__add_resource("scripts", attributes.get("src"))
+        elif tag == "link":
+            rel = (attributes.get("rel") or "").lower().split()
+            if "stylesheet" in rel:
+                self.__add_resource("stylesheets", attributes.get("href"))
+            elif "preload" in rel and (attributes.get("as") or "").lower() == "font":
+                self.__add_resource("fonts", attributes.get("href"))
+            elif not {"canonical", "alternate", "preconnect", "dns-prefetch"} & set(rel):
+                self.__add_resource("links", attributes.get("href"))
+        elif tag == "img":
+            self.__add_resource("images", attributes.get("src"))
+            self.__add_srcset("images", attributes.get("srcset"))
+        elif tag == "source":
+            category = "images" if attributes.get("srcset") else "media"
+            self.__add_resource(category, attributes.get("src"))
+            self.__add_srcset(category, attributes.get("srcset"))
+        elif tag in ("video", "audio"):
+            self.__add_resource("images", attributes.get("poster"))
+            self.__add_resource("media", attributes.get("src"))
+        elif tag in ("iframe", "embed"):
+            self.__add_resource("frames", attributes.get("src"))
+        elif tag == "object":
+            self.__add_resource("frames", attributes.get("data"))
+        elif tag == "footer":
+            self.__footer_depth += 1
+        elif tag == "base" and attributes.get("href"):
+            self.__base_url = urljoin(self.__base_url, attributes["href"])
+
+    def __close_anchor(self):
+        if self.__anchor is None:
+            return
+        self.__anchor["text"] = " ".join("".join(self.__anchor_text).split())
+        self.__result.anchors.append(self.__anchor)
+        self.__anchor = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            self.__close_anchor()
+        self.__collect(tag, attrs)
+        super(PageExtractor, self).handle_starttag(tag, attrs)
+
+    def handle_startendtag(self, tag, attrs):
+        self.__collect(tag, attrs)
+        if tag == "a":
+            self.__close_anchor()
+        super(PageExtractor, self).handle_startendtag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag == "a":
+            self.__close_anchor()
+        elif tag == "footer" and self.__footer_depth:
+            self.__footer_depth -= 1
+        super(PageExtractor, self).handle_endtag(tag)
+
+    def handle_text(self, text):
+        if self.__anchor is not None:
+            self.__anchor_text.append(text)
+        super(PageExtractor, self).handle_text(text)
+
+    def get_result(self):
+        """
+        Flushes the parser and returns the extraction.
+
+        Returns:
+            PageExtraction: The extraction of the fed document.
+        """
+        self.__result.text = self.get_text()
+        self.__close_anchor()
+        candidates = FetchUrl.rank_privacy_policy_candidates(self.__result.anchors, self.__result.url)
+        self.__result.privacy_policy_candidates = candidates
+        if candidates:
+            self.__result.privacy_policy_url = candidates[0][1]
+        return self.__result
+
+    @classmethod
+    def extract(cls, content, url, first_party_domains=None):
+        """
+        Returns the PageExtraction of an HTML document.
+
+        Args:
+            content (str): The HTML content of a webpage.
+            url (str): The URL of the webpage.
+            first_party_domains (iterable, optional): Domains whose URLs are not external resources.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a PageExtraction instance.
+        """
+        try:
+            parser = cls(url, first_party_domains)
+            parser.feed(content)
+            return True, parser.get_result()
+        except Exception as e:
+            return False, e.args[0]
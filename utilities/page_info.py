@@ -5,28 +5,52 @@ A class for fetching webpage information using HTTP GET requests.
 
 Attributes:
     __page_url (str): The URL of the webpage.
+    __client (HttpClient): The pooled HTTP client used to send requests.
+    __cache (DiskHttpCache): The on-disk response cache, or None when caching is disabled.
 
 Methods:
     get_url():
         Get the URL of the webpage.
-    send_get_request():
+    get_client():
+        Get the HTTP client used to send requests.
+    get_cache():
+        Get the on-disk response cache.
+    send_get_request(headers):
         Send a GET request to the webpage URL and return the response.
     get_content():
-        Get the content of the webpage as text.
+        Get the content of the webpage as text, revalidating cached copies with conditional requests.
+    send_streaming_request():
+        Send a GET request whose body is read lazily.
+    iter_content_chunks(chunk_size):
+        Get the content of the webpage as decoded text chunks.
+
+Requests are recorded in the shared MetricsRecorder: the "http.request" stage is split into "http.wait" (DNS, connect
+and time to the response headers) and "http.download", and the "http_requests", "bytes_downloaded",
+"http_cache_fresh_hits" and "http_cache_not_modified" counters are incremented.
 """
 
-import requests
+import time
+
+from utilities.http_cache import DiskHttpCache
+from utilities.http_client import HttpClient
+from utilities.metrics import MetricsRecorder
 
 
 class GetPageInfo:
-    def __init__(self, url):
+    def __init__(self, url, client=None, cache=None):
         """
         Initialize the GetPageInfo instance.
 
         Args:
             url (str): The URL of the webpage.
+            client (HttpClient, optional): The HTTP client used to send requests.
+                                           If not provided, the process-wide shared client is used.
+            cache (DiskHttpCache, optional): The on-disk response cache.
+                                             If not provided, the process-wide shared cache is used, if any.
         """
         self.__page_url = url
+        self.__client = client if client is not None else HttpClient.get_shared_client()
+        self.__cache = cache if cache is not None else DiskHttpCache.get_shared_cache()
 
     def get_url(self):
         """
@@ -37,15 +61,45 @@ class GetPageInfo:
         """
         return self.__page_url
 
-    def send_get_request(self):
+    def get_client(self):
+        """
+        Get the HTTP client used to send requests.
+
+        Returns:
+            HttpClient: The HTTP client.
+        """
+        return self.__client
+
+    def get_cache(self):
+        """
+        Get the on-disk response cache.
+
+        Returns:
+            DiskHttpCache: The response cache, or None when caching is disabled.
+        """
+        return self.__cache
+
+    def send_get_request(self, headers=None):
         """
         Send a GET request to the webpage URL and return the response.
 
+        Args:
+            headers (dict, optional): Extra request headers, e.g. conditional request validators.
+
         Returns:
             tuple: A tuple containing a flag indicating success (bool) and a requests.Response: The response object returned by the GET request.
         """
         try:
-            response = requests.get(self.get_url())
+            metrics = MetricsRecorder.get_shared_recorder()
+            started = time.perf_counter()
+            with metrics.stage("http.request"):
+                response = self.get_client().get(self.get_url(), headers=headers)
+            total_seconds = time.perf_counter() - started
+            wait_seconds = min(response.elapsed.total_seconds(), total_seconds)
+            metrics.add_stage_time("http.wait", wait_seconds)
+            metrics.add_stage_time("http.download", total_seconds - wait_seconds)
+            metrics.increment("http_requests")
+            metrics.increment("bytes_downloaded", len(response.content))
             return True, response
         except Exception as e:
             return False, e.args[0]
@@ -54,11 +108,88 @@ class GetPageInfo:
         """
         Get the content of the webpage as text.
 
+        With a response cache, an entry younger than the cache TTL is served without a request. Older entries are
+        revalidated with If-None-Match/If-Modified-Since, and a 304 answer is served from disk. Error statuses
+        (4xx and 5xx) are reported as failures rather than as an empty or error page body.
+
         Returns:
             tuple: A tuple containing a flag indicating success (bool) and a str: The content of the webpage.
         """
         try:
-            flag, response = self.send_get_request()
+            cache = self.get_cache()
+            entry = cache.lookup(self.get_url()) if cache is not None else None
+            if entry is not None and cache.is_fresh(entry):
+                MetricsRecorder.get_shared_recorder().increment("http_cache_fresh_hits")
+                return True, cache.read_body(entry)
+
+            headers = cache.get_conditional_headers(entry) if entry is not None else None
+            flag, response = self.send_get_request(headers)
+            if not flag:
+                return flag, response
+            if entry is not None and response.status_code == 304:
+                MetricsRecorder.get_shared_recorder().increment("http_cache_not_modified")
+                content = cache.read_body(entry, revalidated=True)
+                return True, content
+            if response.status_code >= 400:
+                return False, f"HTTP {response.status_code} fetching {self.get_url()}"
+            if cache is not None and response.status_code == 200:
+                cache.store(self.get_url(), response.text, response.headers.get("ETag"),
+                            response.headers.get("Last-Modified"))
             return True, response.text
         except Exception as e:
             return False, e.args[0]
+
+    def send_streaming_request(self):
+        """
+        Send a GET request to the webpage URL whose body is read lazily from the connection.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a requests.Response: The response object returned by the GET request.
+        """
+        try:
+            response = self.get_client().get(self.get_url(), stream=True)
+            MetricsRecorder.get_shared_recorder().increment("http_requests")
+            return True, response
+        except Exception as e:
+            return False, e.args[0]
+
+    def iter_content_chunks(self, chunk_size=65536):
+        """
+        Get the content of the webpage as decoded text chunks, without reading the whole body into memory. Error
+        statuses (4xx and 5xx) are reported as failures, as in get_content(), and their body is never read.
+
+        Args:
+            chunk_size (int, optional): The number of bytes read from the connection per chunk. Defaults to 65536.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a generator of str chunks.
+        """
+        try:
+            flag, response = self.send_streaming_request()
+            if not flag:
+                return flag, response
+            if response.status_code >= 400:
+                response.close()
+                return False, f"HTTP {response.status_code} fetching {self.get_url()}"
+            return True, self.__decode_chunks(response, chunk_size)
+        except Exception as e:
+            return False, e.args[0]
+
+    @staticmethod
+    def __decode_chunks(response, chunk_size):
+        """
+        Yield the decoded chunks of a streamed response and release its connection when done.
+
+        Args:
+            response (requests.Response): The streamed response.
+            chunk_size (int): The number of bytes read from the connection per chunk.
+
+        Yields:
+            str: The next decoded chunk of the body.
+        """
+        with response:
+            if response.encoding is None:
+                response.encoding = "utf-8"
+            for chunk in response.iter_content(chunk_size=chunk_size, decode_unicode=True):
+                yield chunk
+            MetricsRecorder.get_shared_recorder().increment("bytes_downloaded", response.raw.tell())
@@ -0,0 +1,98 @@
+"""
+ParserBackends
+
+Selects the HTML parser backend handed to BeautifulSoup. "html.parser" ships with Python, while "lxml" and "html5lib"
+are used only when installed. Without an override, the fastest available backend is picked. Whole-page word counts
+always parse with StreamingWordCounter.TREE_PARSER instead, so they match the streamed counts.
+
+Attributes:
+    BACKENDS (tuple): The supported (parser name, required module) pairs, fastest first.
+    __available_parsers (list): The installed parser backends, looked up once per process.
+    __default_override (str): The parser forced for the whole run by set_default_parser(), if any.
+
+Methods:
+    is_available(parser):
+        Determines whether a parser backend can be used.
+    available_parsers():
+        Returns the usable parser backends, fastest first.
+    set_default_parser(parser):
+        Forces a parser backend for the whole run.
+    select_parser(parser):
+        Returns the parser backend to use, honouring the per-call and per-run overrides.
+"""
+
+import importlib.util
+
+
+class ParserBackends:
+    BACKENDS = (
+        ("lxml", "lxml"),
+        ("html.parser", None),
+        ("html5lib", "html5lib"),
+    )
+
+    __available_parsers = None
+    __default_override = None
+
+    @classmethod
+    def is_available(cls, parser):
+        """
+        Determines whether a parser backend is supported and its module is installed.
+
+        Args:
+            parser (str): The parser name, e.g. "lxml".
+
+        Returns:
+            bool: True if BeautifulSoup can use the parser.
+        """
+        return parser in cls.available_parsers()
+
+    @classmethod
+    def available_parsers(cls):
+        """
+        Returns the usable parser backends, fastest first. The installed modules are looked up on the first call only.
+
+        Returns:
+            list: The names of the installed parser backends.
+        """
+        if cls.__available_parsers is None:
+            cls.__available_parsers = [name for name, module in cls.BACKENDS
+                                       if module is None or importlib.util.find_spec(module) is not None]
+        return list(cls.__available_parsers)
+
+    @classmethod
+    def set_default_parser(cls, parser=None):
+        """
+        Forces a parser backend for the whole run, or restores automatic selection when parser is None.
+
+        Args:
+            parser (str, optional): The parser name.
+
+        Raises:
+            ValueError: If the parser is not supported or not installed.
+        """
+        if parser is not None and not cls.is_available(parser):
+            raise ValueError(f"HTML parser {parser!r} is not available; choose one of {cls.available_parsers()}")
+        cls.__default_override = parser
+
+    @classmethod
+    def select_parser(cls, parser=None):
+        """
+        Returns the parser backend to use: the given parser, else the per-run override, else the fastest installed.
+
+        Args:
+            parser (str, optional): The parser requested by the caller.
+
+        Returns:
+            str: The parser name.
+
+        Raises:
+            ValueError: If the requested parser is not supported or not installed.
+        """
+        if parser is not None:
+            if not cls.is_available(parser):
+                raise ValueError(f"HTML parser {parser!r} is not available; choose one of {cls.available_parsers()}")
+            return parser
+        if cls.__default_override is not None:
+            return cls.__default_override
+        return cls.available_parsers()[0]
@@ -0,0 +1,228 @@
+"""
+PrivacyPolicyCache
+
+A persistent per-domain cache of discovered Privacy Policy URLs, so later runs go straight to the policy page instead
+of fetching and parsing the index page to find the link again.
+
+An entry younger than ttl seconds is used as is. An older entry is revalidated with a HEAD request to the policy URL:
+if the page still answers with a 2xx status the entry is refreshed, otherwise it is dropped and the caller rediscovers
+the policy from the index page. Entries are kept in one JSON file, rewritten atomically by FileWriter.
+
+Attributes:
+    __shared_cache (PrivacyPolicyCache): The process-wide cache returned by get_shared_cache(), None when disabled.
+
+Methods:
+    get_domain(url):
+        Returns the domain an index page URL is cached under.
+    lookup(url):
+        Returns the entry of the domain of a URL.
+    is_fresh(entry):
+        Determines whether an entry can be used without revalidation.
+    revalidate(entry):
+        Checks with a HEAD request that the cached policy URL still exists.
+    get(url):
+        Returns the cached Privacy Policy URL of the domain of a URL, revalidating it when stale.
+    store(url, privacy_policy_url):
+        Caches the Privacy Policy URL of the domain of a URL.
+    invalidate(url):
+        Drops the entry of the domain of a URL.
+    get_shared_cache():
+        Returns the process-wide cache, or None when policy caching is disabled.
+    configure_shared_cache(file_name, **options):
+        Enables policy caching for every BeautifulSoupContentScrapper instance of the process.
+"""
+
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+
+from utilities.metrics import MetricsRecorder
+from utilities.writer import FileWriter
+
+
+class PrivacyPolicyCache:
+    __shared_cache = None
+
+    def __init__(self, file_name=".privacy_policy_cache.json", ttl=7 * 24 * 3600, client=None):
+        """
+        Initialize the PrivacyPolicyCache instance.
+
+        Args:
+            file_name (str, optional): The JSON file holding the entries. Defaults to ".privacy_policy_cache.json".
+            ttl (float, optional): Seconds during which an entry is used without revalidation. Defaults to 7 days.
+            client (HttpClient, optional): The HTTP client sending revalidation requests.
+                                           If not provided, the process-wide shared client is used.
+        """
+        self.__file_name = file_name if file_name.lower().endswith(".json") else f"{file_name}.json"
+        self.__ttl = ttl
+        self.__client = client
+        self.__lock = threading.Lock()
+        try:
+            with open(self.__file_name) as cache_file:
+                self.__entries = json.load(cache_file)
+        except (OSError, ValueError):
+            self.__entries = {}
+
+    def get_file_name(self):
+        """
+        Get the JSON file holding the entries.
+
+        Returns:
+            str: The cache file name.
+        """
+        return self.__file_name
+
+    def get_client(self):
+        """
+        Get the HTTP client sending revalidation requests.
+
+        Returns:
+            HttpClient: The HTTP client.
+        """
+        if self.__client is not None:
+            return self.__client
+        # imported here so looking entries up does not load requests
+        from utilities.http_client import HttpClient
+        return HttpClient.get_shared_client()
+
+    @staticmethod
+    def get_domain(url):
+        """
+        Returns the domain an index page URL is cached under.
+
+        Args:
+            url (str): The URL of the index page.
+
+        Returns:
+            str: The lower-cased host and port of the URL.
+        """
+        return urlsplit(url).netloc.lower()
+
+    def lookup(self, url):
+        """
+        Returns the entry of the domain of a URL.
+
+        Args:
+            url (str): The URL of the index page.
+
+        Returns:
+            dict: The entry ("url", "discovered_at", "validated_at"), or None if the domain is not cached.
+        """
+        with self.__lock:
+            entry = self.__entries.get(self.get_domain(url))
+            return dict(entry) if entry is not None else None
+
+    def is_fresh(self, entry):
+        """
+        Determines whether an entry was validated less than ttl seconds ago.
+
+        Args:
+            entry (dict): The entry returned by lookup().
+
+        Returns:
+            bool: True if the entry can be used without revalidation.
+        """
+        return time.time() - entry["validated_at"] < self.__ttl
+
+    def revalidate(self, entry):
+        """
+        Checks with a HEAD request that the cached policy URL still exists.
+
+        Args:
+            entry (dict): The entry returned by lookup().
+
+        Returns:
+            bool: True if the policy URL answered with a 2xx status.
+        """
+        try:
+            response = self.get_client().head(entry["url"])
+            return 200 <= response.status_code < 300
+        except Exception:
+            return False
+
+    def get(self, url):
+        """
+        Returns the cached Privacy Policy URL of the domain of a URL. Stale entries are revalidated, and entries
+        failing revalidation are dropped.
+
+        Args:
+            url (str): The URL of the index page.
+
+        Returns:
+            tuple: A tuple containing a flag indicating whether a usable entry was found (bool) and the Privacy Policy
+                   URL, or None.
+        """
+        metrics = MetricsRecorder.get_shared_recorder()
+        entry = self.lookup(url)
+        if entry is None:
+            metrics.increment("policy_cache_misses")
+            return False, None
+        if self.is_fresh(entry):
+            metrics.increment("policy_cache_hits")
+            return True, entry["url"]
+        if self.revalidate(entry):
+            metrics.increment("policy_cache_revalidated")
+            self.store(url, entry["url"], entry["discovered_at"])
+            return True, entry["url"]
+        metrics.increment("policy_cache_misses")
+        self.invalidate(url)
+        return False, None
+
+    def store(self, url, privacy_policy_url, discovered_at=None):
+        """
+        Caches the Privacy Policy URL of the domain of a URL.
+
+        Args:
+            url (str): The URL of the index page.
+            privacy_policy_url (str): The discovered Privacy Policy URL.
+            discovered_at (float, optional): When the URL was discovered. Defaults to now.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the error message if writing fails.
+        """
+        now = time.time()
+        with self.__lock:
+            self.__entries[self.get_domain(url)] = {
+                "url": privacy_policy_url,
+                "discovered_at": discovered_at if discovered_at is not None else now,
+                "validated_at": now,
+            }
+            return FileWriter.write_to_json_file(self.__entries, self.__file_name)
+
+    def invalidate(self, url):
+        """
+        Drops the entry of the domain of a URL, e.g. after its policy page stopped answering.
+
+        Args:
+            url (str): The URL of the index page.
+        """
+        with self.__lock:
+            if self.__entries.pop(self.get_domain(url), None) is not None:
+                FileWriter.write_to_json_file(self.__entries, self.__file_name)
+
+    @classmethod
+    def get_shared_cache(cls):
+        """
+        Get the process-wide cache used by BeautifulSoupContentScrapper instances created without an explicit cache.
+
+        Returns:
+            PrivacyPolicyCache: The shared cache, or None when policy caching is disabled.
+        """
+        return cls.__shared_cache
+
+    @classmethod
+    def configure_shared_cache(cls, file_name=None, **options):
+        """
+        Enables policy caching for every BeautifulSoupContentScrapper instance of the process, or disables it when
+        file_name is None.
+
+        Args:
+            file_name (str, optional): The JSON file holding the entries.
+            **options: Other keyword arguments accepted by PrivacyPolicyCache.__init__().
+
+        Returns:
+            PrivacyPolicyCache: The new shared cache, or None.
+        """
+        cls.__shared_cache = cls(file_name, **options) if file_name else None
+        return cls.__shared_cache
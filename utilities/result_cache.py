@@ -0,0 +1,215 @@
+"""
+ResultCache
+
+A bounded in-memory cache of computed results for long-running processes, such as the resources or the word count of
+a site served by the scrape service.
+
+Entries expire ttl seconds after they were computed and the least recently used entry is evicted once max_entries is
+exceeded. Concurrent callers asking for the same missing key share one computation: the first caller computes the
+result while the others wait for it, so a burst of identical requests costs one scrape. Failed results are handed to
+the waiting callers but are not cached, so the next caller retries.
+
+Hits, misses and shared computations are recorded in the shared MetricsRecorder as "result_cache_hits",
+"result_cache_misses" and "result_cache_shared".
+
+Classes:
+    PendingResult:
+        Holds the result of an in-flight computation for the callers waiting on it.
+    ResultCache:
+        Maps keys to unexpired results and deduplicates in-flight computations.
+
+Methods:
+    get(key):
+        Returns the cached result of a key.
+    put(key, value):
+        Caches a result.
+    get_or_compute(key, compute):
+        Returns the cached result of a key, computing it once on a miss.
+    invalidate(key):
+        Drops the cached result of a key.
+    get_stats():
+        Returns the entry, hit, miss and shared computation counts.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from utilities.metrics import MetricsRecorder
+
+
+class PendingResult:
+    def __init__(self):
+        """
+        Initialize the PendingResult instance of a computation that has not finished yet.
+        """
+        self.done = threading.Event()
+        self.result = None
+
+
+class ResultCache:
+    def __init__(self, max_entries=256, ttl=300.0, clock=time.monotonic):
+        """
+        Initialize the ResultCache instance.
+
+        Args:
+            max_entries (int, optional): The number of results kept before the least recently used one is evicted.
+                                         Defaults to 256.
+            ttl (float, optional): Seconds a result is served after it was computed. Defaults to 300.
+            clock (callable, optional): Returns the current time in seconds. Defaults to time.monotonic.
+        """
+        self.__max_entries = max_entries
+        self.__ttl = ttl
+        self.__clock = clock
+        self.__entries = OrderedDict()
+        self.__pending = {}
+        self.__lock = threading.Lock()
+        self.__stats = {"hits": 0, "misses": 0, "shared": 0}
+
+    def get_max_entries(self):
+        """
+        Get the number of results kept before eviction.
+
+        Returns:
+            int: The maximum number of entries.
+        """
+        return self.__max_entries
+
+    def get_ttl(self):
+        """
+        Get the number of seconds a result is served after it was computed.
+
+        Returns:
+            float: The time to live.
+        """
+        return self.__ttl
+
+    def __lookup(self, key):
+        """
+        Returns the unexpired value of a key and marks it as recently used. Expired entries are dropped.
+        Must be called with the lock held.
+
+        Args:
+            key (hashable): The key.
+
+        Returns:
+            tuple: A tuple containing a flag indicating whether the key was found (bool) and the value.
+        """
+        entry = self.__entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= self.__clock():
+            del self.__entries[key]
+            return False, None
+        self.__entries.move_to_end(key)
+        return True, value
+
+    def __store(self, key, value):
+        """
+        Stores a value and evicts the least recently used entries over the limit. Must be called with the lock held.
+
+        Args:
+            key (hashable): The key.
+            value (object): The value.
+        """
+        self.__entries[key] = (self.__clock() + self.__ttl, value)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__max_entries:
+            self.__entries.popitem(last=False)
+
+    def get(self, key):
+        """
+        Returns the cached result of a key.
+
+        Args:
+            key (hashable): The key.
+
+        Returns:
+            tuple: A tuple containing a flag indicating whether an unexpired result was found (bool) and the result.
+        """
+        with self.__lock:
+            return self.__lookup(key)
+
+    def put(self, key, value):
+        """
+        Caches a result.
+
+        Args:
+            key (hashable): The key.
+            value (object): The result.
+        """
+        with self.__lock:
+            self.__store(key, value)
+
+    def invalidate(self, key):
+        """
+        Drops the cached result of a key.
+
+        Args:
+            key (hashable): The key.
+        """
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns the cached result of a key. On a miss the result is computed by the first caller, while concurrent
+        callers of the same key wait for that computation instead of starting their own. Waiting callers are released
+        even when the computation is interrupted, e.g. by KeyboardInterrupt, and then get a failed result.
+
+        Args:
+            key (hashable): The key.
+            compute (callable): Computes the result; returns a flag indicating success (bool) and the result or the
+                                error message. Only successful results are cached.
+
+        Returns:
+            tuple: The flag, the result or the error message, and where the result came from: "hit" for the cache,
+                   "miss" for a computation of this caller or "shared" for the computation of a concurrent caller.
+        """
+        metrics = MetricsRecorder.get_shared_recorder()
+        with self.__lock:
+            found, value = self.__lookup(key)
+            if found:
+                self.__stats["hits"] += 1
+                metrics.increment("result_cache_hits")
+                return True, value, "hit"
+            pending = self.__pending.get(key)
+            computing = pending is None
+            if computing:
+                pending = PendingResult()
+                self.__pending[key] = pending
+                self.__stats["misses"] += 1
+            else:
+                self.__stats["shared"] += 1
+
+        if not computing:
+            metrics.increment("result_cache_shared")
+            pending.done.wait()
+            flag, value = pending.result
+            return flag, value, "shared"
+
+        metrics.increment("result_cache_misses")
+        flag, value = False, "The computation of the result was interrupted"
+        try:
+            flag, value = compute()
+        except Exception as e:
+            flag, value = False, e.args[0] if e.args else repr(e)
+        finally:
+            pending.result = (flag, value)
+            with self.__lock:
+                if flag:
+                    self.__store(key, value)
+                del self.__pending[key]
+            pending.done.set()
+        return flag, value, "miss"
+
+    def get_stats(self):
+        """
+        Get the entry, hit, miss and shared computation counts of the cache.
+
+        Returns:
+            dict: The "entries", "hits", "misses" and "shared" counts.
+        """
+        with self.__lock:
+            return {"entries": len(self.__entries), **self.__stats}
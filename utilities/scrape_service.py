@@ -0,0 +1,205 @@
+"""
+ScrapeService
+
+A small local HTTP/JSON API serving the external resources and the privacy policy word count of any site from one
+long-running process, so repeated jobs skip the interpreter start, the imports and the TLS handshakes of a cold run.
+
+Results are kept in a ResultCache: a site asked for again within the TTL is answered from memory, and identical
+concurrent requests share one scrape. Both endpoints of a site share one PageArtifactCache, kept with the same size
+and TTL as the results, so /resources followed by /wordcount downloads and parses the index page once. Pages are
+fetched through the process-wide pooled HttpClient, whose keep-alive connections stay warm between requests.
+
+Endpoints:
+    GET /resources?url=URL
+        {"url": URL, "resources": {...}}: the external resources of the index page.
+    GET /wordcount?url=URL
+        {"url": URL, "word_count": {...}}: the word count of the privacy policy page.
+    GET /stats
+        {"result_cache": {...}}: the entry, hit, miss and shared computation counts of the result cache.
+
+Every scrape response carries an "X-Cache" header ("hit", "miss" or "shared"). A missing or non-http(s) url answers
+400, an unknown path 404 and a failed scrape 502 with {"url": URL, "error": message}.
+
+Classes:
+    ScrapeService:
+        Computes and caches the results of the endpoints.
+    ScrapeRequestHandler:
+        Serves the endpoints of the ScrapeService of its server.
+    ScrapeServer:
+        A threading HTTP server holding a ScrapeService.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+from utilities.metrics import MetricsRecorder
+from utilities.page_cache import PageArtifactCache
+from utilities.result_cache import ResultCache
+
+
+class ScrapeService:
+    def __init__(self, result_cache=None):
+        """
+        Initialize the ScrapeService instance.
+
+        Args:
+            result_cache (ResultCache, optional): The cache of computed results. Defaults to a ResultCache with the
+                                                  default size and TTL.
+        """
+        self.__result_cache = result_cache if result_cache is not None else ResultCache()
+        self.__page_caches = ResultCache(self.__result_cache.get_max_entries(), self.__result_cache.get_ttl())
+        self.__page_caches_lock = threading.Lock()
+        self.__endpoints = {"/resources": self.get_resources, "/wordcount": self.get_word_count}
+
+    def get_result_cache(self):
+        """
+        Get the cache of computed results.
+
+        Returns:
+            ResultCache: The result cache.
+        """
+        return self.__result_cache
+
+    def get_page_cache(self, url):
+        """
+        Get the page cache shared by the endpoints of a site, creating it if the site has none or its cache expired.
+
+        Args:
+            url (str): The URL of the index page.
+
+        Returns:
+            PageArtifactCache: The page cache of the site.
+        """
+        with self.__page_caches_lock:
+            found, page_cache = self.__page_caches.get(url)
+            if not found:
+                page_cache = PageArtifactCache()
+                self.__page_caches.put(url, page_cache)
+            return page_cache
+
+    def __scrape_resources(self, url):
+        """
+        Scrapes the external resources of the index page of a site.
+
+        Args:
+            url (str): The URL of the index page.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the external resources (dict).
+        """
+        return BeautifulSoupContentScrapper(url, page_cache=self.get_page_cache(url)).scrape_index_page()
+
+    def __count_privacy_policy_words(self, url):
+        """
+        Counts the words of the visible text of the privacy policy page of a site.
+
+        Args:
+            url (str): The URL of the index page.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the word frequency count (dict).
+        """
+        return BeautifulSoupContentScrapper(url, page_cache=self.get_page_cache(url)).count_privacy_policy_words()
+
+    def get_resources(self, url):
+        """
+        Returns the external resources of the index page of a site, scraping it only on a cache miss.
+
+        Args:
+            url (str): The URL of the index page.
+
+        Returns:
+            tuple: The flag, the response payload (dict) and the cache status ("hit", "miss" or "shared").
+        """
+        flag, result, cache_status = self.__result_cache.get_or_compute(
+            ("resources", url), lambda: self.__scrape_resources(url))
+        return flag, {"url": url, "resources" if flag else "error": result}, cache_status
+
+    def get_word_count(self, url):
+        """
+        Returns the word count of the privacy policy page of a site, counting it only on a cache miss.
+
+        Args:
+            url (str): The URL of the index page.
+
+        Returns:
+            tuple: The flag, the response payload (dict) and the cache status ("hit", "miss" or "shared").
+        """
+        flag, result, cache_status = self.__result_cache.get_or_compute(
+            ("wordcount", url), lambda: self.__count_privacy_policy_words(url))
+        return flag, {"url": url, "word_count" if flag else "error": result}, cache_status
+
+    def handle(self, path, query):
+        """
+        Answers a request of the API.
+
+        Args:
+            path (str): The request path, e.g. "/resources".
+            query (dict): The parsed query string, mapping names to lists of values.
+
+        Returns:
+            tuple: The HTTP status (int), the response payload (dict) and the cache status (str), or None for
+                   responses not involving the cache.
+        """
+        if path == "/stats":
+            return 200, {"result_cache": self.__result_cache.get_stats()}, None
+        endpoint = self.__endpoints.get(path)
+        if endpoint is None:
+            return 404, {"error": f"Unknown endpoint {path}"}, None
+        url = query.get("url", [""])[0].strip()
+        if not url.startswith(("http://", "https://")):
+            return 400, {"error": "The url parameter must be an http(s) URL"}, None
+        with MetricsRecorder.get_shared_recorder().stage(f"service{path.replace('/', '.')}"):
+            flag, payload, cache_status = endpoint(url)
+        return 200 if flag else 502, payload, cache_status
+
+
+class ScrapeRequestHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        """
+        Keeps the access log off stderr.
+        """
+
+    def do_GET(self):
+        """
+        Answers a GET request with the JSON payload of the ScrapeService of the server.
+        """
+        parts = urlsplit(self.path)
+        status, payload, cache_status = self.server.service.handle(parts.path.rstrip("/") or "/",
+                                                                   parse_qs(parts.query))
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if cache_status is not None:
+            self.send_header("X-Cache", cache_status)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ScrapeServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service=None):
+        """
+        Initialize the ScrapeServer instance and bind it to its address.
+
+        Args:
+            address (tuple): The (host, port) pair to listen on; port 0 picks a free port.
+            service (ScrapeService, optional): The service answering the requests. Defaults to a new ScrapeService.
+        """
+        super(ScrapeServer, self).__init__(address, ScrapeRequestHandler)
+        self.service = service if service is not None else ScrapeService()
+
+    def get_url(self):
+        """
+        Get the base URL the server listens on.
+
+        Returns:
+            str: The base URL, e.g. "http://127.0.0.1:8080".
+        """
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
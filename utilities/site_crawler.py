@@ -0,0 +1,288 @@
+"""
+SiteCrawler
+
+A breadth-first crawl of one site that reports the external resources loaded anywhere on it, not only on the index
+page, together with the pages each resource appears on.
+
+Same-site links are followed level by level up to max_depth, and at most max_pages pages are fetched. Links are
+canonicalized (lower-cased scheme and host, default ports, fragments and tracking parameters removed, query parameters
+sorted) and deduplicated before they are queued, and non-HTML files are skipped. robots.txt is honoured, including its
+Crawl-delay, and requests to a host are spaced at least 1 / requests_per_second seconds apart on top of a global
+concurrency limit.
+
+Memory stays bounded on large sites: pages are extracted in one pass and dropped, the set of seen URLs holds 8-byte
+digests and never grows past the page budget, and every resource keeps at most max_pages_per_resource sample pages
+next to its total page count.
+
+Methods:
+    canonicalize_url(url):
+        Returns the canonical form of a URL, or None when it is not an http(s) URL.
+    is_same_site(url):
+        Determines whether a URL belongs to the crawled site.
+    is_allowed(url):
+        Determines whether robots.txt allows fetching a URL.
+    crawl():
+        Crawls the site and returns the aggregated result.
+    run():
+        Synchronous wrapper around crawl() for callers without an event loop.
+"""
+
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+from urllib.robotparser import RobotFileParser
+
+from utilities.http_client import HttpClient
+from utilities.metrics import MetricsRecorder
+from utilities.page_extractor import PageExtractor
+from utilities.page_info import GetPageInfo
+
+SKIPPED_EXTENSIONS = frozenset({
+    "7z", "avi", "css", "csv", "doc", "docx", "eot", "exe", "gif", "gz", "ico", "jpeg", "jpg", "js", "json", "mov",
+    "mp3", "mp4", "otf", "pdf", "png", "ppt", "pptx", "rar", "svg", "tar", "ttf", "webm", "webp", "woff", "woff2",
+    "xls", "xlsx", "xml", "zip",
+})
+TRACKING_PARAMETERS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid", "msclkid"})
+
+
+class SiteCrawler:
+    def __init__(self, start_url, max_depth=2, max_pages=100, concurrency=8, requests_per_second=2.0,
+                 max_pages_per_resource=20, user_agent="CFCWebScrapper", client=None):
+        """
+        Initialize the SiteCrawler instance.
+
+        Args:
+            start_url (str): The URL the crawl starts from; its host defines the site.
+            max_depth (int, optional): The number of link hops followed from the start URL. Defaults to 2.
+            max_pages (int, optional): The maximum number of pages fetched. Defaults to 100.
+            concurrency (int, optional): Maximum number of requests in flight. Defaults to 8.
+            requests_per_second (float, optional): Maximum request rate per host. Defaults to 2.
+            max_pages_per_resource (int, optional): Sample pages kept per external resource. Defaults to 20.
+            user_agent (str, optional): The robots.txt user agent name. Defaults to "CFCWebScrapper".
+            client (HttpClient, optional): The HTTP client used to send requests.
+                                           If not provided, the process-wide shared client is used.
+        """
+        self.__start_url = self.canonicalize_url(start_url) or start_url
+        self.__site_host = self.__get_site_host(self.__start_url)
+        self.__max_depth = max_depth
+        self.__max_pages = max_pages
+        self.__concurrency = concurrency
+        self.__interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self.__max_pages_per_resource = max_pages_per_resource
+        self.__user_agent = user_agent
+        self.__client = client if client is not None else HttpClient.get_shared_client()
+        self.__robots = None
+        self.__next_slots = {}
+        self.__rate_lock = None
+        self.__semaphore = None
+        self.__io_executor = None
+
+    def get_start_url(self):
+        """
+        Get the canonical URL the crawl starts from.
+
+        Returns:
+            str: The start URL.
+        """
+        return self.__start_url
+
+    def get_interval(self):
+        """
+        Get the minimum number of seconds between two requests to the same host, including the robots.txt
+        Crawl-delay once it is known.
+
+        Returns:
+            float: The request interval.
+        """
+        crawl_delay = self.__robots.crawl_delay(self.__user_agent) if self.__robots is not None else None
+        return max(self.__interval, float(crawl_delay or 0))
+
+    @staticmethod
+    def __get_site_host(url):
+        host = urlsplit(url).hostname or ""
+        return host[4:] if host.startswith("www.") else host
+
+    @staticmethod
+    def canonicalize_url(url):
+        """
+        Returns the canonical form of a URL: lower-cased scheme and host, no default port, no fragment, no tracking
+        parameters, sorted query parameters and "/" for an empty path.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            str: The canonical URL, or None when the URL is not an http(s) URL.
+        """
+        try:
+            split_url = urlsplit(url.strip())
+            scheme = split_url.scheme.lower()
+            if scheme not in ("http", "https") or not split_url.hostname:
+                return None
+            netloc = split_url.hostname.lower()
+            if split_url.port and (scheme, split_url.port) not in (("http", 80), ("https", 443)):
+                netloc = f"{netloc}:{split_url.port}"
+            query = sorted(
+                (name, value) for name, value in parse_qsl(split_url.query, keep_blank_values=True)
+                if not name.lower().startswith("utm_") and name.lower() not in TRACKING_PARAMETERS
+            )
+            return urlunsplit((scheme, netloc, split_url.path or "/", urlencode(query), ""))
+        except ValueError:
+            return None
+
+    def is_same_site(self, url):
+        """
+        Determines whether a URL belongs to the crawled site. The "www." prefix is ignored.
+
+        Args:
+            url (str): A canonical URL.
+
+        Returns:
+            bool: True if the URL is on the crawled host.
+        """
+        return self.__get_site_host(url) == self.__site_host
+
+    def is_allowed(self, url):
+        """
+        Determines whether robots.txt allows fetching a URL. Every URL is allowed before robots.txt is loaded.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            bool: True if the URL may be fetched.
+        """
+        return self.__robots is None or self.__robots.can_fetch(self.__user_agent, url)
+
+    @staticmethod
+    def __is_page_url(url):
+        last_segment = urlsplit(url).path.rsplit("/", 1)[-1]
+        return "." not in last_segment or last_segment.rsplit(".", 1)[-1].lower() not in SKIPPED_EXTENSIONS
+
+    @staticmethod
+    def __get_digest(url):
+        return hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest()
+
+    def __load_robots(self):
+        """
+        Fetches and parses robots.txt. A missing or unreachable robots.txt allows everything.
+        """
+        robots = RobotFileParser()
+        flag, content = GetPageInfo(urljoin(self.__start_url, "/robots.txt"), self.__client).get_content()
+        if flag:
+            robots.parse(content.splitlines())
+        else:
+            robots.allow_all = True
+        self.__robots = robots
+
+    async def __wait_for_turn(self, url):
+        """
+        Sleeps until the host of a URL may receive its next request.
+
+        Args:
+            url (str): The URL about to be requested.
+        """
+        loop = asyncio.get_running_loop()
+        host = urlsplit(url).netloc
+        async with self.__rate_lock:
+            now = loop.time()
+            slot = max(now, self.__next_slots.get(host, now))
+            self.__next_slots[host] = slot + self.get_interval()
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def __fetch_and_extract(self, url):
+        """
+        Fetches a page and extracts its external resources and links in one pass. Runs on the I/O thread pool.
+
+        Args:
+            url (str): The page URL.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a PageExtraction instance or the error.
+        """
+        flag, content = GetPageInfo(url, self.__client).get_content()
+        if not flag:
+            return flag, content
+        return PageExtractor.extract(content, url)
+
+    async def __crawl_page(self, url):
+        loop = asyncio.get_running_loop()
+        async with self.__semaphore:
+            await self.__wait_for_turn(url)
+            return await loop.run_in_executor(self.__io_executor, self.__fetch_and_extract, url)
+
+    def __add_resources(self, resources, extraction):
+        for category, urls in extraction.resources.items():
+            for resource_url in urls:
+                resource = resources.setdefault(resource_url, {"category": category, "page_count": 0, "pages": []})
+                resource["page_count"] += 1
+                if len(resource["pages"]) < self.__max_pages_per_resource:
+                    resource["pages"].append(extraction.url)
+
+    async def crawl(self):
+        """
+        Crawls the site breadth-first and aggregates the external resources of every fetched page.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a dict with the "start_url", the crawled
+                   "pages" (URL, depth and status) and the "external_resources" mapping each resource URL to its
+                   category, page count and sample pages.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            self.__semaphore = asyncio.Semaphore(self.__concurrency)
+            self.__rate_lock = asyncio.Lock()
+            self.__next_slots = {}
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=self.__concurrency) as io_executor:
+                self.__io_executor = io_executor
+                await loop.run_in_executor(io_executor, self.__load_robots)
+
+                pages = []
+                resources = {}
+                seen = {self.__get_digest(self.__start_url)}
+                frontier = [self.__start_url] if self.is_allowed(self.__start_url) else []
+                depth = 0
+                while frontier:
+                    results = await asyncio.gather(*(self.__crawl_page(url) for url in frontier))
+                    next_frontier = []
+                    for url, (flag, extraction) in zip(frontier, results):
+                        pages.append({"url": url, "depth": depth, "status": "ok" if flag else f"error: {extraction}"})
+                        if not flag:
+                            continue
+                        self.__add_resources(resources, extraction)
+                        if depth >= self.__max_depth:
+                            continue
+                        for anchor in extraction.anchors:
+                            link = self.canonicalize_url(anchor["href"])
+                            if link is None or len(seen) >= self.__max_pages:
+                                continue
+                            if not self.is_same_site(link) or not self.__is_page_url(link):
+                                continue
+                            digest = self.__get_digest(link)
+                            if digest in seen or not self.is_allowed(link):
+                                continue
+                            seen.add(digest)
+                            next_frontier.append(link)
+                    frontier = next_frontier
+                    depth += 1
+            metrics = MetricsRecorder.get_shared_recorder()
+            metrics.add_stage_time("crawl", time.perf_counter() - started)
+            metrics.increment("pages_crawled", len(pages))
+            return True, {"start_url": self.__start_url, "pages": pages, "external_resources": resources}
+        except Exception as e:
+            return False, e.args[0]
+        finally:
+            self.__io_executor = None
+
+    def run(self):
+        """
+        Synchronous wrapper around crawl() for callers without an event loop.
+
+        Returns:
+            tuple: The result of crawl().
+        """
+        return asyncio.run(self.crawl())
@@ -0,0 +1,232 @@
+"""
+SiteWatcher
+
+Re-checks a site for changes of its external resources and of its privacy policy word count, keeping the state of the
+previous check so each check does only the work a change requires:
+
+1. The index page is fetched with the validators (ETag/Last-Modified) of the previous check. A 304 answer, or a body
+   with the same hash as before, means the resources are unchanged and the page is not parsed again.
+2. The privacy policy page is fetched the same way, from the URL found by the previous check while the index page is
+   unchanged. An unchanged body, or a changed body whose visible text has the same hash, is not counted again
+   unless the options of the shared WordTokenizer changed since the previous check.
+3. Changed pages are compared with the previous resource set and word count, and only the differences are reported.
+
+The first check has no previous state, so every resource is reported as added and every word count as a change.
+
+The state is plain data, so it can be saved between runs and passed back in.
+
+Methods:
+    get_state():
+        Returns the state of the last check.
+    check():
+        Checks the site once and returns the changes since the previous check.
+"""
+
+from datetime import datetime, timezone
+
+from utilities.beautiful_soup_scrapper import BeautifulSoupContentScrapper
+from utilities.change_tracker import ChangeTracker
+from utilities.http_cache import DiskHttpCache
+from utilities.metrics import MetricsRecorder
+from utilities.page_cache import PageArtifactCache
+from utilities.page_info import GetPageInfo
+from utilities.tokenizer import WordTokenizer
+
+
+class SiteWatcher:
+    def __init__(self, url=None, state=None):
+        """
+        Initialize the SiteWatcher instance.
+
+        Args:
+            url (str, optional): The URL of the index page. Defaults to the CFC website.
+            state (dict, optional): The state returned by get_state() after an earlier check of the same site.
+        """
+        self.__url = BeautifulSoupContentScrapper(url).get_url()
+        self.__state = state if state and state.get("url") == self.__url else {"url": self.__url}
+
+    def get_url(self):
+        """
+        Get the URL of the watched index page.
+
+        Returns:
+            str: The URL.
+        """
+        return self.__url
+
+    def get_state(self):
+        """
+        Get the state of the last check: the validators and hashes of both pages, the privacy policy URL, the
+        resource set, the word count and the fingerprint of the tokenizer options it was counted with.
+
+        Returns:
+            dict: The JSON-serializable state.
+        """
+        return self.__state
+
+    @staticmethod
+    def __fetch_if_changed(url, previous):
+        """
+        Fetches a page with the validators of its previous fetch.
+
+        Args:
+            url (str): The URL of the page.
+            previous (dict): The "etag", "last_modified" and "content_sha256" of the previous fetch, or an empty dict.
+
+        Returns:
+            tuple: A flag indicating success (bool), the content (str) or None when the page is unchanged, and the
+                   page record to keep for the next check, or the error message in place of the content.
+        """
+        flag, response = GetPageInfo(url).send_get_request(DiskHttpCache.get_conditional_headers(previous))
+        if not flag:
+            return False, response, previous
+        if response.status_code == 304 and previous:
+            return True, None, previous
+        if response.status_code >= 400:
+            return False, f"HTTP {response.status_code} fetching {url}", previous
+        content = response.text
+        page = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_sha256": ChangeTracker.hash_content(content),
+        }
+        if page["content_sha256"] == previous.get("content_sha256"):
+            return True, None, {**previous, **page}
+        return True, content, page
+
+    @staticmethod
+    def __resource_delta(previous, current):
+        """
+        Returns the resources added and removed between two resource sets.
+
+        Args:
+            previous (dict): Mapping of category to the resource URLs of the previous check.
+            current (dict): Mapping of category to the resource URLs of this check.
+
+        Returns:
+            tuple: The added and the removed resources, each a mapping of category to sorted URLs, leaving out
+                   categories without changes.
+        """
+        added, removed = {}, {}
+        for category in sorted(set(previous) | set(current)):
+            previous_urls = set(previous.get(category, ()))
+            current_urls = set(current.get(category, ()))
+            if current_urls - previous_urls:
+                added[category] = sorted(current_urls - previous_urls)
+            if previous_urls - current_urls:
+                removed[category] = sorted(previous_urls - current_urls)
+        return added, removed
+
+    def __check_resources(self, state, changes, page_cache):
+        """
+        Checks the index page and records added and removed resources into changes.
+
+        Args:
+            state (dict): The state being updated.
+            changes (dict): The change record being built.
+            page_cache (PageArtifactCache): The cache seeded with a changed index page for privacy policy discovery.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and whether the index page changed (bool), or
+                   the error message.
+        """
+        flag, content, page = self.__fetch_if_changed(self.__url, state.get("index", {}))
+        if not flag:
+            return False, content
+        state["index"] = page
+        if content is None:
+            return True, False
+        page_cache.put_content(self.__url, content)
+        flag, extraction = page_cache.get_extraction(self.__url)
+        if not flag:
+            return False, extraction
+        resources = {category: sorted(set(urls)) for category, urls in extraction.resources.items()}
+        added, removed = self.__resource_delta(state.get("resources", {}), resources)
+        if added:
+            changes["added_resources"] = added
+        if removed:
+            changes["removed_resources"] = removed
+        state["resources"] = resources
+        return True, True
+
+    def __check_word_count(self, state, changes, page_cache, index_changed):
+        """
+        Checks the privacy policy page and records the changed word counts into changes.
+
+        Args:
+            state (dict): The state being updated.
+            changes (dict): The change record being built.
+            page_cache (PageArtifactCache): The cache holding the index page when it changed.
+            index_changed (bool): Whether the index page changed, so the privacy policy URL must be found again.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and None, or the error message.
+        """
+        previous = state.get("privacy_policy", {})
+        privacy_policy_url = previous.get("url")
+        tokenizer = WordTokenizer.get_shared_tokenizer().get_fingerprint()
+        if state.get("tokenizer") != tokenizer:
+            # Counts made with other tokenizer options are stale, so the page is fetched and counted again
+            previous = {"url": privacy_policy_url}
+        if index_changed or not privacy_policy_url:
+            scrapper = BeautifulSoupContentScrapper(self.__url, page_cache=page_cache)
+            flag, privacy_policy_url = scrapper.get_privacy_policy_url()
+            if not flag:
+                return False, privacy_policy_url
+        if privacy_policy_url != previous.get("url"):
+            if previous.get("url"):
+                changes["privacy_policy_url"] = privacy_policy_url
+            previous = {"text_sha256": previous.get("text_sha256")}
+
+        flag, content, page = self.__fetch_if_changed(privacy_policy_url, previous)
+        if not flag:
+            return False, content
+        if content is None:
+            state["privacy_policy"] = page
+            return True, None
+        flag, visible_text = BeautifulSoupContentScrapper.extract_visible_text(content)
+        if not flag:
+            return False, visible_text
+        page["text_sha256"] = ChangeTracker.hash_text(visible_text)
+        if page["text_sha256"] != previous.get("text_sha256") or "word_count" not in state:
+            flag, word_count = BeautifulSoupContentScrapper.count_text_words(visible_text)
+            if not flag:
+                return False, word_count
+            delta = ChangeTracker.word_count_delta(state.get("word_count", {}), word_count)
+            if delta:
+                changes["word_count_changes"] = delta
+            state["word_count"] = word_count
+            state["tokenizer"] = tokenizer
+        state["privacy_policy"] = page
+        return True, None
+
+    def check(self):
+        """
+        Checks the site once and returns the changes since the previous check. The state is only updated when both
+        pages were checked, so the changes of a failed check are reported by the next successful one.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the change record, or the error message.
+                   The record holds the "url" and "checked_at" time, plus "added_resources", "removed_resources",
+                   "privacy_policy_url" and "word_count_changes" when they changed.
+        """
+        try:
+            metrics = MetricsRecorder.get_shared_recorder()
+            changes = {"url": self.__url, "checked_at": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+            page_cache = PageArtifactCache()
+            state = dict(self.__state)
+            with metrics.stage("watch.check"):
+                flag, index_changed = self.__check_resources(state, changes, page_cache)
+                if not flag:
+                    return False, index_changed
+                flag, error = self.__check_word_count(state, changes, page_cache, index_changed)
+                if not flag:
+                    return False, error
+            self.__state = state
+            metrics.increment("watch_checks")
+            if len(changes) == 2:
+                metrics.increment("watch_unchanged")
+            return True, changes
+        except Exception as e:
+            return False, e.args[0]
@@ -0,0 +1,112 @@
+"""
+StreamingWordCounter
+
+An incremental HTML parser that counts words as text nodes arrive, so a page can be counted chunk by chunk without
+holding the whole document, its parse tree or its text in memory. Peak memory is bounded by the chunk size plus the
+vocabulary size.
+
+The counted text matches BeautifulSoup(content, "html.parser").get_text(): strings inside <script>, <style> and
+<template> are skipped, comments, doctypes and processing instructions are ignored, and adjacent text nodes are
+joined without a separator, so a word split across tags or chunks is counted once. Words are split with the shared
+WordTokenizer, which never joins text across whitespace, so text is tokenized up to its last whitespace and the rest is
+kept for the next piece.
+
+Attributes:
+    SKIPPED_TAGS (frozenset): Tags whose contents are not counted.
+    TREE_PARSER (str): The BeautifulSoup parser whose get_text() the counted text matches.
+
+Methods:
+    feed(data):
+        Parses the next chunk of HTML and counts the words it completes.
+    get_word_count():
+        Flushes the parser and returns the word frequency count.
+    count_chunks(chunks):
+        Counts the words of an iterable of HTML chunks.
+"""
+
+from collections import Counter
+from html.parser import HTMLParser
+
+from utilities.tokenizer import WordTokenizer
+
+
+class StreamingWordCounter(HTMLParser):
+    SKIPPED_TAGS = frozenset({"script", "style", "template"})
+    TREE_PARSER = "html.parser"
+
+    def __init__(self):
+        """
+        Initialize the StreamingWordCounter instance with an empty count.
+        """
+        super(StreamingWordCounter, self).__init__(convert_charrefs=True)
+        self.__word_count = Counter()
+        self.__tokenizer = WordTokenizer.get_shared_tokenizer()
+        self.__pending_word = ""
+        self.__skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIPPED_TAGS:
+            self.__skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIPPED_TAGS and self.__skip_depth:
+            self.__skip_depth -= 1
+
+    def handle_startendtag(self, tag, attrs):
+        pass
+
+    def handle_data(self, data):
+        if not self.__skip_depth:
+            self.__count_text(data)
+
+    def unknown_decl(self, data):
+        if data.startswith("CDATA[") and not self.__skip_depth:
+            self.__count_text(data[len("CDATA["):])
+
+    def __count_text(self, data):
+        """
+        Counts the words completed by a piece of text, keeping a trailing partial word for the next piece.
+
+        Args:
+            data (str): The text of a text node or a part of one.
+        """
+        text = self.__pending_word + data
+        if not text or text[-1].isspace():
+            complete_text, self.__pending_word = text, ""
+        else:
+            parts = text.rsplit(None, 1)
+            complete_text, self.__pending_word = parts if len(parts) == 2 else ("", text)
+        if complete_text:
+            self.__word_count.update(self.__tokenizer.tokenize(complete_text))
+
+    def get_word_count(self):
+        """
+        Flushes the parser and returns the word frequency count.
+
+        Returns:
+            Counter: The case-insensitive word frequency count.
+        """
+        self.close()
+        if self.__pending_word:
+            self.__word_count.update(self.__tokenizer.tokenize(self.__pending_word))
+            self.__pending_word = ""
+        return self.__word_count
+
+    @classmethod
+    def count_chunks(cls, chunks):
+        """
+        Counts the words of an iterable of HTML chunks.
+
+        Args:
+            chunks (iterable): The HTML content, as str chunks.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a Counter containing word frequency count.
+        """
+        try:
+            word_counter = cls()
+            for chunk in chunks:
+                word_counter.feed(chunk)
+            return True, word_counter.get_word_count()
+        except Exception as e:
+            return False, e.args[0]
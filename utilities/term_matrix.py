@@ -0,0 +1,415 @@
+"""
+TermFrequencyMatrix
+
+A vocabulary-indexed term-frequency store for comparing the word counts of many privacy policies, across sites or
+across versions of one site, with vectorized NumPy operations instead of loops over JSON dicts.
+
+Every term gets an integer id on first use, and every document becomes one sparse row of the matrix in compressed
+sparse row (CSR) layout: the term ids and counts of all rows are kept in two flat arrays, and indptr holds where each
+row starts. Rows are appended in batches and compacted into the flat arrays on the first read. Row-wise sums, e.g. dot
+products and norms, are computed for all rows at once with np.add.reduceat over the flat arrays, so comparing one
+policy with thousands of others costs a few milliseconds.
+
+Methods:
+    add_document(label, word_count):
+        Adds the word count of a document as a new row.
+    get_row(label):
+        Returns the word count of a document.
+    term_totals():
+        Returns the total count of every term over all documents.
+    top_terms(n=10, label=None):
+        Returns the most frequent terms of a document or of the whole matrix.
+    cosine_similarities(label):
+        Returns the cosine similarity of a document with every document.
+    most_similar(label, n=5):
+        Returns the documents most similar to a document.
+    term_delta(previous_label, current_label, previous=None):
+        Returns the per-term count changes between two documents or two snapshots of one document.
+    term_totals_delta(previous):
+        Returns the per-term changes of the corpus totals since a previous snapshot.
+    concatenate(other):
+        Appends the rows of another matrix.
+    to_arrays() / from_arrays(arrays):
+        Converts the matrix to and from plain NumPy arrays.
+    save(output_file) / load(input_file):
+        Writes and reads the matrix as a compressed .npz file.
+"""
+
+import numpy as np
+
+from utilities.writer import FileWriter
+
+
+class TermFrequencyMatrix:
+    def __init__(self):
+        """
+        Initialize an empty TermFrequencyMatrix instance.
+        """
+        self.__term_ids = {}
+        self.__terms = []
+        self.__labels = []
+        self.__rows = {}
+        self.__indptr = np.zeros(1, dtype=np.int64)
+        self.__indices = np.zeros(0, dtype=np.int32)
+        self.__counts = np.zeros(0, dtype=np.int64)
+        self.__pending_indices = []
+        self.__pending_counts = []
+        self.__norms = None
+
+    def get_labels(self):
+        """
+        Get the labels of the documents, in row order.
+
+        Returns:
+            list: The document labels.
+        """
+        return list(self.__labels)
+
+    def get_vocabulary(self):
+        """
+        Get the terms, in term id order.
+
+        Returns:
+            list: The terms.
+        """
+        return list(self.__terms)
+
+    def get_shape(self):
+        """
+        Get the number of documents and terms.
+
+        Returns:
+            tuple: The number of rows and the number of columns.
+        """
+        return len(self.__labels), len(self.__terms)
+
+    def __get_term_id(self, term):
+        term_id = self.__term_ids.get(term)
+        if term_id is None:
+            term_id = self.__term_ids[term] = len(self.__terms)
+            self.__terms.append(term)
+        return term_id
+
+    def __get_row_index(self, label):
+        try:
+            return self.__rows[label]
+        except KeyError:
+            raise KeyError(f"Unknown document {label}") from None
+
+    def __compact(self):
+        """
+        Moves the rows added since the last read into the flat CSR arrays.
+        """
+        if not self.__pending_indices:
+            return
+        row_lengths = np.fromiter((len(row) for row in self.__pending_indices), dtype=np.int64,
+                                  count=len(self.__pending_indices))
+        self.__indptr = np.concatenate((self.__indptr, self.__indptr[-1] + np.cumsum(row_lengths)))
+        self.__indices = np.concatenate([self.__indices] + self.__pending_indices)
+        self.__counts = np.concatenate([self.__counts] + self.__pending_counts)
+        self.__pending_indices = []
+        self.__pending_counts = []
+        self.__norms = None
+
+    def add_document(self, label, word_count):
+        """
+        Adds the word count of a document, e.g. the result of count_words_frequency(), as a new row.
+
+        Args:
+            label (str): The unique label of the document, e.g. its URL or "URL@date" for a snapshot.
+            word_count (dict): Mapping of term to count.
+
+        Returns:
+            int: The row index of the document.
+        """
+        if label in self.__rows:
+            raise ValueError(f"Document {label} was already added")
+        size = len(word_count)
+        term_ids = np.fromiter((self.__get_term_id(term) for term in word_count), dtype=np.int32, count=size)
+        counts = np.fromiter(word_count.values(), dtype=np.int64, count=size)
+        order = np.argsort(term_ids, kind="stable")
+        nonzero = counts[order] != 0
+        self.__pending_indices.append(term_ids[order][nonzero])
+        self.__pending_counts.append(counts[order][nonzero])
+        self.__rows[label] = len(self.__labels)
+        self.__labels.append(label)
+        return self.__rows[label]
+
+    def __get_row_arrays(self, label):
+        self.__compact()
+        row = self.__get_row_index(label)
+        start, end = self.__indptr[row], self.__indptr[row + 1]
+        return self.__indices[start:end], self.__counts[start:end]
+
+    def get_row(self, label):
+        """
+        Returns the word count of a document.
+
+        Args:
+            label (str): The label of the document.
+
+        Returns:
+            dict: Mapping of term to count.
+        """
+        term_ids, counts = self.__get_row_arrays(label)
+        return {self.__terms[term_id]: int(count) for term_id, count in zip(term_ids.tolist(), counts.tolist())}
+
+    def term_totals(self):
+        """
+        Returns the total count of every term over all documents.
+
+        Returns:
+            np.ndarray: The totals, indexed by term id.
+        """
+        self.__compact()
+        return np.bincount(self.__indices, weights=self.__counts, minlength=len(self.__terms)).astype(np.int64)
+
+    def __top(self, term_ids, counts, n):
+        """
+        Returns the n largest counts with their terms, most frequent first and ties in term order.
+
+        Args:
+            term_ids (np.ndarray): The term ids.
+            counts (np.ndarray): The counts of the term ids.
+            n (int): The number of terms returned.
+
+        Returns:
+            list: (term, count) tuples.
+        """
+        if n <= 0:
+            return []
+        if n < len(counts):
+            candidates = np.argpartition(-counts, n - 1)[:n]
+            threshold = counts[candidates].min()
+            candidates = np.flatnonzero(counts >= threshold)
+        else:
+            candidates = np.arange(len(counts))
+        order = candidates[np.lexsort((term_ids[candidates], -counts[candidates]))][:n]
+        return [(self.__terms[term_id], int(count)) for term_id, count in zip(term_ids[order].tolist(),
+                                                                               counts[order].tolist())]
+
+    def top_terms(self, n=10, label=None):
+        """
+        Returns the most frequent terms of a document, or of all documents together.
+
+        Args:
+            n (int, optional): The number of terms returned. Defaults to 10.
+            label (str, optional): The label of the document. Defaults to all documents.
+
+        Returns:
+            list: (term, count) tuples, most frequent first.
+        """
+        if label is None:
+            totals = self.term_totals()
+            return self.__top(np.arange(len(totals), dtype=np.int32), totals, n)
+        term_ids, counts = self.__get_row_arrays(label)
+        return self.__top(term_ids, counts, n)
+
+    def __row_sums(self, values):
+        """
+        Sums values aligned with the flat CSR arrays per row, in one np.add.reduceat call. Empty rows sum to zero.
+
+        Args:
+            values (np.ndarray): One value per stored entry.
+
+        Returns:
+            np.ndarray: One sum per row.
+        """
+        sums = np.zeros(len(self.__labels), dtype=np.float64)
+        starts = self.__indptr[:-1]
+        nonempty = self.__indptr[1:] > starts
+        if len(values):
+            sums[nonempty] = np.add.reduceat(values, starts[nonempty])
+        return sums
+
+    def __get_norms(self):
+        if self.__norms is None:
+            self.__norms = np.sqrt(self.__row_sums(self.__counts.astype(np.float64) ** 2))
+        return self.__norms
+
+    def cosine_similarities(self, label):
+        """
+        Returns the cosine similarity of the term frequencies of a document with those of every document.
+
+        Args:
+            label (str): The label of the document.
+
+        Returns:
+            np.ndarray: One similarity between 0 and 1 per row, in row order; 0 for empty documents.
+        """
+        term_ids, counts = self.__get_row_arrays(label)
+        query = np.zeros(len(self.__terms), dtype=np.float64)
+        query[term_ids] = counts
+        dots = self.__row_sums(query[self.__indices] * self.__counts)
+        norms = self.__get_norms() * self.__get_norms()[self.__rows[label]]
+        similarities = np.zeros(len(self.__labels), dtype=np.float64)
+        np.divide(dots, norms, out=similarities, where=norms > 0)
+        return similarities
+
+    def most_similar(self, label, n=5):
+        """
+        Returns the documents whose term frequencies are most similar to those of a document.
+
+        Args:
+            label (str): The label of the document.
+            n (int, optional): The number of documents returned. Defaults to 5.
+
+        Returns:
+            list: (label, similarity) tuples, most similar first, without the document itself.
+        """
+        similarities = self.cosine_similarities(label)
+        similarities[self.__rows[label]] = -1
+        order = np.argsort(-similarities, kind="stable")[:n]
+        return [(self.__labels[row], float(similarities[row])) for row in order.tolist() if similarities[row] >= 0]
+
+    def term_delta(self, previous_label, current_label, previous=None):
+        """
+        Returns the per-term count changes from a previous document to a current one, with the same semantics as
+        ChangeTracker.word_count_delta(): unchanged terms are left out and a removed term has a negative change.
+
+        Args:
+            previous_label (str): The label of the previous document.
+            current_label (str): The label of the current document, in this matrix.
+            previous (TermFrequencyMatrix, optional): The snapshot holding the previous document. Defaults to this
+                                                      matrix.
+
+        Returns:
+            dict: Mapping of term to the change of its count, largest changes first.
+        """
+        previous = previous if previous is not None else self
+        previous_ids, previous_counts = previous.__get_row_arrays(previous_label)
+        current_ids, current_counts = self.__get_row_arrays(current_label)
+        previous_terms = [previous.__terms[term_id] for term_id in previous_ids.tolist()]
+        if previous is not self:
+            previous_ids = np.fromiter((self.__term_ids.get(term, -1) for term in previous_terms), dtype=np.int64,
+                                       count=len(previous_terms))
+        known = previous_ids >= 0
+        term_ids, positions = np.unique(np.concatenate((current_ids, previous_ids[known])), return_inverse=True)
+        changes = np.bincount(positions, weights=np.concatenate((current_counts, -previous_counts[known])),
+                              minlength=len(term_ids)).astype(np.int64)
+        changed = np.flatnonzero(changes)
+        delta = [(self.__terms[term_id], change) for term_id, change in zip(term_ids[changed].tolist(),
+                                                                             changes[changed].tolist())]
+        delta.extend((term, -count) for term, count, is_known in zip(previous_terms, previous_counts.tolist(),
+                                                                     known.tolist()) if not is_known)
+        delta.sort(key=lambda entry: -abs(entry[1]))
+        return dict(delta)
+
+    def term_totals_delta(self, previous):
+        """
+        Returns the per-term changes of the term totals over all documents since a previous snapshot of the corpus,
+        e.g. the matrix written by the previous run.
+
+        Args:
+            previous (TermFrequencyMatrix): The previous snapshot.
+
+        Returns:
+            dict: Mapping of term to the change of its total, largest changes first; unchanged terms are left out.
+        """
+        current_totals = self.term_totals()
+        previous_totals = previous.term_totals()
+        mapping = np.fromiter((self.__term_ids.get(term, -1) for term in previous.__terms), dtype=np.int64,
+                              count=len(previous.__terms))
+        known = mapping >= 0
+        changes = current_totals.copy()
+        changes[mapping[known]] -= previous_totals[known]
+        changed = np.flatnonzero(changes)
+        delta = [(self.__terms[term_id], change) for term_id, change in zip(changed.tolist(),
+                                                                             changes[changed].tolist())]
+        removed = np.flatnonzero(~known & (previous_totals != 0))
+        delta.extend((previous.__terms[term_id], -total) for term_id, total in zip(removed.tolist(),
+                                                                                    previous_totals[removed].tolist()))
+        delta.sort(key=lambda entry: -abs(entry[1]))
+        return dict(delta)
+
+    def concatenate(self, other):
+        """
+        Appends the rows of another matrix, mapping its term ids onto this vocabulary, e.g. to combine the matrices
+        built by several workers.
+
+        Args:
+            other (TermFrequencyMatrix): The matrix whose rows are appended.
+
+        Returns:
+            TermFrequencyMatrix: This matrix.
+        """
+        other.__compact()
+        mapping = np.fromiter((self.__get_term_id(term) for term in other.__terms), dtype=np.int32,
+                              count=len(other.__terms))
+        for row, label in enumerate(other.__labels):
+            if label in self.__rows:
+                raise ValueError(f"Document {label} was already added")
+            start, end = other.__indptr[row], other.__indptr[row + 1]
+            term_ids = mapping[other.__indices[start:end]]
+            order = np.argsort(term_ids, kind="stable")
+            self.__pending_indices.append(term_ids[order])
+            self.__pending_counts.append(other.__counts[start:end][order])
+            self.__rows[label] = len(self.__labels)
+            self.__labels.append(label)
+        return self
+
+    def to_arrays(self):
+        """
+        Converts the matrix to plain NumPy arrays, e.g. to send it between processes or to save it.
+
+        Returns:
+            dict: The "vocabulary", "labels", "indptr", "indices" and "counts" arrays.
+        """
+        self.__compact()
+        return {
+            "vocabulary": np.array(self.__terms, dtype=str),
+            "labels": np.array(self.__labels, dtype=str),
+            "indptr": self.__indptr,
+            "indices": self.__indices,
+            "counts": self.__counts,
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        Restores a matrix converted by to_arrays().
+
+        Args:
+            arrays (mapping): The arrays returned by to_arrays(), or a loaded .npz file.
+
+        Returns:
+            TermFrequencyMatrix: The restored matrix.
+        """
+        matrix = cls()
+        matrix.__terms = arrays["vocabulary"].tolist()
+        matrix.__term_ids = {term: term_id for term_id, term in enumerate(matrix.__terms)}
+        matrix.__labels = arrays["labels"].tolist()
+        matrix.__rows = {label: row for row, label in enumerate(matrix.__labels)}
+        matrix.__indptr = np.asarray(arrays["indptr"], dtype=np.int64)
+        matrix.__indices = np.asarray(arrays["indices"], dtype=np.int32)
+        matrix.__counts = np.asarray(arrays["counts"], dtype=np.int64)
+        return matrix
+
+    def save(self, output_file):
+        """
+        Writes the matrix as a compressed .npz file.
+
+        Args:
+            output_file (str): Path to the output file.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the error message if writing fails.
+        """
+        return FileWriter.write_npz_file(self.to_arrays(), output_file)
+
+    @classmethod
+    def load(cls, input_file):
+        """
+        Reads a matrix written by save().
+
+        Args:
+            input_file (str): Path to the .npz file.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the matrix or the error message.
+        """
+        try:
+            with np.load(input_file, allow_pickle=False) as arrays:
+                return True, cls.from_arrays(arrays)
+        except (OSError, ValueError, KeyError) as e:
+            return False, str(e)
@@ -0,0 +1,148 @@
+"""
+WordTokenizer
+
+Splits text into words for word frequency counting with one precompiled Unicode-aware pattern. The whole text is case
+folded once, the words are found by a single regex scan and counted by one bulk Counter call, instead of one split,
+strip and lower call per whitespace-separated token.
+
+A word is a run of Unicode letters and digits, optionally joined by apostrophes or hyphens ("don't", "third-party"),
+so punctuation no longer sticks to words: "policy," and "policy" are the same word. Stopwords and purely numeric words
+can optionally be dropped.
+
+Attributes:
+    WORD_PATTERN (re.Pattern): The default word pattern.
+    ENGLISH_STOPWORDS (frozenset): Common English function words, for the stopword filter.
+    __shared_tokenizer (WordTokenizer): The process-wide tokenizer returned by get_shared_tokenizer().
+
+Methods:
+    tokenize(text):
+        Returns the words of a text, case folded and filtered.
+    count(text):
+        Returns the word frequency count of a text.
+    get_fingerprint():
+        Returns a hash of the options that change the counts.
+    get_shared_tokenizer():
+        Returns the process-wide tokenizer used by the scrappers.
+    configure_shared_tokenizer(**options):
+        Replaces the process-wide tokenizer.
+"""
+
+import hashlib
+import json
+import re
+from collections import Counter
+
+WORD_PATTERN = re.compile(r"[^\W_]+(?:['’-][^\W_]+)*")
+
+ENGLISH_STOPWORDS = frozenset("""
+    a about above after again against all am an and any are as at be because been before being below between both but
+    by can could did do does doing down during each few for from further had has have having he her here hers herself
+    him himself his how i if in into is it its itself just me more most my myself no nor not now of off on once only or
+    other our ours ourselves out over own same she should so some such than that the their theirs them themselves then
+    there these they this those through to too under until up very was we were what when where which while who whom
+    why will with would you your yours yourself yourselves
+""".split())
+
+
+class WordTokenizer:
+    __shared_tokenizer = None
+
+    def __init__(self, stopwords=None, drop_numbers=False, pattern=WORD_PATTERN):
+        """
+        Initialize the WordTokenizer instance.
+
+        Args:
+            stopwords (iterable, optional): Words left out of the count, compared after case folding.
+                                            Defaults to none.
+            drop_numbers (bool, optional): Leave out words made only of digits, e.g. years. Defaults to False.
+            pattern (re.Pattern, optional): The compiled word pattern. Defaults to WORD_PATTERN.
+        """
+        self.__stopwords = frozenset(word.casefold() for word in stopwords) if stopwords else frozenset()
+        self.__drop_numbers = drop_numbers
+        self.__pattern = pattern
+
+    def get_stopwords(self):
+        """
+        Get the words left out of the count.
+
+        Returns:
+            frozenset: The case folded stopwords.
+        """
+        return self.__stopwords
+
+    def is_filtering(self):
+        """
+        Determines whether the tokenizer leaves any words out.
+
+        Returns:
+            bool: True if stopwords or numbers are dropped.
+        """
+        return bool(self.__stopwords) or self.__drop_numbers
+
+    def tokenize(self, text):
+        """
+        Returns the words of a text, case folded and filtered.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            list: The words, in order of appearance.
+        """
+        words = self.__pattern.findall(text.casefold())
+        if not self.is_filtering():
+            return words
+        stopwords = self.__stopwords
+        if self.__drop_numbers:
+            return [word for word in words if word not in stopwords and not word.isdigit()]
+        return [word for word in words if word not in stopwords]
+
+    def count(self, text):
+        """
+        Returns the word frequency count of a text.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            Counter: The case-insensitive word frequency count.
+        """
+        return Counter(self.tokenize(text))
+
+    def get_fingerprint(self):
+        """
+        Returns a hash of the word pattern, the stopwords and the number filter, so counts saved by an earlier run can
+        be recognised as made with other options.
+
+        Returns:
+            str: The SHA-256 hex digest of the options.
+        """
+        options = {"pattern": self.__pattern.pattern, "stopwords": sorted(self.__stopwords),
+                   "drop_numbers": self.__drop_numbers}
+        return hashlib.sha256(json.dumps(options, sort_keys=True).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def get_shared_tokenizer(cls):
+        """
+        Get the process-wide tokenizer used by the scrappers, creating a tokenizer without filters on first use.
+
+        Returns:
+            WordTokenizer: The shared tokenizer.
+        """
+        if cls.__shared_tokenizer is None:
+            cls.__shared_tokenizer = cls()
+        return cls.__shared_tokenizer
+
+    @classmethod
+    def configure_shared_tokenizer(cls, **options):
+        """
+        Replaces the process-wide tokenizer, e.g. to enable the stopword or number filters for a run.
+
+        Args:
+            **options: Keyword arguments accepted by WordTokenizer.__init__().
+
+        Returns:
+            WordTokenizer: The new shared tokenizer.
+        """
+        cls.__shared_tokenizer = cls(**options)
+        return cls.__shared_tokenizer
@@ -4,40 +4,68 @@ FetchUrl
 A class for fetching URLs from content based on a specified pattern.
 
 Attributes:
-    __url_pattern (str): The regular expression pattern to match URLs.
+    __url_pattern (str): The regular expression pattern to match candidate URLs.
+    __first_party_domains (tuple): The domains whose URLs (including sub-domains) are not external resources.
 
 Methods:
     get_url_pattern():
         Returns the URL pattern used for matching.
+    get_first_party_domains():
+        Returns the domains treated as first-party.
+    get_site_domains(url):
+        Returns the first-party domains of the site a URL belongs to.
+    is_first_party_url(url):
+        Determines whether a URL is hosted on a first-party domain.
     fetch_url_list(content):
-        Fetches and returns a list of URLs from the provided content.
+        Fetches and returns a list of third-party URLs from the provided content.
     get_unique_url_list(url_list):
         Returns a list of unique URLs from the given URL list.
     scrape_using_tags(soup, base_url):
         Extracts external resources from the BeautifulSoup instance using HTML tags.
     scrape_using_regex(content):
         Extracts external resources from the provided content using regular expressions.
+    score_privacy_policy_anchor(anchor, url):
+        Scores how likely an anchor is to link to the Privacy Policy page.
+    rank_privacy_policy_candidates(anchors, url):
+        Returns the Privacy Policy candidates of a page, best first.
     find_privacy_policy_url(soup, url):
         Finds the URL of the Privacy Policy page on the given webpage.
+
+fetch_url_list() is recorded in the shared MetricsRecorder as the "regex_extraction" stage and the "urls_extracted"
+counter.
 """
 
 import re
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlsplit
+
+from utilities.metrics import MetricsRecorder
+
+CFC_DOMAINS = ("cfc.com", "cfcunderwriting.com")
 
 
 class FetchUrl:
-    def __init__(self, pattern=None):
+    def __init__(self, pattern=None, first_party_domains=None):
         """
         Initialize the FetchUrl instance.
 
+        The default pattern only finds candidate URLs; first-party URLs are then dropped by their parsed host. The
+        pattern has no lookahead and ends on the last word character of a URL, so a scan is linear in the size of the
+        content even for multi-megabyte single-line pages.
+
         Args:
             pattern (str, optional): The regular expression pattern to match URLs.
                                      If not provided, a default pattern is used.
+            first_party_domains (iterable, optional): The domains treated as first-party, see get_site_domains().
+                                                      Defaults to cfc.com and cfcunderwriting.com.
         """
         if pattern:
             self.__url_pattern = pattern
         else:
-            self.__url_pattern = r"\b(https?:\/\/(?!.*(?:cfc\.com|cfcunderwriting\.com))[^\s/$.?#]*[^\s\"'><]*)\b"
+            self.__url_pattern = r"\bhttps?://[^\s\"'<>]*\w"
+        if first_party_domains:
+            self.__first_party_domains = tuple(domain.lower() for domain in first_party_domains)
+        else:
+            self.__first_party_domains = CFC_DOMAINS
 
     def get_url_pattern(self):
         """
@@ -48,9 +76,51 @@ class FetchUrl:
         """
         return self.__url_pattern
 
+    def get_first_party_domains(self):
+        """
+        Returns the domains treated as first-party.
+
+        Returns:
+            tuple: The first-party domains.
+        """
+        return self.__first_party_domains
+
+    @staticmethod
+    def get_site_domains(url):
+        """
+        Returns the first-party domains of the site a URL belongs to: its host without a leading "www.", or both CFC
+        domains for a URL on either of them.
+
+        Args:
+            url (str): A URL of the site, e.g. its index page.
+
+        Returns:
+            tuple: The first-party domains.
+        """
+        host = (urlsplit(url).hostname or "").lower()
+        if any(host == domain or host.endswith(f".{domain}") for domain in CFC_DOMAINS):
+            return CFC_DOMAINS
+        return (host[len("www."):] if host.startswith("www.") else host,)
+
+    def is_first_party_url(self, url):
+        """
+        Determines whether a URL is hosted on a first-party domain or one of its sub-domains.
+
+        Args:
+            url (str): The URL to check.
+
+        Returns:
+            bool: True if the URL host is first-party.
+        """
+        try:
+            host = urlsplit(url).hostname or ""
+        except ValueError:
+            return False
+        return any(host == domain or host.endswith(f".{domain}") for domain in self.get_first_party_domains())
+
     def fetch_url_list(self, content):
         """
-        Fetches and returns a list of URLs from the provided content.
+        Fetches and returns a list of third-party URLs from the provided content.
 
         Args:
             content (str): The content from which to fetch URLs.
@@ -59,10 +129,14 @@ class FetchUrl:
             tuple: A tuple containing a flag indicating success (bool) and a List of URLs.
         """
 
-        # Find all URLs matching the URL pattern in the content
+        # Find all candidate URLs in one pass, then drop first-party URLs by their host
         try:
-            url_list = re.findall(self.get_url_pattern(), content)
-            return True, self.get_unique_url_list(url_list)
+            metrics = MetricsRecorder.get_shared_recorder()
+            with metrics.stage("regex_extraction"):
+                url_list = self.get_unique_url_list(re.findall(self.get_url_pattern(), content))
+                url_list = [url for url in url_list if not self.is_first_party_url(url)]
+            metrics.increment("urls_extracted", len(url_list))
+            return True, url_list
         except Exception as e:
             return False, e.args[0]
 
@@ -172,10 +246,73 @@ class FetchUrl:
         except Exception as e:
             return False, e.args[0]
 
+    @staticmethod
+    def score_privacy_policy_anchor(anchor, url):
+        """
+        Scores how likely an anchor is to link to the Privacy Policy page. The "privacy-policy" link relation is the
+        strongest hint, followed by the href path and the anchor text; links in the page footer, where policies are
+        conventionally linked, get a bonus, while cookie policies and off-site links are penalised.
+
+        Args:
+            anchor (dict): The anchor, with its absolute "href", its "text", its "rel" values and "in_footer".
+            url (str): The URL of the webpage the anchor belongs to.
+
+        Returns:
+            int: The score, 0 or less when the anchor is not a candidate.
+        """
+        split_href = urlsplit(anchor["href"])
+        path = f"{split_href.path}?{split_href.query}".lower()
+        text = " ".join(anchor.get("text", "").lower().split())
+        rel = anchor.get("rel", [])
+        if "privacy-policy" in rel:
+            return 100
+        if "privacy" not in path and "privacy" not in text:
+            return 0
+
+        score = 0
+        if "privacy" in path:
+            score += 4
+        if "policy" in path or "notice" in path or "statement" in path:
+            score += 2
+        if re.search(r"privacy[-_]?(policy|notice|statement)", path):
+            score += 2
+        if "privacy" in text:
+            score += 4
+        if text in ("privacy policy", "privacy notice", "privacy statement", "privacy"):
+            score += 3
+        if "cookie" in path or "cookie" in text:
+            score -= 3
+        if anchor.get("in_footer"):
+            score += 1
+        if split_href.hostname != urlsplit(url).hostname:
+            score -= 2
+        return score
+
+    @staticmethod
+    def rank_privacy_policy_candidates(anchors, url):
+        """
+        Returns the Privacy Policy candidates of a page, best first. Candidates with the same score keep their page
+        order, and an href linked several times is ranked once with its best score.
+
+        Args:
+            anchors (list): The anchors of the page, see score_privacy_policy_anchor().
+            url (str): The URL of the webpage.
+
+        Returns:
+            list: (score, href) tuples of the anchors scoring above 0.
+        """
+        best_scores = {}
+        for anchor in anchors:
+            score = FetchUrl.score_privacy_policy_anchor(anchor, url)
+            if score > 0 and score > best_scores.get(anchor["href"], 0):
+                best_scores[anchor["href"]] = score
+        return sorted(((score, href) for href, score in best_scores.items()), key=lambda candidate: -candidate[0])
+
     @staticmethod
     def find_privacy_policy_url(soup, url):
         """
-        Finds the URL of the Privacy Policy page on the given webpage.
+        Finds the URL of the Privacy Policy page on the given webpage, as the best ranked candidate of
+        rank_privacy_policy_candidates().
 
         Args:
             soup (BeautifulSoup): The BeautifulSoup instance representing the parsed HTML content.
@@ -185,14 +322,18 @@ class FetchUrl:
             tuple: A tuple containing a flag indicating success (bool) and the URL of the Privacy Policy page.
         """
         try:
-            # Find all <a> tags and search for the Privacy Policy link
-            links = soup.find_all('a', href=True)
-            for link in links:
-                href = link['href']
-                if 'privacy' in href.lower() and 'policy' in href.lower():
-                    privacy_policy_url = urlparse(url)._replace(path=href).geturl()
-                    return True, privacy_policy_url
-
-            return False, None
+            anchors = []
+            for link in soup.find_all('a', href=True):
+                rel = link.get('rel') or []
+                anchors.append({
+                    "href": urljoin(url, link['href'].strip()),
+                    "text": link.get_text(" "),
+                    "rel": [value.lower() for value in (rel.split() if isinstance(rel, str) else rel)],
+                    "in_footer": link.find_parent('footer') is not None,
+                })
+            candidates = FetchUrl.rank_privacy_policy_candidates(anchors, url)
+            if not candidates:
+                return False, None
+            return True, candidates[0][1]
         except Exception as e:
             return False, e.args[0]
@@ -0,0 +1,155 @@
+"""
+VisibleTextParser
+
+An HTML parser that extracts only the text a visitor can see. Subtrees that are never rendered are pruned while
+parsing, so their markup is neither turned into nodes nor tokenized:
+
+- <script> (including JSON-LD blobs), <style>, <noscript> and <template> elements,
+- elements with the "hidden" attribute or aria-hidden="true",
+- elements whose inline style sets display: none or visibility: hidden.
+
+Block-level elements and <br> are separated by whitespace, so "<li>one</li><li>two</li>" yields two words rather than
+"onetwo".
+
+Attributes:
+    PRUNED_TAGS (frozenset): Tags whose whole subtree is never visible.
+    VOID_TAGS (frozenset): Tags that never have a subtree.
+    BLOCK_TAGS (frozenset): Tags whose boundaries separate words.
+
+Methods:
+    get_text():
+        Flushes the parser and returns the visible text.
+    extract(content):
+        Returns the visible text of an HTML document.
+"""
+
+import re
+from html.parser import HTMLParser
+
+
+class VisibleTextParser(HTMLParser):
+    PRUNED_TAGS = frozenset({"script", "style", "noscript", "template"})
+    VOID_TAGS = frozenset({
+        "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr",
+    })
+    BLOCK_TAGS = frozenset({
+        "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset", "figcaption",
+        "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol",
+        "p", "pre", "section", "table", "td", "th", "title", "tr", "ul",
+    })
+    __hidden_style = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden", re.IGNORECASE)
+
+    def __init__(self):
+        """
+        Initialize the VisibleTextParser instance.
+        """
+        super(VisibleTextParser, self).__init__(convert_charrefs=True)
+        self.__text_parts = []
+        self.__open_tags = []
+        self.__pruned_tag = None
+        self.__pruned_depth = 0
+
+    def is_hidden(self, tag, attrs):
+        """
+        Determines whether an element and its subtree are never rendered.
+
+        Args:
+            tag (str): The lower-cased tag name.
+            attrs (list): The (name, value) attribute pairs of the element.
+
+        Returns:
+            bool: True if the element subtree must be pruned.
+        """
+        if tag in self.PRUNED_TAGS:
+            return True
+        for name, value in attrs:
+            if name == "hidden":
+                return True
+            if name == "aria-hidden" and (value or "").strip().lower() == "true":
+                return True
+            if name == "style" and value and self.__hidden_style.search(value):
+                return True
+        return False
+
+    def handle_starttag(self, tag, attrs):
+        if self.__pruned_tag is not None:
+            if tag == self.__pruned_tag:
+                self.__pruned_depth += 1
+            return
+        if tag in self.VOID_TAGS:
+            if tag in self.BLOCK_TAGS:
+                self.handle_text(" ")
+            return
+        if self.is_hidden(tag, attrs):
+            self.__pruned_tag = tag
+            self.__pruned_depth = 1
+            return
+        self.__open_tags.append(tag)
+        if tag in self.BLOCK_TAGS:
+            self.handle_text(" ")
+
+    def handle_endtag(self, tag):
+        if self.__pruned_tag is not None:
+            if tag == self.__pruned_tag:
+                self.__pruned_depth -= 1
+                if not self.__pruned_depth:
+                    self.__pruned_tag = None
+                return
+            if tag not in self.__open_tags:
+                return
+            # An ancestor closed, so the pruned element was implicitly closed too (e.g. <li hidden> ... </ul>)
+            self.__pruned_tag = None
+        if tag in self.__open_tags:
+            while self.__open_tags.pop() != tag:
+                pass
+        if tag in self.BLOCK_TAGS:
+            self.handle_text(" ")
+
+    def handle_startendtag(self, tag, attrs):
+        if self.__pruned_tag is None and tag in self.BLOCK_TAGS:
+            self.handle_text(" ")
+
+    def handle_data(self, data):
+        if self.__pruned_tag is None:
+            self.handle_text(data)
+
+    def unknown_decl(self, data):
+        if data.startswith("CDATA[") and self.__pruned_tag is None:
+            self.handle_text(data[len("CDATA["):])
+
+    def handle_text(self, text):
+        """
+        Receives the next piece of visible text. Subclasses may override it to consume text incrementally.
+
+        Args:
+            text (str): A piece of visible text.
+        """
+        self.__text_parts.append(text)
+
+    def get_text(self):
+        """
+        Flushes the parser and returns the visible text.
+
+        Returns:
+            str: The visible text.
+        """
+        self.close()
+        return "".join(self.__text_parts)
+
+    @classmethod
+    def extract(cls, content):
+        """
+        Returns the visible text of an HTML document.
+
+        Args:
+            content (str): The HTML content of a webpage.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and a str: The visible text.
+        """
+        try:
+            parser = cls()
+            parser.feed(content)
+            return True, parser.get_text()
+        except Exception as e:
+            return False, e.args[0]
@@ -0,0 +1,284 @@
+"""
+WorkQueue
+
+A durable work queue of scrape and crawl tasks shared by many worker processes, so throughput scales by adding workers
+instead of being capped by one Python process. The store is a single SQLite database, so it needs no outside service;
+workers on other machines can share it through a network file system that supports SQLite locking. The database uses
+the rollback journal rather than WAL, since WAL relies on shared memory and only works for processes on one host.
+
+Tasks are leased rather than popped: a worker leasing a task owns it until lease_seconds elapse, and extends the lease
+with heartbeat() while it works. A task whose worker died becomes available again when its lease expires. Every lease
+counts as an attempt, and a task that failed or timed out max_attempts times is marked failed for good.
+
+Enqueueing is idempotent (a task is identified by its kind and payload) and so are result writes: the first completion
+of a task is kept and later completions, e.g. by a worker whose lease expired while it was finishing, are ignored.
+
+Attributes:
+    PENDING, LEASED, DONE, FAILED (str): The task statuses.
+
+Methods:
+    enqueue(kind, payload):
+        Adds a task unless an identical one was already added.
+    lease(worker_id):
+        Leases the oldest available task.
+    heartbeat(task_id, worker_id):
+        Extends the lease of a task.
+    complete(task_id, worker_id, result):
+        Records the result of a task.
+    fail(task_id, worker_id, error):
+        Records a failed attempt of a task.
+    get_task(task_id):
+        Returns a task.
+    get_counts():
+        Returns the number of tasks per status.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+
+
+class WorkQueue:
+    PENDING = "pending"
+    LEASED = "leased"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, path="work_queue.sqlite3", lease_seconds=300.0, max_attempts=3):
+        """
+        Initialize the WorkQueue instance, creating the database if needed.
+
+        Args:
+            path (str, optional): The SQLite database file. Defaults to "work_queue.sqlite3".
+            lease_seconds (float, optional): Seconds a leased task stays owned without a heartbeat. Defaults to 300.
+            max_attempts (int, optional): The number of leases after which a task is failed for good. Defaults to 3.
+        """
+        self.__path = path
+        self.__lease_seconds = lease_seconds
+        self.__max_attempts = max_attempts
+        with closing(self.__connect()) as connection:
+            connection.execute("PRAGMA journal_mode=DELETE")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    task_key TEXT NOT NULL UNIQUE,
+                    kind TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    lease_owner TEXT,
+                    lease_expires REAL,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            connection.execute("CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, lease_expires)")
+
+    def get_path(self):
+        """
+        Get the SQLite database file.
+
+        Returns:
+            str: The database path.
+        """
+        return self.__path
+
+    def get_lease_seconds(self):
+        """
+        Get the number of seconds a leased task stays owned without a heartbeat.
+
+        Returns:
+            float: The lease duration.
+        """
+        return self.__lease_seconds
+
+    def __connect(self):
+        """
+        Opens a connection in autocommit mode; write transactions are started explicitly with BEGIN IMMEDIATE so
+        concurrent workers serialize on the database lock instead of failing on upgrade.
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+        connection = sqlite3.connect(self.__path, timeout=30, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    @staticmethod
+    def get_task_key(kind, payload):
+        """
+        Returns the identity of a task.
+
+        Args:
+            kind (str): The task kind, e.g. "resources".
+            payload (dict): The task payload.
+
+        Returns:
+            str: The SHA-256 of the kind and the canonical JSON payload.
+        """
+        return hashlib.sha256(f"{kind}:{json.dumps(payload, sort_keys=True)}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def __to_task(row):
+        if row is None:
+            return None
+        task = dict(row)
+        task["payload"] = json.loads(task["payload"])
+        task["result"] = json.loads(task["result"]) if task["result"] is not None else None
+        return task
+
+    def enqueue(self, kind, payload):
+        """
+        Adds a task unless an identical one (same kind and payload) was already added.
+
+        Args:
+            kind (str): The task kind, e.g. "resources".
+            payload (dict): The JSON-serializable task payload.
+
+        Returns:
+            tuple: A tuple containing a flag indicating whether the task was added (bool) and the task id (int).
+        """
+        task_key = self.get_task_key(kind, payload)
+        now = time.time()
+        with closing(self.__connect()) as connection:
+            cursor = connection.execute(
+                "INSERT OR IGNORE INTO tasks (task_key, kind, payload, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (task_key, kind, json.dumps(payload, sort_keys=True), self.PENDING, now, now),
+            )
+            added = cursor.rowcount == 1
+            task_id = connection.execute("SELECT id FROM tasks WHERE task_key = ?", (task_key,)).fetchone()["id"]
+            return added, task_id
+
+    def lease(self, worker_id):
+        """
+        Leases the oldest pending task, or a leased task whose lease expired. Expired tasks that used up their
+        attempts are failed instead.
+
+        Args:
+            worker_id (str): The identity of the leasing worker.
+
+        Returns:
+            dict: The leased task ("id", "kind", "payload", "attempts", ...), or None if no task is available.
+        """
+        now = time.time()
+        with closing(self.__connect()) as connection:
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute(
+                    "UPDATE tasks SET status = ?, error = 'lease expired', lease_owner = NULL, updated_at = ? "
+                    "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                    (self.FAILED, now, self.LEASED, now, self.__max_attempts),
+                )
+                row = connection.execute(
+                    "SELECT id FROM tasks WHERE status = ? OR (status = ? AND lease_expires < ?) ORDER BY id LIMIT 1",
+                    (self.PENDING, self.LEASED, now),
+                ).fetchone()
+                if row is None:
+                    connection.execute("COMMIT")
+                    return None
+                connection.execute(
+                    "UPDATE tasks SET status = ?, lease_owner = ?, lease_expires = ?, attempts = attempts + 1, "
+                    "updated_at = ? WHERE id = ?",
+                    (self.LEASED, worker_id, now + self.__lease_seconds, now, row["id"]),
+                )
+                task = connection.execute("SELECT * FROM tasks WHERE id = ?", (row["id"],)).fetchone()
+                connection.execute("COMMIT")
+                return self.__to_task(task)
+            except BaseException:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                raise
+
+    def heartbeat(self, task_id, worker_id):
+        """
+        Extends the lease of a task still owned by the worker.
+
+        Args:
+            task_id (int): The task id.
+            worker_id (str): The identity of the worker.
+
+        Returns:
+            bool: True if the lease was extended, False if the worker lost the task.
+        """
+        now = time.time()
+        with closing(self.__connect()) as connection:
+            cursor = connection.execute(
+                "UPDATE tasks SET lease_expires = ?, updated_at = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                (now + self.__lease_seconds, now, task_id, self.LEASED, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, task_id, worker_id, result):
+        """
+        Records the result of a task. Only the first completion is kept, so a task finished twice (e.g. after its
+        lease expired and another worker picked it up) keeps one result.
+
+        Args:
+            task_id (int): The task id.
+            worker_id (str): The identity of the worker.
+            result (dict): The JSON-serializable task result.
+
+        Returns:
+            bool: True if this call recorded the result, False if the task was already done or failed for good.
+        """
+        now = time.time()
+        with closing(self.__connect()) as connection:
+            cursor = connection.execute(
+                "UPDATE tasks SET status = ?, result = ?, error = NULL, lease_owner = ?, lease_expires = NULL, "
+                "updated_at = ? WHERE id = ? AND status IN (?, ?)",
+                (self.DONE, json.dumps(result), worker_id, now, task_id, self.PENDING, self.LEASED),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, task_id, worker_id, error):
+        """
+        Records a failed attempt of a task owned by the worker. The task is retried by the next lease until it used up
+        its attempts, then it is failed for good.
+
+        Args:
+            task_id (int): The task id.
+            worker_id (str): The identity of the worker.
+            error (str): The error message.
+
+        Returns:
+            bool: True if the failure was recorded, False if the worker no longer owned the task.
+        """
+        now = time.time()
+        with closing(self.__connect()) as connection:
+            cursor = connection.execute(
+                "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, error = ?, lease_owner = NULL, "
+                "lease_expires = NULL, updated_at = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                (self.__max_attempts, self.FAILED, self.PENDING, str(error), now, task_id, self.LEASED, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def get_task(self, task_id):
+        """
+        Returns a task.
+
+        Args:
+            task_id (int): The task id.
+
+        Returns:
+            dict: The task, or None if it does not exist.
+        """
+        with closing(self.__connect()) as connection:
+            return self.__to_task(connection.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone())
+
+    def get_counts(self):
+        """
+        Returns the number of tasks per status.
+
+        Returns:
+            dict: Mapping of every status to its number of tasks.
+        """
+        counts = {status: 0 for status in (self.PENDING, self.LEASED, self.DONE, self.FAILED)}
+        with closing(self.__connect()) as connection:
+            for row in connection.execute("SELECT status, COUNT(*) AS count FROM tasks GROUP BY status"):
+                counts[row["status"]] = row["count"]
+        return counts
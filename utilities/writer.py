@@ -1,31 +1,184 @@
 """
 FileWriter
 
-A class for writing data to a JSON file.
+A class for writing data to JSON, NDJSON and log files.
+
+Every write goes to a temporary file in the destination directory, which is flushed, fsynced and renamed over the
+destination, so a crash mid-write leaves either the previous file or the complete new one, never a truncated file.
+Appends to logs that only ever grow are written in place instead, one flushed and fsynced batch of lines per call.
 
 Methods:
-    write_to_json_file(data, output_file):
-        Writes the data to a JSON file.
+    write_to_json_file(data, output_file, compact):
+        Writes the data to a JSON file, pretty-printed or compact.
+    write_ndjson_file(records, output_file):
+        Writes records streamed from an iterable to an NDJSON file, one JSON document per line.
+    append_ndjson_records(records, output_file):
+        Appends records to an NDJSON file, keeping the records already written.
+    write_npz_file(arrays, output_file):
+        Writes NumPy arrays to a compressed .npz file.
+    write_logs(data, output_file):
+        Writes the data to a log file.
+    write_text_file(text, output_file):
+        Writes a string to a text file.
+
+JSON and NDJSON writes are recorded in the shared MetricsRecorder as the "write_output" stage.
 """
 
 import json
+import os
+import secrets
+
+from utilities.metrics import MetricsRecorder
+
+COMPACT_SEPARATORS = (",", ":")
 
 
 class FileWriter:
     @staticmethod
-    def write_to_json_file(data, output_file):
+    def __with_extension(output_file, extension):
+        return (f"{output_file}.{extension}" if output_file.lower().split('.')[-1] != extension
+                else output_file)
+
+    @staticmethod
+    def __write_atomic(output_file, write, mode="w"):
+        """
+        Calls write() with a temporary file next to output_file, then flushes, fsyncs and renames it into place.
+
+        Args:
+            output_file (str): Path to the destination file.
+            write (callable): Function writing the content into the file object it is given.
+            mode (str, optional): The mode the temporary file is opened with, "w" or "wb". Defaults to "w".
+        """
+        directory = os.path.dirname(os.path.abspath(output_file))
+        # Created with mode 0o666 like open() does, so the kernel applies the process umask to new files
+        while True:
+            temporary_path = os.path.join(directory, f".{os.path.basename(output_file)}.{secrets.token_hex(4)}.tmp")
+            try:
+                file_descriptor = os.open(temporary_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+                break
+            except FileExistsError:
+                continue
+        try:
+            if os.path.exists(output_file):
+                os.chmod(temporary_path, os.stat(output_file).st_mode & 0o777)
+            with os.fdopen(file_descriptor, mode) as file:
+                write(file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary_path, output_file)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        try:
+            directory_descriptor = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(directory_descriptor)
+        except OSError:
+            pass
+        finally:
+            os.close(directory_descriptor)
+
+    @staticmethod
+    def write_to_json_file(data, output_file, compact=False):
         """
         Writes the data to a JSON file.
 
         Args:
             data (dict): Data to be written to the JSON file.
             output_file (str): Path to the output JSON file.
+            compact (bool, optional): Write without indentation or spaces after separators, which is several times
+                                      smaller and faster for large outputs. Defaults to False.
         """
         try:
-            output_file = (f"{output_file}.json" if output_file.lower().split('.')[-1] != 'json'
-                           else output_file)
-            with open(output_file, 'w+') as file:
-                json.dump(data, file, indent=4)
+            output_file = FileWriter.__with_extension(output_file, "json")
+            if compact:
+                options = {"separators": COMPACT_SEPARATORS}
+            else:
+                options = {"indent": 4}
+            with MetricsRecorder.get_shared_recorder().stage("write_output"):
+                FileWriter.__write_atomic(output_file, lambda file: json.dump(data, file, **options))
+            return True, None
+        except Exception as e:
+            return False, e.args[0]
+
+    @staticmethod
+    def write_ndjson_file(records, output_file):
+        """
+        Writes records to an NDJSON file, one compact JSON document per line. Records are consumed one at a time, so
+        a generator can produce them while they are written without building the whole output in memory.
+
+        Args:
+            records (iterable): The records to be written, e.g. a generator of dicts.
+            output_file (str): Path to the output NDJSON file.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the number of records written (int) or the
+                   error message if writing fails.
+        """
+        try:
+            output_file = FileWriter.__with_extension(output_file, "ndjson")
+            written = [0]
+
+            def write(file):
+                for record in records:
+                    file.write(json.dumps(record, separators=COMPACT_SEPARATORS))
+                    file.write("\n")
+                    written[0] += 1
+
+            with MetricsRecorder.get_shared_recorder().stage("write_output"):
+                FileWriter.__write_atomic(output_file, write)
+            return True, written[0]
+        except Exception as e:
+            return False, e.args[0]
+
+    @staticmethod
+    def append_ndjson_records(records, output_file):
+        """
+        Appends records to an NDJSON file, one compact JSON document per line, creating the file if needed. The
+        records already in the file are never rewritten, so the file can serve as an append-only log.
+
+        Args:
+            records (iterable): The records to be appended.
+            output_file (str): Path to the output NDJSON file.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the number of records appended (int) or
+                   the error message if writing fails.
+        """
+        try:
+            output_file = FileWriter.__with_extension(output_file, "ndjson")
+            lines = "".join(json.dumps(record, separators=COMPACT_SEPARATORS) + "\n" for record in records)
+            if lines:
+                with MetricsRecorder.get_shared_recorder().stage("write_output"):
+                    with open(output_file, "a", encoding="utf-8") as file:
+                        file.write(lines)
+                        file.flush()
+                        os.fsync(file.fileno())
+            return True, lines.count("\n")
+        except Exception as e:
+            return False, e.args[0]
+
+    @staticmethod
+    def write_npz_file(arrays, output_file):
+        """
+        Writes NumPy arrays to a compressed .npz file. NumPy is only imported when this method is used.
+
+        Args:
+            arrays (dict): Mapping of array name to array.
+            output_file (str): Path to the output .npz file.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the error message if writing fails.
+        """
+        try:
+            import numpy as np
+
+            output_file = FileWriter.__with_extension(output_file, "npz")
+            with MetricsRecorder.get_shared_recorder().stage("write_output"):
+                FileWriter.__write_atomic(output_file, lambda file: np.savez_compressed(file, **arrays), mode="wb")
             return True, None
         except Exception as e:
             return False, e.args[0]
@@ -40,10 +193,26 @@ class FileWriter:
             output_file (str): Path to the output JSON file.
         """
         try:
-            output_file = (f"{output_file}.log" if output_file.lower().split('.')[-1] != 'log'
-                           else output_file)
-            with open(output_file, 'w+') as file:
-                json.dump(data, file, indent=4)
+            output_file = FileWriter.__with_extension(output_file, "log")
+            FileWriter.__write_atomic(output_file, lambda file: json.dump(data, file, indent=4))
+            return True, None
+        except Exception as e:
+            return False, e.args[0]
+
+    @staticmethod
+    def write_text_file(text, output_file):
+        """
+        Writes a string to a text file as is, without adding an extension.
+
+        Args:
+            text (str): The text to be written.
+            output_file (str): Path to the output file.
+
+        Returns:
+            tuple: A tuple containing a flag indicating success (bool) and the error message if writing fails.
+        """
+        try:
+            FileWriter.__write_atomic(output_file, lambda file: file.write(text))
             return True, None
         except Exception as e:
             return False, e.args[0]